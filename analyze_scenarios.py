@@ -0,0 +1,51 @@
+#!/usr/bin/env python3
+"""
+Analyse statique des scénarios JSON - détecte les graphes cassés sans jouer
+Scènes inaccessibles, culs-de-sac, cycles, chemins les plus courts/longs vers les fins
+
+Usage:
+    python analyze_scenarios.py --all --json scenario_report.json
+    python analyze_scenarios.py data/scenes/fort_roanoke_enrichi.json
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from src.simulation.headless import list_scenario_files
+from src.utils.scenario_analyzer import analyze_files, build_report, DEFAULT_MAX_PATHS
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Analyse statique des scénarios D&D 5e")
+    parser.add_argument('files', nargs='*', help="Fichiers de scénario JSON")
+    parser.add_argument('--all', action='store_true', help="Tous les fichiers de data/scenes")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Processus parallèles (défaut: nombre de CPU, 1 = séquentiel)")
+    parser.add_argument('--max-paths', type=int, default=DEFAULT_MAX_PATHS,
+                        help="Chemins max énumérés par scénario")
+    parser.add_argument('--json', type=str, default=None, help="Écrire le rapport JSON")
+    args = parser.parse_args()
+
+    files = list_scenario_files() if args.all else [Path(f) for f in args.files]
+    if not files:
+        parser.error("Indiquez des fichiers de scénario ou --all")
+
+    analyses = analyze_files(files, workers=args.workers, max_paths=args.max_paths)
+    for analysis in analyses:
+        print(analysis.format_summary())
+
+    report = build_report(analyses)
+    print(f"\n📊 {report['healthy']}/{report['scenarios']} scénarios sans problème")
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2, ensure_ascii=False)
+        print(f"💾 Rapport écrit: {args.json}")
+
+    return 0 if report['healthy'] == report['scenarios'] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+Équilibrage automatique des combats d'un scénario - taux de victoire visé
+Le groupe est celui du scénario (niveau et taille recommandés); les tableaux
+"monsters" des scènes de combat sont réécrits avec --write
+
+Usage:
+    python balance_encounters.py data/scenes/armee_verte_enrichi.json
+    python balance_encounters.py data/scenes/*_enrichi.json --target 0.8 --write
+    python balance_encounters.py data/scenes/oeil_de_gruumsh.json --scene combat_orcs -n 1000
+"""
+
+import argparse
+import json
+import sys
+from contextlib import redirect_stdout
+from os import devnull
+from pathlib import Path
+
+from src.simulation.encounter_balancer import EncounterBalancer, balance_scenario
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Équilibrage des rencontres D&D 5e par simulation")
+    parser.add_argument('files', nargs='+', help="Fichiers de scénario JSON")
+    parser.add_argument('--scene', action='append', default=None,
+                        help="Scène de combat à équilibrer (répétable, défaut: toutes)")
+    parser.add_argument('--target', type=float, default=0.85, help="Taux de victoire visé (défaut: 0.85)")
+    parser.add_argument('--tolerance', type=float, default=0.05, help="Écart accepté (défaut: 0.05)")
+    parser.add_argument('-n', '--trials', type=int, default=500, help="Combats par rencontre évaluée")
+    parser.add_argument('--max-monsters', type=int, default=12, help="Nombre maximal de monstres")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Processus parallèles (défaut: nombre de CPU, 0 = séquentiel)")
+    parser.add_argument('--seed', type=int, default=0, help="Graine commune des simulations")
+    parser.add_argument('--backend', choices=['python', 'numpy'], default=None,
+                        help="Moteur de simulation (défaut: DND_COMBAT_BACKEND ou python); "
+                             "numpy ne modélise que EnhancedCombatSystem")
+    parser.add_argument('--write', action='store_true', help="Réécrire les fichiers JSON")
+    args = parser.parse_args()
+
+    from src.scenarios.json_scenario import JsonScenario
+
+    for file in args.files:
+        json_path = Path(file)
+        with open(json_path, 'r', encoding='utf-8') as f:
+            raw = f.read()
+        scenario_data = json.loads(raw)
+
+        with open(devnull, 'w') as sink, redirect_stdout(sink):
+            scenario = JsonScenario(str(json_path))
+            party = scenario.create_party()
+
+        print(f"\n📜 {json_path.name} - groupe niveau {scenario_data.get('level', 1)}: "
+              f"{', '.join(c.name for c in party)}")
+        balancer = EncounterBalancer(party, target=args.target, tolerance=args.tolerance,
+                                     trials=args.trials, max_monsters=args.max_monsters,
+                                     seed=args.seed, scenario_path=str(json_path),
+                                     workers=args.workers, backend=args.backend)
+        results = balance_scenario(scenario_data, balancer, args.scene)
+        if not results:
+            print("   Aucun combat")
+            continue
+        for scene_id, result in results.items():
+            print(result.format_summary(scene_id))
+
+        if args.write and any(result.changed for result in results.values()):
+            text = json.dumps(scenario_data, indent=2, ensure_ascii=False)
+            with open(json_path, 'w', encoding='utf-8') as f:
+                f.write(text + ("\n" if raw.endswith("\n") else ""))
+            print(f"💾 {json_path.name} réécrit")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -8,7 +8,6 @@ from typing import List
 from pathlib import Path
 from dnd_5e_core import Character
 from src.scenarios.base_scenario import BaseScenario
-from src.scenes.scene_factory import SceneFactory
 
 
 class CryptesDeKelemvorScenario(BaseScenario):
@@ -43,14 +42,7 @@ class CryptesDeKelemvorScenario(BaseScenario):
             self._build_default_scenes()
             return
 
-        import json
-        with open(json_path, 'r', encoding='utf-8') as f:
-            scenario_data = json.load(f)
-
-        for scene_data in scenario_data.get('scenes', []):
-            scene = SceneFactory.create_scene_from_dict(scene_data, self.monster_factory)
-            if scene:
-                self.scene_manager.add_scene(scene)
+        self.load_scenes_from_json(json_path)
 
         print(f"✅ Scénario chargé depuis JSON: {len(self.scene_manager.scenes)} scènes")
 
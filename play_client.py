@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Joueurs simulés pour le serveur de parties (tests de charge)
+
+Usage:
+    python play_client.py --sessions 200 --concurrency 50 --scenario chasse_gobelins
+    python play_client.py --interactive                 # une partie au clavier
+    python play_client.py --stats
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+
+from src.server.client import play_session, run_clients, fetch_stats
+from src.simulation.headless import RandomChoicePolicy, ChoicePolicy
+
+
+class KeyboardPolicy(ChoicePolicy):
+    """Choix saisis au clavier (partie interactive via le serveur)"""
+
+    def choose(self, options):
+        for i, option in enumerate(options, 1):
+            print(f"  {i}. {option}")
+        while True:
+            try:
+                choice = int(input("\nVotre choix: "))
+                if 1 <= choice <= len(options):
+                    return choice - 1
+            except ValueError:
+                pass
+            print(f"Veuillez entrer un nombre entre 1 et {len(options)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Client du serveur de parties D&D 5e")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', type=str, default=None)
+    parser.add_argument('--scenario', type=str, default=None, help="Nom du scénario (ex: chasse_gobelins)")
+    parser.add_argument('--sessions', type=int, default=10, help="Parties à jouer")
+    parser.add_argument('--concurrency', type=int, default=50, help="Parties simultanées")
+    parser.add_argument('--seed', type=int, default=None, help="Graine des choix aléatoires")
+    parser.add_argument('--interactive', action='store_true', help="Jouer une partie au clavier")
+    parser.add_argument('--stats', action='store_true', help="Afficher les statistiques du serveur")
+    args = parser.parse_args()
+
+    connection = dict(host=args.host, port=args.port, unix_path=args.unix)
+
+    if args.stats:
+        print(json.dumps(asyncio.run(fetch_stats(**connection)), indent=2, ensure_ascii=False))
+        return 0
+
+    if args.interactive:
+        result = asyncio.run(play_session(KeyboardPolicy(), args.scenario,
+                                          on_text=lambda text: print(text, end=''), **connection))
+        print(f"\n🏁 {result['outcome']}")
+        return 0
+
+    def policy_factory(i):
+        return RandomChoicePolicy(None if args.seed is None else args.seed + i)
+
+    summary = asyncio.run(run_clients(args.sessions, policy_factory, args.concurrency,
+                                      args.scenario, **connection))
+    print(json.dumps(summary, indent=2, ensure_ascii=False))
+    print(json.dumps(asyncio.run(fetch_stats(**connection)), indent=2, ensure_ascii=False))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,8 +7,7 @@ Exemple: La Chasse aux Gobelins
 from pathlib import Path
 from dnd_5e_core import Character
 from src.scenes.scene_factory import SceneFactory
-from src.utils.monster_factory import MonsterFactory
-from src.utils.save_manager import JSONLoader
+from src.utils.monster_registry import monster_registry
 from src.rendering.renderer import create_renderer
 from dnd_5e_core.combat import CombatSystem
 
@@ -93,32 +92,8 @@ def main():
     renderer = create_renderer(use_ncurses=False)
     combat_system = CombatSystem(verbose=True)
 
-    # Charger les monstres
-    json_loader = JSONLoader()
-    monsters_data = json_loader.load_monsters()
-    monster_factory = MonsterFactory(monsters_data)
-
-    # Si pas de monstres dans data/, utiliser ceux du package dnd_5e_core
-    if not monsters_data:
-        print("⚠️ Utilisation des monstres du package dnd_5e_core")
-        from dnd_5e_core.entities import FiveEToolsMonsterLoader
-        loader = FiveEToolsMonsterLoader()
-
-        # Créer une factory simple depuis le FiveEToolsMonsterLoader
-        class SimpleMonsterFactory:
-            def __init__(self, loader):
-                self.loader = loader
-
-            def create_monster(self, monster_name):
-                # Normaliser le nom (ex: "goblin_boss" -> "goblin-boss")
-                normalized_name = monster_name.replace('_', '-')
-                monster = self.loader.load_monster(normalized_name)
-                if not monster:
-                    # Essayer sans normalisation
-                    monster = self.loader.load_monster(monster_name)
-                return monster
-
-        monster_factory = SimpleMonsterFactory(loader)
+    # Monstres: registre partagé (data/monsters puis package dnd_5e_core)
+    monster_factory = monster_registry()
 
     # Charger le scénario
     print("\n📖 Chargement du scénario...")
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+Parties headless des scénarios JSON - tests de régression et de charge
+Aucune saisie, aucune pause: les choix sont faits par une politique
+
+Usage:
+    python run_headless.py data/scenes/chasse_gobelins.json --runs 1000 --policy random --seed 42
+    python run_headless.py --all --runs 200 --json headless_report.json
+    python run_headless.py data/scenes/tour_mage_fou.json --policy scripted --script choix.txt
+    python run_headless.py data/scenes/chasse_gobelins.json --record partie.json --seed 42
+    python run_headless.py --replay partie.json
+    python run_headless.py --replay partie.json --trust-context   # groupe enregistré (pickle)
+"""
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+from src.simulation.headless import (
+    HeadlessRunner, create_policy, scenario_context_factory, list_scenario_files
+)
+from src.simulation.replay import SessionJournal, record, replay
+
+
+def load_scenario(json_path: Path):
+    """Construire un JsonScenario et ses scènes"""
+    from src.scenarios.json_scenario import JsonScenario
+
+    scenario = JsonScenario(str(json_path))
+    scenario.build_custom_scenes()
+    return scenario
+
+
+def run_file(json_path: Path, args) -> dict:
+    """Jouer args.runs parties d'un scénario et retourner le rapport"""
+    scenario = load_scenario(json_path)
+
+    weights = [float(w) for w in args.weights.split(',')] if args.weights else None
+    policy = create_policy(args.policy, seed=args.seed, weights=weights, script_path=args.script)
+
+    runner = HeadlessRunner(
+        scenario.scene_manager,
+        policy=policy,
+        context_factory=scenario_context_factory(scenario),
+        start_scene_id=scenario.get_start_scene_id(),
+        max_steps=args.max_steps
+    )
+    if args.record:
+        result, journal = record(runner, str(json_path), args.seed)
+        journal.save(args.record)
+        print(f"📼 {json_path.name}: {result.outcome} en {len(result.path)} scènes, "
+              f"{len(journal.choices)} choix -> {args.record}")
+        return {'outcome': result.outcome, 'path': result.path}
+
+    report = runner.run_batch(args.runs or 100)
+    print(report.format_summary(f"{scenario.get_scenario_name()} ({json_path.name})"))
+    return report.to_dict()
+
+
+def replay_journal(journal_path: str, runs: int, trust_context: bool = False) -> int:
+    """Rejouer un journal (runs fois pour les benchmarks) et vérifier l'issue"""
+    journal = SessionJournal.load(journal_path, trust_context)
+    scenario = load_scenario(Path(journal.scenario))
+    context_factory = scenario_context_factory(scenario)
+
+    durations = []
+    for _ in range(runs):
+        result = replay(journal, scenario.scene_manager, context_factory)
+        durations.append(result.duration)
+        if not result.matches:
+            print(f"❌ Rejeu divergent à l'étape {result.diverged_at}: "
+                  f"{result.outcome} ({len(result.path)} scènes) au lieu de "
+                  f"{journal.outcome} ({len(journal.path)} scènes)")
+            return 1
+
+    print(f"✅ Rejeu identique: {journal.outcome} en {len(journal.path)} scènes")
+    print(f"   {runs} rejeu(x), meilleur {min(durations) * 1000:.2f} ms, "
+          f"moyen {sum(durations) / len(durations) * 1000:.2f} ms")
+    return 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Parties headless des scénarios D&D 5e")
+    parser.add_argument('files', nargs='*', help="Fichiers de scénario JSON")
+    parser.add_argument('--all', action='store_true', help="Tous les fichiers de data/scenes")
+    parser.add_argument('--runs', type=int, default=None,
+                        help="Parties par scénario (défaut: 100, 1 pour --replay)")
+    parser.add_argument('--policy', default='random',
+                        choices=['first', 'random', 'weighted', 'scripted'],
+                        help="Politique de choix")
+    parser.add_argument('--weights', type=str, default=None,
+                        help="Poids par position pour 'weighted' (ex: 3,1,1)")
+    parser.add_argument('--script', type=str, default=None,
+                        help="Fichier de choix pour 'scripted' (un numéro par ligne)")
+    parser.add_argument('--seed', type=int, default=None, help="Graine des choix aléatoires")
+    parser.add_argument('--max-steps', type=int, default=500, help="Scènes max par partie")
+    parser.add_argument('--json', type=str, default=None, help="Écrire le rapport JSON")
+    parser.add_argument('--record', type=str, default=None,
+                        help="Jouer une partie et écrire son journal rejouable")
+    parser.add_argument('--replay', type=str, default=None,
+                        help="Rejouer un journal (avec --runs pour mesurer)")
+    parser.add_argument('--trust-context', action='store_true',
+                        help="Charger l'état de départ du journal (.context.pkl, pickle: source sûre uniquement)")
+    args = parser.parse_args()
+
+    if args.replay:
+        return replay_journal(args.replay, args.runs or 1, args.trust_context)
+
+    files = list_scenario_files() if args.all else [Path(f) for f in args.files]
+    if not files:
+        parser.error("Indiquez des fichiers de scénario ou --all")
+    if args.record and len(files) != 1:
+        parser.error("--record enregistre une seule partie d'un seul scénario")
+
+    reports = {}
+    for json_path in files:
+        try:
+            reports[json_path.name] = run_file(json_path, args)
+        except Exception as e:
+            print(f"❌ {json_path.name}: {e}")
+            reports[json_path.name] = {'error': str(e)}
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Rapport écrit: {args.json}")
+
+    return 0 if all('error' not in r for r in reports.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
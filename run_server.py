@@ -0,0 +1,65 @@
+#!/usr/bin/env python3
+"""
+Serveur de parties multi-joueurs (asyncio, TCP ou socket Unix)
+Chaque connexion joue sa propre partie; les scénarios sont chargés une seule fois
+
+Usage:
+    python run_server.py --all --port 7777
+    python run_server.py data/scenes/chasse_gobelins.json --unix /tmp/dnd.sock
+    python play_client.py --sessions 200 --concurrency 50    # joueurs simulés
+"""
+
+import argparse
+import asyncio
+import json
+import sys
+from pathlib import Path
+
+from src.server.game_server import GameServer
+from src.simulation.headless import list_scenario_files
+
+
+async def serve(args, files):
+    server = GameServer.from_files(files, max_sessions=args.max_sessions,
+                                   answer_timeout=args.timeout)
+    if args.unix:
+        await server.start_unix(args.unix)
+        where = args.unix
+    else:
+        await server.start_tcp(args.host, args.port)
+        where = f"{args.host}:{args.port}"
+    print(f"🎲 Serveur prêt sur {where} ({len(server.scenarios)} scénario(s))")
+
+    try:
+        while True:
+            await asyncio.sleep(args.report_every)
+            print(f"📊 {json.dumps(server.stats.snapshot(), ensure_ascii=False)}")
+    finally:
+        await server.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serveur de parties D&D 5e")
+    parser.add_argument('files', nargs='*', help="Fichiers de scénario JSON")
+    parser.add_argument('--all', action='store_true', help="Tous les fichiers de data/scenes")
+    parser.add_argument('--host', default="127.0.0.1")
+    parser.add_argument('--port', type=int, default=7777)
+    parser.add_argument('--unix', type=str, default=None, help="Socket Unix au lieu de TCP")
+    parser.add_argument('--max-sessions', type=int, default=256, help="Sessions simultanées max")
+    parser.add_argument('--timeout', type=float, default=600, help="Délai de réponse d'un joueur (s)")
+    parser.add_argument('--report-every', type=float, default=30, help="Période des statistiques (s)")
+    args = parser.parse_args()
+
+    files = list_scenario_files() if args.all else [Path(f) for f in args.files]
+    if not files:
+        parser.error("Indiquez des fichiers de scénario ou --all")
+
+    try:
+        asyncio.run(serve(args, files))
+    except KeyboardInterrupt:
+        print("\n👋 Serveur arrêté")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
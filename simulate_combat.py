@@ -0,0 +1,98 @@
+#!/usr/bin/env python3
+"""
+Simulation Monte Carlo des combats d'un scénario - équilibrage sans jouer
+Victoire, tours, HP restants et mort par personnage, XP gagnée
+
+Usage:
+    python simulate_combat.py data/scenes/oeil_de_gruumsh.json
+    python simulate_combat.py data/scenes/oeil_de_gruumsh.json --scene combat_orcs -n 20000
+    python simulate_combat.py data/scenes/oeil_de_gruumsh.json --monsters orc,orc,ogre --json report.json
+    python simulate_combat.py data/scenes/oeil_de_gruumsh.json --scene combat_orcs --trace orcs.trace
+"""
+
+import argparse
+import json
+import sys
+from contextlib import redirect_stdout
+from os import devnull
+from pathlib import Path
+
+from src.simulation.combat_simulator import simulate_encounter, combat_encounters
+
+
+def print_trace_summary(trace_path: str):
+    """Statistiques lues dans la trace binaire d'une rencontre"""
+    from src.systems.combat_trace import TraceReader
+
+    with TraceReader(trace_path) as trace:
+        combats = trace.combats()
+        print(f"   📼 Trace {trace_path}: {len(trace)} événements, {combats} combats")
+        for group, damage in trace.damage_by_group(side='character').most_common():
+            print(f"      {group}: {damage / max(combats, 1):.1f} dégâts par combat")
+        for group, rate in sorted(trace.critical_rate_by_group().items()):
+            print(f"      {group}: {rate:.1%} de critiques")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Simulation Monte Carlo des combats D&D 5e")
+    parser.add_argument('file', help="Fichier de scénario JSON (groupe et rencontres)")
+    parser.add_argument('--scene', action='append', default=None,
+                        help="Scène de combat à simuler (répétable, défaut: toutes)")
+    parser.add_argument('--monsters', type=str, default=None,
+                        help="Rencontre libre: ids de monstres séparés par des virgules")
+    parser.add_argument('-n', '--trials', type=int, default=10000, help="Combats par rencontre")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="Processus parallèles (défaut: nombre de CPU, 0 = séquentiel)")
+    parser.add_argument('--seed', type=int, default=None, help="Graine des simulations")
+    parser.add_argument('--backend', choices=['python', 'numpy'], default=None,
+                        help="Moteur de simulation (défaut: DND_COMBAT_BACKEND ou python); "
+                             "numpy ne modélise que EnhancedCombatSystem")
+    parser.add_argument('--json', type=str, default=None, help="Écrire le rapport JSON")
+    parser.add_argument('--trace', type=str, default=None,
+                        help="Trace binaire des combats (une par rencontre: <trace>.<scène>)")
+    args = parser.parse_args()
+
+    from src.scenarios.json_scenario import JsonScenario
+
+    json_path = Path(args.file)
+    with open(devnull, 'w') as sink, redirect_stdout(sink):
+        scenario = JsonScenario(str(json_path))
+        party = scenario.create_party()
+
+    if args.monsters:
+        encounters = {'custom': [m.strip() for m in args.monsters.split(',') if m.strip()]}
+    else:
+        encounters = combat_encounters(scenario.scenario_json)
+        if args.scene:
+            missing = [s for s in args.scene if s not in encounters]
+            if missing:
+                parser.error(f"Scènes de combat inconnues: {', '.join(missing)}")
+            encounters = {s: encounters[s] for s in args.scene}
+    if not encounters:
+        print(f"Aucun combat dans {json_path.name}")
+        return 0
+
+    print(f"👥 Groupe: {', '.join(f'{c.name} ({c.hit_points} HP)' for c in party)}")
+    reports = {}
+    for scene_id, monster_ids in encounters.items():
+        trace_path = None
+        if args.trace:
+            trace_path = args.trace if len(encounters) == 1 else f"{args.trace}.{scene_id}"
+        report = simulate_encounter(party, monster_ids, n=args.trials, scenario_path=str(json_path),
+                                    workers=args.workers, seed=args.seed,
+                                    backend=args.backend, trace_path=trace_path)
+        print(report.format_summary(f"{scene_id}: {', '.join(monster_ids)}"))
+        reports[scene_id] = report.to_dict()
+        if trace_path:
+            print_trace_summary(trace_path)
+
+    if args.json:
+        with open(args.json, 'w', encoding='utf-8') as f:
+            json.dump(reports, f, indent=2, ensure_ascii=False)
+        print(f"\n💾 Rapport écrit: {args.json}")
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
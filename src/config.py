@@ -45,3 +45,93 @@ class GameSettings:
             str: 'dnd_5e_core' ou 'enhanced'
         """
         return os.environ.get('DND_COMBAT_SYSTEM', 'dnd_5e_core')
+
+    @staticmethod
+    def get_combat_backend():
+        """
+        Obtenir le moteur des simulations de combat en masse (équilibrage)
+
+        Returns:
+            str: 'python' (boucle de CombatScene) ou 'numpy' (combats vectorisés par lots)
+        """
+        return os.environ.get('DND_COMBAT_BACKEND', 'python')
+
+    @staticmethod
+    def get_prefetch_hops():
+        """
+        Obtenir la distance de préchargement des combats
+
+        Returns:
+            int: Transitions max vers les combats préparés en arrière-plan (0 = désactivé)
+        """
+        try:
+            return max(0, int(os.environ.get('DND_PREFETCH_HOPS', '2')))
+        except ValueError:
+            return 2
+
+    @staticmethod
+    def get_journal_path():
+        """
+        Obtenir le fichier où enregistrer le journal de la partie
+
+        Returns:
+            str: Chemin du journal (DND_RECORD_JOURNAL), ou None si pas d'enregistrement
+        """
+        return os.environ.get('DND_RECORD_JOURNAL') or None
+
+    @staticmethod
+    def get_choice_preview_rollouts():
+        """
+        Obtenir le nombre de parties simulées par option pour l'aperçu des choix
+
+        Returns:
+            int: Parties simulées par option (DND_CHOICE_PREVIEW, 0 = aperçu désactivé)
+        """
+        try:
+            return max(0, int(os.environ.get('DND_CHOICE_PREVIEW', '0')))
+        except ValueError:
+            return 0
+
+    @staticmethod
+    def get_combat_log_level():
+        """
+        Obtenir le niveau du journal de combat structuré
+
+        Returns:
+            str: 'silent', 'summary', 'normal' ou 'verbose' (DND_COMBAT_LOG),
+                 None pour l'affichage direct historique
+        """
+        return os.environ.get('DND_COMBAT_LOG') or None
+
+    @staticmethod
+    def get_combat_log_path():
+        """
+        Obtenir le fichier JSONL où exporter les événements de combat
+
+        Returns:
+            str: Chemin (DND_COMBAT_LOG_JSONL), ou None si pas d'export
+        """
+        return os.environ.get('DND_COMBAT_LOG_JSONL') or None
+
+    @staticmethod
+    def get_combat_trace_path():
+        """
+        Obtenir le fichier de la trace binaire des combats (analyse statistique)
+
+        Returns:
+            str: Chemin (DND_COMBAT_TRACE), ou None si pas de trace
+        """
+        return os.environ.get('DND_COMBAT_TRACE') or None
+
+    @staticmethod
+    def get_session_seed():
+        """
+        Obtenir la graine de session des flux aléatoires (combats, trésors)
+
+        Returns:
+            int: Graine (DND_SEED), ou None pour le random global historique
+        """
+        try:
+            return int(os.environ['DND_SEED'])
+        except (KeyError, ValueError):
+            return None
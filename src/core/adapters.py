@@ -8,6 +8,9 @@ from dnd_5e_core import Character, Monster
 from dnd_5e_core.equipment import Weapon, Armor, Equipment
 from dnd_5e_core.spells import Spell
 
+from ..utils.dice import roll
+from .combat_profile import invalidate_combat_profile
+
 
 class CharacterExtensions:
     """
@@ -39,6 +42,7 @@ class CharacterExtensions:
         character.equipped_weapon = weapon
         if weapon in character.inventory_items:
             character.inventory_items.remove(weapon)
+        invalidate_combat_profile(character)
 
     @staticmethod
     def equip_armor(character: Character, armor: Armor):
@@ -58,6 +62,7 @@ class CharacterExtensions:
             character._custom_armor_class = armor.armor_class.base
         else:
             character._custom_armor_class = armor.armor_class
+        invalidate_combat_profile(character)
 
     @staticmethod
     def get_armor_class(character: Character) -> int:
@@ -109,6 +114,7 @@ class CharacterExtensions:
         """Utiliser emplacement de sort"""
         if CharacterExtensions.can_cast_spell(character, spell_level):
             character.spell_slots_current[spell_level] -= 1
+            invalidate_combat_profile(character)
             return True
         return False
 
@@ -117,6 +123,7 @@ class CharacterExtensions:
         """Repos long - restaure HP et sorts"""
         character.hit_points = character.max_hit_points
         character.spell_slots_current = CharacterExtensions.init_spell_slots(character)
+        invalidate_combat_profile(character)
 
 
 class Potion:
@@ -136,17 +143,7 @@ class Potion:
 
     def use(self) -> int:
         """Utiliser la potion et retourner valeur effet"""
-        import random
-
-        if '+' in self.effect_value:
-            dice, bonus = self.effect_value.split('+')
-            num, sides = map(int, dice.split('d'))
-            return sum(random.randint(1, sides) for _ in range(num)) + int(bonus)
-        elif 'd' in self.effect_value:
-            num, sides = map(int, self.effect_value.split('d'))
-            return sum(random.randint(1, sides) for _ in range(num))
-        else:
-            return int(self.effect_value)
+        return roll(self.effect_value)
 
     def __str__(self):
         return f"{self.name} ({self.value} po)"
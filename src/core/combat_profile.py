@@ -0,0 +1,179 @@
+"""
+Combat Profile - capacités de combat d'un personnage, calculées une fois
+Bonus d'attaque, dés de dommages, arme et sorts de soin disponibles,
+mis en cache sur le personnage jusqu'à invalidation explicite (équipement,
+emplacement de sort utilisé, repos, montée de niveau). Les potions ne sont
+pas en cache: l'inventaire est modifié en trop d'endroits (marchands, trésors)
+"""
+
+from typing import Tuple
+
+from ..utils.dice import parse_dice, DiceError
+
+# Attribut du personnage qui porte le profil en cache
+_PROFILE_ATTRIBUTE = '_combat_profile'
+
+
+def character_attack_bonus(character) -> int:
+    """
+    Bonus d'attaque D&D 5e: FOR (DEX pour les roublards) + maîtrise
+    Partagé avec le moteur de combat par lots (batch_combat)
+    """
+    str_mod = (character.abilities.str - 10) // 2
+    dex_mod = (character.abilities.dex - 10) // 2
+
+    # Choisir STR ou DEX selon la classe
+    attack_bonus = str_mod
+    if hasattr(character, 'class_type') and 'rogue' in character.class_type.index.lower():
+        attack_bonus = dex_mod
+
+    return attack_bonus + character.level // 4 + 2  # Bonus de maîtrise
+
+
+def character_damage_profile(character) -> Tuple[str, int, str]:
+    """
+    Dés de dommages, modificateur et nom de l'arme d'un personnage
+    Utilise l'arme équipée si disponible, sinon l'arme typique de la classe
+
+    Returns:
+        (dés "XdY", modificateur de caractéristique, nom de l'arme)
+    """
+    # Modificateurs d'aptitudes
+    str_mod = (character.abilities.str - 10) // 2
+    dex_mod = (character.abilities.dex - 10) // 2
+
+    # Déterminer l'arme et le modificateur
+    damage_dice = "1d4"  # Par défaut (coup de poing)
+    ability_mod = str_mod
+    weapon_name = "poing"
+
+    # ✅ PRIORITÉ 1: Utiliser l'arme équipée si elle existe
+    if hasattr(character, 'weapon') and character.weapon:
+        weapon = character.weapon
+        weapon_name = weapon.name
+
+        # Extraire les dés de dommages de l'arme
+        if hasattr(weapon, 'damage_dice'):
+            if hasattr(weapon.damage_dice, 'dd'):
+                damage_dice = weapon.damage_dice.dd
+            else:
+                damage_dice = str(weapon.damage_dice)
+
+        # Utiliser FOR pour armes de mêlée, DEX pour armes à distance/finesse
+        if hasattr(weapon, 'range_type'):
+            from dnd_5e_core.equipment import RangeType
+            if weapon.range_type == RangeType.RANGED:
+                ability_mod = dex_mod
+            else:
+                ability_mod = str_mod
+        elif hasattr(weapon, 'properties'):
+            # Vérifier si l'arme a la propriété "finesse"
+            if any(hasattr(p, 'index') and p.index == 'finesse' for p in weapon.properties):
+                ability_mod = max(str_mod, dex_mod)  # Finesse = choisir le meilleur
+            else:
+                ability_mod = str_mod
+        else:
+            ability_mod = str_mod
+
+    # PRIORITÉ 2: Fallback selon la classe si pas d'arme équipée
+    elif hasattr(character, 'class_type'):
+        class_name = character.class_type.index.lower()
+
+        if 'fighter' in class_name or 'paladin' in class_name:
+            damage_dice = "1d8"  # Épée longue
+            ability_mod = str_mod
+            weapon_name = "épée longue"
+        elif 'rogue' in class_name or 'ranger' in class_name:
+            damage_dice = "1d6"  # Épée courte/arc
+            ability_mod = dex_mod
+            weapon_name = "épée courte"
+        elif 'cleric' in class_name:
+            damage_dice = "1d6"  # Masse d'armes
+            ability_mod = str_mod
+            weapon_name = "masse d'armes"
+        elif 'wizard' in class_name or 'sorcerer' in class_name:
+            damage_dice = "1d4"  # Dague
+            ability_mod = dex_mod
+            weapon_name = "dague"
+
+    return damage_dice, ability_mod, weapon_name
+
+
+def _weapon_label(character) -> str:
+    """Nom de l'arme dans les messages de combat"""
+    if hasattr(character, 'weapon') and character.weapon:
+        return character.weapon.name.lower()
+    if hasattr(character, 'class_type'):
+        class_name = character.class_type.index.lower()
+        if 'fighter' in class_name or 'paladin' in class_name:
+            return "son épée"
+        elif 'rogue' in class_name:
+            return "sa dague"
+        elif 'cleric' in class_name:
+            return "sa masse"
+        elif 'wizard' in class_name:
+            return "son bâton"
+    return "ses poings"
+
+
+def _healing_spells(character) -> tuple:
+    """Sorts de soin appris dont un emplacement est encore disponible"""
+    if not (hasattr(character, 'is_spell_caster') and character.is_spell_caster):
+        return ()
+    if not (hasattr(character, 'sc') and hasattr(character.sc, 'learned_spells')):
+        return ()
+    return tuple(s for s in character.sc.learned_spells
+                 if hasattr(s, 'heal_at_slot_level') and s.heal_at_slot_level
+                 and character.sc.spell_slots[s.level - 1] > 0)
+
+
+class CombatProfile:
+    """Capacités de combat figées d'un personnage (voir combat_profile)"""
+
+    __slots__ = ('attack_bonus', 'damage', 'ability_mod', 'weapon_name', 'weapon_label',
+                 'healing_spells')
+
+    def __init__(self, character):
+        damage_dice, ability_mod, weapon_name = character_damage_profile(character)
+        try:
+            damage = parse_dice(damage_dice)
+        except DiceError:
+            damage = parse_dice("1d6")
+
+        self.attack_bonus = character_attack_bonus(character)
+        self.damage = damage
+        self.ability_mod = ability_mod
+        self.weapon_name = weapon_name
+        self.weapon_label = _weapon_label(character)
+        self.healing_spells = _healing_spells(character)
+
+    def roll_damage(self, rng=None) -> int:
+        """Dommages d'une attaque touchée (minimum 1)"""
+        return max(1, self.damage.roll(rng) + self.ability_mod)
+
+    def __repr__(self) -> str:
+        return (f"CombatProfile(+{self.attack_bonus}, {self.damage.text}+{self.ability_mod} "
+                f"{self.weapon_name}, soins={len(self.healing_spells)})")
+
+
+def combat_profile(character) -> CombatProfile:
+    """Profil de combat du personnage (calculé au premier appel puis en cache)"""
+    profile = getattr(character, _PROFILE_ATTRIBUTE, None)
+    if profile is None:
+        profile = CombatProfile(character)
+        try:
+            setattr(character, _PROFILE_ATTRIBUTE, profile)
+        except AttributeError:
+            pass  # Personnage sans attributs libres: profil recalculé à chaque tour
+    return profile
+
+
+def invalidate_combat_profile(character):
+    """
+    Oublier le profil en cache: à appeler après tout changement d'équipement,
+    d'emplacements de sorts, un repos ou une montée de niveau
+    """
+    try:
+        delattr(character, _PROFILE_ATTRIBUTE)
+    except AttributeError:
+        pass
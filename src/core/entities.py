@@ -8,6 +8,9 @@ from dataclasses import dataclass, field
 from dnd_5e_core import Character, Monster
 from dnd_5e_core.equipment import Weapon as DndWeapon, Armor as DndArmor
 
+from ..utils.dice import roll
+from .combat_profile import invalidate_combat_profile
+
 
 class Item:
     """Base class for all items"""
@@ -80,16 +83,7 @@ class Potion(Item):
 
     def use(self) -> int:
         """Use the potion and return effect value"""
-        import random
-        if '+' in self.effect_value:
-            dice, bonus = self.effect_value.split('+')
-            num, sides = map(int, dice.split('d'))
-            return sum(random.randint(1, int(sides)) for _ in range(int(num))) + int(bonus)
-        elif 'd' in self.effect_value:
-            num, sides = map(int, self.effect_value.split('d'))
-            return sum(random.randint(1, int(sides)) for _ in range(int(num)))
-        else:
-            return int(self.effect_value)
+        return roll(self.effect_value)
 
 
 class GameCharacter(Character):
@@ -129,6 +123,7 @@ class GameCharacter(Character):
         self.equipped_weapon = weapon
         if weapon in self.inventory_items:
             self.inventory_items.remove(weapon)
+        invalidate_combat_profile(self)
 
     def equip_armor(self, armor: Armor):
         """Equip armor"""
@@ -139,6 +134,7 @@ class GameCharacter(Character):
             self.inventory_items.remove(armor)
         # Update AC
         self.armor_class = armor.armor_class
+        invalidate_combat_profile(self)
 
     def add_item(self, item: Item):
         """Add item to inventory"""
@@ -174,6 +170,7 @@ class GameCharacter(Character):
         """Use a spell slot"""
         if self.can_cast_spell(spell_level):
             self.spell_slots_current[spell_level] -= 1
+            invalidate_combat_profile(self)
             return True
         return False
 
@@ -181,6 +178,7 @@ class GameCharacter(Character):
         """Long rest - restore HP and spell slots"""
         self.hit_points = self.max_hit_points
         self.spell_slots_current = self._init_spell_slots()
+        invalidate_combat_profile(self)
 
     def rest_short(self):
         """Short rest - restore some HP"""
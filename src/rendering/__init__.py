@@ -2,7 +2,7 @@
 Rendering module for game output
 """
 
-from .renderer import Renderer, ConsoleRenderer, create_renderer
+from .renderer import Renderer, ConsoleRenderer, HeadlessRenderer, create_renderer
 
-__all__ = ['Renderer', 'ConsoleRenderer', 'create_renderer']
+__all__ = ['Renderer', 'ConsoleRenderer', 'HeadlessRenderer', 'create_renderer']
 
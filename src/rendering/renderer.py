@@ -37,6 +37,10 @@ class Renderer(ABC):
         """Afficher une map"""
         pass
 
+    def pause(self, seconds: float):
+        """Pause dramatique (ignorée par les renderers non interactifs)"""
+        time.sleep(seconds)
+
 
 class ConsoleRenderer(Renderer):
     """
@@ -99,6 +103,34 @@ class ConsoleRenderer(Renderer):
         print("─" * 70 + "\n")
 
 
+class HeadlessRenderer(Renderer):
+    """
+    Renderer sans affichage ni attente
+    Les choix sont délégués à une politique (voir src.simulation.headless)
+    """
+
+    def __init__(self, policy):
+        self.policy = policy
+
+    def print_header(self, title: str):
+        pass
+
+    def print_slow(self, text: str, delay: float = 0.02):
+        pass
+
+    def wait_for_input(self, prompt: str = "\n[Appuyez sur ENTRÉE pour continuer]"):
+        pass
+
+    def get_choice(self, options: List[str]) -> int:
+        return self.policy.choose(options)
+
+    def display_map(self, map_ascii: str, player_pos: tuple = None):
+        pass
+
+    def pause(self, seconds: float):
+        pass
+
+
 def create_renderer(use_ncurses: bool = False) -> Renderer:
     """
     Factory pour créer renderer
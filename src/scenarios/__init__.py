@@ -3,6 +3,7 @@ Scenarios module - D&D 5e adventures
 """
 
 from .base_scenario import BaseScenario
+from .json_scenario import JsonScenario
 
-__all__ = ['BaseScenario']
+__all__ = ['BaseScenario', 'JsonScenario']
 
@@ -12,14 +12,24 @@ from ..utils.pdf_reader import PDFScenarioReader
 from ..utils.save_manager import SaveGameManager, JSONLoader
 from ..utils.exploration_map import ExplorationMap
 from ..utils.level_manager import LevelUpManager, VillageRestManager
-from ..utils.monster_factory import MonsterFactory
+from ..utils.monster_registry import monster_registry
 from ..scenes.scene_system import SceneManager
+from ..scenes.game_context import GameContext
 from ..rendering.renderer import create_renderer, Renderer
 from ..systems.spellcasting_v2 import SpellcastingManager
 from ..systems.merchant import MerchantSystem
 from ..config import GameSettings
 
 
+class SimpleEquipment:
+    """Équipement minimal quand Equipment de dnd_5e_core est indisponible (picklable)"""
+
+    def __init__(self, name, desc, weight=1):
+        self.name = name
+        self.desc = desc
+        self.weight = weight
+
+
 class BaseScenario(ABC):
     """
     Classe de base abstraite pour tous les scénarios
@@ -44,6 +54,7 @@ class BaseScenario(ABC):
         self.spellcasting = SpellcastingManager()
         self.merchant_system = MerchantSystem()
         self.scene_manager = SceneManager()
+        self.scenario_json_path: Optional[str] = None  # Renseigné par load_scenes_from_json
 
         # 🆕 Nouveaux systèmes
         self.save_manager = SaveGameManager()
@@ -52,190 +63,12 @@ class BaseScenario(ABC):
         self.level_manager = LevelUpManager()
         self.village_rest = VillageRestManager()
 
-        # 🆕 Monster loader depuis fichiers JSON locaux + dnd_5e_core package
-        from dnd_5e_core.data import load_monster
-        from dnd_5e_core import Monster, Abilities
-        from dnd_5e_core.combat import Action, ActionType, Damage
-        from dnd_5e_core.mechanics import DamageDice
-        from dnd_5e_core.equipment import DamageType
-        import json
-        from pathlib import Path
-
-        # Créer un wrapper pour compatibilité avec l'ancienne interface
-        class MonsterFactoryWrapper:
-            def __init__(self):
-                # Charger les monstres locaux depuis JSON
-                local_monsters_path = Path(__file__).parent.parent.parent / "data" / "monsters" / "all_monsters.json"
-                self.local_monsters = {}
-                if local_monsters_path.exists():
-                    try:
-                        with open(local_monsters_path, 'r', encoding='utf-8') as f:
-                            self.local_monsters = json.load(f)
-                    except Exception as e:
-                        print(f"⚠️ Erreur chargement monstres locaux: {e}")
-
-            def create_monster(self, monster_id: str, name: Optional[str] = None):
-                """Créer un monstre en utilisant les données locales ou dnd_5e_core.data.load_monster"""
-                # 1. Essayer d'abord les monstres locaux
-                if monster_id in self.local_monsters:
-                    return self._create_from_local(monster_id, name)
-
-                # 2. Sinon, essayer l'API dnd_5e_core
-                normalized_id = monster_id.replace('_', '-')
-                monster_data = load_monster(normalized_id)
-                if not monster_data:
-                    monster_data = load_monster(monster_id)
-
-                if monster_data:
-                    return self._create_from_api(monster_data, monster_id, name)
-
-                print(f"⚠️ Monstre non trouvé: {monster_id}")
-                return None
-
-            def _create_from_local(self, monster_id: str, name: Optional[str] = None):
-                """Créer un monstre depuis les données locales JSON"""
-                data = self.local_monsters[monster_id]
-
-                try:
-                    abilities = Abilities(
-                        str=data['abilities']['str'],
-                        dex=data['abilities']['dex'],
-                        con=data['abilities']['con'],
-                        int=data['abilities']['int'],
-                        wis=data['abilities']['wis'],
-                        cha=data['abilities']['cha']
-                    )
-
-                    # Convertir les actions
-                    actions = []
-                    for action_data in data.get('actions', []):
-                        # Ignorer les actions sans attaque (comme Multiattack)
-                        if 'attack_bonus' not in action_data:
-                            continue
-
-                        damage_type_name = action_data.get('damage_type', 'slashing')
-                        damage_type = DamageType(
-                            index=damage_type_name.lower(),
-                            name=damage_type_name.capitalize(),
-                            desc=f"{damage_type_name} damage"
-                        )
-
-                        # Parser la portée (range)
-                        range_str = action_data.get('range', '5 ft')
-                        if '/' in range_str:
-                            # Format: "80/320 ft"
-                            normal_range = int(range_str.split('/')[0].replace(' ft', '').replace('ft', '').strip())
-                        else:
-                            # Format: "5 ft" ou "5"
-                            normal_range = int(range_str.replace(' ft', '').replace('ft', '').strip())
-
-                        action = Action(
-                            name=action_data['name'],
-                            desc=action_data.get('desc', ''),
-                            type=ActionType.MELEE if normal_range <= 10 else ActionType.RANGED,
-                            attack_bonus=action_data['attack_bonus'],
-                            damages=[Damage(
-                                type=damage_type,
-                                dd=DamageDice(action_data.get('damage_dice', '1d6'))
-                            )],
-                            normal_range=normal_range
-                        )
-                        actions.append(action)
-
-                    # Extraire la vitesse
-                    speed_data = data.get('speed', {})
-                    if isinstance(speed_data, dict):
-                        walk_speed = speed_data.get('walk', '30 ft')
-                    else:
-                        walk_speed = '30 ft'
-                    speed = int(walk_speed.replace(' ft', '').replace('ft', '').strip())
-
-                    monster = Monster(
-                        index=monster_id,
-                        name=name if name else data['name'],
-                        abilities=abilities,
-                        proficiencies=[],
-                        armor_class=data['armor_class'],
-                        hit_points=data['hit_points'],
-                        hit_dice=data['hit_dice'],
-                        xp=data['xp'],
-                        speed=speed,
-                        challenge_rating=data['challenge_rating'],
-                        actions=actions
-                    )
-
-                    return monster
-
-                except Exception as e:
-                    print(f"⚠️ Erreur lors de la création du monstre local {monster_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    return None
-
-            def _create_from_api(self, monster_data: dict, monster_id: str, name: Optional[str] = None):
-                """Créer un monstre depuis les données de l'API dnd_5e_core"""
-                try:
-                    abilities = Abilities(
-                        str=monster_data.get('strength', 10),
-                        dex=monster_data.get('dexterity', 10),
-                        con=monster_data.get('constitution', 10),
-                        int=monster_data.get('intelligence', 10),
-                        wis=monster_data.get('wisdom', 10),
-                        cha=monster_data.get('charisma', 10)
-                    )
-
-                    # Convertir les actions
-                    actions = []
-                    for action_data in monster_data.get('actions', []):
-                        if 'attack_bonus' in action_data and 'damage' in action_data:
-                            damage_parts = action_data['damage'][0] if action_data['damage'] else {}
-                            damage_type_name = damage_parts.get('damage_type', {}).get('name', 'slashing')
-
-                            damage_type = DamageType(
-                                index=damage_type_name.lower(),
-                                name=damage_type_name,
-                                desc=f"{damage_type_name} damage"
-                            )
-
-                            action = Action(
-                                name=action_data.get('name', 'Attack'),
-                                desc=action_data.get('desc', ''),
-                                type=ActionType.MELEE,
-                                attack_bonus=action_data.get('attack_bonus', 0),
-                                damages=[Damage(
-                                    type=damage_type,
-                                    dd=DamageDice(damage_parts.get('damage_dice', '1d6'))
-                                )],
-                                normal_range=5
-                            )
-                            actions.append(action)
-
-                    monster = Monster(
-                        index=monster_data.get('index', monster_id),
-                        name=name if name else monster_data.get('name', 'Unknown'),
-                        abilities=abilities,
-                        proficiencies=[],
-                        armor_class=monster_data.get('armor_class', 10),
-                        hit_points=monster_data.get('hit_points', 1),
-                        hit_dice=monster_data.get('hit_dice', '1d8'),
-                        xp=monster_data.get('xp', 0),
-                        speed=monster_data.get('speed', {}).get('walk', '30 ft').replace(' ft', '').replace('ft', '').strip() if isinstance(monster_data.get('speed'), dict) else 30,
-                        challenge_rating=monster_data.get('challenge_rating', 0),
-                        actions=actions
-                    )
-
-                    return monster
-
-                except Exception as e:
-                    print(f"⚠️ Erreur lors de la création du monstre API {monster_id}: {e}")
-                    import traceback
-                    traceback.print_exc()
-                    return None
-
-        self.monster_factory = MonsterFactoryWrapper()
+        # 🆕 Monstres: registre partagé du processus (JSON locaux + dnd_5e_core, prototypes clonés)
+        self.monster_factory = monster_registry()
 
         # Données du scénario
         self.scenario_data: Optional[Dict] = None
+        self.scenario_settings: Dict = {}  # Réglages du JSON de scènes (mass_battle, formation...)
         self.party: List[Character] = []
 
         # État du jeu
@@ -272,6 +105,20 @@ class BaseScenario(ABC):
         """
         pass
 
+    def load_scenes_from_json(self, json_path) -> int:
+        """
+        Ajouter au scene_manager les scènes d'un fichier data/scenes/*.json
+        Passe par le cache des scénarios compilés: le JSON n'est re-parsé que s'il change
+
+        Returns:
+            Nombre de scènes dans le scene_manager
+        """
+        from ..scenes.scene_cache import ScenarioCache
+        self.scenario_json_path = str(json_path)
+        bundle = ScenarioCache.default().populate(self.scene_manager, str(json_path), self.monster_factory)
+        self.scenario_settings = bundle.settings
+        return len(self.scene_manager.scenes)
+
     def load_scenario_from_pdf(self):
         """Charger et analyser le PDF du scénario"""
         self.renderer.print_header(f"📖 CHARGEMENT: {self.get_scenario_name()}")
@@ -441,6 +288,14 @@ class BaseScenario(ABC):
 
         self.renderer.wait_for_input()
 
+        # 🆕 Journal de partie rejouable (DND_RECORD_JOURNAL): semer avant la création du groupe
+        journal_path = GameSettings.get_journal_path()
+        recorder = None
+        if journal_path:
+            from ..simulation.replay import SessionRecorder
+            recorder = SessionRecorder()
+            recorder.begin()
+
         # 1. Charger le PDF
         # self.load_scenario_from_pdf()
 
@@ -459,28 +314,79 @@ class BaseScenario(ABC):
         print(f"\n✨ Préparation des trésors magiques...")
         magic_items = self._create_magic_items_treasure()
 
-        # 4. Préparer le contexte de jeu
-        game_context = {
-            'party': self.party,
-            'game_state': self.game_state,
-            'renderer': self.renderer,
-            'combat_system': self.combat_system,
-            'spellcasting': self.spellcasting,
-            'merchant_system': self.merchant_system,
-            'scenario_data': self.scenario_data,
-            'weapons': weapons,        # 🆕
-            'armors': armors,          # 🆕
-            'equipments': equipments,  # 🆕
-            'potions': potions,        # 🆕
-            'magic_items': magic_items,  # 🆕 NEW: Magic items treasures
-            'scenario': self           # 🆕 Pour permettre la sauvegarde depuis les scènes
-        }
+        # 4. Préparer le contexte de jeu (GameContext: slots typés + accès type dict)
+        game_context = GameContext(
+            party=self.party,
+            game_state=self.game_state,
+            renderer=self.renderer,
+            combat_system=self.combat_system,
+            spellcasting=self.spellcasting,
+            merchant_system=self.merchant_system,
+            scenario_data=self.scenario_data,
+            scenario_settings=self.scenario_settings,
+            weapons=weapons,        # 🆕
+            armors=armors,          # 🆕
+            equipments=equipments,  # 🆕
+            potions=potions,        # 🆕
+            magic_items=magic_items,  # 🆕 NEW: Magic items treasures
+            scenario=self           # 🆕 Pour permettre la sauvegarde depuis les scènes
+        )
 
         # 5. Lancer le scénario
         self.renderer.print_header("🎬 DÉBUT DE L'AVENTURE")
         self.renderer.wait_for_input()
 
-        self.scene_manager.run(game_context, start_scene_id=self.get_start_scene_id())
+        # Les combats proches sont préparés en arrière-plan pendant la narration
+        self.scene_manager.enable_prefetch(GameSettings.get_prefetch_hops())
+
+        # 🆕 Journal de combat structuré (DND_COMBAT_LOG, export DND_COMBAT_LOG_JSONL,
+        # trace binaire DND_COMBAT_TRACE)
+        log_level = GameSettings.get_combat_log_level()
+        log_path = GameSettings.get_combat_log_path()
+        trace_path = GameSettings.get_combat_trace_path()
+        trace = None
+        if log_level or log_path or trace_path:
+            from ..systems.combat_log import CombatLog, LogLevel
+            if trace_path:
+                from ..systems.combat_trace import CombatTrace
+                trace = CombatTrace(trace_path)
+            level = LogLevel.from_name(log_level) if log_level else LogLevel.NORMAL
+            game_context['combat_log'] = CombatLog(level, jsonl_path=log_path, trace=trace)
+
+        # 🆕 Flux aléatoires par combat et par trésor dérivés de DND_SEED (parties reproductibles)
+        session_seed = GameSettings.get_session_seed()
+        if session_seed is not None:
+            from ..utils.rng import SeedStream
+            game_context['seed_stream'] = SeedStream(session_seed)
+
+        # 🆕 Aperçu des choix par simulation (DND_CHOICE_PREVIEW parties par option)
+        previewer = None
+        preview_rollouts = GameSettings.get_choice_preview_rollouts()
+        if preview_rollouts and self.scenario_json_path:
+            from ..simulation.branch_preview import BranchPreviewer
+            previewer = BranchPreviewer(preview_rollouts, scenario_path=str(self.scenario_json_path))
+            game_context['branch_preview'] = previewer
+        if recorder and not self.scenario_json_path:
+            # Le rejeu reconstruit les scènes depuis le JSON (JsonScenario)
+            print("⚠️ Journal de partie désactivé: scènes non chargées depuis un fichier JSON")
+            recorder = None
+        if recorder:
+            recorder.journal.scenario = self.scenario_json_path
+            recorder.attach(self.scene_manager, game_context, self.get_start_scene_id())
+
+        try:
+            result = self.scene_manager.run(game_context, start_scene_id=self.get_start_scene_id())
+        finally:
+            if previewer:
+                previewer.shutdown()
+            if trace:
+                trace.close()
+
+        if recorder:
+            from ..simulation.headless import classify_outcome
+            outcome = classify_outcome(self.scene_manager, result)
+            recorder.finish(self.scene_manager, outcome).save(journal_path)
+            print(f"\n📼 Journal de partie enregistré: {journal_path}")
 
         # 6. Statistiques finales
         self.show_final_stats()
@@ -1311,12 +1217,6 @@ class BaseScenario(ABC):
             ]
         except Exception:
             # Si Equipment n'est pas disponible, créer des objets simples
-            class SimpleEquipment:
-                def __init__(self, name, desc, weight=1):
-                    self.name = name
-                    self.desc = desc
-                    self.weight = weight
-
             equipments = [
                 SimpleEquipment('Corde (15m)', 'Corde en chanvre robuste', 10),
                 SimpleEquipment('Torche', 'Torche pour éclairer', 1),
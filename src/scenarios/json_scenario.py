@@ -0,0 +1,53 @@
+"""
+Scénario générique construit depuis un fichier data/scenes/*.json
+Utilisé par les outils (headless, analyse) pour n'importe quel scénario JSON
+"""
+
+from pathlib import Path
+from typing import Dict, List
+
+from dnd_5e_core import Character
+
+from .base_scenario import BaseScenario
+from ..scenes.scene_cache import ScenarioCache
+
+
+class JsonScenario(BaseScenario):
+    """
+    Scénario piloté uniquement par son fichier JSON
+    Le groupe alterne guerriers et clercs au niveau recommandé
+    """
+
+    PARTY_NAMES = ["Grok", "Sœur Elara", "Tordek", "Jozan", "Aldric", "Lyra"]
+
+    def __init__(self, json_path: str, pdf_path: str = "", use_ncurses: bool = False):
+        self.json_path = Path(json_path)
+        bundle = ScenarioCache.default().load_bundle(str(self.json_path))
+        self.scenario_json: Dict = bundle.scenario_data
+        super().__init__(pdf_path, use_ncurses)
+        self.scenario_settings = bundle.settings
+
+    def get_scenario_name(self) -> str:
+        return self.scenario_json.get('name', self.json_path.stem)
+
+    def create_party(self) -> List[Character]:
+        """Groupe générique adapté au niveau du scénario"""
+        level = int(self.scenario_json.get('level', 1))
+        size = int(self.scenario_json.get('recommended_party_size', 2))
+
+        party = []
+        for i in range(size):
+            name = self.PARTY_NAMES[i % len(self.PARTY_NAMES)]
+            if i % 2 == 0:
+                party.append(self.create_basic_fighter(name, level=level))
+            else:
+                party.append(self.create_basic_cleric(name, level=level))
+        return party
+
+    def build_custom_scenes(self):
+        """Charger les scènes depuis le fichier JSON"""
+        self.load_scenes_from_json(self.json_path)
+
+    def get_start_scene_id(self) -> str:
+        scenes = self.scenario_json.get('scenes', [])
+        return scenes[0].get('id', 'intro') if scenes else 'intro'
@@ -8,10 +8,20 @@ from .scene_system import (
     SceneManager
 )
 from .scene_factory import SceneFactory
+from .scene_graph import SceneGraph, DanglingReference
+from .scene_cache import ScenarioCache, ScenarioBundle
+from .prefetch import EncounterPrefetcher
+from .expressions import compile_condition, compile_effects, ExpressionError
+from .game_context import GameContext, GameState
+from .formation import Formation
+from .initiative import InitiativeScheduler
 
 __all__ = [
     'SceneType', 'SceneResult', 'BaseScene', 'NarrativeScene',
     'ChoiceScene', 'CombatScene', 'MerchantScene', 'TreasureScene', 'RestScene',
-    'SceneManager', 'SceneFactory'
+    'SceneManager', 'SceneFactory', 'SceneGraph', 'DanglingReference',
+    'ScenarioCache', 'ScenarioBundle', 'EncounterPrefetcher',
+    'compile_condition', 'compile_effects', 'ExpressionError',
+    'GameContext', 'GameState', 'Formation', 'InitiativeScheduler'
 ]
 
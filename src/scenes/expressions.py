@@ -0,0 +1,315 @@
+"""
+Expressions de scénario - conditions et effets déclaratifs des choix
+Compilés une seule fois en closures sur game_context (ni eval, ni re-parsing)
+
+Conditions:  "gold >= 50 and reputation > 0", "not curse_level", "party_size in (3, 4)"
+Effets:      {"reputation": 1, "met_king": true}            (nombre: ajout, sinon: affectation)
+             ["gold -= 10", "clues = clues * 2", "ally = 'harpers'"]
+"""
+
+import operator
+import re
+from functools import lru_cache
+from typing import Any, Callable, Dict, List, Union
+
+Condition = Callable[[Dict], bool]
+Effect = Callable[[Dict], None]
+
+
+class ExpressionError(ValueError):
+    """Expression de scénario invalide"""
+    pass
+
+
+def _party_alive(game_context: Dict) -> List:
+    return [c for c in game_context.get('party', []) if getattr(c, 'hit_points', 0) > 0]
+
+
+# Variables calculées depuis le contexte (game_state est prioritaire en cas de conflit)
+CONTEXT_VARIABLES: Dict[str, Callable[[Dict], Any]] = {
+    'party_gold': lambda ctx: sum(getattr(c, 'gold', 0) for c in ctx.get('party', [])),
+    'party_size': lambda ctx: len(_party_alive(ctx)),
+    'party_level': lambda ctx: max((getattr(c, 'level', 1) for c in ctx.get('party', [])), default=0),
+    'party_hp': lambda ctx: sum(c.hit_points for c in _party_alive(ctx)),
+}
+
+_TOKEN_RE = re.compile(r"""
+    \s*(?:
+        (?P<number>\d+\.\d*|\.\d+|\d+)
+      | (?P<string>'[^']*'|"[^"]*")
+      | (?P<name>[A-Za-z_][A-Za-z0-9_]*)
+      | (?P<op>==|!=|<=|>=|\+=|-=|\*=|[<>+\-*/%(),=])
+    )""", re.VERBOSE)
+
+_KEYWORDS = {'and', 'or', 'not', 'in', 'true', 'false', 'none'}
+_CONSTANTS = {'true': True, 'false': False, 'none': None}
+
+_COMPARISONS = {
+    '==': operator.eq, '!=': operator.ne,
+    '<': operator.lt, '<=': operator.le, '>': operator.gt, '>=': operator.ge,
+}
+_ARITHMETIC = {
+    '+': operator.add, '-': operator.sub,
+    '*': operator.mul, '/': operator.truediv, '%': operator.mod,
+}
+_ASSIGNMENTS = {'+=': operator.add, '-=': operator.sub, '*=': operator.mul}
+
+
+def _tokenize(text: str) -> List[tuple]:
+    tokens = []
+    position = 0
+    text = text.rstrip()
+    while position < len(text):
+        match = _TOKEN_RE.match(text, position)
+        if not match or match.end() == position:
+            raise ExpressionError(f"Caractère inattendu en position {position}: {text!r}")
+        kind = match.lastgroup
+        value = match.group(kind)
+        if kind == 'name' and value.lower() in _KEYWORDS:
+            kind, value = 'keyword', value.lower()
+        tokens.append((kind, value))
+        position = match.end()
+    tokens.append(('end', None))
+    return tokens
+
+
+class _Parser:
+    """
+    Descente récursive, chaque règle retourne une closure ctx -> valeur
+
+    expr       := or_expr
+    or_expr    := and_expr ('or' and_expr)*
+    and_expr   := not_expr ('and' not_expr)*
+    not_expr   := 'not' not_expr | comparison
+    comparison := sum (('=='|'!='|'<'|'<='|'>'|'>='|'in'|'not' 'in') sum)*
+    sum        := term (('+'|'-') term)*
+    term       := unary (('*'|'/'|'%') unary)*
+    unary      := '-' unary | atom
+    atom       := number | string | name | constant | '(' expr (',' expr)* [','] ')'
+    """
+
+    def __init__(self, text: str):
+        self.text = text
+        self.tokens = _tokenize(text)
+        self.position = 0
+
+    def peek(self, offset: int = 0) -> tuple:
+        return self.tokens[min(self.position + offset, len(self.tokens) - 1)]
+
+    def advance(self) -> tuple:
+        token = self.tokens[self.position]
+        self.position += 1
+        return token
+
+    def accept(self, kind: str, value: str = None) -> bool:
+        token_kind, token_value = self.peek()
+        if token_kind == kind and (value is None or token_value == value):
+            self.position += 1
+            return True
+        return False
+
+    def expect(self, kind: str, value: str = None):
+        if not self.accept(kind, value):
+            found = self.peek()[1] or "fin de l'expression"
+            raise ExpressionError(f"Attendu {value or kind}, trouvé {found!r}: {self.text!r}")
+
+    def expect_end(self):
+        if self.peek()[0] != 'end':
+            raise ExpressionError(f"Élément inattendu {self.peek()[1]!r}: {self.text!r}")
+
+    def parse_expr(self) -> Callable:
+        return self.parse_or()
+
+    def parse_or(self) -> Callable:
+        operands = [self.parse_and()]
+        while self.accept('keyword', 'or'):
+            operands.append(self.parse_and())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda ctx: next((v for v in (f(ctx) for f in operands) if v), False)
+
+    def parse_and(self) -> Callable:
+        operands = [self.parse_not()]
+        while self.accept('keyword', 'and'):
+            operands.append(self.parse_not())
+        if len(operands) == 1:
+            return operands[0]
+        return lambda ctx: all(f(ctx) for f in operands)
+
+    def parse_not(self) -> Callable:
+        if self.accept('keyword', 'not'):
+            operand = self.parse_not()
+            return lambda ctx: not operand(ctx)
+        return self.parse_comparison()
+
+    def parse_comparison(self) -> Callable:
+        left = self.parse_sum()
+        while True:
+            kind, value = self.peek()
+            if kind == 'op' and value in _COMPARISONS:
+                self.advance()
+                left = self._binary(_COMPARISONS[value], left, self.parse_sum())
+            elif kind == 'keyword' and value == 'in':
+                self.advance()
+                left = self._binary(lambda a, b: a in b, left, self.parse_sum())
+            elif kind == 'keyword' and value == 'not' and self.peek(1) == ('keyword', 'in'):
+                self.position += 2
+                left = self._binary(lambda a, b: a not in b, left, self.parse_sum())
+            else:
+                return left
+
+    def parse_sum(self) -> Callable:
+        left = self.parse_term()
+        while self.peek()[0] == 'op' and self.peek()[1] in ('+', '-'):
+            left = self._binary(_ARITHMETIC[self.advance()[1]], left, self.parse_term())
+        return left
+
+    def parse_term(self) -> Callable:
+        left = self.parse_unary()
+        while self.peek()[0] == 'op' and self.peek()[1] in ('*', '/', '%'):
+            left = self._binary(_ARITHMETIC[self.advance()[1]], left, self.parse_unary())
+        return left
+
+    def parse_unary(self) -> Callable:
+        if self.accept('op', '-'):
+            operand = self.parse_unary()
+            return lambda ctx: -operand(ctx)
+        return self.parse_atom()
+
+    def parse_atom(self) -> Callable:
+        kind, value = self.advance()
+        if kind == 'number':
+            constant = float(value) if '.' in value else int(value)
+            return lambda ctx: constant
+        if kind == 'string':
+            constant = value[1:-1]
+            return lambda ctx: constant
+        if kind == 'keyword' and value in _CONSTANTS:
+            constant = _CONSTANTS[value]
+            return lambda ctx: constant
+        if kind == 'name':
+            return _variable(value)
+        if kind == 'op' and value == '(':
+            items = [self.parse_expr()]
+            is_tuple = False
+            while self.accept('op', ','):
+                is_tuple = True
+                if self.peek() == ('op', ')'):
+                    break
+                items.append(self.parse_expr())
+            self.expect('op', ')')
+            if not is_tuple:
+                return items[0]
+            return lambda ctx: tuple(f(ctx) for f in items)
+        raise ExpressionError(f"Élément inattendu {value or 'fin'!r}: {self.text!r}")
+
+    def parse_statement(self) -> Effect:
+        """statement := name ('='|'+='|'-='|'*=') expr"""
+        kind, name = self.advance()
+        if kind != 'name':
+            raise ExpressionError(f"Variable attendue en début d'effet: {self.text!r}")
+        kind, op = self.advance()
+        if kind != 'op' or (op != '=' and op not in _ASSIGNMENTS):
+            raise ExpressionError(f"Affectation attendue après {name!r}: {self.text!r}")
+        value = self.parse_expr()
+        self.expect_end()
+        read = _variable(name)
+
+        if op == '=':
+            def assign(ctx):
+                ctx['game_state'][name] = value(ctx)
+        else:
+            combine = _ASSIGNMENTS[op]
+
+            def assign(ctx):
+                ctx['game_state'][name] = combine(read(ctx), value(ctx))
+        return assign
+
+    @staticmethod
+    def _binary(function: Callable, left: Callable, right: Callable) -> Callable:
+        return lambda ctx: function(left(ctx), right(ctx))
+
+
+def _variable(name: str) -> Callable:
+    """Lecture d'une variable: game_state, puis variables calculées, sinon 0"""
+    derived = CONTEXT_VARIABLES.get(name)
+
+    def read(ctx):
+        state = ctx.get('game_state', {})
+        if name in state:
+            return state[name]
+        return derived(ctx) if derived else 0
+    return read
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(text: str) -> Condition:
+    """
+    Compiler une condition (résultat mis en cache par texte)
+
+    Raises:
+        ExpressionError: si l'expression est invalide
+    """
+    parser = _Parser(text)
+    expression = parser.parse_expr()
+    parser.expect_end()
+    return lambda ctx: bool(expression(ctx))
+
+
+@lru_cache(maxsize=1024)
+def compile_statement(text: str) -> Effect:
+    """Compiler une affectation: "gold -= 10", "met_king = true" """
+    return _Parser(text).parse_statement()
+
+
+def compile_effects(effects: Union[Dict, List[str], str, None]) -> Effect:
+    """
+    Compiler les effets d'un choix en une seule fonction
+
+    Args:
+        effects: dict {variable: valeur} (nombre ajouté, autre valeur affectée),
+                 liste d'affectations, ou une affectation seule
+
+    Raises:
+        ExpressionError: si une affectation est invalide
+    """
+    if not effects:
+        return lambda ctx: None
+
+    if isinstance(effects, str):
+        effects = [effects]
+
+    if isinstance(effects, dict):
+        items = tuple(effects.items())
+
+        def apply(ctx):
+            game_state = ctx['game_state']
+            for key, value in items:
+                if isinstance(value, (int, float)) and not isinstance(value, bool):
+                    game_state[key] = game_state.get(key, 0) + value
+                else:
+                    game_state[key] = value
+        return apply
+
+    statements = [compile_statement(statement) for statement in effects]
+
+    def apply(ctx):
+        for statement in statements:
+            statement(ctx)
+    return apply
+
+
+def check_expressions(choice: Dict) -> List[str]:
+    """Erreurs de compilation de la condition et des effets d'un choix JSON"""
+    errors = []
+    condition = choice.get('condition')
+    if isinstance(condition, str):
+        try:
+            compile_condition(condition)
+        except ExpressionError as e:
+            errors.append(str(e))
+    try:
+        compile_effects(choice.get('effects'))
+    except ExpressionError as e:
+        errors.append(str(e))
+    return errors
@@ -0,0 +1,115 @@
+"""
+Formation - ligne de front et arrière-garde du groupe pendant un combat
+Les monstres n'atteignent l'arrière-garde que lorsque la ligne de front est tombée
+"""
+
+from bisect import insort
+from typing import Dict, List, Optional
+
+# Taille de la ligne de front par défaut (les 3 premiers personnages du groupe)
+DEFAULT_FRONT_ROW = 3
+
+
+class Formation:
+    """
+    Rangs du groupe, tenus à jour au fil du combat
+
+    La position de chaque personnage est fixée à la création (ordre du
+    groupe): les front_row premiers forment la ligne de front, les autres
+    l'arrière-garde. Chaque rang garde la liste ordonnée de ses membres
+    encore debout; sync() ne déplace que les personnages tombés ou relevés
+    depuis le dernier appel.
+    """
+
+    FRONT = 0
+    BACK = 1
+
+    def __init__(self, party: List, front_row: int = DEFAULT_FRONT_ROW):
+        """
+        Args:
+            party: Groupe dans l'ordre de marche
+            front_row: Nombre de places de la ligne de front
+        """
+        self.front_row = max(1, front_row)
+        self._positions: Dict[int, int] = {}        # id(personnage) -> position
+        self._members: List = []                    # personnages par position
+        self._rows: List[int] = []                  # rang de chaque position
+        self._standing = ([], [])                   # positions debout, par rang
+        self._down = set()                          # positions à terre
+        for character in party:
+            self.add(character)
+
+    @classmethod
+    def for_scenario(cls, party: List, scenario_settings: Optional[Dict] = None) -> 'Formation':
+        """Formation avec la taille de rang du scénario ("formation": {"front_row": N})"""
+        settings = (scenario_settings or {}).get('formation') or {}
+        return cls(party, int(settings.get('front_row', DEFAULT_FRONT_ROW)))
+
+    def add(self, character, row: Optional[int] = None):
+        """
+        Ajouter un personnage (allié invoqué...) en fin de formation
+
+        Args:
+            row: Formation.FRONT / Formation.BACK, sinon selon sa position
+        """
+        if id(character) in self._positions:
+            return
+        position = len(self._members)
+        if row is None:
+            row = self.FRONT if position < self.front_row else self.BACK
+        self._positions[id(character)] = position
+        self._members.append(character)
+        self._rows.append(row)
+        if character.hit_points > 0:
+            self._standing[row].append(position)
+        else:
+            self._down.add(position)
+
+    def row_of(self, character) -> Optional[int]:
+        """Rang d'un personnage (None s'il ne fait pas partie de la formation)"""
+        position = self._positions.get(id(character))
+        return None if position is None else self._rows[position]
+
+    def drop(self, character):
+        """Un personnage tombe: il quitte son rang"""
+        position = self._positions.get(id(character))
+        if position is None or position in self._down:
+            return
+        self._standing[self._rows[position]].remove(position)
+        self._down.add(position)
+
+    def revive(self, character):
+        """Un personnage se relève: il reprend sa place dans son rang"""
+        position = self._positions.get(id(character))
+        if position is None or position not in self._down:
+            return
+        self._down.discard(position)
+        insort(self._standing[self._rows[position]], position)
+
+    def sync(self):
+        """Reporter les chutes et les relevés (points de vie) depuis le dernier appel"""
+        for line in self._standing:
+            fallen = [p for p in line if self._members[p].hit_points <= 0]
+            for position in fallen:
+                self.drop(self._members[position])
+        if self._down:
+            for position in [p for p in self._down if self._members[p].hit_points > 0]:
+                self.revive(self._members[position])
+
+    @property
+    def front(self) -> List:
+        """Ligne de front encore debout"""
+        return [self._members[p] for p in self._standing[self.FRONT]]
+
+    @property
+    def back(self) -> List:
+        """Arrière-garde encore debout"""
+        return [self._members[p] for p in self._standing[self.BACK]]
+
+    def targets(self) -> List:
+        """Personnages à portée des monstres: la ligne de front, sinon l'arrière-garde"""
+        return self.front or self.back
+
+    def __repr__(self) -> str:
+        return (f"Formation(front={[c.name for c in self.front]}, "
+                f"back={[c.name for c in self.back]})")
@@ -0,0 +1,215 @@
+"""
+Game Context - Contexte de jeu typé et compact (__slots__)
+Remplace le dict game_context tout en restant lisible comme un dict par les scènes
+"""
+
+import weakref
+from collections.abc import MutableMapping
+from typing import Any, Dict, Iterator, List, Optional
+
+
+class GameState(MutableMapping):
+    """
+    État du jeu (compteurs, drapeaux) avec copie sur écriture
+
+    fork() est en O(1): l'état dérivé partage le dict de son propriétaire
+    jusqu'à la première écriture de l'un d'eux. Le propriétaire écrit
+    toujours dans son dict (celui de BaseScenario.game_state): avant sa
+    première écriture, les états dérivés encore partagés reçoivent une copie.
+    La copie est superficielle: les valeurs mutables (listes...) doivent être
+    remplacées, pas modifiées en place.
+    """
+
+    __slots__ = ('_data', '_shared', '_owner', '_forks', '__weakref__')
+
+    def __init__(self, data: Optional[Dict] = None):
+        # Pas de copie: l'état écrit dans le dict fourni (BaseScenario.game_state)
+        self._data = data if data is not None else {}
+        self._shared = False
+        self._owner = None
+        self._forks: List[weakref.ref] = []
+
+    def fork(self) -> 'GameState':
+        owner = self._owner if self._shared else self
+        child = GameState.__new__(GameState)
+        child._data = self._data
+        child._shared = True
+        child._owner = owner
+        child._forks = []
+        if owner is not None:
+            owner._forks.append(weakref.ref(child))
+        return child
+
+    def _own(self):
+        """État dérivé: copier le dict partagé avant d'y écrire"""
+        self._data = dict(self._data)
+        self._shared = False
+        self._owner = None
+
+    def _detach_forks(self):
+        """Propriétaire: donner une copie aux états dérivés qui partagent encore son dict"""
+        snapshot = None
+        for ref in self._forks:
+            child = ref()
+            if child is not None and child._shared and child._data is self._data:
+                if snapshot is None:
+                    # Plus personne n'écrit dans cette copie: elle peut être partagée
+                    snapshot = dict(self._data)
+                child._data = snapshot
+                child._owner = None
+        self._forks.clear()
+
+    def _before_write(self):
+        if self._shared:
+            self._own()
+        elif self._forks:
+            self._detach_forks()
+
+    def __getitem__(self, key):
+        return self._data[key]
+
+    def get(self, key, default=None):
+        return self._data.get(key, default)
+
+    def __contains__(self, key) -> bool:
+        return key in self._data
+
+    def __setitem__(self, key, value):
+        self._before_write()
+        self._data[key] = value
+
+    def __delitem__(self, key):
+        self._before_write()
+        del self._data[key]
+
+    def __iter__(self) -> Iterator:
+        return iter(self._data)
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def to_dict(self) -> Dict:
+        return dict(self._data)
+
+    def __reduce__(self):
+        # Les états dérivés (weakref) restent propres au processus
+        return (GameState, (dict(self._data),))
+
+    def __repr__(self) -> str:
+        return f"GameState({self._data!r})"
+
+
+class GameContext(MutableMapping):
+    """
+    Contexte partagé par les scènes d'une partie
+
+    Les champs connus sont des slots (accès direct: ctx.renderer), les clés
+    inconnues vont dans extras. Le shim dict (ctx['renderer'], ctx.get(...),
+    'magic_items' in ctx) garde les scènes existantes compatibles: un champ
+    jamais renseigné se comporte comme une clé absente.
+    """
+
+    FIELDS = (
+        'party', 'game_state', 'renderer', 'combat_system', 'spellcasting',
+        'merchant_system', 'monster_factory', 'scenario_data', 'scenario_settings',
+        'weapons', 'armors', 'equipments', 'potions', 'magic_items', 'scenario',
+    )
+    __slots__ = FIELDS + ('extras',)
+
+    party: List
+    game_state: GameState
+    renderer: Any
+    combat_system: Any
+    spellcasting: Any
+    merchant_system: Any
+    monster_factory: Any
+    scenario_data: Dict
+    scenario_settings: Dict
+    weapons: List
+    armors: List
+    equipments: List
+    potions: List
+    magic_items: List
+    scenario: Any
+    extras: Dict[str, Any]
+
+    _FIELD_SET = frozenset(FIELDS)
+
+    def __init__(self, **values):
+        self.extras = {}
+        for key, value in values.items():
+            self[key] = value
+
+    @classmethod
+    def coerce(cls, context) -> 'GameContext':
+        """Convertir un dict game_context (ou le retourner tel quel)"""
+        if isinstance(context, GameContext):
+            return context
+        return cls(**context)
+
+    def fork(self, **overrides) -> 'GameContext':
+        """
+        Contexte dérivé pour une simulation: même systèmes et même groupe
+        (sauf override), game_state en copie sur écriture
+        """
+        child = GameContext.__new__(GameContext)
+        for key in self.FIELDS:
+            try:
+                setattr(child, key, getattr(self, key))
+            except AttributeError:
+                pass
+        child.extras = dict(self.extras)
+        if 'game_state' in self:
+            child.game_state = self.game_state.fork()
+        for key, value in overrides.items():
+            child[key] = value
+        return child
+
+    # Shim dict
+
+    def __getitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                return getattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        return self.extras[key]
+
+    def get(self, key, default=None):
+        if key in self._FIELD_SET:
+            return getattr(self, key, default)
+        return self.extras.get(key, default)
+
+    def __contains__(self, key) -> bool:
+        if key in self._FIELD_SET:
+            return hasattr(self, key)
+        return key in self.extras
+
+    def __setitem__(self, key, value):
+        if key == 'game_state' and not isinstance(value, GameState):
+            value = GameState(value)
+        if key in self._FIELD_SET:
+            setattr(self, key, value)
+        else:
+            self.extras[key] = value
+
+    def __delitem__(self, key):
+        if key in self._FIELD_SET:
+            try:
+                delattr(self, key)
+            except AttributeError:
+                raise KeyError(key) from None
+        else:
+            del self.extras[key]
+
+    def __iter__(self) -> Iterator[str]:
+        for key in self.FIELDS:
+            if hasattr(self, key):
+                yield key
+        yield from self.extras
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+    def __repr__(self) -> str:
+        return f"GameContext({', '.join(self)})"
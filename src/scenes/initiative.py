@@ -0,0 +1,169 @@
+"""
+Initiative - ordre des tours de combat (file de priorité)
+Initiative tirée (d20 + DEX), morts ignorés au passage, actions préparées
+et tours retardés
+"""
+
+import heapq
+from typing import Callable, Dict, List, Optional
+
+from ..utils.dice import get_rng
+
+
+def dexterity_modifier(combatant) -> int:
+    """Modificateur de DEX d'un personnage ou d'un monstre (0 si inconnu)"""
+    abilities = getattr(combatant, 'abilities', None)
+    dex = getattr(abilities, 'dex', None) if abilities is not None else getattr(combatant, 'dex', None)
+    if dex is None:
+        return 0
+    return (dex - 10) // 2
+
+
+class _Entry:
+    __slots__ = ('combatant', 'side', 'initiative', 'dexterity', 'order', 'removed')
+
+    def __init__(self, combatant, side: int, initiative: int, dexterity: int, order: int):
+        self.combatant = combatant
+        self.side = side
+        self.initiative = initiative
+        self.dexterity = dexterity
+        self.order = order
+        self.removed = False
+
+    def key(self) -> tuple:
+        # Initiative décroissante, puis DEX, puis personnages avant monstres
+        return (-self.initiative, -self.dexterity, self.side, self.order)
+
+
+class InitiativeScheduler:
+    """
+    Ordre de jeu d'un combat
+
+    Chaque tour de table remplit un tas avec les combattants actifs;
+    next_turn() dépile le suivant en ignorant les morts et les retirés
+    (suppression paresseuse, jamais de list.remove). Un combattant peut
+    retarder son tour (delay) ou préparer une action déclenchée par le tour
+    d'un autre (ready).
+    """
+
+    CHARACTER = 0
+    MONSTER = 1
+
+    def __init__(self, rolled: bool = True, rng=None):
+        """
+        Args:
+            rolled: Tirer l'initiative (d20 + DEX); sinon personnages puis
+                    monstres dans l'ordre d'ajout (ordre historique de CombatScene)
+            rng: Générateur des jets, par défaut celui des dés
+        """
+        self.rolled = rolled
+        self.rng = rng
+        self.round = 0
+        self.current = None
+        self._entries: Dict[int, _Entry] = {}
+        self._by_order: Dict[int, _Entry] = {}
+        self._heap: List[tuple] = []
+        self._readied: Dict[int, tuple] = {}
+
+    @classmethod
+    def for_combat(cls, characters: List, monsters: List, rolled: bool = True,
+                   rng=None) -> 'InitiativeScheduler':
+        scheduler = cls(rolled, rng)
+        for character in characters:
+            scheduler.add(character, cls.CHARACTER)
+        for monster in monsters:
+            scheduler.add(monster, cls.MONSTER)
+        return scheduler
+
+    def add(self, combatant, side: int, initiative: Optional[int] = None):
+        """
+        Ajouter un combattant (en cours de combat: il joue dès ce tour-ci
+        si son initiative n'est pas encore passée)
+        """
+        dexterity = dexterity_modifier(combatant)
+        if initiative is None:
+            initiative = (self.rng or get_rng()).randint(1, 20) + dexterity if self.rolled else 0
+        order = len(self._by_order)
+        entry = _Entry(combatant, side, initiative, dexterity if self.rolled else 0, order)
+        self._entries[id(combatant)] = entry
+        self._by_order[order] = entry
+        if self.current is not None and entry.key() > self.current.key():
+            heapq.heappush(self._heap, entry.key())
+
+    def remove(self, combatant):
+        """Retirer un combattant (effectif au moment où son tour serait dépilé)"""
+        entry = self._entries.pop(id(combatant), None)
+        if entry is not None:
+            entry.removed = True
+            self._readied.pop(id(combatant), None)
+
+    def __contains__(self, combatant) -> bool:
+        return id(combatant) in self._entries
+
+    def initiative_of(self, combatant) -> Optional[int]:
+        entry = self._entries.get(id(combatant))
+        return entry.initiative if entry else None
+
+    def side_of(self, combatant) -> Optional[int]:
+        entry = self._entries.get(id(combatant))
+        return entry.side if entry else None
+
+    def order(self) -> List:
+        """Combattants actifs dans l'ordre d'initiative"""
+        entries = sorted((e for e in self._entries.values() if self._is_active(e)), key=_Entry.key)
+        return [e.combatant for e in entries]
+
+    @staticmethod
+    def _is_active(entry: _Entry) -> bool:
+        return not entry.removed and getattr(entry.combatant, 'hit_points', 1) > 0
+
+    # Tours
+
+    def start_round(self):
+        """Nouveau tour de table: tous les combattants actifs rejouent"""
+        self.round += 1
+        self.current = None
+        self._heap = [e.key() for e in self._entries.values() if self._is_active(e)]
+        heapq.heapify(self._heap)
+
+    def next_turn(self):
+        """Combattant suivant de ce tour de table, None quand tous ont joué"""
+        while self._heap:
+            key = heapq.heappop(self._heap)
+            entry = self._by_order[key[3]]
+            # Clé périmée (tour retardé) ou combattant mort/retiré: ignoré
+            if key != entry.key() or not self._is_active(entry):
+                continue
+            self.current = entry
+            # Une action préparée expire au début du tour suivant de son auteur
+            self._readied.pop(id(entry.combatant), None)
+            return entry.combatant
+        return None
+
+    def delay(self, combatant, initiative: int):
+        """
+        Retarder le tour en cours: le combattant jouera plus tard dans ce tour
+        de table, puis à cette nouvelle initiative les tours suivants
+        """
+        entry = self._entries.get(id(combatant))
+        if entry is None or initiative >= entry.initiative:
+            return
+        entry.initiative = initiative
+        heapq.heappush(self._heap, entry.key())
+
+    def ready(self, combatant, trigger: Callable[[object], bool], action: Callable[[object], None]):
+        """
+        Préparer une action: action(acteur) sera jouée après le premier tour
+        d'un autre combattant pour lequel trigger(acteur) est vrai
+        """
+        if id(combatant) in self._entries:
+            self._readied[id(combatant)] = (combatant, trigger, action)
+
+    def after_turn(self, actor):
+        """Déclencher les actions préparées par le tour de actor"""
+        for key, (combatant, trigger, action) in list(self._readied.items()):
+            if combatant is actor or not getattr(combatant, 'hit_points', 1) > 0:
+                continue
+            if trigger(actor):
+                del self._readied[key]
+                action(actor)
@@ -0,0 +1,91 @@
+"""
+Encounter Prefetcher - Préparation des combats à venir en arrière-plan
+Pendant l'affichage d'une scène, les monstres des combats situés à moins
+de N transitions sont créés sur un thread de travail
+"""
+
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Set
+
+from .scene_system import BaseScene, ChoiceScene, CombatScene
+
+
+def scene_successors(scene: BaseScene) -> List[str]:
+    """Ids des scènes atteignables en une transition (choix et issues de combat compris)"""
+    targets = []
+    if isinstance(scene, ChoiceScene):
+        targets.extend(choice.get('next_scene') for choice in scene.choices)
+    elif isinstance(scene, CombatScene):
+        targets.extend((scene.on_victory_scene, scene.on_defeat_scene))
+    targets.append(scene.next_scene_id)
+    return [target for target in targets if target]
+
+
+class EncounterPrefetcher:
+    """
+    Précharge les ennemis des CombatScene proches de la scène courante
+    """
+
+    def __init__(self, scenes: Dict[str, BaseScene], hops: int = 2, max_workers: int = 1):
+        """
+        Args:
+            scenes: Scènes du SceneManager
+            hops: Distance max (en transitions) des combats à préparer
+            max_workers: Threads de travail (1 = factories jamais appelées en concurrence)
+        """
+        self.scenes = scenes
+        self.hops = hops
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._scheduled: Set[str] = set()
+
+    def upcoming_combats(self, scene_id: str) -> List[str]:
+        """Combats à 1..hops transitions de scene_id, du plus proche au plus lointain"""
+        seen = {scene_id}
+        combats = []
+        frontier = deque([(scene_id, 0)])
+        while frontier:
+            current, depth = frontier.popleft()
+            scene = self.scenes.get(current)
+            if scene is None or depth >= self.hops:
+                continue
+            for target in scene_successors(scene):
+                if target in seen:
+                    continue
+                seen.add(target)
+                if isinstance(self.scenes.get(target), CombatScene):
+                    combats.append(target)
+                frontier.append((target, depth + 1))
+        return combats
+
+    def schedule(self, scene_id: str, game_context: Dict):
+        """Lancer la préparation des combats proches de scene_id"""
+        upcoming = self.upcoming_combats(scene_id)
+
+        # Les combats sortis de l'horizon ne seront probablement pas joués
+        # (sauf la scène courante, qui va consommer ses ennemis préparés)
+        keep = set(upcoming)
+        keep.add(scene_id)
+        for stale in self._scheduled - keep:
+            self.scenes[stale].discard_prefetch()
+        self._scheduled &= keep
+
+        for combat_id in upcoming:
+            scene = self.scenes[combat_id]
+            if scene.has_prefetch():
+                continue
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(max_workers=self.max_workers,
+                                                    thread_name_prefix="encounter-prefetch")
+            scene.prefetch(self._executor, game_context)
+            self._scheduled.add(combat_id)
+
+    def shutdown(self):
+        """Annuler les préparations en attente et arrêter les threads"""
+        for scene_id in self._scheduled:
+            self.scenes[scene_id].discard_prefetch()
+        self._scheduled.clear()
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
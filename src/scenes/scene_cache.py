@@ -0,0 +1,146 @@
+"""
+Scenario Cache - Scénarios pré-validés et pré-compilés, gardés en mémoire
+Un fichier JSON n'est relu, re-validé et recompilé que s'il a changé
+(date de modification ou taille)
+"""
+
+import json
+import threading
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from .expressions import check_expressions
+from .scene_factory import SceneFactory
+from .scene_graph import SceneGraph
+from .scene_system import SceneManager
+
+KNOWN_SCENE_TYPES = ('narrative', 'choice', 'combat', 'merchant', 'rest')
+
+
+@dataclass
+class ScenarioBundle:
+    """Scénario validé et compilé, prêt à instancier ses scènes"""
+    source: str
+    scenario_data: Dict
+    graph: SceneGraph
+    warnings: List[str] = field(default_factory=list)
+
+    @property
+    def settings(self) -> Dict:
+        """Réglages du scénario: clés de premier niveau hors scènes (mass_battle, formation...)"""
+        return {key: value for key, value in self.scenario_data.items() if key != 'scenes'}
+
+
+def validate_scenario(scenario_data: Dict, graph: SceneGraph) -> List[str]:
+    """
+    Valider un scénario JSON
+
+    Returns:
+        Liste des avertissements (vide si le scénario est sain)
+    """
+    warnings = []
+    for i, scene_data in enumerate(scenario_data.get('scenes', [])):
+        scene_id = scene_data.get('id')
+        if not scene_id:
+            warnings.append(f"Scène #{i} sans id")
+        scene_type = scene_data.get('type')
+        if scene_type not in KNOWN_SCENE_TYPES:
+            warnings.append(f"Type de scène inconnu: {scene_id} ({scene_type})")
+        if scene_type == 'choice' and not scene_data.get('choices'):
+            warnings.append(f"Scène de choix sans choix: {scene_id}")
+        for choice in scene_data.get('choices', []) if scene_type == 'choice' else []:
+            warnings.extend(f"Expression invalide dans {scene_id}: {error}"
+                            for error in check_expressions(choice))
+        if scene_type == 'combat' and not scene_data.get('monsters'):
+            warnings.append(f"Combat sans monstres: {scene_id}")
+    warnings.extend(f"Transition invalide: {reference}" for reference in graph.dangling)
+    return warnings
+
+
+class ScenarioCache:
+    """
+    Cache des scénarios compilés du processus
+
+    Les scènes elles-mêmes sont instanciées à chaque populate(): elles ont
+    un état de partie et CombatScene garde une closure sur la factory de
+    monstres. Conditions et effets des choix sont déjà compilés une fois
+    par processus (lru_cache de expressions).
+    """
+
+    _default: Optional['ScenarioCache'] = None
+
+    def __init__(self):
+        # Chemin résolu -> ((mtime_ns, taille), bundle)
+        self._bundles: Dict[str, Tuple[Tuple[int, int], ScenarioBundle]] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    @classmethod
+    def default(cls) -> 'ScenarioCache':
+        """Cache partagé du processus"""
+        if cls._default is None:
+            cls._default = cls()
+        return cls._default
+
+    def load_bundle(self, json_path: str) -> ScenarioBundle:
+        """
+        Charger le bundle d'un scénario (compilé si le fichier a changé)
+
+        Raises:
+            FileNotFoundError: si le fichier JSON n'existe pas
+        """
+        path = Path(json_path).resolve()
+        stat = path.stat()
+        signature = (stat.st_mtime_ns, stat.st_size)
+
+        cached = self._bundles.get(str(path))
+        if cached and cached[0] == signature:
+            self.hits += 1
+            return cached[1]
+
+        self.misses += 1
+        bundle = self.compile_bundle(path, path.read_bytes())
+        for warning in bundle.warnings:
+            print(f"⚠️ {path.name}: {warning}")
+
+        with self._lock:
+            self._bundles[str(path)] = (signature, bundle)
+        return bundle
+
+    @staticmethod
+    def compile_bundle(path: Path, content: bytes) -> ScenarioBundle:
+        """Parser, compiler et valider un scénario JSON"""
+        scenario_data = json.loads(content.decode('utf-8'))
+        graph = SceneFactory.compile_scenario(scenario_data)
+        return ScenarioBundle(
+            source=str(path),
+            scenario_data=scenario_data,
+            graph=graph,
+            warnings=validate_scenario(scenario_data, graph)
+        )
+
+    def populate(self, manager: SceneManager, json_path: str, monster_factory=None) -> ScenarioBundle:
+        """Ajouter à un SceneManager existant les scènes d'un scénario"""
+        bundle = self.load_bundle(json_path)
+        for scene_data in bundle.scenario_data.get('scenes', []):
+            scene = SceneFactory.create_scene_from_dict(scene_data, monster_factory)
+            if scene:
+                manager.add_scene(scene)
+        manager.graph = bundle.graph
+        return bundle
+
+    def build_scene_manager(self, json_path: str, monster_factory=None) -> SceneManager:
+        """Construire un SceneManager complet depuis le cache"""
+        manager = SceneManager()
+        bundle = self.populate(manager, json_path, monster_factory)
+        manager.set_start_scene(bundle.graph.ids[bundle.graph.start] if len(bundle.graph) else None)
+        return manager
+
+    def clear(self) -> int:
+        """Oublier tous les bundles, retourne leur nombre"""
+        with self._lock:
+            removed = len(self._bundles)
+            self._bundles.clear()
+        return removed
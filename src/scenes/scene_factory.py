@@ -7,6 +7,8 @@ from .scene_system import (
     BaseScene, NarrativeScene, ChoiceScene, CombatScene,
     MerchantScene, RestScene, SceneManager
 )
+from .scene_graph import SceneGraph
+from .expressions import compile_condition, compile_effects, ExpressionError
 
 
 class SceneFactory:
@@ -42,11 +44,21 @@ class SceneFactory:
         elif scene_type == 'choice':
             choices = []
             for choice_data in scene_data.get('choices', []):
-                choices.append({
+                choice = {
                     'text': choice_data.get('text'),
                     'next_scene': choice_data.get('next_scene'),
-                    'effects': choice_data.get('effects', {})
-                })
+                }
+                # Conditions et effets compilés une fois au chargement
+                try:
+                    choice['effects'] = compile_effects(choice_data.get('effects'))
+                except ExpressionError as e:
+                    print(f"⚠️ Effets ignorés dans {scene_id}: {e}")
+                if choice_data.get('condition'):
+                    try:
+                        choice['condition'] = compile_condition(choice_data['condition'])
+                    except ExpressionError as e:
+                        print(f"⚠️ Condition ignorée dans {scene_id}: {e}")
+                choices.append(choice)
 
             return ChoiceScene(
                 scene_id=scene_id,
@@ -114,6 +126,11 @@ class SceneFactory:
 
         scenes_data = scenario_data.get('scenes', [])
 
+        # Compiler le graphe: les transitions cassées sont signalées dès le chargement
+        manager.graph = SceneFactory.compile_scenario(scenario_data)
+        for reference in manager.graph.dangling:
+            print(f"⚠️ Transition invalide: {reference}")
+
         # Créer toutes les scènes
         for scene_data in scenes_data:
             scene = SceneFactory.create_scene_from_dict(scene_data, monster_factory)
@@ -127,6 +144,19 @@ class SceneFactory:
 
         return manager
 
+    @staticmethod
+    def compile_scenario(scenario_data: Dict) -> SceneGraph:
+        """
+        Compiler un scénario en graphe immuable sans instancier les scènes
+
+        Args:
+            scenario_data: Données complètes du scénario
+
+        Returns:
+            Un SceneGraph (ids internés, adjacence plate, références pendantes)
+        """
+        return SceneGraph.from_json(scenario_data)
+
     @staticmethod
     def load_scenario_from_json_file(json_file_path: str, monster_factory=None) -> Optional[SceneManager]:
         """
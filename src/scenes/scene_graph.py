@@ -0,0 +1,208 @@
+"""
+Scene Graph - Forme compilée et immuable d'un scénario
+Les ids de scènes sont internés en entiers, les transitions stockées
+dans des tableaux d'adjacence plats (format CSR)
+"""
+
+import sys
+from dataclasses import dataclass
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Sequence, Tuple
+
+# Scènes ajoutées par BaseScenario.build_scenes, jamais présentes dans le JSON
+IMPLICIT_SCENES = ('game_over',)
+
+# Types d'arêtes
+EDGE_NEXT = 'next'
+EDGE_CHOICE = 'choice'
+EDGE_VICTORY = 'victory'
+EDGE_DEFEAT = 'defeat'
+
+
+@dataclass(frozen=True)
+class DanglingReference:
+    """Transition vers une scène inexistante"""
+    scene_id: str
+    kind: str
+    target: str
+
+    def __str__(self) -> str:
+        return f"{self.scene_id} --{self.kind}--> {self.target}"
+
+
+@dataclass(frozen=True)
+class SceneGraph:
+    """
+    Graphe de scènes compilé
+
+    Les arêtes du nœud i sont edge_targets[edge_offsets[i]:edge_offsets[i + 1]]
+    (edge_kinds donne le type de chaque arête, edge_labels le texte du choix)
+    """
+    ids: Tuple[str, ...]
+    index: Mapping[str, int]
+    types: Tuple[str, ...]
+    edge_offsets: Tuple[int, ...]
+    edge_targets: Tuple[int, ...]
+    edge_kinds: Tuple[str, ...]
+    edge_labels: Tuple[Optional[str], ...]
+    start: int
+    dangling: Tuple[DanglingReference, ...]
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, scene_id: str) -> bool:
+        return scene_id in self.index
+
+    @property
+    def is_valid(self) -> bool:
+        """Aucune référence pendante"""
+        return not self.dangling
+
+    def successors(self, node: int) -> Tuple[int, ...]:
+        """Indices des scènes atteignables en une transition depuis node"""
+        return self.edge_targets[self.edge_offsets[node]:self.edge_offsets[node + 1]]
+
+    def out_edges(self, node: int) -> Iterator[Tuple[int, str, Optional[str]]]:
+        """(cible, type, libellé) pour chaque arête sortante de node"""
+        for e in range(self.edge_offsets[node], self.edge_offsets[node + 1]):
+            yield self.edge_targets[e], self.edge_kinds[e], self.edge_labels[e]
+
+    def is_terminal(self, node: int) -> bool:
+        """Scène sans transition sortante"""
+        return self.edge_offsets[node] == self.edge_offsets[node + 1]
+
+    def nodes_of_type(self, scene_type: str) -> List[int]:
+        return [i for i, t in enumerate(self.types) if t == scene_type]
+
+    def __reduce__(self):
+        # MappingProxyType n'est pas picklable: l'index est reconstruit depuis ids
+        return (_restore_graph, (self.ids, self.types, self.edge_offsets, self.edge_targets,
+                                 self.edge_kinds, self.edge_labels, self.start, self.dangling))
+
+    @staticmethod
+    def compile(scene_records: Sequence[Tuple[str, str, Sequence[Tuple[str, Optional[str], Optional[str]]]]],
+                start_scene_id: Optional[str] = None,
+                implicit_scenes: Sequence[str] = IMPLICIT_SCENES) -> 'SceneGraph':
+        """
+        Compiler un graphe depuis des enregistrements normalisés
+
+        Args:
+            scene_records: [(scene_id, type, [(kind, target_id, label), ...]), ...]
+            start_scene_id: Scène de départ (première scène par défaut)
+            implicit_scenes: Scènes terminales fournies par le moteur si absentes
+
+        Returns:
+            Un SceneGraph immuable
+        """
+        # Un id dupliqué écrase le précédent dans SceneManager: même règle ici
+        records: Dict[str, Tuple[str, Sequence]] = {}
+        dangling: List[DanglingReference] = []
+        for scene_id, scene_type, edges in scene_records:
+            scene_id = sys.intern(scene_id)
+            if scene_id in records:
+                dangling.append(DanglingReference(scene_id, 'duplicate', scene_id))
+            records[scene_id] = (scene_type, edges)
+
+        ids: List[str] = list(records)
+        types: List[str] = [scene_type for scene_type, _ in records.values()]
+        index: Dict[str, int] = {scene_id: i for i, scene_id in enumerate(ids)}
+
+        referenced = {target for _, edges in records.values() for _, target, _ in edges if target}
+        for scene_id in implicit_scenes:
+            if scene_id in referenced and scene_id not in index:
+                index[scene_id] = len(ids)
+                ids.append(sys.intern(scene_id))
+                types.append('narrative')
+
+        offsets = [0]
+        targets: List[int] = []
+        kinds: List[str] = []
+        labels: List[Optional[str]] = []
+
+        for scene_id, (_, edges) in records.items():
+            for kind, target, label in edges:
+                if not target:
+                    continue
+                if target not in index:
+                    dangling.append(DanglingReference(scene_id, kind, target))
+                    continue
+                targets.append(index[target])
+                kinds.append(kind)
+                labels.append(label)
+            offsets.append(len(targets))
+
+        # Scènes implicites: terminales
+        while len(offsets) < len(ids) + 1:
+            offsets.append(len(targets))
+
+        start = index.get(start_scene_id, 0) if start_scene_id else 0
+
+        return SceneGraph(
+            ids=tuple(ids),
+            index=MappingProxyType(index),
+            types=tuple(types),
+            edge_offsets=tuple(offsets),
+            edge_targets=tuple(targets),
+            edge_kinds=tuple(kinds),
+            edge_labels=tuple(labels),
+            start=start,
+            dangling=tuple(dangling)
+        )
+
+    @staticmethod
+    def from_json(scenario_data: Dict, implicit_scenes: Sequence[str] = IMPLICIT_SCENES) -> 'SceneGraph':
+        """Compiler depuis les données JSON d'un scénario (data/scenes/*.json)"""
+        records = []
+        for scene_data in scenario_data.get('scenes', []):
+            scene_type = scene_data.get('type', '')
+            edges = []
+            if scene_type == 'choice':
+                for choice in scene_data.get('choices', []):
+                    edges.append((EDGE_CHOICE, choice.get('next_scene'), choice.get('text')))
+            elif scene_type == 'combat':
+                edges.append((EDGE_VICTORY, scene_data.get('on_victory'), None))
+                edges.append((EDGE_DEFEAT, scene_data.get('on_defeat') or 'game_over', None))
+            else:
+                edges.append((EDGE_NEXT, scene_data.get('next_scene'), None))
+            records.append((scene_data.get('id'), scene_type, edges))
+
+        start = records[0][0] if records else None
+        return SceneGraph.compile(records, start, implicit_scenes)
+
+    @staticmethod
+    def from_scene_manager(manager, implicit_scenes: Sequence[str] = IMPLICIT_SCENES) -> 'SceneGraph':
+        """Compiler depuis les scènes déjà instanciées d'un SceneManager"""
+        from .scene_system import ChoiceScene, CombatScene
+
+        records = []
+        for scene_id, scene in manager.scenes.items():
+            scene_type = type(scene).__name__.replace('Scene', '').lower()
+            edges = []
+            if isinstance(scene, ChoiceScene):
+                for choice in scene.choices:
+                    edges.append((EDGE_CHOICE, choice.get('next_scene'), choice.get('text')))
+            elif isinstance(scene, CombatScene):
+                edges.append((EDGE_VICTORY, scene.on_victory_scene, None))
+                edges.append((EDGE_DEFEAT, scene.on_defeat_scene or 'game_over', None))
+            else:
+                edges.append((EDGE_NEXT, scene.next_scene_id, None))
+            records.append((scene_id, scene_type, edges))
+
+        return SceneGraph.compile(records, manager.current_scene_id, implicit_scenes)
+
+
+def _restore_graph(ids, types, edge_offsets, edge_targets, edge_kinds, edge_labels, start, dangling) -> SceneGraph:
+    """Reconstruire un SceneGraph dépicklé"""
+    ids = tuple(sys.intern(scene_id) for scene_id in ids)
+    return SceneGraph(
+        ids=ids,
+        index=MappingProxyType({scene_id: i for i, scene_id in enumerate(ids)}),
+        types=types,
+        edge_offsets=edge_offsets,
+        edge_targets=edge_targets,
+        edge_kinds=edge_kinds,
+        edge_labels=edge_labels,
+        start=start,
+        dangling=dangling
+    )
@@ -4,9 +4,20 @@ Permet de factoriser les scènes de jeu
 """
 
 from abc import ABC, abstractmethod
+from concurrent.futures import Executor, Future
+from contextlib import nullcontext
 from typing import List, Dict, Optional, Callable
 from enum import Enum
-import time
+
+from .expressions import compile_condition, compile_effects
+from .formation import Formation
+from .initiative import InitiativeScheduler
+from ..utils.dice import get_rng
+from ..utils.rng import context_rng, context_stream, use_stream
+
+
+# Option ajoutée aux menus de choix en mode interactif (pas un choix du scénario)
+SAVE_OPTION = "💾 Sauvegarder la partie"
 
 
 class SceneType(Enum):
@@ -116,8 +127,8 @@ class ChoiceScene(BaseScene):
             {
                 'text': "Texte du choix",
                 'next_scene': "scene_id",
-                'effects': {'reputation': +1},  # optionnel
-                'condition': lambda ctx: True   # optionnel
+                'effects': {'reputation': +1},  # optionnel (ou ["gold -= 10"], voir expressions)
+                'condition': lambda ctx: True   # optionnel (ou "gold >= 50 and reputation > 0")
             }
         ]
         """
@@ -136,8 +147,10 @@ class ChoiceScene(BaseScene):
         choice_mapping = []
 
         for i, choice in enumerate(self.choices):
-            condition = choice.get('condition', lambda ctx: True)
-            if condition(game_context):
+            condition = choice.get('condition')
+            if isinstance(condition, str):
+                condition = compile_condition(condition)
+            if condition is None or condition(game_context):
                 available_choices.append(choice['text'])
                 choice_mapping.append(i)
 
@@ -145,10 +158,17 @@ class ChoiceScene(BaseScene):
             print("Aucun choix disponible!")
             return SceneResult.FAILURE
 
+        # 🆕 Aperçu des conséquences (survie, XP) simulé pour chaque option
+        previewer = game_context.get('branch_preview')
+        if previewer:
+            estimates = previewer.preview([(i, self.choices[i]) for i in choice_mapping], game_context)
+            available_choices = [f"{text}  [{estimate.label()}]"
+                                 for text, estimate in zip(available_choices, estimates)]
+
         # 🆕 Ajouter option de sauvegarde seulement si mode interactif
         from ..config import GameSettings
         if not GameSettings.is_auto_save_enabled():
-            available_choices.append("💾 Sauvegarder la partie")
+            available_choices.append(SAVE_OPTION)
             save_option_added = True
         else:
             save_option_added = False
@@ -187,15 +207,11 @@ class ChoiceScene(BaseScene):
         self.on_exit(game_context)
         return SceneResult.CONTINUE
 
-    def _apply_effects(self, effects: Dict, game_context: Dict):
-        """Appliquer effets du choix"""
-        game_state = game_context['game_state']
-
-        for key, value in effects.items():
-            if key in game_state:
-                game_state[key] += value
-            else:
-                game_state[key] = value
+    def _apply_effects(self, effects, game_context: Dict):
+        """Appliquer effets du choix (déjà compilés par SceneFactory, ou dict/liste bruts)"""
+        if not callable(effects):
+            effects = compile_effects(effects)
+        effects(game_context)
 
 
 class CombatScene(BaseScene):
@@ -203,6 +219,10 @@ class CombatScene(BaseScene):
     Scène de combat
     """
 
+    MAX_ROUNDS = 50
+    # Nombre de monstres à partir duquel le mode "mass_battle" d'un scénario s'applique
+    MASS_BATTLE_MIN = 12
+
     def __init__(self, scene_id: str, title: str, description: str,
                  enemies_factory: Callable,
                  on_victory_scene: str,
@@ -211,6 +231,29 @@ class CombatScene(BaseScene):
         self.enemies_factory = enemies_factory  # Function qui retourne liste de monstres
         self.on_victory_scene = on_victory_scene
         self.on_defeat_scene = on_defeat_scene
+        self._prefetched: Optional[Future] = None  # Ennemis préparés par EncounterPrefetcher
+
+    def prefetch(self, executor: Executor, game_context: Dict):
+        """Créer les ennemis en arrière-plan avant le début du combat"""
+        self._prefetched = executor.submit(self.enemies_factory, game_context)
+
+    def has_prefetch(self) -> bool:
+        return self._prefetched is not None
+
+    def discard_prefetch(self):
+        if self._prefetched is not None:
+            self._prefetched.cancel()
+            self._prefetched = None
+
+    def create_enemies(self, game_context: Dict) -> List:
+        """Ennemis préchargés s'ils existent, sinon créés maintenant"""
+        pending, self._prefetched = self._prefetched, None
+        if pending is not None and not pending.cancelled():
+            try:
+                return pending.result()
+            except Exception as e:
+                print(f"⚠️ Préchargement des ennemis échoué ({e}), nouvel essai")
+        return self.enemies_factory(game_context)
 
     def execute(self, game_context: Dict) -> SceneResult:
         self.on_enter(game_context)
@@ -220,7 +263,7 @@ class CombatScene(BaseScene):
             renderer.print_slow(self.description)
 
         # Créer ennemis
-        enemies = self.enemies_factory(game_context)
+        enemies = self.create_enemies(game_context)
 
         # Lancer combat
         combat_system = game_context.get('combat_system')
@@ -228,13 +271,43 @@ class CombatScene(BaseScene):
             print("❌ Système de combat non disponible!")
             return SceneResult.FAILURE
         
-        # DEBUG: Afficher quel système est utilisé
-        print(f"\n🔧 DEBUG: Système de combat = {type(combat_system).__name__}")
-
         party = game_context['party']
         alive_chars = [c for c in party if c.hit_points > 0]
         alive_monsters = enemies.copy()
 
+        # Journal de combat en mode silencieux: pas de présentation du combat
+        log = game_context.get('combat_log')
+        if log is None or log.level:
+            self._print_intro(combat_system, alive_chars, alive_monsters)
+
+        renderer.wait_for_input("\n[Combat! Appuyez sur ENTRÉE]")
+
+        # Combat loop - utilise CombatSystem correctement
+        self.run_rounds(combat_system, party, alive_chars, alive_monsters, game_context)
+
+        # Résultat
+        if alive_chars:
+            print("\n✅ VICTOIRE!")
+
+            # Récompenses
+            total_xp = sum(m.xp for m in enemies)
+            game_context['game_state']['total_xp'] = game_context['game_state'].get('total_xp', 0) + total_xp
+
+            self.next_scene_id = self.on_victory_scene
+            self.on_exit(game_context)
+            return SceneResult.SUCCESS
+        else:
+            print("\n❌ DÉFAITE!")
+            self.next_scene_id = self.on_defeat_scene
+            self.on_exit(game_context)
+            return SceneResult.FAILURE
+
+    @staticmethod
+    def _print_intro(combat_system, alive_chars: List, alive_monsters: List):
+        """Présenter les deux camps avant le combat"""
+        # DEBUG: Afficher quel système est utilisé
+        print(f"\n🔧 DEBUG: Système de combat = {type(combat_system).__name__}")
+
         # Afficher info combat
         print(f"\n⚔️  Votre groupe:")
         for char in alive_chars:
@@ -257,79 +330,183 @@ class CombatScene(BaseScene):
         for monster in alive_monsters:
             print(f"  - {monster.name}: {monster.hit_points} HP")
 
-        renderer.wait_for_input("\n[Combat! Appuyez sur ENTRÉE]")
-
-        # Combat loop - utilise CombatSystem correctement
+        # 🆕 Difficulté estimée (distributions exactes des dommages, sans simulation)
+        try:
+            from ..utils.damage_pmf import estimate_encounter, combatants_from_party, combatants_from_monsters
+            estimate = estimate_encounter(combatants_from_party(alive_chars),
+                                          combatants_from_monsters(alive_monsters))
+            print(f"\n{estimate.format_line()}")
+        except (ImportError, AttributeError):
+            pass
+
+    @classmethod
+    def run_rounds(cls, combat_system, party: List, alive_chars: List, alive_monsters: List,
+                   game_context: Dict, max_rounds: Optional[int] = None) -> int:
+        """
+        Boucle de combat dans l'ordre d'initiative, jusqu'à la fin d'un camp
+
+        alive_chars et alive_monsters sont mis à jour en place.
+        Utilisée par execute() et par le simulateur de combat (src.simulation).
+        Pendant le combat, game_context['initiative'] donne accès à l'ordre
+        de jeu (actions préparées, tours retardés). Avec une graine de session
+        (game_context['seed_stream']), les dés du combat et le random global
+        (dnd_5e_core) suivent leur propre flux.
+        Les réglages du scénario (game_context['scenario_settings']: formation,
+        mass_battle, initiative) viennent du premier niveau de son JSON.
+
+        Returns:
+            int: Nombre de tours joués
+        """
+        max_rounds = max_rounds or cls.MAX_ROUNDS
         round_num = 1
-        max_rounds = 50
-
-        while alive_chars and alive_monsters and round_num <= max_rounds:
+        settings = game_context.get('scenario_settings') or {}
+
+        # Journal structuré: rendu différé par tour (sinon affichage direct)
+        log = game_context.get('combat_log')
+        previous_log = log.attach(combat_system) if log is not None else None
+        if log is not None and log.trace is not None:
+            log.trace.begin_combat(party, alive_monsters)
+
+        # Rangs du groupe (taille de la ligne de front propre au scénario)
+        formation = Formation.for_scenario(party, settings)
+
+        # Grande bataille: monstres identiques regroupés en escouades
+        mass_battle = cls._mass_battle(alive_monsters, settings)
+        monsters = alive_monsters if mass_battle is None else mass_battle.squads + mass_battle.individuals
+
+        # Dés du combat et random global: nouveau flux de la graine de session s'il y en a une
+        with use_stream(context_stream(game_context)):
+            # Ordre de jeu: initiative tirée, sauf "initiative": false (personnages puis monstres)
+            scheduler = InitiativeScheduler.for_combat(alive_chars, monsters,
+                                                       rolled=settings.get('initiative', True))
+            game_context['initiative'] = scheduler
+            try:
+                while alive_chars and alive_monsters and round_num <= max_rounds:
+                    cls._play_round(combat_system, party, alive_chars, alive_monsters,
+                                    game_context, round_num, log, formation, mass_battle, scheduler)
+                    round_num += 1
+            finally:
+                del game_context['initiative']
+                if log is not None:
+                    log.detach(combat_system, previous_log)
+
+        return round_num - 1
+
+    @classmethod
+    def _mass_battle(cls, alive_monsters: List, scenario_settings: Optional[Dict]):
+        """
+        Résolution par escouades si le scénario l'active
+        ("mass_battle": {"min_monsters": 12, "expand_below": 3})
+        """
+        settings = (scenario_settings or {}).get('mass_battle')
+        if not settings or len(alive_monsters) < settings.get('min_monsters', cls.MASS_BATTLE_MIN):
+            return None
+        from ..systems.mass_battle import MassBattle
+        mass_battle = MassBattle(alive_monsters, expand_below=settings.get('expand_below', 3))
+        mass_battle.sync(alive_monsters)
+        return mass_battle
+
+    @staticmethod
+    def _play_round(combat_system, party: List, alive_chars: List, alive_monsters: List,
+                    game_context: Dict, round_num: int, log, formation: Formation,
+                    mass_battle, scheduler: InitiativeScheduler):
+        """Un tour de table: chaque combattant joue à son initiative"""
+        if log is not None:
+            log.start_round(round_num)
+        else:
             print(f"\n{'─' * 60}")
             print(f"  TOUR {round_num}")
             print(f"{'─' * 60}\n")
 
-            # Tours personnages
-            for char in alive_chars[:]:
-                if not alive_monsters:
-                    break
-                if char.hit_points <= 0:
-                    if char in alive_chars:
-                        alive_chars.remove(char)
-                    continue
-
-                # Appeler character_turn (même signature pour dnd_5e_core et enhanced)
-                combat_system.character_turn(
-                    character=char,
-                    alive_chars=alive_chars,
-                    alive_monsters=alive_monsters,
-                    party=party,
-                    weapons=game_context.get('weapons', []),
-                    armors=game_context.get('armors', []),
-                    equipments=game_context.get('equipments', []),
-                    potions=game_context.get('potions', [])
-                )
-
-            # Tours monstres
-            for monster in alive_monsters[:]:
-                if not alive_chars:
-                    break
-                if monster.hit_points <= 0:
-                    if monster in alive_monsters:
-                        alive_monsters.remove(monster)
-                    continue
-
-                # Limiter attaque à la ligne de front
-                char_indices = {party.index(c): c for c in alive_chars if c in party}
-                melee_chars = [c for idx, c in char_indices.items() if idx < 3]
-                ranged_chars = [c for idx, c in char_indices.items() if idx >= 3]
-                accessible_chars = melee_chars if melee_chars else ranged_chars
-
-                combat_system.monster_turn(
-                    monster=monster,
-                    alive_monsters=alive_monsters,
-                    alive_chars=accessible_chars if accessible_chars else alive_chars,
-                    party=party,
-                    round_num=round_num
-                )
-
-            round_num += 1
-
-        # Résultat
-        if alive_chars:
-            print("\n✅ VICTOIRE!")
-
-            # Récompenses
-            total_xp = sum(m.xp for m in enemies)
-            game_context['game_state']['total_xp'] = game_context['game_state'].get('total_xp', 0) + total_xp
-
-            self.next_scene_id = self.on_victory_scene
-            self.on_exit(game_context)
-            return SceneResult.SUCCESS
-        else:
-            print("\n❌ DÉFAITE!")
-            self.next_scene_id = self.on_defeat_scene
-            self.on_exit(game_context)
-            return SceneResult.FAILURE
+        # Les morts restent dans le tas et sont ignorés quand vient leur tour
+        scheduler.start_round()
+        while alive_chars and alive_monsters:
+            actor = scheduler.next_turn()
+            if actor is None:
+                break
+            before = CombatScene._combatant_states(party, alive_monsters) if log is not None else None
+
+            # Jets d'attaque des créatures de dnd_5e_core relevés dans le journal
+            with log.attacks(actor) if log is not None else nullcontext():
+                if scheduler.side_of(actor) == InitiativeScheduler.CHARACTER:
+                    # Appeler character_turn (même signature pour dnd_5e_core et enhanced)
+                    combat_system.character_turn(
+                        character=actor,
+                        alive_chars=alive_chars,
+                        alive_monsters=alive_monsters,
+                        party=party,
+                        weapons=game_context.get('weapons', []),
+                        armors=game_context.get('armors', []),
+                        equipments=game_context.get('equipments', []),
+                        potions=game_context.get('potions', [])
+                    )
+                else:
+                    # Limiter attaque à la ligne de front
+                    formation.sync()
+                    accessible_chars = formation.targets()
+
+                    if mass_battle is not None and actor in mass_battle.squads:
+                        # Escouade: toutes ses attaques d'un bloc (journalisées par l'escouade)
+                        mass_battle.squad_turn(actor, accessible_chars or alive_chars, alive_chars, log)
+                        before = None
+                    else:
+                        combat_system.monster_turn(
+                            monster=actor,
+                            alive_monsters=alive_monsters,
+                            alive_chars=accessible_chars if accessible_chars else alive_chars,
+                            party=party,
+                            round_num=round_num
+                        )
+
+            if before is not None:
+                CombatScene._log_changes(log, actor.name, before)
+
+            # Un membre d'escouade tombé est remplacé par le suivant; une
+            # escouade dissoute laisse la place à ses survivants, à son initiative
+            if mass_battle is not None:
+                for squad in mass_battle.sync(alive_monsters):
+                    initiative = scheduler.initiative_of(squad)
+                    scheduler.remove(squad)
+                    for monster in squad.members:
+                        scheduler.add(monster, InitiativeScheduler.MONSTER, initiative)
+
+            scheduler.after_turn(actor)
+
+        # Un seul nettoyage par tour plutôt qu'un list.remove par mort
+        alive_chars[:] = [c for c in alive_chars if c.hit_points > 0]
+        if mass_battle is None:
+            alive_monsters[:] = [m for m in alive_monsters if m.hit_points > 0]
+
+        if log is not None:
+            log.end_round()
+
+    @staticmethod
+    def _combatant_states(party: List, monsters: List) -> List[tuple]:
+        """HP et conditions avant un tour (événements du journal par différence)"""
+        return [(c, c.hit_points, CombatScene._condition_names(c)) for c in (*party, *monsters)]
+
+    @staticmethod
+    def _condition_names(combatant) -> frozenset:
+        conditions = getattr(combatant, 'conditions', None) or ()
+        return frozenset(c.name if hasattr(c, 'name') else str(c) for c in conditions)
+
+    @staticmethod
+    def _log_changes(log, actor: str, before: List[tuple]):
+        """Enregistrer dégâts, soins, morts et conditions causés par le tour de actor"""
+        for combatant, hit_points, conditions in before:
+            delta = combatant.hit_points - hit_points
+            if delta < 0:
+                log.damage(actor, combatant.name, -delta)
+                if hit_points > 0 >= combatant.hit_points:
+                    log.kill(combatant.name, actor)
+            elif delta > 0:
+                log.heal(combatant.name, delta, actor)
+            after = CombatScene._condition_names(combatant)
+            if after != conditions:
+                for name in after - conditions:
+                    log.condition(combatant.name, name, applied=True)
+                for name in conditions - after:
+                    log.condition(combatant.name, name, applied=False)
 
 
 class MerchantScene(BaseScene):
@@ -547,12 +724,12 @@ class TreasureScene(BaseScene):
             if available_magic_items:
                 print(f"\n✨ Magic Items trouvés:")
 
-                import random
-                # Distribuer aléatoirement
+                # Distribuer aléatoirement (flux propre au trésor si la partie a une graine)
+                rng = context_rng(game_context) or get_rng()
                 distributed = 0
                 for idx in range(min(self.magic_items_count, len(available_magic_items))):
                     magic_item = available_magic_items[idx]
-                    recipient = random.choice(party)
+                    recipient = rng.choice(party)
 
                     print(f"   🌟 {magic_item.name} ({magic_item.rarity.value}) → {recipient.name}")
 
@@ -586,7 +763,7 @@ class RestScene(BaseScene):
 
         if self.rest_type == "long":
             renderer.print_slow("Vous installez un campement pour la nuit...")
-            time.sleep(1)
+            renderer.pause(1)
 
             for char in party:
                 if char.hit_points > 0:
@@ -626,6 +803,9 @@ class SceneManager:
         self.scenes: Dict[str, BaseScene] = {}
         self.current_scene_id: Optional[str] = None
         self.history: List[str] = []
+        self.graph = None  # SceneGraph compilé (voir SceneFactory.compile_scenario)
+        self.prefetcher = None  # EncounterPrefetcher (voir enable_prefetch)
+        self.listeners: List[Callable[[str, Dict], None]] = []  # Appelés avant chaque scène
 
     def add_scene(self, scene: BaseScene):
         """Ajouter une scène"""
@@ -635,15 +815,43 @@ class SceneManager:
         """Définir scène de départ"""
         self.current_scene_id = scene_id
 
+    def compile_graph(self):
+        """Compiler (et mémoriser) le graphe des scènes déjà ajoutées"""
+        from .scene_graph import SceneGraph
+        self.graph = SceneGraph.from_scene_manager(self)
+        return self.graph
+
+    def add_listener(self, listener: Callable[[str, Dict], None]):
+        """Ajouter un observateur appelé avec (scene_id, game_context) avant chaque scène"""
+        self.listeners.append(listener)
+
+    def remove_listener(self, listener: Callable[[str, Dict], None]):
+        if listener in self.listeners:
+            self.listeners.remove(listener)
+
+    def enable_prefetch(self, hops: int = 2):
+        """Préparer en arrière-plan les combats à moins de hops transitions"""
+        from .prefetch import EncounterPrefetcher
+        if self.prefetcher is not None:
+            self.prefetcher.shutdown()
+        self.prefetcher = EncounterPrefetcher(self.scenes, hops) if hops > 0 else None
+
     def execute_scene(self, scene_id: str, game_context: Dict) -> SceneResult:
         """Exécuter une scène"""
-        if scene_id not in self.scenes:
+        scene = self.scenes.get(scene_id)
+        if scene is None:
             print(f"❌ Scène {scene_id} non trouvée!")
             return SceneResult.FAILURE
 
-        scene = self.scenes[scene_id]
         self.history.append(scene_id)
 
+        for listener in self.listeners:
+            listener(scene_id, game_context)
+
+        # Préparer les combats suivants pendant l'affichage de la scène
+        if self.prefetcher is not None:
+            self.prefetcher.schedule(scene_id, game_context)
+
         result = scene.execute(game_context)
 
         # Mettre à jour scène courante
@@ -652,35 +860,57 @@ class SceneManager:
 
         return result
 
-    def run(self, game_context: Dict, start_scene_id: Optional[str] = None):
+    def run(self, game_context: Dict, start_scene_id: Optional[str] = None,
+            max_steps: Optional[int] = None) -> Optional[SceneResult]:
         """
         Exécuter le scénario complet
         Boucle principale du jeu
+
+        Args:
+            game_context: Contexte de jeu partagé par les scènes
+            start_scene_id: Scène de départ (sinon scène courante)
+            max_steps: Nombre maximal de scènes exécutées (None = illimité)
+
+        Returns:
+            Le résultat de la dernière scène exécutée (None si aucune)
         """
         if start_scene_id:
             self.current_scene_id = start_scene_id
 
         if not self.current_scene_id:
             print("❌ Aucune scène de départ définie!")
-            return
+            return None
+
+        result = None
+        steps = 0
+        try:
+            while self.current_scene_id:
+                if max_steps is not None and steps >= max_steps:
+                    print(f"\n⚠️ Limite de {max_steps} scènes atteinte")
+                    break
 
-        while self.current_scene_id:
-            result = self.execute_scene(self.current_scene_id, game_context)
+                result = self.execute_scene(self.current_scene_id, game_context)
+                steps += 1
 
-            if result == SceneResult.EXIT:
-                print("\n" + "="*70)
-                print("🏁 Fin du scénario")
-                print("="*70)
-                break
-            elif result == SceneResult.FAILURE:
-                # Gérer échec (game over, etc.)
-                print("\n💀 Game Over")
-                break
+                if result == SceneResult.EXIT:
+                    print("\n" + "="*70)
+                    print("🏁 Fin du scénario")
+                    print("="*70)
+                    break
+                elif result == SceneResult.FAILURE:
+                    # Gérer échec (game over, etc.)
+                    print("\n💀 Game Over")
+                    break
 
-            # Si pas de prochaine scène, fin du scénario
-            if not self.current_scene_id:
-                print("\n" + "="*70)
-                print("🏁 Fin du scénario - Merci d'avoir joué!")
-                print("="*70)
-                break
+                # Si pas de prochaine scène, fin du scénario
+                if not self.current_scene_id:
+                    print("\n" + "="*70)
+                    print("🏁 Fin du scénario - Merci d'avoir joué!")
+                    print("="*70)
+                    break
+        finally:
+            # Ennemis préparés pour des combats qui ne seront pas joués
+            if self.prefetcher is not None:
+                self.prefetcher.shutdown()
 
+        return result
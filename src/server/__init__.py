@@ -0,0 +1,14 @@
+"""
+Server module - hébergement de nombreuses parties dans un seul processus
+"""
+
+from .game_server import (
+    GameServer, SharedScenario, SessionRenderer, SessionClosed, ServerStats,
+    encode_message, read_message
+)
+from .client import play_session, run_clients, fetch_stats
+
+__all__ = [
+    'GameServer', 'SharedScenario', 'SessionRenderer', 'SessionClosed', 'ServerStats',
+    'encode_message', 'read_message', 'play_session', 'run_clients', 'fetch_stats'
+]
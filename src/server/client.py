@@ -0,0 +1,127 @@
+"""
+Client local du serveur de parties - joueurs simulés pour les tests de charge
+Les choix sont faits par une ChoicePolicy (voir src.simulation.headless)
+"""
+
+import asyncio
+import time
+from collections import Counter
+from typing import Callable, Dict, Optional
+
+from .game_server import encode_message, read_message
+
+
+async def _connect(host: str, port: int, unix_path: Optional[str]):
+    if unix_path:
+        return await asyncio.open_unix_connection(unix_path)
+    return await asyncio.open_connection(host, port)
+
+
+async def play_session(policy, scenario: Optional[str] = None, host: str = "127.0.0.1",
+                       port: int = 7777, unix_path: Optional[str] = None,
+                       on_text: Optional[Callable[[str], None]] = None) -> Dict:
+    """
+    Jouer une partie complète sur le serveur
+
+    Args:
+        policy: ChoicePolicy qui répond aux choix
+        scenario: Nom du scénario (premier servi si None)
+        on_text: Callback pour le texte reçu (affichage)
+
+    Returns:
+        {'outcome', 'path', 'choices', 'round_trips' (secondes)}
+    """
+    reader, writer = await _connect(host, port, unix_path)
+    round_trips = []
+    choices = 0
+    try:
+        hello = await read_message(reader)
+        if not hello or hello.get('type') != 'hello':
+            return {'outcome': 'error', 'error': "Pas de message hello"}
+        writer.write(encode_message({'type': 'start', 'scenario': scenario}))
+        await writer.drain()
+
+        policy.reset()
+        sent_at = time.perf_counter()
+        while True:
+            message = await read_message(reader)
+            if message is None:
+                return {'outcome': 'disconnected', 'choices': choices, 'round_trips': round_trips}
+            kind = message.get('type')
+            if kind == 'text':
+                if on_text:
+                    on_text(message['text'])
+                continue
+            if kind in ('choice', 'wait'):
+                round_trips.append(time.perf_counter() - sent_at)
+            if kind == 'choice':
+                choices += 1
+                reply = {'type': 'choice', 'index': policy.choose(message['options'])}
+            elif kind == 'wait':
+                reply = {'type': 'continue'}
+            elif kind == 'end':
+                return {'outcome': message['outcome'], 'path': message.get('path', []),
+                        'choices': choices, 'round_trips': round_trips}
+            else:
+                return {'outcome': 'error', 'error': message.get('message', kind),
+                        'choices': choices, 'round_trips': round_trips}
+            writer.write(encode_message(reply))
+            await writer.drain()
+            sent_at = time.perf_counter()
+    finally:
+        writer.close()
+        try:
+            await writer.wait_closed()
+        except ConnectionError:
+            pass
+
+
+async def fetch_stats(host: str = "127.0.0.1", port: int = 7777,
+                      unix_path: Optional[str] = None) -> Dict:
+    """Demander les statistiques du serveur"""
+    reader, writer = await _connect(host, port, unix_path)
+    try:
+        await read_message(reader)
+        writer.write(encode_message({'type': 'stats'}))
+        await writer.drain()
+        return await read_message(reader) or {}
+    finally:
+        writer.close()
+
+
+async def run_clients(sessions: int, policy_factory: Callable[[int], object],
+                      concurrency: int = 50, scenario: Optional[str] = None,
+                      host: str = "127.0.0.1", port: int = 7777,
+                      unix_path: Optional[str] = None) -> Dict:
+    """
+    Lancer de nombreuses parties en parallèle
+
+    Args:
+        sessions: Nombre total de parties
+        policy_factory: Fonction (numéro de partie) -> ChoicePolicy
+        concurrency: Parties simultanées max
+
+    Returns:
+        Résumé: issues, parties/s, latence aller-retour
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one(i):
+        async with semaphore:
+            return await play_session(policy_factory(i), scenario, host, port, unix_path)
+
+    start = time.perf_counter()
+    results = await asyncio.gather(*(one(i) for i in range(sessions)))
+    elapsed = time.perf_counter() - start
+
+    round_trips = sorted(rt for result in results for rt in result.get('round_trips', []))
+    return {
+        'sessions': sessions,
+        'elapsed': round(elapsed, 3),
+        'sessions_per_second': round(sessions / elapsed, 1) if elapsed > 0 else 0.0,
+        'outcomes': dict(Counter(result['outcome'] for result in results)),
+        'round_trip_ms': {
+            'p50': round(round_trips[len(round_trips) // 2] * 1000, 3) if round_trips else 0.0,
+            'p95': round(round_trips[int(len(round_trips) * 0.95)] * 1000, 3) if round_trips else 0.0,
+        },
+    }
@@ -0,0 +1,421 @@
+"""
+Game Server - Serveur asyncio multi-sessions
+Chaque connexion (TCP ou socket Unix) reçoit son SceneManager, son game_state et son groupe.
+Les données en lecture seule (scénarios compilés, monstres, sorts) sont chargées une fois.
+
+Protocole: une ligne JSON par message
+    serveur -> client: hello, text, choice, wait, end, stats, error
+    client -> serveur: start {scenario}, choice {index 0-based}, continue, stats
+"""
+
+import asyncio
+import io
+import json
+import os
+import queue
+import sys
+import threading
+import time
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Tuple
+
+from ..rendering.renderer import Renderer
+from ..scenes.scene_system import SceneManager, SceneResult
+from ..scenes.game_context import GameContext
+
+# (SceneManager, game_context, start_scene_id) d'une nouvelle session
+SessionFactory = Callable[[], Tuple[SceneManager, Dict, Optional[str]]]
+
+
+def encode_message(message: Dict) -> bytes:
+    return (json.dumps(message, ensure_ascii=False) + "\n").encode('utf-8')
+
+
+async def read_message(reader: asyncio.StreamReader) -> Optional[Dict]:
+    """Lire un message JSON (None si la connexion est fermée)"""
+    line = await reader.readline()
+    if not line:
+        return None
+    try:
+        return json.loads(line.decode('utf-8'))
+    except ValueError:
+        return {'type': 'invalid'}
+
+
+class SessionClosed(Exception):
+    """Le joueur s'est déconnecté (ou n'a pas répondu à temps)"""
+    pass
+
+
+class _ThreadLocalStdout(io.TextIOBase):
+    """
+    sys.stdout aiguillé par thread: les print() des scènes et du combat
+    d'une session partent vers son client, le reste vers la console
+    """
+
+    def __init__(self, fallback):
+        self.fallback = fallback
+        self.local = threading.local()
+
+    def write(self, text: str) -> int:
+        target = getattr(self.local, 'target', None)
+        if target is None:
+            return self.fallback.write(text)
+        target.write_text(text)
+        return len(text)
+
+    def flush(self):
+        if getattr(self.local, 'target', None) is None:
+            self.fallback.flush()
+
+
+class ServerStats:
+    """Compteurs du serveur (partagés entre threads)"""
+
+    def __init__(self, latency_window: int = 10000):
+        self._lock = threading.Lock()
+        self.started_at = time.perf_counter()
+        self.sessions_started = 0
+        self.active = 0
+        self.peak_active = 0
+        self.steps = 0
+        self.outcomes = Counter()
+        self.latencies = deque(maxlen=latency_window)
+
+    def session_started(self):
+        with self._lock:
+            self.sessions_started += 1
+            self.active += 1
+            self.peak_active = max(self.peak_active, self.active)
+
+    def session_ended(self, outcome: str):
+        with self._lock:
+            self.active -= 1
+            self.outcomes[outcome] += 1
+
+    def record_step(self, seconds: float):
+        with self._lock:
+            self.steps += 1
+            self.latencies.append(seconds)
+
+    def snapshot(self) -> Dict:
+        with self._lock:
+            latencies = sorted(self.latencies)
+            cores = os.cpu_count() or 1
+
+            def percentile(p):
+                if not latencies:
+                    return 0.0
+                return latencies[min(len(latencies) - 1, int(p * len(latencies)))] * 1000
+
+            return {
+                'uptime': round(time.perf_counter() - self.started_at, 2),
+                'cores': cores,
+                'sessions_started': self.sessions_started,
+                'active_sessions': self.active,
+                'peak_sessions': self.peak_active,
+                'sessions_per_core': round(self.active / cores, 2),
+                'peak_sessions_per_core': round(self.peak_active / cores, 2),
+                'steps': self.steps,
+                'step_latency_ms': {
+                    'p50': round(percentile(0.50), 3),
+                    'p95': round(percentile(0.95), 3),
+                    'p99': round(percentile(0.99), 3),
+                    'max': round(latencies[-1] * 1000, 3) if latencies else 0.0,
+                },
+                'outcomes': dict(self.outcomes),
+            }
+
+
+class SessionRenderer(Renderer):
+    """
+    Renderer d'une session: exécuté sur le thread de la session,
+    il pousse les messages vers la boucle asyncio et attend les réponses du client
+
+    La latence d'une étape est le temps serveur entre une réponse du joueur
+    et la question suivante (le temps de réflexion du joueur n'est pas compté)
+    """
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, outgoing: asyncio.Queue,
+                 stats: ServerStats, answer_timeout: Optional[float] = 600):
+        self.loop = loop
+        self.outgoing = outgoing
+        self.stats = stats
+        self.answer_timeout = answer_timeout
+        self.answers: queue.Queue = queue.Queue()
+        self._buffer: List[str] = []
+        self._resumed_at = time.perf_counter()
+
+    # Côté thread de session
+
+    def write_text(self, text: str):
+        self._buffer.append(text)
+
+    def send(self, message: Dict):
+        self.flush_text()
+        self.loop.call_soon_threadsafe(self.outgoing.put_nowait, message)
+
+    def flush_text(self):
+        if self._buffer:
+            text, self._buffer = "".join(self._buffer), []
+            self.loop.call_soon_threadsafe(self.outgoing.put_nowait, {'type': 'text', 'text': text})
+
+    def _ask(self, message: Dict) -> Dict:
+        self.stats.record_step(time.perf_counter() - self._resumed_at)
+        self.send(message)
+        try:
+            answer = self.answers.get(timeout=self.answer_timeout)
+        except queue.Empty:
+            raise SessionClosed("Délai de réponse dépassé")
+        if answer is None:
+            raise SessionClosed("Joueur déconnecté")
+        self._resumed_at = time.perf_counter()
+        return answer
+
+    def print_header(self, title: str):
+        self.write_text(f"\n{'=' * 70}\n  {title}\n{'=' * 70}\n")
+
+    def print_slow(self, text: str, delay: float = 0.02):
+        self.write_text(text + "\n")
+
+    def wait_for_input(self, prompt: str = "\n[Appuyez sur ENTRÉE pour continuer]"):
+        self._ask({'type': 'wait', 'prompt': prompt})
+
+    def get_choice(self, options: List[str]) -> int:
+        while True:
+            answer = self._ask({'type': 'choice', 'options': list(options)})
+            index = answer.get('index')
+            if isinstance(index, int) and 0 <= index < len(options):
+                return index
+            self.write_text(f"Veuillez choisir entre 1 et {len(options)}\n")
+
+    def display_map(self, map_ascii: str, player_pos: tuple = None):
+        self.write_text(map_ascii + "\n")
+
+    def pause(self, seconds: float):
+        # Pas de pause côté serveur: le rythme est celui du client
+        pass
+
+
+class SharedScenario:
+    """
+    Données d'un scénario partagées par toutes ses sessions
+    Le bundle compilé (JSON parsé, graphe, expressions) et le BaseScenario
+    (monstres, sorts, marchands) sont chargés une seule fois
+    """
+
+    def __init__(self, json_path: str):
+        from ..scenarios.json_scenario import JsonScenario
+        from ..scenes.scene_cache import ScenarioCache
+        from ..simulation.headless import scenario_context_factory
+
+        self.json_path = json_path
+        self.name = Path(json_path).stem
+        self.bundle = ScenarioCache.default().load_bundle(json_path)
+        self.scenario = JsonScenario(json_path)
+        self.context_factory = scenario_context_factory(self.scenario)
+        self.start_scene_id = self.scenario.get_start_scene_id()
+
+    def new_session(self) -> Tuple[SceneManager, Dict, Optional[str]]:
+        """
+        Scènes, groupe et game_state propres à une session
+        (les scènes gardent un état d'exécution, elles ne sont pas partagées)
+        """
+        from ..scenes.scene_factory import SceneFactory
+
+        manager = SceneManager()
+        for scene_data in self.bundle.scenario_data.get('scenes', []):
+            scene = SceneFactory.create_scene_from_dict(scene_data, self.scenario.monster_factory)
+            if scene:
+                manager.add_scene(scene)
+        manager.graph = self.bundle.graph
+        return manager, self.context_factory(), self.start_scene_id
+
+
+class GameServer:
+    """
+    Serveur de parties: E/S réseau sur la boucle asyncio, boucle de scènes
+    (synchrone) de chaque session sur un thread de travail
+    """
+
+    def __init__(self, scenarios: Dict[str, SessionFactory], max_sessions: int = 256,
+                 answer_timeout: Optional[float] = 600):
+        """
+        Args:
+            scenarios: Nom du scénario -> fabrique de sessions
+            max_sessions: Sessions simultanées max (threads de travail)
+            answer_timeout: Secondes d'attente d'une réponse avant déconnexion
+        """
+        if not scenarios:
+            raise ValueError("Aucun scénario à servir")
+        self.scenarios = scenarios
+        self.max_sessions = max_sessions
+        self.answer_timeout = answer_timeout
+        self.stats = ServerStats()
+        self._executor = ThreadPoolExecutor(max_workers=max_sessions, thread_name_prefix="session")
+        self._servers: List[asyncio.AbstractServer] = []
+        self._stdout: Optional[_ThreadLocalStdout] = None
+        self._previous_auto_save: Optional[str] = None
+
+    @classmethod
+    def from_files(cls, json_paths: List[str], **kwargs) -> 'GameServer':
+        """Charger (une fois) les scénarios JSON à servir"""
+        scenarios = {}
+        for json_path in json_paths:
+            shared = SharedScenario(str(json_path))
+            scenarios[shared.name] = shared.new_session
+        return cls(scenarios, **kwargs)
+
+    async def start_tcp(self, host: str = "127.0.0.1", port: int = 7777) -> asyncio.AbstractServer:
+        self._install_process_state()
+        server = await asyncio.start_server(self.handle_connection, host, port)
+        self._servers.append(server)
+        return server
+
+    async def start_unix(self, path: str) -> asyncio.AbstractServer:
+        self._install_process_state()
+        server = await asyncio.start_unix_server(self.handle_connection, path)
+        self._servers.append(server)
+        return server
+
+    async def close(self):
+        for server in self._servers:
+            server.close()
+            await server.wait_closed()
+        self._servers.clear()
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._restore_process_state()
+
+    def _install_process_state(self):
+        """
+        Aiguiller sys.stdout par thread et forcer DND_AUTO_SAVE, une fois au démarrage
+        (boucle asyncio, avant toute session). close() rétablit les deux
+        """
+        if self._stdout is not None:
+            return
+        # Les sessions tournent en mode non interactif (pas de input() de sauvegarde)
+        self._previous_auto_save = os.environ.get('DND_AUTO_SAVE')
+        os.environ['DND_AUTO_SAVE'] = 'true'
+        self._stdout = _ThreadLocalStdout(sys.stdout)
+        sys.stdout = self._stdout
+
+    def _restore_process_state(self):
+        if self._stdout is None:
+            return
+        if sys.stdout is self._stdout:
+            sys.stdout = self._stdout.fallback
+        self._stdout = None
+        if self._previous_auto_save is None:
+            os.environ.pop('DND_AUTO_SAVE', None)
+        else:
+            os.environ['DND_AUTO_SAVE'] = self._previous_auto_save
+
+    async def handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        try:
+            writer.write(encode_message({'type': 'hello', 'scenarios': sorted(self.scenarios)}))
+            await writer.drain()
+
+            request = await read_message(reader)
+            if request is None:
+                return
+            if request.get('type') == 'stats':
+                writer.write(encode_message({'type': 'stats', **self.stats.snapshot()}))
+                await writer.drain()
+                return
+            if request.get('type') != 'start':
+                writer.write(encode_message({'type': 'error', 'message': "Message 'start' attendu"}))
+                await writer.drain()
+                return
+
+            name = request.get('scenario') or sorted(self.scenarios)[0]
+            factory = self.scenarios.get(name)
+            if factory is None:
+                writer.write(encode_message({'type': 'error', 'message': f"Scénario inconnu: {name}"}))
+                await writer.drain()
+                return
+            if self.stats.active >= self.max_sessions:
+                writer.write(encode_message({'type': 'error', 'message': "Serveur complet"}))
+                await writer.drain()
+                return
+
+            await self._run_session(factory, reader, writer)
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _run_session(self, factory: SessionFactory,
+                           reader: asyncio.StreamReader, writer: asyncio.StreamWriter):
+        loop = asyncio.get_running_loop()
+        outgoing: asyncio.Queue = asyncio.Queue()
+        renderer = SessionRenderer(loop, outgoing, self.stats, self.answer_timeout)
+
+        async def pump_outgoing():
+            while True:
+                message = await outgoing.get()
+                writer.write(encode_message(message))
+                await writer.drain()
+                if message['type'] == 'end':
+                    return
+
+        async def pump_answers():
+            while True:
+                message = await read_message(reader)
+                if message is None:
+                    renderer.answers.put(None)
+                    return
+                if message.get('type') == 'continue':
+                    renderer.answers.put({})
+                elif message.get('type') == 'choice':
+                    renderer.answers.put(message)
+
+        self.stats.session_started()
+        outcome = 'error'
+        sender = asyncio.ensure_future(pump_outgoing())
+        receiver = asyncio.ensure_future(pump_answers())
+        try:
+            outcome = await loop.run_in_executor(self._executor, self._play, factory, renderer)
+            await sender
+        except ConnectionError:
+            outcome = 'disconnected'
+        finally:
+            receiver.cancel()
+            sender.cancel()
+            self.stats.session_ended(outcome)
+
+    def _play(self, factory: SessionFactory, renderer: SessionRenderer) -> str:
+        """Boucle de scènes d'une session (thread de travail, serveur démarré)"""
+        stdout = self._stdout
+        stdout.local.target = renderer
+        manager = None
+        try:
+            manager, game_context, start_scene_id = factory()
+            game_context = GameContext.coerce(game_context)
+            game_context.renderer = renderer
+            result = manager.run(game_context, start_scene_id)
+            outcome = self._classify(manager, result)
+        except SessionClosed:
+            outcome = 'disconnected'
+        except Exception as e:
+            renderer.write_text(f"❌ Erreur serveur: {type(e).__name__}: {e}\n")
+            outcome = 'error'
+        finally:
+            stdout.local.target = None
+
+        path = list(manager.history) if manager else []
+        renderer.send({'type': 'end', 'outcome': outcome, 'path': path})
+        return outcome
+
+    @staticmethod
+    def _classify(manager: SceneManager, result: Optional[SceneResult]) -> str:
+        if result == SceneResult.EXIT:
+            return 'exit'
+        if result == SceneResult.FAILURE or (manager.history and manager.history[-1] == 'game_over'):
+            return 'defeat'
+        return 'completed'
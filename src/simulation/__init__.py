@@ -0,0 +1,26 @@
+"""
+Simulation module - parties non interactives (tests de régression, charge)
+"""
+
+from .headless import (
+    ChoicePolicy, FirstChoicePolicy, RandomChoicePolicy, WeightedChoicePolicy,
+    ScriptedChoicePolicy, ChoiceLimitReached, PlaythroughResult, BatchReport,
+    HeadlessRunner, classify_outcome, create_policy, scenario_context_factory, list_scenario_files
+)
+from .replay import (
+    SessionJournal, SessionRecorder, RecordingRenderer, ReplayResult, record, replay
+)
+from .snapshot import clone_character, clone_party
+from .branch_preview import ChoiceEstimate, BranchPreviewer, simulate_branch
+from .combat_simulator import EncounterReport, simulate_encounter, combat_encounters
+from .encounter_balancer import BalanceResult, EncounterBalancer, balance_scenario
+
+__all__ = [
+    'ChoicePolicy', 'FirstChoicePolicy', 'RandomChoicePolicy', 'WeightedChoicePolicy',
+    'ScriptedChoicePolicy', 'ChoiceLimitReached', 'PlaythroughResult', 'BatchReport',
+    'HeadlessRunner', 'classify_outcome', 'create_policy', 'scenario_context_factory', 'list_scenario_files',
+    'SessionJournal', 'SessionRecorder', 'RecordingRenderer', 'ReplayResult', 'record', 'replay',
+    'clone_character', 'clone_party', 'ChoiceEstimate', 'BranchPreviewer', 'simulate_branch',
+    'EncounterReport', 'simulate_encounter', 'combat_encounters',
+    'BalanceResult', 'EncounterBalancer', 'balance_scenario'
+]
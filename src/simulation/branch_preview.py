@@ -0,0 +1,258 @@
+"""
+Aperçu des choix - estimation des conséquences de chaque option d'une ChoiceScene
+Chaque option est jouée de nombreuses fois au hasard (Monte Carlo) sur une copie
+du groupe et de l'état du jeu; le menu affiche la survie et l'XP moyennes
+"""
+
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from ..scenes.expressions import compile_effects
+from ..scenes.game_context import GameContext
+from ..scenes.scene_system import SceneManager
+from .headless import HeadlessRunner, RandomChoicePolicy
+from .snapshot import clone_party
+
+# Clés du contexte retirées des simulations: pas de sauvegarde, pas d'aperçu récursif,
+# rien d'écrit dans le journal / la trace de la partie, flux DND_SEED de la partie intacts
+_ROLLOUT_EXCLUDED_KEYS = ('scenario', 'branch_preview', 'combat_log', 'seed_stream', 'initiative')
+
+
+@dataclass
+class ChoiceEstimate:
+    """Statistiques des parties simulées après une option"""
+    index: int
+    text: str
+    next_scene: Optional[str]
+    rollouts: int = 0
+    survivals: int = 0
+    total_xp: float = 0.0
+    outcomes: Counter = field(default_factory=Counter)
+
+    @property
+    def survival_rate(self) -> float:
+        return self.survivals / self.rollouts if self.rollouts else 0.0
+
+    @property
+    def mean_xp(self) -> float:
+        return self.total_xp / self.rollouts if self.rollouts else 0.0
+
+    def add(self, rollouts: int, survivals: int, total_xp: float, outcomes: Dict):
+        """Ajouter les résultats d'un lot de parties"""
+        self.rollouts += rollouts
+        self.survivals += survivals
+        self.total_xp += total_xp
+        self.outcomes.update(outcomes)
+
+    def label(self) -> str:
+        """Annotation affichée à côté du texte de l'option"""
+        return f"survie {self.survival_rate:.0%}, ~{self.mean_xp:.0f} XP"
+
+
+def _party_survived(party: List) -> bool:
+    return any(getattr(c, 'hit_points', 0) > 0 for c in party)
+
+
+def rollout_context(game_context) -> GameContext:
+    """
+    Contexte d'une partie simulée: groupe copié (clone_party), game_state en
+    copie sur écriture, mêmes systèmes de jeu
+    """
+    context = GameContext.coerce(game_context).fork(
+        party=clone_party(game_context.get('party', [])))
+    for key in _ROLLOUT_EXCLUDED_KEYS:
+        if key in context:
+            del context[key]
+    return context
+
+
+def simulate_branch(scene_manager: SceneManager, game_context, start_scene_id: Optional[str],
+                    rollouts: int, max_steps: int = 60,
+                    seed: Optional[int] = None) -> Tuple[int, int, float, Dict]:
+    """
+    Jouer rollouts parties aléatoires depuis start_scene_id
+
+    Le groupe est copié à chaque partie, jamais modifié. Le random global est
+    semé par seed (le combat l'utilise).
+
+    Returns:
+        (parties, survies, XP totale gagnée, {issue: nombre})
+    """
+    party = game_context.get('party', [])
+    if not start_scene_id or start_scene_id not in scene_manager.scenes:
+        # L'option termine l'aventure: issue connue sans simulation
+        outcome = 'completed' if not start_scene_id else 'missing_scene'
+        return 1, int(_party_survived(party)), 0.0, {outcome: 1}
+
+    start_xp = game_context.get('game_state', {}).get('total_xp', 0)
+    random.seed(seed)
+    runner = HeadlessRunner(
+        scene_manager,
+        policy=RandomChoicePolicy(seed),
+        context_factory=lambda: rollout_context(game_context),
+        start_scene_id=start_scene_id,
+        max_steps=max_steps,
+    )
+
+    survivals = 0
+    total_xp = 0.0
+    outcomes = Counter()
+    for _ in range(rollouts):
+        result = runner.run_once()
+        outcomes[result.outcome] += 1
+        if result.outcome != 'defeat':
+            survivals += 1
+        total_xp += result.game_state.get('total_xp', 0) - start_xp
+    return rollouts, survivals, total_xp, dict(outcomes)
+
+
+# Processus de simulation: un scénario construit une fois par processus
+_worker_scenario = None
+
+
+def _init_worker(scenario_path: str):
+    global _worker_scenario
+    from ..scenarios.json_scenario import JsonScenario
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        _worker_scenario = JsonScenario(scenario_path)
+        _worker_scenario.build_custom_scenes()
+
+
+def _simulate_in_worker(start_scene_id: Optional[str], party: List, game_state: Dict,
+                        rollouts: int, max_steps: int, seed: int) -> Tuple[int, int, float, Dict]:
+    scenario = _worker_scenario
+    context = GameContext(
+        party=party,
+        game_state=game_state,
+        combat_system=scenario.combat_system,
+        spellcasting=scenario.spellcasting,
+        merchant_system=scenario.merchant_system,
+        monster_factory=scenario.monster_factory,
+        scenario_data=scenario.scenario_data,
+        scenario_settings=scenario.scenario_settings,
+        weapons=[], armors=[], equipments=[], potions=[],
+    )
+    return simulate_branch(scenario.scene_manager, context, start_scene_id,
+                           rollouts, max_steps, seed)
+
+
+class BranchPreviewer:
+    """
+    Estime survie et XP de chaque option d'un menu de choix
+
+    Deux modes:
+    - processus (scenario_path + workers > 0): chaque processus construit les
+      scènes du JSON une fois; le groupe n'est sérialisé qu'une fois par lot,
+      puis copié à chaque partie avec clone_party
+    - local (scene_manager_factory, ou workers=0): simulation dans ce processus
+      sur un SceneManager dédié (les scènes ont un état, celui du jeu n'est pas
+      partagé). Le random global et l'environnement sont restaurés ensuite.
+    """
+
+    def __init__(self, rollouts: int = 100, max_steps: int = 60,
+                 scenario_path: Optional[str] = None,
+                 scene_manager_factory: Optional[Callable[[], SceneManager]] = None,
+                 workers: Optional[int] = None, seed: Optional[int] = None):
+        """
+        Args:
+            rollouts: Parties simulées par option
+            max_steps: Scènes max par partie simulée
+            scenario_path: Fichier JSON du scénario (mode processus)
+            scene_manager_factory: Fonction retournant un SceneManager neuf (mode local)
+            workers: Processus de simulation (nombre de cœurs par défaut, 0 = local)
+            seed: Graine des simulations (reproductibles si fournie)
+        """
+        if not scenario_path and not scene_manager_factory:
+            raise ValueError("BranchPreviewer requiert scenario_path ou scene_manager_factory")
+        self.rollouts = rollouts
+        self.max_steps = max_steps
+        self.scenario_path = scenario_path
+        self.scene_manager_factory = scene_manager_factory
+        if workers is None:
+            workers = 0 if scene_manager_factory else (os.cpu_count() or 1)
+        self.workers = workers if scenario_path else 0
+        self.rng = random.Random(seed)
+        self._executor: Optional[ProcessPoolExecutor] = None
+        self._local_manager: Optional[SceneManager] = None
+
+    def preview(self, choices: Sequence[Tuple[int, Dict]], game_context) -> List[ChoiceEstimate]:
+        """
+        Estimer les options disponibles
+
+        Args:
+            choices: (index dans scene.choices, choix) des options affichées
+            game_context: Contexte courant (ni le groupe ni l'état ne sont modifiés)
+        """
+        estimates = []
+        branches = []
+        for index, choice in choices:
+            context = rollout_context(game_context)
+            effects = choice.get('effects')
+            if effects:
+                (effects if callable(effects) else compile_effects(effects))(context)
+            estimates.append(ChoiceEstimate(index, choice.get('text', ''), choice.get('next_scene')))
+            branches.append(context)
+
+        if self.workers > 0:
+            self._preview_in_pool(estimates, branches)
+        else:
+            self._preview_locally(estimates, branches)
+        return estimates
+
+    def _chunks(self) -> List[int]:
+        """Répartir les parties d'une option entre les processus"""
+        count = max(1, min(self.workers, self.rollouts))
+        base, extra = divmod(self.rollouts, count)
+        return [base + (1 if i < extra else 0) for i in range(count)]
+
+    def _preview_in_pool(self, estimates: List[ChoiceEstimate], branches: List[GameContext]):
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(
+                max_workers=self.workers, initializer=_init_worker,
+                initargs=(self.scenario_path,))
+
+        futures = []
+        for estimate, context in zip(estimates, branches):
+            party = context.get('party', [])
+            game_state = context.game_state.to_dict()
+            for rollouts in self._chunks():
+                futures.append((estimate, self._executor.submit(
+                    _simulate_in_worker, estimate.next_scene, party, game_state,
+                    rollouts, self.max_steps, self.rng.randrange(2 ** 32))))
+        for estimate, future in futures:
+            estimate.add(*future.result())
+
+    def _preview_locally(self, estimates: List[ChoiceEstimate], branches: List[GameContext]):
+        if self._local_manager is None:
+            if self.scene_manager_factory:
+                self._local_manager = self.scene_manager_factory()
+            else:
+                _init_worker(self.scenario_path)
+                self._local_manager = _worker_scenario.scene_manager
+
+        random_state = random.getstate()
+        environment = {key: os.environ.get(key) for key in ('DND_AUTO_SAVE', 'DND_TEXT_SPEED')}
+        try:
+            for estimate, context in zip(estimates, branches):
+                estimate.add(*simulate_branch(self._local_manager, context, estimate.next_scene,
+                                              self.rollouts, self.max_steps,
+                                              self.rng.randrange(2 ** 32)))
+        finally:
+            random.setstate(random_state)
+            for key, value in environment.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+
+    def shutdown(self):
+        """Arrêter les processus de simulation"""
+        if self._executor is not None:
+            self._executor.shutdown(cancel_futures=True)
+            self._executor = None
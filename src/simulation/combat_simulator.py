@@ -0,0 +1,355 @@
+"""
+Simulateur de combat Monte Carlo - statistiques d'une rencontre sans la jouer
+Rejoue la boucle de CombatScene (CombatScene.run_rounds) des milliers de fois,
+réparties sur un pool de processus
+"""
+
+import os
+import random
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import redirect_stdout
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Sequence
+
+from ..config import GameSettings
+from ..scenes.scene_cache import ScenarioCache
+from ..scenes.scene_system import CombatScene
+from ..utils.rng import SeedStream, use_rng
+from .snapshot import clone_party
+
+
+@dataclass
+class EncounterReport:
+    """Statistiques agrégées des combats simulés"""
+    monster_ids: List[str]
+    characters: List[str]
+    trials: int = 0
+    wins: int = 0
+    timeouts: int = 0
+    rounds: Counter = field(default_factory=Counter)
+    xp: Counter = field(default_factory=Counter)
+    hp_remaining: List[float] = field(default_factory=list)
+    deaths: List[int] = field(default_factory=list)
+    max_hit_points: List[int] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.hp_remaining:
+            self.hp_remaining = [0.0] * len(self.characters)
+        if not self.deaths:
+            self.deaths = [0] * len(self.characters)
+
+    @property
+    def win_rate(self) -> float:
+        return self.wins / self.trials if self.trials else 0.0
+
+    def death_probability(self, position: int) -> float:
+        """Probabilité de mort du personnage à cette position du groupe"""
+        return self.deaths[position] / self.trials if self.trials else 0.0
+
+    def mean_hp_remaining(self, position: int) -> float:
+        return self.hp_remaining[position] / self.trials if self.trials else 0.0
+
+    def percentile(self, counter: Counter, q: float) -> float:
+        """Quantile q (0-1) d'une distribution stockée en Counter {valeur: nombre}"""
+        if not self.trials:
+            return 0.0
+        target = q * (self.trials - 1)
+        seen = 0
+        for value in sorted(counter):
+            seen += counter[value]
+            if seen > target:
+                return value
+        return max(counter)
+
+    def record(self, party: List, rounds: int, victory: bool, timeout: bool, xp: int):
+        """Ajouter un combat (party: copies du groupe après le combat)"""
+        self.trials += 1
+        self.wins += int(victory)
+        self.timeouts += int(timeout)
+        self.rounds[rounds] += 1
+        self.xp[xp] += 1
+        for position, character in enumerate(party):
+            hit_points = max(0, character.hit_points)
+            self.hp_remaining[position] += hit_points
+            if hit_points <= 0:
+                self.deaths[position] += 1
+
+    def record_batch(self, result):
+        """Ajouter les combats d'un BatchResult (moteur NumPy)"""
+        fights = len(result.victory)
+        self.trials += fights
+        self.wins += int(result.victory.sum())
+        self.timeouts += int(result.timeout.sum())
+        self.rounds.update(result.rounds.tolist())
+        self.xp.update(result.xp.tolist())
+        self.hp_remaining = [a + float(b) for a, b in zip(self.hp_remaining, result.character_hp.sum(axis=0).tolist())]
+        self.deaths = [a + int(b) for a, b in zip(self.deaths, (result.character_hp <= 0).sum(axis=0).tolist())]
+
+    def merge(self, other: 'EncounterReport'):
+        """Fusionner le rapport d'un autre processus"""
+        self.trials += other.trials
+        self.wins += other.wins
+        self.timeouts += other.timeouts
+        self.rounds.update(other.rounds)
+        self.xp.update(other.xp)
+        self.hp_remaining = [a + b for a, b in zip(self.hp_remaining, other.hp_remaining)]
+        self.deaths = [a + b for a, b in zip(self.deaths, other.deaths)]
+
+    def to_dict(self) -> Dict:
+        return {
+            'monsters': self.monster_ids,
+            'trials': self.trials,
+            'win_rate': round(self.win_rate, 4),
+            'timeouts': self.timeouts,
+            'rounds': {
+                'mean': round(sum(r * c for r, c in self.rounds.items()) / self.trials, 2) if self.trials else 0,
+                'p50': self.percentile(self.rounds, 0.5),
+                'p95': self.percentile(self.rounds, 0.95),
+                'distribution': dict(sorted(self.rounds.items())),
+            },
+            'xp': {
+                'mean': round(sum(x * c for x, c in self.xp.items()) / self.trials, 1) if self.trials else 0,
+                'p5': self.percentile(self.xp, 0.05),
+                'p50': self.percentile(self.xp, 0.5),
+                'p95': self.percentile(self.xp, 0.95),
+            },
+            'characters': [
+                {
+                    'name': name,
+                    'max_hit_points': self.max_hit_points[i] if i < len(self.max_hit_points) else None,
+                    'mean_hp_remaining': round(self.mean_hp_remaining(i), 2),
+                    'death_probability': round(self.death_probability(i), 4),
+                }
+                for i, name in enumerate(self.characters)
+            ],
+        }
+
+    def format_summary(self, title: str = "") -> str:
+        data = self.to_dict()
+        lines = [f"⚔️  {title or ', '.join(self.monster_ids)}"]
+        lines.append(f"   Combats: {self.trials}, victoire {self.win_rate:.1%}"
+                     + (f" ({self.timeouts} à la limite de tours)" if self.timeouts else ""))
+        lines.append(f"   Tours: moyenne {data['rounds']['mean']}, "
+                     f"médiane {data['rounds']['p50']}, 95% {data['rounds']['p95']}")
+        lines.append(f"   XP: moyenne {data['xp']['mean']}, "
+                     f"5% {data['xp']['p5']} / 50% {data['xp']['p50']} / 95% {data['xp']['p95']}")
+        for character in data['characters']:
+            max_hp = f"/{character['max_hit_points']}" if character['max_hit_points'] else ""
+            lines.append(f"   - {character['name']}: {character['mean_hp_remaining']}{max_hp} HP restants, "
+                         f"mort {character['death_probability']:.1%}")
+        return "\n".join(lines)
+
+
+def run_trials(party: List, monster_ids: Sequence[str], trials: int,
+               combat_system, monster_factory, seed: Optional[int] = None,
+               max_rounds: Optional[int] = None, first_trial: int = 0,
+               trace_path: Optional[str] = None,
+               scenario_settings: Optional[Dict] = None) -> EncounterReport:
+    """
+    Simuler trials combats dans ce processus
+
+    Chaque combat part d'une copie du groupe (clone_party) et de monstres neufs.
+    Le combat n° i utilise le flux SeedStream(seed).child(i), pour les dés et
+    pour le random global (dnd_5e_core): son résultat ne dépend pas du
+    processus qui le joue.
+
+    Args:
+        first_trial: Numéro du premier combat (découpage entre processus)
+        trace_path: Trace binaire des combats (CombatTrace, optionnelle)
+        scenario_settings: Réglages du scénario (mass_battle, formation, initiative)
+    """
+    report = EncounterReport(list(monster_ids), [c.name for c in party],
+                             max_hit_points=[c.max_hit_points for c in party])
+    stream = SeedStream(seed)
+    context = {'weapons': [], 'armors': [], 'equipments': [], 'potions': [],
+               'scenario_settings': scenario_settings or {}}
+    trace = None
+    if trace_path:
+        from ..systems.combat_log import CombatLog, LogLevel
+        from ..systems.combat_trace import CombatTrace
+        trace = CombatTrace(trace_path)
+        context['combat_log'] = CombatLog(LogLevel.SILENT, trace=trace)
+
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        for index in range(first_trial, first_trial + trials):
+            trial = stream.child(index)
+            random.seed(trial.child('global').seed)
+            with use_rng(trial.random()):
+                fighters = clone_party(party)
+                enemies = [m for m in (monster_factory.create_monster(monster_id) for monster_id in monster_ids) if m]
+                alive_chars = [c for c in fighters if c.hit_points > 0]
+                alive_monsters = enemies.copy()
+
+                rounds = CombatScene.run_rounds(combat_system, fighters, alive_chars, alive_monsters,
+                                                context, max_rounds)
+
+            # Même règle que CombatScene.execute: victoire si un personnage est debout
+            victory = bool(alive_chars)
+            xp = sum(getattr(m, 'xp', 0) for m in enemies) if victory else 0
+            report.record(fighters, rounds, victory, bool(alive_chars and alive_monsters), xp)
+
+    if trace:
+        trace.close()
+    return report
+
+
+# Processus de simulation: systèmes de jeu créés une fois par processus
+_worker_systems = None
+
+
+def _init_worker(scenario_path: Optional[str], combat_system, monster_factory):
+    global _worker_systems
+    if combat_system is None or monster_factory is None:
+        from ..scenarios.json_scenario import JsonScenario
+
+        with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+            scenario = JsonScenario(scenario_path)
+        combat_system = combat_system or scenario.combat_system
+        monster_factory = monster_factory or scenario.monster_factory
+    _worker_systems = (combat_system, monster_factory)
+
+
+def _run_trials_in_worker(party: List, monster_ids: List[str], trials: int,
+                          seed: int, max_rounds: Optional[int], first_trial: int,
+                          scenario_settings: Optional[Dict]) -> EncounterReport:
+    combat_system, monster_factory = _worker_systems
+    return run_trials(party, monster_ids, trials, combat_system, monster_factory, seed, max_rounds,
+                      first_trial, scenario_settings=scenario_settings)
+
+
+# Réglages du scénario que le moteur par lots ne modélise pas
+_BATCH_IGNORED_SETTINGS = ('mass_battle', 'formation', 'initiative')
+
+# Refus du backend numpy déjà signalés (un avertissement par raison et par processus)
+_batch_refusals = set()
+
+
+def batch_unsupported_reason(combat_system, scenario_settings: Optional[Dict]) -> Optional[str]:
+    """
+    Pourquoi BatchCombatEngine ne reproduirait pas ces combats (None s'il le peut)
+    Le moteur par lots modélise EnhancedCombatSystem, sans les réglages du scénario
+    """
+    from ..systems.enhanced_combat import EnhancedCombatSystem
+
+    if not isinstance(combat_system, EnhancedCombatSystem):
+        return (f"il modélise EnhancedCombatSystem, le scénario combat avec "
+                f"{type(combat_system).__name__}")
+    ignored = [key for key in _BATCH_IGNORED_SETTINGS if key in (scenario_settings or {})]
+    if ignored:
+        return f"il ignore les réglages du scénario ({', '.join(ignored)})"
+    return None
+
+
+def _simulate_batch(party: List, monster_ids: List[str], n: int, monster_factory,
+                    seed: Optional[int], max_rounds: Optional[int]) -> Optional[EncounterReport]:
+    """Combats vectorisés (BatchCombatEngine), None si numpy est absent"""
+    try:
+        from ..systems.batch_combat import BatchCombatEngine, CombatantArrays, NUMPY_AVAILABLE
+    except ImportError:
+        NUMPY_AVAILABLE = False
+    if not NUMPY_AVAILABLE:
+        print("⚠️ numpy non disponible - simulation avec le backend python")
+        return None
+
+    # Les statistiques d'un monstre ne dépendent que de son id: une seule création
+    with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+        monsters = [m for m in (monster_factory.create_monster(monster_id) for monster_id in monster_ids) if m]
+    engine = BatchCombatEngine(seed)
+    result = engine.run(CombatantArrays.from_party(party), CombatantArrays.from_monsters(monsters),
+                        n, max_rounds or CombatScene.MAX_ROUNDS)
+
+    report = EncounterReport(monster_ids, [c.name for c in party],
+                             max_hit_points=[c.max_hit_points for c in party])
+    report.record_batch(result)
+    return report
+
+
+def simulate_encounter(party: List, monster_ids: Sequence[str], n: int = 10000,
+                       combat_system=None, monster_factory=None,
+                       scenario_path: Optional[str] = None,
+                       workers: Optional[int] = None, seed: Optional[int] = None,
+                       max_rounds: Optional[int] = None,
+                       backend: Optional[str] = None,
+                       trace_path: Optional[str] = None,
+                       scenario_settings: Optional[Dict] = None) -> EncounterReport:
+    """
+    Simuler n combats du groupe contre les monstres
+
+    Args:
+        party: Groupe (jamais modifié, chaque combat utilise une copie)
+        monster_ids: Monstres de la rencontre (ids du monster_factory)
+        n: Nombre de combats
+        combat_system: Système de combat (celui du scénario sinon)
+        monster_factory: Fabrique de monstres (celle du scénario sinon)
+        scenario_path: JSON du scénario, pour créer les systèmes manquants
+        workers: Processus (défaut: nombre de CPU, 0 = dans ce processus)
+        seed: Graine (résultats reproductibles, quel que soit le nombre de processus)
+        max_rounds: Limite de tours (CombatScene.MAX_ROUNDS par défaut)
+        backend: 'python' ou 'numpy' (GameSettings.get_combat_backend() par défaut);
+                 numpy n'est utilisé que si le système de combat est EnhancedCombatSystem
+                 sans réglages de scénario qu'il ignorerait (sinon avertissement et python)
+        trace_path: Trace binaire des combats (backend python, dans ce processus)
+        scenario_settings: Réglages du scénario (ceux du JSON de scenario_path par défaut)
+
+    Returns:
+        EncounterReport: victoire, tours, HP restants, morts, XP
+    """
+    monster_ids = list(monster_ids)
+    if scenario_settings is None and scenario_path:
+        scenario_settings = ScenarioCache.default().load_bundle(scenario_path).settings
+    if (backend or GameSettings.get_combat_backend()) == 'numpy' and not trace_path \
+            and (combat_system or scenario_path) and (monster_factory or scenario_path):
+        if combat_system is None or monster_factory is None:
+            _init_worker(scenario_path, combat_system, monster_factory)
+            combat_system, monster_factory = _worker_systems
+        reason = batch_unsupported_reason(combat_system, scenario_settings)
+        if reason is None:
+            report = _simulate_batch(party, monster_ids, n, monster_factory, seed, max_rounds)
+            if report is not None:
+                return report
+        elif reason not in _batch_refusals:
+            _batch_refusals.add(reason)
+            print(f"⚠️⚠️ Backend numpy refusé: {reason} - simulation avec le backend python")
+
+    if (combat_system is None or monster_factory is None) and not scenario_path:
+        raise ValueError("simulate_encounter requiert combat_system et monster_factory, ou scenario_path")
+
+    # Une entropie pour toute la simulation: le combat n° i a le même flux dans tout processus
+    seed = SeedStream(seed).entropy
+    if workers is None:
+        workers = os.cpu_count() or 1
+    workers = 0 if trace_path else min(workers, n)
+
+    if workers <= 0:
+        if combat_system is None or monster_factory is None:
+            _init_worker(scenario_path, combat_system, monster_factory)
+            combat_system, monster_factory = _worker_systems
+        random_state = random.getstate()
+        try:
+            return run_trials(party, monster_ids, n, combat_system, monster_factory, seed, max_rounds,
+                              trace_path=trace_path, scenario_settings=scenario_settings)
+        finally:
+            random.setstate(random_state)
+
+    base, extra = divmod(n, workers)
+    chunks = [base + (1 if i < extra else 0) for i in range(workers)]
+    report = EncounterReport(monster_ids, [c.name for c in party],
+                             max_hit_points=[c.max_hit_points for c in party])
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(scenario_path, combat_system, monster_factory)) as executor:
+        futures = [executor.submit(_run_trials_in_worker, party, monster_ids, trials,
+                                   seed, max_rounds, sum(chunks[:i]), scenario_settings)
+                   for i, trials in enumerate(chunks)]
+        for future in futures:
+            report.merge(future.result())
+    return report
+
+
+def combat_encounters(scenario_data: Dict) -> Dict[str, List[str]]:
+    """Rencontres d'un scénario JSON: {scene_id: [monster_ids]}"""
+    return {
+        scene['id']: list(scene.get('monsters', []))
+        for scene in scenario_data.get('scenes', [])
+        if scene.get('type') == 'combat' and scene.get('monsters')
+    }
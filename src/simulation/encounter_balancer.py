@@ -0,0 +1,205 @@
+"""
+Équilibreur de rencontres - ajuste les monstres d'un combat jusqu'au taux de victoire visé
+Recherche par dichotomie sur le nombre de monstres puis substitutions gloutonnes
+(monstre plus faible / plus fort de data/monsters/all_monsters.json), chaque
+rencontre n'étant simulée qu'une fois (mémoïsation)
+"""
+
+import json
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from .combat_simulator import simulate_encounter, combat_encounters
+
+DEFAULT_MONSTERS_PATH = Path(__file__).parent.parent.parent / "data" / "monsters" / "all_monsters.json"
+
+
+def load_candidates(path: Optional[str] = None) -> List[Tuple[str, int]]:
+    """Monstres de substitution (id, XP), du plus faible au plus fort"""
+    with open(path or DEFAULT_MONSTERS_PATH, 'r', encoding='utf-8') as f:
+        monsters = json.load(f)
+    return sorted(((monster_id, int(data.get('xp', 0))) for monster_id, data in monsters.items()),
+                  key=lambda item: (item[1], item[0]))
+
+
+@dataclass
+class BalanceResult:
+    """Rencontre équilibrée et rencontre d'origine"""
+    monster_ids: List[str]
+    win_rate: float
+    original_ids: List[str]
+    original_win_rate: float
+    target: float
+    tolerance: float
+    evaluations: int
+
+    @property
+    def on_target(self) -> bool:
+        return abs(self.win_rate - self.target) <= self.tolerance
+
+    @property
+    def changed(self) -> bool:
+        return sorted(self.monster_ids) != sorted(self.original_ids)
+
+    def format_summary(self, title: str = "") -> str:
+        status = "✅" if self.on_target else "⚠️"
+        return (f"{status} {title or ', '.join(self.original_ids)}\n"
+                f"   Avant: {', '.join(self.original_ids)} (victoire {self.original_win_rate:.1%})\n"
+                f"   Après: {', '.join(self.monster_ids)} (victoire {self.win_rate:.1%}, "
+                f"cible {self.target:.0%} ± {self.tolerance:.0%}, {self.evaluations} simulations)")
+
+
+class EncounterBalancer:
+    """
+    Cherche une rencontre dont le taux de victoire du groupe approche la cible
+
+    1. Dichotomie sur le nombre de monstres (la composition est répétée),
+       en supposant la victoire d'autant plus rare qu'il y a de monstres
+    2. Si le nombre seul ne suffit pas, substitution gloutonne: le monstre
+       le plus fort est remplacé par le candidat immédiatement plus faible
+       (rencontre trop dure), ou le plus faible par le candidat plus fort
+       (trop facile), puis nouvelle dichotomie
+
+    Toutes les évaluations utilisent la même graine: les écarts entre deux
+    rencontres ne viennent pas du bruit de simulation.
+    """
+
+    def __init__(self, party: List, target: float = 0.85, tolerance: float = 0.05,
+                 trials: int = 500, max_monsters: int = 12, max_substitutions: int = 20,
+                 candidates: Optional[List[Tuple[str, int]]] = None,
+                 simulate: Optional[Callable[[List[str]], float]] = None,
+                 seed: int = 0, **simulate_kwargs):
+        """
+        Args:
+            party: Groupe de référence
+            target: Taux de victoire visé
+            tolerance: Écart accepté autour de la cible
+            trials: Combats simulés par rencontre évaluée
+            max_monsters: Nombre maximal de monstres
+            max_substitutions: Substitutions gloutonnes au plus
+            candidates: (id, XP) des monstres de substitution (all_monsters.json par défaut)
+            simulate: Taux de victoire d'une liste d'ids (simulate_encounter par défaut)
+            seed: Graine commune des simulations
+            **simulate_kwargs: combat_system, monster_factory, scenario_path, workers, backend
+        """
+        self.party = party
+        self.target = target
+        self.tolerance = tolerance
+        self.trials = trials
+        self.max_monsters = max_monsters
+        self.max_substitutions = max_substitutions
+        self.candidates = candidates if candidates is not None else load_candidates()
+        self._candidate_xp = [xp for _, xp in self.candidates]
+        self._xp = dict(self.candidates)
+        self._simulate = simulate or self._simulate_encounter
+        self.seed = seed
+        self.simulate_kwargs = simulate_kwargs
+        self._win_rates: Dict[Tuple[str, ...], float] = {}
+
+    def _simulate_encounter(self, monster_ids: List[str]) -> float:
+        report = simulate_encounter(self.party, monster_ids, n=self.trials, seed=self.seed,
+                                    **self.simulate_kwargs)
+        return report.win_rate
+
+    @property
+    def evaluations(self) -> int:
+        """Rencontres distinctes simulées"""
+        return len(self._win_rates)
+
+    def win_rate(self, monster_ids: Sequence[str]) -> float:
+        """Taux de victoire d'une rencontre (simulée une seule fois)"""
+        key = tuple(sorted(monster_ids))
+        if key not in self._win_rates:
+            self._win_rates[key] = self._simulate(list(monster_ids))
+        return self._win_rates[key]
+
+    def _distance(self, rate: float) -> float:
+        return abs(rate - self.target)
+
+    @staticmethod
+    def _scaled(composition: List[str], count: int) -> List[str]:
+        return [composition[i % len(composition)] for i in range(count)]
+
+    def fit_count(self, composition: List[str]) -> Tuple[List[str], float]:
+        """Nombre de monstres (composition répétée) le plus proche de la cible"""
+        low, high = 1, max(self.max_monsters, len(composition))
+        if self.win_rate(self._scaled(composition, low)) < self.target:
+            return self._scaled(composition, low), self.win_rate(self._scaled(composition, low))
+        if self.win_rate(self._scaled(composition, high)) >= self.target:
+            return self._scaled(composition, high), self.win_rate(self._scaled(composition, high))
+
+        # Invariant: victoire >= cible avec low monstres, < cible avec high
+        while high - low > 1:
+            middle = (low + high) // 2
+            if self.win_rate(self._scaled(composition, middle)) >= self.target:
+                low = middle
+            else:
+                high = middle
+        options = [self._scaled(composition, low), self._scaled(composition, high)]
+        best = min(options, key=lambda ids: self._distance(self.win_rate(ids)))
+        return best, self.win_rate(best)
+
+    def _substitute(self, composition: List[str], weaker: bool) -> Optional[List[str]]:
+        """Remplacer le monstre le plus fort par un plus faible (ou l'inverse)"""
+        ranked = sorted(range(len(composition)), key=lambda i: self._xp.get(composition[i], 0),
+                        reverse=weaker)
+        for index in ranked:
+            xp = self._xp.get(composition[index], 0)
+            if weaker:
+                position = bisect_left(self._candidate_xp, xp) - 1
+            else:
+                position = bisect_right(self._candidate_xp, xp)
+            if 0 <= position < len(self.candidates):
+                replaced = list(composition)
+                replaced[index] = self.candidates[position][0]
+                return replaced
+        return None
+
+    def balance(self, monster_ids: Sequence[str]) -> BalanceResult:
+        """Rencontre la plus proche de la cible à partir de monster_ids"""
+        original = list(monster_ids) or [self.candidates[0][0]]
+        original_rate = self.win_rate(original)
+
+        best, best_rate = original, original_rate
+        composition = sorted(set(original), key=original.index)
+        seen = set()
+        for _ in range(self.max_substitutions + 1):
+            seen.add(tuple(sorted(composition)))
+            ids, rate = self.fit_count(composition)
+            if self._distance(rate) < self._distance(best_rate):
+                best, best_rate = ids, rate
+            if self._distance(best_rate) <= self.tolerance:
+                break
+            composition = self._substitute(ids, weaker=rate < self.target)
+            if composition is None or tuple(sorted(composition)) in seen:
+                break
+
+        return BalanceResult(best, best_rate, list(monster_ids), original_rate,
+                             self.target, self.tolerance, self.evaluations)
+
+
+def balance_scenario(scenario_data: Dict, balancer: EncounterBalancer,
+                     scenes: Optional[Sequence[str]] = None) -> Dict[str, BalanceResult]:
+    """
+    Équilibrer les combats d'un scénario JSON (tableaux "monsters" réécrits en place)
+
+    Args:
+        scenario_data: Contenu du fichier de scénario
+        balancer: Équilibreur (groupe du scénario)
+        scenes: Scènes de combat à traiter (défaut: toutes)
+
+    Returns:
+        {scene_id: BalanceResult}
+    """
+    encounters = combat_encounters(scenario_data)
+    results = {}
+    for scene in scenario_data.get('scenes', []):
+        scene_id = scene.get('id')
+        if scene_id not in encounters or (scenes and scene_id not in scenes):
+            continue
+        result = balancer.balance(encounters[scene_id])
+        scene['monsters'] = result.monster_ids
+        results[scene_id] = result
+    return results
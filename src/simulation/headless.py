@@ -0,0 +1,385 @@
+"""
+Headless Runner - Parties complètes sans interaction
+Pilote SceneManager.run avec des politiques de choix (Strategy pattern)
+pour les tests de régression et de charge des scénarios JSON
+"""
+
+import os
+import random
+import time
+from abc import ABC, abstractmethod
+from collections import Counter
+from contextlib import contextmanager, redirect_stdout
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable, Dict, List, Optional, Sequence
+
+from ..rendering.renderer import HeadlessRenderer
+from ..scenes.scene_system import SceneManager, SceneResult, CombatScene
+from ..scenes.game_context import GameContext
+
+
+class ChoiceLimitReached(Exception):
+    """Levée quand une partie dépasse le nombre de choix autorisés (boucle de menus)"""
+    pass
+
+
+# Pas de sauvegarde interactive ni de délai d'affichage pendant une partie simulée
+HEADLESS_ENVIRONMENT = {'DND_AUTO_SAVE': 'true', 'DND_TEXT_SPEED': 'instant'}
+
+
+@contextmanager
+def headless_environment():
+    """Variables HEADLESS_ENVIRONMENT le temps du bloc, valeurs précédentes restaurées ensuite"""
+    previous = {key: os.environ.get(key) for key in HEADLESS_ENVIRONMENT}
+    os.environ.update(HEADLESS_ENVIRONMENT)
+    try:
+        yield
+    finally:
+        for key, value in previous.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+
+
+class ChoicePolicy(ABC):
+    """Interface abstraite pour les politiques de choix"""
+
+    @abstractmethod
+    def choose(self, options: List[str]) -> int:
+        """Retourner l'index (0-based) de l'option choisie"""
+        pass
+
+    def reset(self):
+        """Réinitialiser la politique avant une nouvelle partie"""
+        pass
+
+
+class FirstChoicePolicy(ChoicePolicy):
+    """Toujours la première option"""
+
+    def choose(self, options: List[str]) -> int:
+        return 0
+
+
+class RandomChoicePolicy(ChoicePolicy):
+    """Option uniforme au hasard (reproductible si seed fourni)"""
+
+    def __init__(self, seed: Optional[int] = None):
+        self.rng = random.Random(seed)
+
+    def choose(self, options: List[str]) -> int:
+        return self.rng.randrange(len(options))
+
+
+class WeightedChoicePolicy(ChoicePolicy):
+    """
+    Option au hasard pondérée par position
+    weights[i] s'applique à l'option i (1.0 au-delà de la liste)
+    """
+
+    def __init__(self, weights: Sequence[float], seed: Optional[int] = None):
+        self.weights = list(weights)
+        self.rng = random.Random(seed)
+
+    def choose(self, options: List[str]) -> int:
+        weights = [self.weights[i] if i < len(self.weights) else 1.0
+                   for i in range(len(options))]
+        if sum(weights) <= 0:
+            return 0
+        return self.rng.choices(range(len(options)), weights=weights)[0]
+
+
+class ScriptedChoicePolicy(ChoicePolicy):
+    """
+    Rejoue une liste de choix (1-based, comme saisis en console)
+    Quand le script est épuisé, délègue à la politique de repli
+    """
+
+    def __init__(self, choices: Sequence[int], fallback: Optional[ChoicePolicy] = None):
+        self.choices = list(choices)
+        self.fallback = fallback or FirstChoicePolicy()
+        self.position = 0
+
+    @classmethod
+    def from_file(cls, path: str, fallback: Optional[ChoicePolicy] = None) -> 'ScriptedChoicePolicy':
+        """
+        Charger un script de choix: un numéro par ligne, '#' pour les commentaires
+        """
+        choices = []
+        with open(path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.split('#', 1)[0].strip()
+                if line:
+                    choices.append(int(line))
+        return cls(choices, fallback)
+
+    def choose(self, options: List[str]) -> int:
+        if self.position < len(self.choices):
+            choice = self.choices[self.position] - 1
+            self.position += 1
+            if 0 <= choice < len(options):
+                return choice
+        return self.fallback.choose(options)
+
+    def reset(self):
+        self.position = 0
+        self.fallback.reset()
+
+
+def create_policy(name: str, seed: Optional[int] = None,
+                  weights: Optional[Sequence[float]] = None,
+                  script_path: Optional[str] = None) -> ChoicePolicy:
+    """
+    Factory pour créer une politique depuis son nom
+
+    Args:
+        name: 'first', 'random', 'weighted' ou 'scripted'
+        seed: Graine pour les politiques aléatoires
+        weights: Poids par position (politique 'weighted')
+        script_path: Fichier de choix (politique 'scripted')
+    """
+    if name == 'first':
+        return FirstChoicePolicy()
+    if name == 'random':
+        return RandomChoicePolicy(seed)
+    if name == 'weighted':
+        return WeightedChoicePolicy(weights or [], seed)
+    if name == 'scripted':
+        if not script_path:
+            raise ValueError("La politique 'scripted' requiert un fichier de choix")
+        return ScriptedChoicePolicy.from_file(script_path, RandomChoicePolicy(seed))
+    raise ValueError(f"Politique de choix inconnue: {name}")
+
+
+class _CountingRenderer(HeadlessRenderer):
+    """HeadlessRenderer qui borne le nombre de choix d'une partie"""
+
+    def __init__(self, policy: ChoicePolicy, max_choices: int):
+        super().__init__(policy)
+        self.max_choices = max_choices
+        self.choices_made = 0
+
+    def get_choice(self, options: List[str]) -> int:
+        self.choices_made += 1
+        if self.choices_made > self.max_choices:
+            raise ChoiceLimitReached(f"Plus de {self.max_choices} choix")
+        return super().get_choice(options)
+
+
+@dataclass
+class PlaythroughResult:
+    """Résultat d'une partie headless"""
+    outcome: str  # completed, defeat, exit, step_limit, missing_scene, error
+    path: List[str]
+    choices: int
+    duration: float
+    game_state: Dict = field(default_factory=dict)
+    error: Optional[str] = None
+
+
+@dataclass
+class BatchReport:
+    """Statistiques agrégées d'une série de parties"""
+    runs: int = 0
+    elapsed: float = 0.0
+    steps: int = 0
+    outcomes: Counter = field(default_factory=Counter)
+    scene_visits: Counter = field(default_factory=Counter)
+    errors: Counter = field(default_factory=Counter)
+
+    @property
+    def runs_per_second(self) -> float:
+        return self.runs / self.elapsed if self.elapsed > 0 else 0.0
+
+    def add(self, result: PlaythroughResult):
+        """Ajouter le résultat d'une partie"""
+        self.runs += 1
+        self.steps += len(result.path)
+        self.outcomes[result.outcome] += 1
+        self.scene_visits.update(result.path)
+        if result.error:
+            self.errors[result.error] += 1
+
+    def to_dict(self) -> Dict:
+        return {
+            'runs': self.runs,
+            'elapsed': round(self.elapsed, 4),
+            'runs_per_second': round(self.runs_per_second, 1),
+            'steps': self.steps,
+            'outcomes': dict(self.outcomes),
+            'scene_visits': dict(self.scene_visits.most_common()),
+            'errors': dict(self.errors),
+        }
+
+    def format_summary(self, title: str = "") -> str:
+        lines = [f"📊 {title}" if title else "📊 Résultats"]
+        lines.append(f"   Parties: {self.runs} en {self.elapsed:.2f}s "
+                     f"({self.runs_per_second:.0f} parties/s)")
+        for outcome, count in self.outcomes.most_common():
+            lines.append(f"   - {outcome}: {count} ({100 * count / self.runs:.1f}%)")
+        never_visited = [s for s, c in self.scene_visits.items() if c == 0]
+        lines.append(f"   Scènes visitées: {len(self.scene_visits) - len(never_visited)}")
+        for error, count in self.errors.most_common(3):
+            lines.append(f"   ⚠️ {error} (x{count})")
+        return "\n".join(lines)
+
+
+class HeadlessRunner:
+    """
+    Exécute des parties complètes sans input(), pause ni effet machine à écrire
+    Le SceneManager est réutilisé d'une partie à l'autre, le contexte est recréé
+    """
+
+    def __init__(self, scene_manager: SceneManager,
+                 policy: Optional[ChoicePolicy] = None,
+                 context_factory: Optional[Callable[[], Dict]] = None,
+                 start_scene_id: Optional[str] = None,
+                 max_steps: int = 500,
+                 max_choices: int = 1000,
+                 quiet: bool = True):
+        """
+        Args:
+            scene_manager: Scènes du scénario
+            policy: Politique de choix (première option par défaut)
+            context_factory: Fonction retournant un game_context neuf (party, game_state...)
+            start_scene_id: Scène de départ (scène courante du manager sinon)
+            max_steps: Nombre maximal de scènes par partie (protège des cycles)
+            max_choices: Nombre maximal de choix par partie (protège des menus en boucle)
+            quiet: Supprimer la sortie console des scènes et du combat
+        """
+        self.scene_manager = scene_manager
+        self.policy = policy or FirstChoicePolicy()
+        self.context_factory = context_factory or (lambda: {'party': [], 'game_state': {}})
+        self.start_scene_id = start_scene_id or scene_manager.current_scene_id or "intro"
+        self.max_steps = max_steps
+        self.max_choices = max_choices
+        self.quiet = quiet
+
+    def run_once(self, recorder=None) -> PlaythroughResult:
+        """
+        Jouer une partie complète
+
+        Args:
+            recorder: SessionRecorder (ou rejeu d'un journal) qui sème le random global
+        """
+        with headless_environment():
+            return self._play(recorder)
+
+    def _play(self, recorder) -> PlaythroughResult:
+        self.policy.reset()
+        if recorder:
+            recorder.begin()
+        renderer = _CountingRenderer(self.policy, self.max_choices)
+        game_context = GameContext.coerce(self.context_factory())
+        game_context.renderer = renderer
+
+        manager = self.scene_manager
+        manager.history = []
+        manager.current_scene_id = None
+        if recorder:
+            recorder.attach(manager, game_context, self.start_scene_id)
+
+        start = time.perf_counter()
+        error = None
+        outcome = None
+        result = None
+        try:
+            if self.quiet:
+                with open(os.devnull, 'w') as devnull, redirect_stdout(devnull):
+                    result = manager.run(game_context, self.start_scene_id, self.max_steps)
+            else:
+                result = manager.run(game_context, self.start_scene_id, self.max_steps)
+        except ChoiceLimitReached:
+            outcome = 'step_limit'
+        except Exception as e:
+            outcome = 'error'
+            error = f"{type(e).__name__}: {e}"
+
+        outcome = outcome or classify_outcome(manager, result)
+        if recorder:
+            recorder.finish(manager, outcome)
+
+        return PlaythroughResult(
+            outcome=outcome,
+            path=list(manager.history),
+            choices=renderer.choices_made,
+            duration=time.perf_counter() - start,
+            game_state=dict(game_context.get('game_state', {})),
+            error=error
+        )
+
+    def run_batch(self, runs: int, progress: Optional[Callable[[int], None]] = None) -> BatchReport:
+        """
+        Jouer plusieurs parties et agréger les statistiques
+
+        Args:
+            runs: Nombre de parties
+            progress: Callback optionnel appelé avec le numéro de la partie terminée
+        """
+        report = BatchReport()
+        report.scene_visits.update({scene_id: 0 for scene_id in self.scene_manager.scenes})
+
+        start = time.perf_counter()
+        for i in range(runs):
+            report.add(self.run_once())
+            if progress:
+                progress(i + 1)
+        report.elapsed = time.perf_counter() - start
+
+        return report
+
+def classify_outcome(manager: SceneManager, result: Optional[SceneResult]) -> str:
+    """
+    Déduire l'issue d'une partie depuis l'état final du SceneManager
+    ('completed', 'defeat', 'exit', 'missing_scene', 'step_limit')
+    """
+    current = manager.current_scene_id
+
+    if result == SceneResult.EXIT:
+        return 'exit'
+
+    if result == SceneResult.FAILURE:
+        last_scene = manager.scenes.get(manager.history[-1]) if manager.history else None
+        if isinstance(last_scene, CombatScene) and last_scene.next_scene_id == last_scene.on_defeat_scene:
+            return 'defeat'
+        if current and current not in manager.scenes and current != 'game_over':
+            return 'missing_scene'
+        return 'defeat'
+
+    if current:
+        return 'step_limit'
+
+    if manager.history and manager.history[-1] == 'game_over':
+        return 'defeat'
+
+    return 'completed'
+
+
+def scenario_context_factory(scenario) -> Callable[[], GameContext]:
+    """
+    Contexte de jeu headless pour un BaseScenario
+    Le groupe et l'état du jeu sont recréés à chaque partie
+    """
+    def factory() -> GameContext:
+        return GameContext(
+            party=scenario.create_party(),
+            game_state=scenario._init_game_state(),
+            combat_system=scenario.combat_system,
+            spellcasting=scenario.spellcasting,
+            merchant_system=scenario.merchant_system,
+            monster_factory=scenario.monster_factory,
+            scenario_data=scenario.scenario_data,
+            scenario_settings=scenario.scenario_settings,
+            weapons=[],
+            armors=[],
+            equipments=[],
+            potions=[],
+        )
+    return factory
+
+
+def list_scenario_files(scenes_dir: str = "data/scenes") -> List[Path]:
+    """Lister les fichiers de scénarios JSON"""
+    return sorted(Path(scenes_dir).glob("*.json"))
@@ -0,0 +1,310 @@
+"""
+Replay - Journal de partie déterministe
+Enregistre les choix, les graines aléatoires et le chemin d'une partie,
+puis la rejoue en headless à l'identique (rapports de bug, benchmarks)
+"""
+
+import json
+import pickle
+import random
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Callable, Dict, List, Optional
+
+from ..rendering.renderer import Renderer
+from ..scenes.scene_system import SAVE_OPTION, SceneManager
+
+JOURNAL_VERSION = 1
+
+# État de départ enregistré à côté du journal (groupe, équipement): le groupe d'une
+# partie interactive vient de la sous-classe du scénario. Ce fichier est un pickle,
+# il n'est relu que sur demande explicite (trust_context, --trust-context)
+CONTEXT_KEYS = ('party', 'weapons', 'armors', 'equipments', 'potions', 'magic_items')
+
+
+def context_path(path) -> Path:
+    """Fichier de l'état de départ associé à un journal"""
+    path = Path(path)
+    return path.with_name(path.name + '.context.pkl')
+
+
+@dataclass
+class SessionJournal:
+    """
+    Journal d'une partie
+
+    Le module random global est re-semé avant chaque scène avec scene_seeds[i]:
+    le combat (EnhancedCombatSystem, dnd_5e_core) devient reproductible scène par scène.
+    session_seed rejoue les flux de DND_SEED, game_state (JSON) et context l'état
+    de départ de la partie.
+    """
+    scenario: str
+    seed: int
+    start_scene: Optional[str] = None
+    choices: List[int] = field(default_factory=list)  # Index 0-based, dans l'ordre
+    scene_seeds: List[int] = field(default_factory=list)
+    path: List[str] = field(default_factory=list)
+    outcome: Optional[str] = None
+    session_seed: Optional[int] = None
+    game_state: Optional[Dict] = None
+    version: int = JOURNAL_VERSION
+    context: Optional[bytes] = field(default=None, repr=False)  # Pickle de CONTEXT_KEYS
+
+    def capture_context(self, game_context: Dict):
+        """Enregistrer l'état de départ de la partie (les valeurs non enregistrables sont ignorées)"""
+        if 'game_state' in game_context:
+            try:
+                self.game_state = json.loads(json.dumps(dict(game_context['game_state'])))
+            except (TypeError, ValueError) as e:
+                print(f"⚠️ game_state non enregistré dans le journal: {e}")
+        state = {}
+        for key in CONTEXT_KEYS:
+            if key not in game_context:
+                continue
+            value = game_context[key]
+            try:
+                pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)
+            except Exception as e:
+                print(f"⚠️ {key} non enregistré dans le journal: {e}")
+                continue
+            state[key] = value
+        self.context = pickle.dumps(state, protocol=pickle.HIGHEST_PROTOCOL) if state else None
+
+    def restore_context(self) -> Dict:
+        """Copie neuve de l'état de départ ({} s'il n'a pas été enregistré ou chargé)"""
+        state = pickle.loads(self.context) if self.context else {}
+        if self.game_state is not None:
+            state['game_state'] = json.loads(json.dumps(self.game_state))
+        return state
+
+    def save(self, path: str):
+        """Écrire le journal (JSON compact) et son état de départ (.context.pkl)"""
+        data = asdict(self)
+        del data['context']
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, separators=(',', ':'), ensure_ascii=False)
+        if self.context:
+            context_path(path).write_bytes(self.context)
+
+    @classmethod
+    def load(cls, path: str, trust_context: bool = False) -> 'SessionJournal':
+        """
+        Lire un journal
+
+        Args:
+            path: Fichier JSON du journal
+            trust_context: Charger aussi l'état de départ (.context.pkl). Décharger un
+                pickle exécute du code: à réserver aux journaux de source sûre
+        """
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') != JOURNAL_VERSION:
+            raise ValueError(f"Version de journal non supportée: {data.get('version')}")
+        journal = cls(**data)
+        if context_path(path).exists():
+            if trust_context:
+                journal.context = context_path(path).read_bytes()
+            else:
+                print(f"⚠️ {context_path(path).name} ignoré (pickle non approuvé): "
+                      f"rejeu avec le groupe par défaut du scénario")
+        return journal
+
+
+class RecordingRenderer(Renderer):
+    """Renderer qui délègue tout à un autre et note chaque choix (sauf la sauvegarde)"""
+
+    def __init__(self, inner: Renderer, choices: List[int]):
+        self.inner = inner
+        self.choices = choices
+
+    def print_header(self, title: str):
+        self.inner.print_header(title)
+
+    def print_slow(self, text: str, delay: float = 0.02):
+        self.inner.print_slow(text, delay)
+
+    def wait_for_input(self, prompt: str = "\n[Appuyez sur ENTRÉE pour continuer]"):
+        self.inner.wait_for_input(prompt)
+
+    def get_choice(self, options: List[str]) -> int:
+        choice = self.inner.get_choice(options)
+        # L'option de sauvegarde n'existe qu'en interactif: la scène re-pose la question
+        if options[choice] != SAVE_OPTION:
+            self.choices.append(choice)
+        return choice
+
+    def display_map(self, map_ascii: str, player_pos: tuple = None):
+        self.inner.display_map(map_ascii, player_pos)
+
+    def pause(self, seconds: float):
+        self.inner.pause(seconds)
+
+
+class _SeedingListener:
+    """Re-sème le random global avant chaque scène (observateur de SceneManager)"""
+
+    def __init__(self, seed: int):
+        self.seed = seed
+        self._seeds = random.Random(seed)
+
+    def begin(self):
+        """Semer avant la création du groupe et du contexte"""
+        random.seed(self.seed)
+
+    def next_seed(self, scene_id: str) -> int:
+        return self._seeds.getrandbits(63)
+
+    def __call__(self, scene_id: str, game_context: Dict):
+        random.seed(self.next_seed(scene_id))
+
+    def attach(self, manager: SceneManager, game_context: Optional[Dict] = None,
+               start_scene_id: Optional[str] = None):
+        # Le préchargement consommerait le random global depuis un autre thread
+        if manager.prefetcher is not None:
+            manager.enable_prefetch(0)
+        manager.add_listener(self)
+
+    def finish(self, manager: SceneManager, outcome: Optional[str] = None):
+        manager.remove_listener(self)
+
+
+class SessionRecorder(_SeedingListener):
+    """
+    Enregistre une partie dans un SessionJournal
+
+    Usage:
+        recorder = SessionRecorder("data/scenes/chasse_gobelins.json")
+        recorder.begin()
+        ... créer le groupe et le game_context ...
+        recorder.attach(manager, game_context)
+        manager.run(game_context, start_scene_id)
+        recorder.finish(manager, outcome).save("partie.json")
+    """
+
+    def __init__(self, scenario: str = "", seed: Optional[int] = None):
+        if seed is None:
+            seed = random.SystemRandom().getrandbits(32)
+        super().__init__(seed)
+        self.journal = SessionJournal(scenario=scenario, seed=seed)
+
+    def next_seed(self, scene_id: str) -> int:
+        scene_seed = super().next_seed(scene_id)
+        self.journal.scene_seeds.append(scene_seed)
+        self.journal.path.append(scene_id)
+        return scene_seed
+
+    def attach(self, manager: SceneManager, game_context: Optional[Dict] = None,
+               start_scene_id: Optional[str] = None):
+        """Observer le SceneManager, enregistrer l'état de départ et les choix du renderer"""
+        super().attach(manager, game_context, start_scene_id)
+        self.journal.start_scene = start_scene_id or manager.current_scene_id
+        if game_context is None:
+            return
+        self.journal.capture_context(game_context)
+        seed_stream = game_context.get('seed_stream')
+        if seed_stream is not None:
+            self.journal.session_seed = seed_stream.entropy
+        if 'renderer' in game_context:
+            game_context['renderer'] = RecordingRenderer(game_context['renderer'], self.journal.choices)
+
+    def finish(self, manager: SceneManager, outcome: Optional[str] = None) -> SessionJournal:
+        super().finish(manager, outcome)
+        self.journal.outcome = outcome
+        return self.journal
+
+
+class _JournalSeeder(_SeedingListener):
+    """Rejoue les graines d'un journal et détecte la divergence du chemin"""
+
+    def __init__(self, journal: SessionJournal):
+        super().__init__(journal.seed)
+        self.journal = journal
+        self.step = 0
+        self.diverged_at: Optional[int] = None
+
+    def next_seed(self, scene_id: str) -> int:
+        step = self.step
+        self.step += 1
+        if self.diverged_at is None and (step >= len(self.journal.path) or self.journal.path[step] != scene_id):
+            self.diverged_at = step
+        if step < len(self.journal.scene_seeds):
+            # Même séquence de graines que l'enregistrement
+            self._seeds.getrandbits(63)
+            return self.journal.scene_seeds[step]
+        return self._seeds.getrandbits(63)
+
+
+@dataclass
+class ReplayResult:
+    """Résultat d'un rejeu"""
+    journal: SessionJournal
+    outcome: str
+    path: List[str]
+    duration: float
+    diverged_at: Optional[int] = None
+
+    @property
+    def matches(self) -> bool:
+        """Même chemin et même issue que la partie enregistrée"""
+        return (self.diverged_at is None and self.path == self.journal.path
+                and (self.journal.outcome is None or self.outcome == self.journal.outcome))
+
+
+def record(runner, scenario: str = "", seed: Optional[int] = None):
+    """
+    Jouer une partie headless en l'enregistrant
+
+    Args:
+        runner: HeadlessRunner configuré
+        scenario: Fichier du scénario (noté dans le journal)
+        seed: Graine de la partie (aléatoire si None)
+
+    Returns:
+        (PlaythroughResult, SessionJournal)
+    """
+    recorder = SessionRecorder(scenario, seed)
+    result = runner.run_once(recorder=recorder)
+    return result, recorder.journal
+
+
+def replay(journal: SessionJournal, scene_manager: SceneManager,
+           context_factory: Callable[[], Dict], max_steps: Optional[int] = None) -> ReplayResult:
+    """
+    Rejouer un journal en headless, sans rendu ni pause
+
+    Args:
+        journal: Partie enregistrée
+        scene_manager: Scènes du même scénario
+        context_factory: Fonction retournant un game_context neuf (systèmes de jeu),
+            complété par l'état de départ et la graine de session du journal
+        max_steps: Scènes max (longueur du chemin enregistré + marge par défaut)
+    """
+    from .headless import HeadlessRunner, ScriptedChoicePolicy
+    from ..utils.rng import SeedStream
+
+    def journal_context():
+        game_context = context_factory()
+        for key, value in journal.restore_context().items():
+            game_context[key] = value
+        if journal.session_seed is not None:
+            game_context['seed_stream'] = SeedStream(journal.session_seed)
+        return game_context
+
+    runner = HeadlessRunner(
+        scene_manager,
+        policy=ScriptedChoicePolicy([choice + 1 for choice in journal.choices]),
+        context_factory=journal_context,
+        start_scene_id=journal.start_scene,
+        max_steps=max_steps or len(journal.path) + 50
+    )
+    seeder = _JournalSeeder(journal)
+    result = runner.run_once(recorder=seeder)
+    if seeder.diverged_at is None and len(result.path) != len(journal.path):
+        seeder.diverged_at = min(len(result.path), len(journal.path))
+    return ReplayResult(
+        journal=journal,
+        outcome=result.outcome,
+        path=result.path,
+        duration=result.duration,
+        diverged_at=seeder.diverged_at
+    )
@@ -0,0 +1,26 @@
+"""
+Snapshots de groupe - copies légères des personnages pour les simulations
+Alternative au pickle complet de SaveGameManager quand il faut des milliers de copies
+"""
+
+from typing import Any, List
+
+from ..utils.combat_copy import clone_combatant
+
+
+def clone_character(character: Any) -> Any:
+    """
+    Copie d'un personnage indépendante pour tout ce qu'un combat modifie
+
+    Points de vie, or, XP (attributs simples), conditions, inventaire, kills
+    (conteneurs) et emplacements de sorts (character.sc) sont propres à la
+    copie. Les objets immuables en jeu (caractéristiques, classe, race, sorts
+    connus, objets de l'inventaire) sont partagés avec l'original: pas de
+    sérialisation, coût proportionnel au nombre d'attributs.
+    """
+    return clone_combatant(character)
+
+
+def clone_party(party: List) -> List:
+    """Copier un groupe complet (voir clone_character)"""
+    return [clone_character(character) for character in party]
@@ -0,0 +1,238 @@
+"""
+Batch Combat Engine - milliers de combats indépendants résolus en parallèle (NumPy)
+Backend d'équilibrage (DND_COMBAT_BACKEND=numpy): mêmes règles d'attaque que
+EnhancedCombatSystem, sans soins, sorts ni potions
+"""
+
+from dataclasses import dataclass
+from typing import List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+from ..core.combat_profile import character_attack_bonus, character_damage_profile
+from ..utils.dice import parse_dice, DiceError
+from ..scenes.formation import DEFAULT_FRONT_ROW
+
+# Les monstres attaquent en priorité la ligne de front (comme CombatScene)
+FRONT_LINE = DEFAULT_FRONT_ROW
+
+
+def _parse_dice(text: str) -> Tuple[int, int, int]:
+    """
+    '2d6+3' -> (2, 6, 3); texte invalide -> 1d6 (comme EnhancedCombatSystem)
+    Les termes de dés supplémentaires ("1d8+1d6") sont comptés à leur moyenne
+    """
+    try:
+        expression = parse_dice(text)
+    except DiceError:
+        expression = parse_dice("1d6")
+    if not expression.terms:
+        return 0, 1, expression.bonus
+    (count, sides), extra = expression.terms[0], expression.terms[1:]
+    bonus = expression.bonus + round(sum(c * (s + 1) / 2 for c, s in extra))
+    return count, sides, bonus
+
+
+def _dice_text(dice) -> str:
+    """Texte des dés d'un DamageDice / Damage de dnd_5e_core (ou d'une chaîne)"""
+    for _ in range(3):
+        if isinstance(dice, str):
+            return dice
+        for attribute in ('dd', 'dice'):
+            if hasattr(dice, attribute):
+                dice = getattr(dice, attribute)
+                break
+        else:
+            break
+    return str(dice)
+
+
+def monster_attack_profile(monster) -> Tuple[int, str, int]:
+    """
+    Attaque principale d'un monstre: première action avec bonus d'attaque
+    (mêlée de préférence)
+
+    Returns:
+        (bonus d'attaque, dés "XdY", bonus de dommages)
+    """
+    actions = [a for a in getattr(monster, 'actions', None) or []
+               if getattr(a, 'attack_bonus', None) is not None and getattr(a, 'damages', None)]
+    if not actions:
+        return 0, "1d4", 0
+    melee = [a for a in actions if getattr(a, 'normal_range', 5) <= 10]
+    action = (melee or actions)[0]
+    damage = action.damages[0]
+    dice = getattr(damage, 'dd', damage)
+    return action.attack_bonus, _dice_text(dice), int(getattr(dice, 'bonus', 0) or 0)
+
+
+@dataclass
+class CombatantArrays:
+    """
+    Un camp en struct-of-arrays: une case par combattant, dans l'ordre de jeu
+    """
+    names: List[str]
+    hit_points: 'np.ndarray'
+    armor_class: 'np.ndarray'
+    attack_bonus: 'np.ndarray'
+    dice_count: 'np.ndarray'
+    dice_sides: 'np.ndarray'
+    damage_bonus: 'np.ndarray'
+    initiative: 'np.ndarray'
+    xp: 'np.ndarray'
+
+    def __len__(self) -> int:
+        return len(self.names)
+
+    @classmethod
+    def _build(cls, rows: List[tuple]) -> 'CombatantArrays':
+        _require_numpy()
+        columns = list(zip(*rows)) if rows else [()] * 9
+        names = list(columns[0])
+        return cls(names, *(np.array(column, dtype=np.int64) for column in columns[1:]))
+
+    @classmethod
+    def from_party(cls, party: List) -> 'CombatantArrays':
+        """Personnages: bonus et dés de EnhancedCombatSystem (arme équipée ou classe)"""
+        rows = []
+        for character in party:
+            damage_dice, ability_mod, _ = character_damage_profile(character)
+            count, sides, bonus = _parse_dice(damage_dice)
+            rows.append((
+                character.name,
+                max(0, character.hit_points),
+                getattr(character, 'armor_class', 10),
+                character_attack_bonus(character),
+                count, sides, bonus + ability_mod,
+                (character.abilities.dex - 10) // 2,
+                0,
+            ))
+        return cls._build(rows)
+
+    @classmethod
+    def from_monsters(cls, monsters: List) -> 'CombatantArrays':
+        """Monstres: attaque principale (monster_attack_profile)"""
+        rows = []
+        for monster in monsters:
+            attack_bonus, damage_dice, damage_bonus = monster_attack_profile(monster)
+            count, sides, bonus = _parse_dice(damage_dice)
+            abilities = getattr(monster, 'abilities', None)
+            rows.append((
+                monster.name,
+                max(0, monster.hit_points),
+                getattr(monster, 'armor_class', 12),
+                attack_bonus,
+                count, sides, bonus + damage_bonus,
+                (abilities.dex - 10) // 2 if abilities else 0,
+                getattr(monster, 'xp', 0),
+            ))
+        return cls._build(rows)
+
+
+@dataclass
+class BatchResult:
+    """Issue de chaque combat (une ligne par combat)"""
+    victory: 'np.ndarray'       # bool (combats,)
+    timeout: 'np.ndarray'       # bool (combats,)
+    rounds: 'np.ndarray'        # int (combats,)
+    character_hp: 'np.ndarray'  # int (combats, personnages)
+    xp: 'np.ndarray'            # int (combats,)
+
+
+def _require_numpy():
+    if not NUMPY_AVAILABLE:
+        raise ImportError("Le moteur de combat par lots requiert numpy (pip install numpy)")
+
+
+class BatchCombatEngine:
+    """
+    Résout des combats indépendants en parallèle
+
+    Boucle de CombatScene en ordre fixe ("initiative": false: personnages
+    puis monstres, 50 tours max), chaque attaque étant vectorisée sur tous
+    les combats en cours:
+    - 1 naturel: échec, 20 naturel: critique (dommages doublés)
+    - sinon touché si d20 + bonus >= CA
+    - dommages: dés + modificateur, minimum 1
+    Cibles: monstre vivant au hasard; les monstres visent la ligne de front
+    (front_row premiers personnages) tant qu'elle tient.
+    """
+
+    def __init__(self, seed: Optional[int] = None, use_initiative: bool = False,
+                 front_row: int = FRONT_LINE):
+        """
+        Args:
+            seed: Graine du générateur NumPy
+            use_initiative: Ordonner chaque camp par initiative (DEX) plutôt que
+                            par ordre du groupe
+            front_row: Taille de la ligne de front (Formation du scénario)
+        """
+        _require_numpy()
+        self.rng = np.random.default_rng(seed)
+        self.use_initiative = use_initiative
+        self.front_row = max(1, front_row)
+
+    def run(self, party: CombatantArrays, monsters: CombatantArrays, fights: int,
+            max_rounds: int = 50) -> BatchResult:
+        """Simuler fights combats du groupe contre les monstres"""
+        char_hp = np.tile(party.hit_points, (fights, 1))
+        monster_hp = np.tile(monsters.hit_points, (fights, 1))
+        rounds = np.zeros(fights, dtype=np.int64)
+
+        active = (char_hp > 0).any(axis=1) & (monster_hp > 0).any(axis=1)
+        for round_num in range(1, max_rounds + 1):
+            if not active.any():
+                break
+            rounds[active] = round_num
+
+            for index in self._order(party):
+                acting = active & (char_hp[:, index] > 0) & (monster_hp > 0).any(axis=1)
+                self._attack(party, index, acting, monster_hp, monsters.armor_class, front=None)
+
+            for index in self._order(monsters):
+                acting = active & (monster_hp[:, index] > 0) & (char_hp > 0).any(axis=1)
+                self._attack(monsters, index, acting, char_hp, party.armor_class, front=self.front_row)
+
+            active = (char_hp > 0).any(axis=1) & (monster_hp > 0).any(axis=1)
+
+        victory = (char_hp > 0).any(axis=1)
+        timeout = victory & (monster_hp > 0).any(axis=1)
+        xp = np.where(victory, int(monsters.xp.sum()), 0)
+        return BatchResult(victory, timeout, rounds, np.maximum(char_hp, 0), xp)
+
+    def _order(self, side: CombatantArrays) -> List[int]:
+        if not self.use_initiative:
+            return list(range(len(side)))
+        return [int(i) for i in np.argsort(-side.initiative, kind='stable')]
+
+    def _attack(self, attackers: CombatantArrays, index: int, acting: 'np.ndarray',
+                target_hp: 'np.ndarray', target_ac: 'np.ndarray', front: Optional[int]):
+        """Attaque du combattant index dans tous les combats où il agit"""
+        rows = np.flatnonzero(acting)
+        if rows.size == 0:
+            return
+
+        candidates = target_hp[rows] > 0
+        if front:
+            front_mask = np.zeros(candidates.shape[1], dtype=bool)
+            front_mask[:front] = True
+            in_front = candidates & front_mask
+            candidates = np.where(in_front.any(axis=1)[:, None], in_front, candidates)
+        scores = np.where(candidates, self.rng.random(candidates.shape), -1.0)
+        targets = scores.argmax(axis=1)
+
+        d20 = self.rng.integers(1, 21, size=rows.size)
+        hit = (d20 != 1) & ((d20 == 20) | (d20 + attackers.attack_bonus[index] >= target_ac[targets]))
+
+        count = int(attackers.dice_count[index])
+        sides = int(attackers.dice_sides[index])
+        damage = self.rng.integers(1, sides + 1, size=(rows.size, count)).sum(axis=1)
+        damage = np.maximum(1, damage + attackers.damage_bonus[index])
+        damage = np.where(d20 == 20, damage * 2, damage)
+
+        target_hp[rows[hit], targets[hit]] -= damage[hit]
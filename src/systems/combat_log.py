@@ -0,0 +1,365 @@
+"""
+Combat Log - journal de combat structuré, bufferisé et à niveaux de verbosité
+Les événements (attaque, dégâts, mort, soin, condition) sont enregistrés avec
+leurs valeurs numériques puis affichés une fois par tour, ou jamais (simulation)
+"""
+
+import json
+import random
+import re
+import threading
+from collections import deque
+from contextlib import contextmanager
+from enum import IntEnum
+from typing import Callable, Dict, Iterable, List, Optional
+
+
+_ANSI_ESCAPE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+
+# Résultats d'attaque dans les messages de Character.attack / Monster.attack (dnd_5e_core)
+_ATTACK_HIT = re.compile(r' for \d+ hit points!$')
+_ATTACK_MISS = re.compile(r' misses .+!$')
+
+# d20 tirés pendant l'attaque en cours, par thread (voir _install_d20_tap)
+_d20_tap = threading.local()
+_d20_tap_lock = threading.Lock()
+_d20_tap_installed = False
+
+
+def _tapped_randint(randint):
+    def tapped_randint(a, b):
+        value = randint(a, b)
+        rolls = getattr(_d20_tap, 'rolls', None)
+        if rolls is not None and a == 1 and b == 20:
+            rolls.append(value)
+        return value
+    tapped_randint.__wrapped__ = randint
+    return tapped_randint
+
+
+def _install_d20_tap() -> bool:
+    """
+    Envelopper une fois le randint des attaques de dnd_5e_core (random.randint
+    pour Character.attack, celui du module monster pour Monster.attack)
+
+    L'enveloppe délègue toujours au randint d'origine (mêmes tirages, mêmes
+    résultats); elle ne note les d20 que dans un thread qui enregistre une
+    attaque (CombatLog.attacks).
+
+    Returns:
+        False si dnd_5e_core est absent
+    """
+    global _d20_tap_installed
+    with _d20_tap_lock:
+        if not _d20_tap_installed:
+            try:
+                from dnd_5e_core.entities import monster as monster_module
+            except ImportError:
+                return False
+            random.randint = _tapped_randint(random.randint)
+            monster_module.randint = _tapped_randint(monster_module.randint)
+            _d20_tap_installed = True
+    return True
+
+
+class LogLevel(IntEnum):
+    """Niveaux d'affichage du journal"""
+    SILENT = 0   # rien (simulations, tests)
+    SUMMARY = 1  # une ligne par tour
+    NORMAL = 2   # coups portés, morts, soins, conditions
+    VERBOSE = 3  # + échecs, jets de dés, messages bruts du système de combat
+
+    @classmethod
+    def from_name(cls, name: str) -> 'LogLevel':
+        try:
+            return cls[name.strip().upper()]
+        except KeyError:
+            raise ValueError(f"Niveau de journal inconnu: {name}") from None
+
+
+class CombatEvent:
+    """Événement de combat (champs numériques, texte seulement pour les messages)"""
+
+    __slots__ = ('round', 'kind', 'actor', 'target', 'value', 'roll', 'critical', 'text')
+
+    def __init__(self, round: int, kind: str, actor: Optional[str] = None,
+                 target: Optional[str] = None, value: int = 0, roll: Optional[int] = None,
+                 critical: bool = False, text: Optional[str] = None):
+        self.round = round
+        self.kind = kind
+        self.actor = actor
+        self.target = target
+        self.value = value
+        self.roll = roll
+        self.critical = critical
+        self.text = text
+
+    def to_dict(self) -> Dict:
+        """Dict sans les champs vides (une ligne JSONL)"""
+        data = {'round': self.round, 'kind': self.kind}
+        for name in ('actor', 'target', 'roll', 'text'):
+            value = getattr(self, name)
+            if value is not None:
+                data[name] = value
+        if self.value:
+            data['value'] = self.value
+        if self.critical:
+            data['critical'] = True
+        return data
+
+    def __repr__(self) -> str:
+        return f"CombatEvent({self.to_dict()})"
+
+
+# Niveau minimal d'affichage de chaque type d'événement
+_EVENT_LEVELS = {
+    'attack': LogLevel.VERBOSE,
+    'miss': LogLevel.VERBOSE,
+    'message': LogLevel.VERBOSE,
+    'damage': LogLevel.NORMAL,
+    'kill': LogLevel.NORMAL,
+    'heal': LogLevel.NORMAL,
+    'condition': LogLevel.NORMAL,
+}
+
+
+def format_event(event: CombatEvent) -> str:
+    """Ligne lisible d'un événement"""
+    kind = event.kind
+    if kind == 'attack':
+        # Total inconnu (0) pour les attaques de dnd_5e_core, d20 inconnu pour leurs sorts
+        details = [f"d20={event.roll}"] if event.roll is not None else []
+        details += [f"total {event.value}"] if event.value else []
+        details = f" ({', '.join(details)})" if details else ""
+        return f"   🎲 {event.actor} attaque {event.target}{details}"
+    if kind == 'miss':
+        return f"   ➖ {event.actor} rate {event.target}"
+    if kind == 'damage':
+        critical = " (CRITIQUE!)" if event.critical else ""
+        weapon = f" avec {event.text}" if event.text else ""
+        return f"   ⚔️  {event.actor} touche {event.target}{weapon}: {event.value} dégâts{critical}"
+    if kind == 'kill':
+        return f"   💀 {event.target} est tué" + (f" par {event.actor}" if event.actor else "")
+    if kind == 'heal':
+        source = f" ({event.actor})" if event.actor and event.actor != event.target else ""
+        return f"   💚 {event.target} récupère {event.value} HP{source}"
+    if kind == 'condition':
+        change = "subit" if event.value >= 0 else "n'est plus sous"
+        return f"   ⚠️ {event.target} {change} {event.text}"
+    return f"   {event.text}"
+
+
+class CombatLog:
+    """
+    Journal circulaire des événements de combat
+
+    Les événements du tour en cours sont rendus d'un bloc par end_round()
+    selon le niveau; les plus anciens sortent du buffer (capacity). Avec
+    jsonl_path, chaque tour terminé est aussi ajouté au fichier JSONL, rien
+    n'est perdu même quand le buffer tourne. Avec trace, chaque événement est
+    aussi écrit dans une trace binaire (CombatTrace).
+    """
+
+    def __init__(self, level: LogLevel = LogLevel.NORMAL, capacity: int = 2000,
+                 jsonl_path: Optional[str] = None,
+                 output: Callable[[str], None] = print,
+                 trace=None):
+        """
+        Args:
+            level: Niveau d'affichage
+            capacity: Événements conservés en mémoire
+            jsonl_path: Fichier JSONL alimenté à chaque fin de tour (optionnel)
+            output: Fonction d'affichage (print par défaut)
+            trace: Trace binaire (CombatTrace, optionnelle)
+        """
+        self.level = LogLevel(level)
+        self.events: deque = deque(maxlen=capacity)
+        self.jsonl_path = jsonl_path
+        self.output = output
+        self.trace = trace
+        self.round = 0
+        self._round_start = 0  # Événements enregistrés avant le tour courant
+        self._recorded = 0
+
+    # Enregistrement
+
+    def record(self, kind: str, actor: Optional[str] = None, target: Optional[str] = None,
+               value: int = 0, roll: Optional[int] = None, critical: bool = False,
+               text: Optional[str] = None):
+        event = CombatEvent(self.round, kind, actor, target, value, roll, critical, text)
+        self.events.append(event)
+        self._recorded += 1
+        if self.trace is not None:
+            self.trace.write(event)
+
+    def attack(self, actor: str, target: str, roll: Optional[int], total: int = 0):
+        self.record('attack', actor, target, total, roll, critical=roll == 20)
+
+    def miss(self, actor: str, target: str, roll: Optional[int] = None):
+        self.record('miss', actor, target, roll=roll)
+
+    def damage(self, actor: str, target: str, amount: int, critical: bool = False,
+               weapon: Optional[str] = None):
+        self.record('damage', actor, target, amount, critical=critical, text=weapon)
+
+    def kill(self, target: str, actor: Optional[str] = None):
+        self.record('kill', actor, target)
+
+    def heal(self, target: str, amount: int, actor: Optional[str] = None):
+        self.record('heal', actor, target, amount)
+
+    def condition(self, target: str, name: str, applied: bool = True):
+        self.record('condition', None, target, 1 if applied else -1, text=name)
+
+    def message(self, text: str, clean_ansi: bool = False):
+        """Message texte d'un système de combat non structuré (signature de CombatSystem.log_message)"""
+        text = str(text)
+        if clean_ansi:
+            text = _ANSI_ESCAPE.sub('', text).strip()
+        self.record('message', text=text)
+
+    # Tours et rendu
+
+    def start_round(self, round_num: int):
+        self.round = round_num
+        self._round_start = self._recorded
+
+    def round_events(self) -> List[CombatEvent]:
+        """Événements du tour courant encore dans le buffer"""
+        count = min(self._recorded - self._round_start, len(self.events))
+        return list(self.events)[len(self.events) - count:] if count else []
+
+    def end_round(self):
+        """Rendre le tour selon le niveau et l'ajouter au fichier JSONL"""
+        if self.level == LogLevel.SILENT and not self.jsonl_path:
+            return
+        events = self.round_events()
+        if self.jsonl_path and events:
+            self._append_jsonl(self.jsonl_path, events)
+        if self.level == LogLevel.SILENT:
+            return
+        if self.level == LogLevel.SUMMARY:
+            self.output(self.summarize(events))
+            return
+        self.output(f"\n{'─' * 60}\n  TOUR {self.round}\n{'─' * 60}")
+        for event in events:
+            if self.level >= _EVENT_LEVELS.get(event.kind, LogLevel.NORMAL):
+                self.output(format_event(event))
+
+    def summarize(self, events: Iterable[CombatEvent]) -> str:
+        """Résumé d'un tour: dégâts, soins, morts"""
+        dealt = healed = kills = 0
+        for event in events:
+            if event.kind == 'damage':
+                dealt += event.value
+            elif event.kind == 'heal':
+                healed += event.value
+            elif event.kind == 'kill':
+                kills += 1
+        line = f"  Tour {self.round}: {dealt} dégâts"
+        if healed:
+            line += f", {healed} HP soignés"
+        if kills:
+            line += f", {kills} mort(s)"
+        return line
+
+    # Système de combat
+
+    def attach(self, combat_system) -> tuple:
+        """
+        Brancher un système de combat sur le journal
+
+        Les messages texte deviennent des événements 'message': par le
+        message_callback du CombatSystem de dnd_5e_core (son log_message
+        reste en place), ou en remplaçant log_message des autres systèmes.
+        EnhancedCombatSystem enregistre en plus des événements structurés
+        via son attribut combat_log.
+
+        Returns:
+            État précédent, à rendre à detach()
+        """
+        combat_log = getattr(combat_system, 'combat_log', None)
+        combat_system.combat_log = self
+        if hasattr(combat_system, 'message_callback'):
+            previous = ('message_callback', combat_system.message_callback, combat_log)
+            combat_system.message_callback = self.message
+        else:
+            previous = ('log_message', combat_system.__dict__.get('log_message'), combat_log)
+            combat_system.log_message = self.message
+        return previous
+
+    @contextmanager
+    def attacks(self, actor):
+        """
+        Jets d'attaque de actor le temps de son tour
+
+        Ses appels à attack() (Character et Monster de dnd_5e_core) deviennent
+        des événements 'attack' ou 'miss' avec le d20 tiré, pris au randint
+        de dnd_5e_core: le combat n'est pas modifié. Sans attack() propre
+        (escouades, faux combattants) ou sans dnd_5e_core, rien n'est relevé.
+        """
+        attack = getattr(actor, 'attack', None)
+        state = getattr(actor, '__dict__', None)
+        if attack is None or state is None or 'attack' in state or not _install_d20_tap():
+            yield
+            return
+
+        def recorded_attack(*args, **kwargs):
+            target = kwargs.get('monster', kwargs.get('target', args[0] if args else None))
+            previous, _d20_tap.rolls = getattr(_d20_tap, 'rolls', None), []
+            try:
+                result = attack(*args, **kwargs)
+                rolls = _d20_tap.rolls
+            finally:
+                _d20_tap.rolls = previous
+            self._record_attack_results(actor.name, getattr(target, 'name', None), result[0], rolls)
+            return result
+
+        state['attack'] = recorded_attack
+        try:
+            yield
+        finally:
+            state.pop('attack', None)
+
+    def _record_attack_results(self, actor: str, target: Optional[str], messages, rolls: List[int]):
+        """Touches et ratés d'après les messages, avec les d20 s'il y en a un par attaque"""
+        outcomes = [_ATTACK_HIT.search(line) is not None
+                    for line in str(messages or '').splitlines()
+                    if _ATTACK_HIT.search(line) or _ATTACK_MISS.search(line)]
+        if len(rolls) != len(outcomes):
+            rolls = [None] * len(outcomes)  # sorts, désavantage, capacités spéciales
+        for hit, roll in zip(outcomes, rolls):
+            if hit:
+                self.attack(actor, target, roll)
+            else:
+                self.miss(actor, target, roll)
+
+    @staticmethod
+    def detach(combat_system, previous: tuple = ('log_message', None, None)):
+        """Rendre au système de combat son affichage d'origine (état retourné par attach)"""
+        attribute, output, combat_log = previous
+        if attribute == 'log_message' and output is None:
+            combat_system.__dict__.pop('log_message', None)
+        else:
+            setattr(combat_system, attribute, output)
+        combat_system.combat_log = combat_log
+
+    # Export
+
+    def export_jsonl(self, path: str):
+        """Écrire les événements en mémoire dans un fichier JSONL"""
+        with open(path, 'w', encoding='utf-8') as f:
+            for event in self.events:
+                f.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def _append_jsonl(path: str, events: List[CombatEvent]):
+        with open(path, 'a', encoding='utf-8') as f:
+            for event in events:
+                f.write(json.dumps(event.to_dict(), ensure_ascii=False) + "\n")
+
+    @staticmethod
+    def load_jsonl(path: str) -> List[Dict]:
+        """Relire un export JSONL (analyse d'après-partie)"""
+        with open(path, 'r', encoding='utf-8') as f:
+            return [json.loads(line) for line in f if line.strip()]
@@ -0,0 +1,256 @@
+"""
+Combat Trace - trace binaire compacte des combats pour l'analyse après coup
+Un enregistrement de largeur fixe (16 octets) par événement du journal de
+combat; la table des combattants est écrite à côté (fichier .names.json)
+
+Les statistiques sur des millions d'attaques simulées se lisent par mmap
+sans analyser de texte (numpy si disponible, struct.iter_unpack sinon).
+"""
+
+import json
+import mmap
+import struct
+from collections import Counter
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Tuple
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+MAGIC = b'DNDT'
+VERSION = 1
+
+# En-tête: magie, version, taille d'un enregistrement
+HEADER = struct.Struct('<4sHH')
+# Combat, tour, type, drapeaux, acteur, cible, jet de dé, valeur
+RECORD = struct.Struct('<IHBBHHhh')
+FIELDS = ('combat', 'round', 'kind', 'flags', 'actor', 'target', 'roll', 'value')
+
+# Types d'événements (code = position); les messages texte ne sont pas tracés
+KINDS = ('attack', 'miss', 'damage', 'kill', 'heal', 'condition')
+KIND_CODES = {kind: code for code, kind in enumerate(KINDS)}
+
+FLAG_CRITICAL = 1
+
+NO_ID = 0xFFFF    # Pas d'acteur / de cible
+NO_ROLL = -1      # Pas de jet de dé
+
+_VALUE_LIMIT = 2 ** 15 - 1
+
+
+def names_path(path) -> Path:
+    """Table des combattants associée à une trace"""
+    path = Path(path)
+    return path.with_name(path.name + '.names.json')
+
+
+class CombatTrace:
+    """
+    Enregistreur de trace binaire, branché sur un CombatLog (trace=...)
+
+    Les combattants sont numérotés par nom (les mêmes ids d'un combat à
+    l'autre) avec leur camp et leur groupe: classe pour un personnage,
+    espèce pour un monstre. Les enregistrements sont bufferisés et écrits
+    par blocs.
+    """
+
+    def __init__(self, path: str, buffer_records: int = 4096):
+        """
+        Args:
+            path: Fichier de trace (écrasé)
+            buffer_records: Enregistrements gardés en mémoire avant écriture
+        """
+        self.path = Path(path)
+        self.buffer_records = buffer_records
+        self.combatants: List[Dict] = []
+        self._ids: Dict[str, int] = {}
+        self._buffer = bytearray()
+        self._pending = 0
+        self.combat = 0
+        self.records = 0
+        self._file = open(self.path, 'wb')
+        self._file.write(HEADER.pack(MAGIC, VERSION, RECORD.size))
+
+    # Combattants
+
+    def combatant_id(self, name: Optional[str], side: str = '', group: Optional[str] = None) -> int:
+        """Id d'un combattant (enregistré au premier appel)"""
+        if name is None:
+            return NO_ID
+        combatant_id = self._ids.get(name)
+        if combatant_id is None:
+            if len(self.combatants) >= NO_ID:
+                raise ValueError("Trace de combat: trop de combattants distincts")
+            combatant_id = self._ids[name] = len(self.combatants)
+            self.combatants.append({'name': name, 'side': side, 'group': group or name})
+        return combatant_id
+
+    def begin_combat(self, party: List, monsters: List):
+        """Nouveau combat: numéro suivant et combattants enregistrés avec leur groupe"""
+        self.combat += 1
+        for character in party:
+            class_type = getattr(character, 'class_type', None)
+            self.combatant_id(character.name, 'character', getattr(class_type, 'index', None))
+        for monster in monsters:
+            self.combatant_id(monster.name, 'monster', getattr(monster, 'index', None))
+
+    # Écriture
+
+    def write(self, event):
+        """Ajouter un CombatEvent (les messages texte sont ignorés)"""
+        kind = KIND_CODES.get(event.kind)
+        if kind is None:
+            return
+        flags = FLAG_CRITICAL if event.critical else 0
+        roll = NO_ROLL if event.roll is None else event.roll
+        value = max(-_VALUE_LIMIT, min(_VALUE_LIMIT, int(event.value or 0)))
+        self._buffer += RECORD.pack(self.combat, event.round, kind, flags,
+                                    self.combatant_id(event.actor), self.combatant_id(event.target),
+                                    roll, value)
+        self._pending += 1
+        if self._pending >= self.buffer_records:
+            self.flush()
+
+    def flush(self):
+        if self._buffer:
+            self._file.write(self._buffer)
+            self.records += self._pending
+            self._buffer.clear()
+            self._pending = 0
+        self._file.flush()
+
+    def close(self):
+        """Écrire les derniers enregistrements et la table des combattants"""
+        if self._file.closed:
+            return
+        self.flush()
+        self._file.close()
+        with open(names_path(self.path), 'w', encoding='utf-8') as f:
+            json.dump(self.combatants, f, ensure_ascii=False)
+
+    def __enter__(self) -> 'CombatTrace':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class TraceReader:
+    """
+    Lecture d'une trace par mmap (aucune copie du fichier)
+
+    Exemple:
+        with TraceReader("combats.trace") as trace:
+            trace.damage_by_group(side='character')   # dégâts par classe
+            trace.critical_rate_by_group(side='monster')
+    """
+
+    def __init__(self, path: str):
+        self.path = Path(path)
+        with open(names_path(self.path), 'r', encoding='utf-8') as f:
+            self.combatants: List[Dict] = json.load(f)
+        self._file = open(self.path, 'rb')
+        self._mmap = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        magic, version, record_size = HEADER.unpack_from(self._mmap)
+        if magic != MAGIC or record_size != RECORD.size:
+            self.close()
+            raise ValueError(f"Trace de combat invalide: {path}")
+        if version != VERSION:
+            self.close()
+            raise ValueError(f"Version de trace non supportée: {version}")
+        self._array = None
+
+    def __len__(self) -> int:
+        return (len(self._mmap) - HEADER.size) // RECORD.size
+
+    def records(self) -> Iterator[Tuple]:
+        """Enregistrements bruts (combat, round, kind, flags, actor, target, roll, value)"""
+        body = memoryview(self._mmap)[HEADER.size:HEADER.size + len(self) * RECORD.size]
+        try:
+            yield from RECORD.iter_unpack(body)
+        finally:
+            body.release()
+
+    def array(self):
+        """Tableau numpy structuré sur le mmap (None sans numpy)"""
+        if not NUMPY_AVAILABLE:
+            return None
+        if self._array is None:
+            dtype = np.dtype([('combat', '<u4'), ('round', '<u2'), ('kind', 'u1'), ('flags', 'u1'),
+                              ('actor', '<u2'), ('target', '<u2'), ('roll', '<i2'), ('value', '<i2')])
+            self._array = np.frombuffer(self._mmap, dtype=dtype, count=len(self), offset=HEADER.size)
+        return self._array
+
+    # Requêtes
+
+    def _count_by(self, kind: str, key: str, value: Optional[str] = None,
+                  critical: bool = False) -> Counter:
+        """Somme de value (ou nombre d'événements) par id de combattant"""
+        code = KIND_CODES[kind]
+        column = FIELDS.index(key)
+        records = self.array()
+        if records is not None:
+            selected = records[records['kind'] == code]
+            if critical:
+                selected = selected[(selected['flags'] & FLAG_CRITICAL) != 0]
+            weights = selected[value].astype(np.int64) if value else None
+            counts = np.bincount(selected[key], weights=weights)
+            return Counter({i: int(total) for i, total in enumerate(counts) if total})
+
+        totals = Counter()
+        value_column = FIELDS.index(value) if value else None
+        for record in self.records():
+            if record[2] != code or (critical and not record[3] & FLAG_CRITICAL):
+                continue
+            totals[record[column]] += record[value_column] if value_column is not None else 1
+        return totals
+
+    def _by_group(self, counts: Counter, side: Optional[str]) -> Counter:
+        groups = Counter()
+        for combatant_id, total in counts.items():
+            if combatant_id == NO_ID:
+                continue
+            combatant = self.combatants[combatant_id]
+            if side is None or combatant['side'] == side:
+                groups[combatant['group']] += total
+        return groups
+
+    def combats(self) -> int:
+        """Nombre de combats tracés"""
+        records = self.array()
+        if records is not None:
+            return len(np.unique(records['combat']))
+        return len({record[0] for record in self.records()})
+
+    def damage_by_group(self, side: Optional[str] = None) -> Counter:
+        """Dégâts infligés par groupe (classe / espèce)"""
+        return self._by_group(self._count_by('damage', 'actor', 'value'), side)
+
+    def damage_taken_by_group(self, side: Optional[str] = None) -> Counter:
+        """Dégâts subis par groupe"""
+        return self._by_group(self._count_by('damage', 'target', 'value'), side)
+
+    def kills_by_group(self, side: Optional[str] = None) -> Counter:
+        return self._by_group(self._count_by('kill', 'actor'), side)
+
+    def critical_rate_by_group(self, side: Optional[str] = None) -> Dict[str, float]:
+        """Part des jets d'attaque critiques par groupe (attaques touchées et ratées)"""
+        attacks = (self._by_group(self._count_by('attack', 'actor'), side)
+                   + self._by_group(self._count_by('miss', 'actor'), side))
+        criticals = self._by_group(self._count_by('attack', 'actor', critical=True), side)
+        return {group: criticals[group] / total for group, total in attacks.items() if total}
+
+    def close(self):
+        self._array = None
+        if not self._mmap.closed:
+            self._mmap.close()
+        self._file.close()
+
+    def __enter__(self) -> 'TraceReader':
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
@@ -0,0 +1,217 @@
+"""
+Mass Battle - grandes batailles: les monstres identiques combattent en escouades
+Chaque escouade attaque d'un bloc (nombre de touches binomial, dégâts sommés)
+et redevient une liste de monstres individuels quand elle est presque détruite
+"""
+
+import math
+from typing import Dict, List, Tuple
+
+from .batch_combat import monster_attack_profile
+from ..utils.dice import get_rng, parse_dice, DiceError
+
+# Au-delà, les tirages exacts sont remplacés par l'approximation normale
+_EXACT_LIMIT = 60
+
+
+def _binomial(n: int, p: float, rng) -> int:
+    """Nombre de succès sur n essais de probabilité p"""
+    if n <= 0 or p <= 0:
+        return 0
+    if p >= 1:
+        return n
+    if n <= _EXACT_LIMIT:
+        return sum(1 for _ in range(n) if rng.random() < p)
+    mean = n * p
+    deviation = math.sqrt(n * p * (1 - p))
+    return min(n, max(0, round(rng.gauss(mean, deviation))))
+
+
+def _sum_dice(count: int, sides: int, rng) -> int:
+    """Somme de count dés à sides faces"""
+    if count <= 0:
+        return 0
+    if count <= _EXACT_LIMIT:
+        return sum(rng.randint(1, sides) for _ in range(count))
+    mean = count * (sides + 1) / 2
+    deviation = math.sqrt(count * (sides * sides - 1) / 12)
+    return min(count * sides, max(count, round(rng.gauss(mean, deviation))))
+
+
+def _split(n: int, parts: int, rng) -> List[int]:
+    """Répartir n attaquants au hasard entre parts cibles (multinomiale uniforme)"""
+    shares = []
+    for index in range(parts - 1):
+        share = _binomial(n, 1 / (parts - index), rng)
+        shares.append(share)
+        n -= share
+    shares.append(n)
+    return shares
+
+
+def hit_probability(attack_bonus: int, armor_class: int) -> float:
+    """Probabilité de toucher: 1 naturel rate, 20 naturel touche, sinon d20 + bonus >= CA"""
+    faces = sum(1 for d20 in range(2, 20) if d20 + attack_bonus >= armor_class)
+    return (faces + 1) / 20
+
+
+class Squad:
+    """
+    Monstres identiques combattant ensemble
+
+    Les points de vie sont mis en commun: seul le premier membre (front)
+    est exposé aux coups; quand il tombe, le suivant prend sa place.
+    """
+
+    def __init__(self, members: List):
+        self.members = list(members)
+        prototype = self.members[0]
+        self.name = prototype.name
+        self.abilities = getattr(prototype, 'abilities', None)  # initiative de l'escouade
+        attack_bonus, dice_text, damage_bonus = monster_attack_profile(prototype)
+        try:
+            dice = parse_dice(dice_text)
+        except DiceError:
+            dice = parse_dice("1d4")
+        self.attack_bonus = attack_bonus
+        self.dice = dice
+        self.damage_bonus = dice.bonus + damage_bonus
+
+    @property
+    def count(self) -> int:
+        return len(self.members)
+
+    @property
+    def front(self):
+        """Membre exposé (représentant de l'escouade face aux personnages)"""
+        return self.members[0]
+
+    @property
+    def hit_points(self) -> int:
+        """Points de vie cumulés de l'escouade"""
+        return sum(max(0, m.hit_points) for m in self.members)
+
+    def remove_fallen(self) -> int:
+        """Retirer les membres tombés, retourne le nombre de pertes"""
+        before = len(self.members)
+        self.members = [m for m in self.members if m.hit_points > 0]
+        return before - len(self.members)
+
+    def roll_attacks(self, attackers: int, armor_class: int, rng) -> Tuple[int, int]:
+        """
+        Attaques groupées de attackers membres contre une CA
+
+        Returns:
+            (touches, dégâts)
+        """
+        chance = hit_probability(self.attack_bonus, armor_class)
+        hits = _binomial(attackers, chance, rng)
+        if not hits:
+            return 0, 0
+        # Parmi les touches, 20 naturel (1 chance sur 20) = critique: dés doublés
+        criticals = _binomial(hits, (1 / 20) / chance, rng)
+        damage = hits * self.damage_bonus
+        for count, sides in self.dice.terms:
+            rolled = _sum_dice(abs(count) * (hits + criticals), sides, rng)
+            damage += rolled if count > 0 else -rolled
+        return hits, max(hits, damage)
+
+    def __repr__(self) -> str:
+        return f"Squad({self.count} × {self.name}, {self.hit_points} HP)"
+
+
+class MassBattle:
+    """
+    Côté monstres d'une grande bataille
+
+    Les monstres de même nom et de même profil d'attaque forment des
+    escouades; les groupes de expand_below monstres ou moins restent des
+    individus joués normalement par le système de combat. Face aux
+    personnages, chaque escouade n'expose que son premier membre.
+    """
+
+    def __init__(self, monsters: List, expand_below: int = 3, rng=None):
+        """
+        Args:
+            monsters: Monstres du combat
+            expand_below: Taille sous laquelle une escouade est dissoute
+            rng: Générateur (random.Random...), par défaut celui des dés
+        """
+        self.expand_below = expand_below
+        self.rng = rng
+        self.individuals: List = []
+        self.squads: List[Squad] = []
+
+        groups: Dict[tuple, List] = {}
+        for monster in monsters:
+            if monster.hit_points <= 0:
+                continue
+            key = (type(monster), monster.name, getattr(monster, 'armor_class', None),
+                   monster_attack_profile(monster))
+            groups.setdefault(key, []).append(monster)
+        for members in groups.values():
+            if len(members) > expand_below:
+                self.squads.append(Squad(members))
+            else:
+                self.individuals.extend(members)
+
+    def sync(self, alive_monsters: List) -> List[Squad]:
+        """
+        Reporter les pertes puis réécrire alive_monsters (sur place):
+        premiers membres des escouades puis individus
+
+        Returns:
+            Escouades dissoutes par ces pertes (leurs survivants sont
+            désormais des individus)
+        """
+        dissolved = []
+        for squad in self.squads[:]:
+            squad.remove_fallen()
+            if squad.count <= self.expand_below:
+                # Escouade décimée: les survivants combattent individuellement
+                self.individuals.extend(squad.members)
+                self.squads.remove(squad)
+                dissolved.append(squad)
+        self.individuals = [m for m in self.individuals if m.hit_points > 0]
+        alive_monsters[:] = [squad.front for squad in self.squads] + self.individuals
+        return dissolved
+
+    def squad_turns(self, targets: List, alive_chars: List, log=None):
+        """Attaques de toutes les escouades (voir squad_turn)"""
+        for squad in self.squads:
+            self.squad_turn(squad, targets, alive_chars, log)
+
+    def squad_turn(self, squad: Squad, targets: List, alive_chars: List, log=None):
+        """
+        Attaques d'une escouade, réparties au hasard entre les cibles
+
+        Args:
+            targets: Personnages à portée (ligne de front)
+            alive_chars: Personnages vivants (les morts en sont retirés)
+            log: Journal de combat (sinon une ligne par escouade)
+        """
+        targets = [c for c in targets if c.hit_points > 0]
+        if not targets:
+            return
+        rng = self.rng or get_rng()
+        summary = []
+        for target, attackers in zip(targets, _split(squad.count, len(targets), rng)):
+            if not attackers:
+                continue
+            hits, damage = squad.roll_attacks(attackers, getattr(target, 'armor_class', 10), rng)
+            if not hits:
+                continue
+            was_standing = target.hit_points > 0
+            target.hit_points -= damage
+            summary.append(f"{target.name} -{damage} ({hits}/{attackers} touches)")
+            if log is not None:
+                log.damage(squad.name, target.name, damage)
+            if was_standing and target.hit_points <= 0:
+                if target in alive_chars:
+                    alive_chars.remove(target)
+                if log is not None:
+                    log.kill(target.name, squad.name)
+                else:
+                    summary[-1] += " 💀"
+        if log is None:
+            print(f"👹 {squad.count} × {squad.name}: {', '.join(summary) or 'aucune touche'}")
@@ -6,6 +6,8 @@ from typing import Dict, List, Optional
 from dataclasses import dataclass
 import random
 
+from ..utils.dice import roll
+
 
 @dataclass
 class Spell:
@@ -37,27 +39,8 @@ class Spell:
 
     @staticmethod
     def _roll_dice(dice_str: str) -> int:
-        """Parse and roll dice (e.g., '3d8+5')"""
-        total = 0
-
-        # Handle bonus
-        if '+' in dice_str:
-            dice_part, bonus = dice_str.split('+')
-            total += int(bonus)
-        elif '-' in dice_str:
-            dice_part, penalty = dice_str.split('-')
-            total -= int(penalty)
-        else:
-            dice_part = dice_str
-
-        # Roll dice
-        if 'd' in dice_part:
-            num, sides = map(int, dice_part.split('d'))
-            total += sum(random.randint(1, sides) for _ in range(num))
-        else:
-            total += int(dice_part)
-
-        return max(0, total)
+        """Roll dice (e.g., '3d8+5'), never below 0"""
+        return max(0, roll(dice_str))
 
 
 class SpellcastingSystem:
@@ -9,6 +9,8 @@ from dnd_5e_core import Character
 from dnd_5e_core.data import load_spell
 import random
 
+from ..utils.dice import roll
+
 
 class SpellcastingManager:
     """
@@ -177,25 +179,8 @@ class SpellcastingManager:
 
     @staticmethod
     def _roll_dice(dice_str: str) -> int:
-        """Parser et lancer dés (ex: '2d8+3')"""
-        total = 0
-
-        if '+' in dice_str:
-            dice_part, bonus = dice_str.split('+')
-            total += int(bonus)
-        elif '-' in dice_str:
-            dice_part, penalty = dice_str.split('-')
-            total -= int(penalty)
-        else:
-            dice_part = dice_str
-
-        if 'd' in dice_part:
-            num, sides = map(int, dice_part.split('d'))
-            total += sum(random.randint(1, sides) for _ in range(num))
-        else:
-            total += int(dice_part)
-
-        return max(0, total)
+        """Lancer dés (ex: '2d8+3'), jamais en dessous de 0"""
+        return max(0, roll(dice_str))
 
     @staticmethod
     def format_spell_slots(character: Character) -> str:
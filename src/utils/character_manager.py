@@ -5,6 +5,8 @@ Fournit des menus et fonctions pour gérer les personnages en jeu
 from typing import List, Optional
 from dnd_5e_core.entities import Character
 
+from ..core.combat_profile import invalidate_combat_profile
+
 
 def display_character_sheet(character: Character):
     """
@@ -278,6 +280,7 @@ def short_rest(party: List[Character]):
             actual_healing = char.hit_points - old_hp
 
             print(f"   {char.name}: +{actual_healing} HP ({old_hp} → {char.hit_points})")
+            invalidate_combat_profile(char)
 
     print("\n✅ Repos court terminé!")
 
@@ -316,6 +319,8 @@ def long_rest(party: List[Character]):
             if conditions_removed:
                 print(f"      Conditions retirées: {', '.join(conditions_removed)}")
 
+        invalidate_combat_profile(char)
+
     # Recharger magic items
     print()
     recharge_magic_items(party)
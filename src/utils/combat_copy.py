@@ -0,0 +1,43 @@
+"""
+Copies légères des combattants (personnages, monstres)
+Seul l'état modifié en combat est dupliqué, le reste est partagé avec l'original
+"""
+
+import copy
+from typing import Any
+
+# Conteneurs copiés au premier niveau (leurs éléments restent partagés)
+_CONTAINER_TYPES = (list, dict, set)
+
+# Sous-objets eux-mêmes modifiés en combat (emplacements de sorts...)
+_NESTED_STATE = ('sc',)
+
+
+def copy_containers(obj: Any) -> Any:
+    """Copie superficielle de obj dont les listes/dicts/sets sont eux aussi copiés"""
+    clone = copy.copy(obj)
+    state = getattr(clone, '__dict__', None)
+    if state is None:
+        return clone
+    for name, value in state.items():
+        if type(value) in _CONTAINER_TYPES:
+            state[name] = value.copy()
+    return clone
+
+
+def clone_combatant(combatant: Any) -> Any:
+    """
+    Copie indépendante pour tout ce qu'un combat modifie: attributs simples,
+    conteneurs et sous-objets de _NESTED_STATE (emplacements de sorts)
+    """
+    if not hasattr(combatant, '__dict__'):
+        # Objet à __slots__: pas de raccourci sûr
+        return copy.deepcopy(combatant)
+
+    clone = copy_containers(combatant)
+    state = clone.__dict__
+    for name in _NESTED_STATE:
+        nested = state.get(name)
+        if nested is not None and hasattr(nested, '__dict__'):
+            state[name] = copy_containers(nested)
+    return clone
@@ -0,0 +1,378 @@
+"""
+Distributions exactes des dommages (PMF) et du nombre de tours pour abattre une cible
+Estimation instantanée de la difficulté d'un combat, sans simulation
+
+Une attaque = mélange échec / touche / critique de la distribution des dés;
+les attaques d'un camp se convoluent en dommages par tour, dont on déduit la
+loi du nombre de tours nécessaires pour abattre chaque combattant.
+"""
+
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from .dice import parse_dice, DiceExpression
+
+# Seuils de difficulté: part des PV du groupe perdue avant d'éliminer les ennemis
+PRESSURE_THRESHOLDS = (
+    (0.15, 'trivial'),
+    (0.3, 'easy'),
+    (0.5, 'medium'),
+    (0.8, 'hard'),
+)
+
+
+class DamagePMF:
+    """
+    Loi de probabilité d'une quantité entière: probs[i] = P(X = offset + i)
+    Immuable; + convolue deux lois indépendantes
+    """
+
+    __slots__ = ('offset', 'probs')
+
+    def __init__(self, probs: Sequence[float], offset: int = 0):
+        probs = list(probs)
+        # Retirer les zéros aux extrémités (support minimal)
+        start = 0
+        while start < len(probs) - 1 and probs[start] == 0:
+            start += 1
+        end = len(probs)
+        while end > start + 1 and probs[end - 1] == 0:
+            end -= 1
+        self.offset = offset + start
+        self.probs = tuple(probs[start:end])
+
+    @classmethod
+    def point(cls, value: int) -> 'DamagePMF':
+        return cls((1.0,), value)
+
+    @classmethod
+    def uniform(cls, low: int, high: int) -> 'DamagePMF':
+        return cls([1 / (high - low + 1)] * (high - low + 1), low)
+
+    @classmethod
+    def mixture(cls, parts: Iterable[Tuple[float, 'DamagePMF']]) -> 'DamagePMF':
+        """Mélange: parts = [(poids, loi)], poids de somme 1"""
+        parts = [(w, p) for w, p in parts if w > 0]
+        low = min(p.offset for _, p in parts)
+        high = max(p.high for _, p in parts)
+        probs = [0.0] * (high - low + 1)
+        for weight, pmf in parts:
+            for i, prob in enumerate(pmf.probs):
+                probs[pmf.offset - low + i] += weight * prob
+        return cls(probs, low)
+
+    @property
+    def low(self) -> int:
+        return self.offset
+
+    @property
+    def high(self) -> int:
+        return self.offset + len(self.probs) - 1
+
+    def __add__(self, other: 'DamagePMF') -> 'DamagePMF':
+        """Somme de deux variables indépendantes (convolution)"""
+        if isinstance(other, int):
+            return DamagePMF(self.probs, self.offset + other)
+        a, b = self.probs, other.probs
+        probs = [0.0] * (len(a) + len(b) - 1)
+        for i, pa in enumerate(a):
+            if pa:
+                for j, pb in enumerate(b):
+                    probs[i + j] += pa * pb
+        return DamagePMF(probs, self.offset + other.offset)
+
+    __radd__ = __add__
+
+    def __neg__(self) -> 'DamagePMF':
+        return DamagePMF(self.probs[::-1], -self.high)
+
+    def power(self, count: int) -> 'DamagePMF':
+        """Somme de count tirages indépendants (exponentiation rapide)"""
+        result, base = DamagePMF.point(0), self
+        while count > 0:
+            if count & 1:
+                result = result + base
+            count >>= 1
+            if count:
+                base = base + base
+        return result
+
+    def clamp_min(self, minimum: int) -> 'DamagePMF':
+        """max(X, minimum): la masse inférieure est reportée sur minimum"""
+        if self.offset >= minimum:
+            return self
+        cut = min(minimum - self.offset, len(self.probs))
+        below = sum(self.probs[:cut])
+        probs = [below] + list(self.probs[cut:]) if cut < len(self.probs) else [below]
+        return DamagePMF(probs, minimum)
+
+    def scaled(self, factor: int) -> 'DamagePMF':
+        """factor * X (critique qui double le total)"""
+        probs = [0.0] * (factor * (len(self.probs) - 1) + 1)
+        for i, prob in enumerate(self.probs):
+            probs[i * factor] = prob
+        return DamagePMF(probs, self.offset * factor)
+
+    def probability(self, value: int) -> float:
+        index = value - self.offset
+        return self.probs[index] if 0 <= index < len(self.probs) else 0.0
+
+    def cdf(self, value: int) -> float:
+        """P(X <= value)"""
+        index = value - self.offset
+        if index < 0:
+            return 0.0
+        return sum(self.probs[:index + 1])
+
+    @property
+    def mean(self) -> float:
+        return sum((self.offset + i) * p for i, p in enumerate(self.probs))
+
+    @property
+    def variance(self) -> float:
+        mean = self.mean
+        return sum((self.offset + i - mean) ** 2 * p for i, p in enumerate(self.probs))
+
+    def to_dict(self) -> Dict[int, float]:
+        return {self.offset + i: p for i, p in enumerate(self.probs) if p}
+
+    def __repr__(self) -> str:
+        return f"DamagePMF({self.low}..{self.high}, moyenne {self.mean:.2f})"
+
+
+@lru_cache(maxsize=256)
+def _dice_power(count: int, sides: int) -> DamagePMF:
+    return DamagePMF.uniform(1, sides).power(count)
+
+
+def dice_pmf(dice) -> DamagePMF:
+    """Loi exacte d'une expression de dés ("2d6+3", DiceExpression)"""
+    expression = dice if isinstance(dice, DiceExpression) else parse_dice(dice)
+    pmf = DamagePMF.point(expression.bonus)
+    for count, sides in expression.terms:
+        term = _dice_power(abs(count), sides)
+        pmf = pmf + (term if count > 0 else -term)
+    return pmf
+
+
+def hit_chances(attack_bonus: int, armor_class: int) -> Tuple[float, float]:
+    """(touche normale, critique): 1 naturel rate, 20 naturel critique, sinon d20 + bonus >= CA"""
+    normal = sum(1 for d20 in range(2, 20) if d20 + attack_bonus >= armor_class)
+    return normal / 20, 1 / 20
+
+
+def attack_pmf(attack_bonus: int, armor_class: int, damage, damage_bonus: int = 0,
+               critical: str = 'dice', minimum: int = 1) -> DamagePMF:
+    """
+    Dommages d'une attaque contre une CA (0 si ratée)
+
+    Args:
+        damage: Dés de dommages ("1d8", DiceExpression)
+        damage_bonus: Bonus ajouté aux dés (modificateur de caractéristique)
+        critical: 'dice' (dés doublés, règle 5e) ou 'double' (total doublé,
+                  comme EnhancedCombatSystem)
+        minimum: Dommages minimum d'une attaque touchée
+    """
+    dice = dice_pmf(damage)
+    hit = (dice + damage_bonus).clamp_min(minimum)
+    if critical == 'double':
+        crit = hit.scaled(2)
+    else:
+        crit = (dice + dice + damage_bonus).clamp_min(minimum)
+    normal, critical_chance = hit_chances(attack_bonus, armor_class)
+    return DamagePMF.mixture([(1 - normal - critical_chance, DamagePMF.point(0)),
+                              (normal, hit), (critical_chance, crit)])
+
+
+def round_pmf(attacks: Iterable[DamagePMF]) -> DamagePMF:
+    """Dommages d'un tour: somme des attaques (indépendantes)"""
+    total = DamagePMF.point(0)
+    counts: Dict[Tuple, Tuple[DamagePMF, int]] = {}
+    for pmf in attacks:
+        key = (pmf.offset, pmf.probs)
+        counts[key] = (pmf, counts.get(key, (pmf, 0))[1] + 1)
+    # Attaques identiques regroupées: une seule exponentiation par profil
+    for pmf, count in counts.values():
+        total = total + pmf.power(count)
+    return total
+
+
+@dataclass
+class KillTime:
+    """Loi du nombre de tours pour abattre une cible"""
+    cdf: List[float]           # cdf[t-1] = P(abattue en t tours ou moins)
+    max_rounds: int
+
+    @property
+    def expected(self) -> float:
+        """Espérance (les cibles encore debout à max_rounds comptent max_rounds + 1)"""
+        survival = 1.0 + sum(1 - p for p in self.cdf)
+        return survival
+
+    def probability_by(self, rounds: int) -> float:
+        if rounds <= 0:
+            return 0.0
+        return self.cdf[min(rounds, len(self.cdf)) - 1]
+
+    @property
+    def median(self) -> Optional[int]:
+        for rounds, p in enumerate(self.cdf, 1):
+            if p >= 0.5:
+                return rounds
+        return None
+
+
+def kill_time(damage_per_round: DamagePMF, hit_points: int, max_rounds: int = 50) -> KillTime:
+    """
+    Loi exacte du nombre de tours pour infliger hit_points dommages
+
+    Les dommages cumulés restent sous hit_points (états vivants); la masse
+    qui atteint hit_points est absorbée (cible abattue).
+    """
+    if hit_points <= 0:
+        return KillTime([1.0] * max_rounds, max_rounds)
+    per_round = damage_per_round.clamp_min(0)
+    alive = [1.0] + [0.0] * (hit_points - 1)
+    killed = 0.0
+    cdf = []
+    for _ in range(max_rounds):
+        following = [0.0] * hit_points
+        for total, p_total in enumerate(alive):
+            if not p_total:
+                continue
+            for i, p_damage in enumerate(per_round.probs):
+                value = total + per_round.offset + i
+                if value >= hit_points:
+                    killed += p_total * sum(per_round.probs[i:])
+                    break
+                following[value] += p_total * p_damage
+        alive = following
+        cdf.append(min(1.0, killed))
+        if killed >= 1 - 1e-12:
+            cdf.extend([1.0] * (max_rounds - len(cdf)))
+            break
+    return KillTime(cdf, max_rounds)
+
+
+@dataclass
+class Combatant:
+    """Caractéristiques de combat utiles à l'estimation"""
+    name: str
+    hit_points: int
+    armor_class: int
+    attack_bonus: int
+    damage: str
+    damage_bonus: int = 0
+    critical: str = 'dice'
+
+    def attack_against(self, armor_class: int) -> DamagePMF:
+        return attack_pmf(self.attack_bonus, armor_class, self.damage, self.damage_bonus, self.critical)
+
+
+@dataclass
+class EncounterEstimate:
+    """
+    Estimation analytique d'un combat
+
+    Le groupe abat les ennemis un par un (dans l'ordre), toutes ses attaques
+    sur la même cible; chaque ennemi frappe tant qu'il est debout.
+    """
+    clear_rounds: float                 # Tours pour abattre tous les ennemis (espérance)
+    monster_kill_rounds: List[float]    # Tours pour abattre chaque ennemi (groupe entier)
+    character_kill_rounds: List[float]  # Tours pour qu'un personnage tombe (ennemis réunis)
+    expected_damage: float              # Dommages subis par le groupe avant la victoire
+    party_hit_points: int
+    difficulty: str = field(default='')
+
+    @property
+    def pressure(self) -> float:
+        """Part des PV du groupe perdue avant d'éliminer les ennemis"""
+        return self.expected_damage / self.party_hit_points if self.party_hit_points else float('inf')
+
+    def __post_init__(self):
+        if not self.difficulty:
+            self.difficulty = difficulty_from_pressure(self.pressure)
+
+    def to_dict(self) -> Dict:
+        return {
+            'difficulty': self.difficulty,
+            'clear_rounds': round(self.clear_rounds, 2),
+            'expected_damage': round(self.expected_damage, 1),
+            'party_hit_points': self.party_hit_points,
+            'pressure': round(self.pressure, 3),
+            'monster_kill_rounds': [round(r, 2) for r in self.monster_kill_rounds],
+            'character_kill_rounds': [round(r, 2) for r in self.character_kill_rounds],
+        }
+
+    def format_line(self) -> str:
+        first_fall = min(self.character_kill_rounds) if self.character_kill_rounds else float('inf')
+        return (f"📊 Estimation: {self.difficulty} - ennemis éliminés en ~{self.clear_rounds:.1f} tours, "
+                f"~{self.pressure:.0%} des PV du groupe perdus, "
+                f"premier personnage à terre en ~{first_fall:.1f} tours s'il est ciblé")
+
+
+def difficulty_from_pressure(pressure: float) -> str:
+    for threshold, difficulty in PRESSURE_THRESHOLDS:
+        if pressure < threshold:
+            return difficulty
+    return 'deadly'
+
+
+def estimate_encounter(party: List[Combatant], monsters: List[Combatant],
+                       max_rounds: int = 50) -> EncounterEstimate:
+    """Estimer un combat sans le simuler (voir EncounterEstimate)"""
+    monster_kill_rounds = []
+    for monster in monsters:
+        damage = round_pmf(c.attack_against(monster.armor_class) for c in party)
+        monster_kill_rounds.append(kill_time(damage, monster.hit_points, max_rounds).expected)
+
+    character_kill_rounds = []
+    for character in party:
+        damage = round_pmf(m.attack_against(character.armor_class) for m in monsters)
+        character_kill_rounds.append(kill_time(damage, character.hit_points, max_rounds).expected)
+
+    # Chaque ennemi frappe jusqu'à sa chute (cible moyenne du groupe)
+    expected_damage = 0.0
+    elapsed = 0.0
+    for monster, rounds in zip(monsters, monster_kill_rounds):
+        elapsed += rounds
+        if party:
+            per_round = sum(monster.attack_against(c.armor_class).mean for c in party) / len(party)
+            expected_damage += elapsed * per_round
+
+    return EncounterEstimate(
+        clear_rounds=elapsed,
+        monster_kill_rounds=monster_kill_rounds,
+        character_kill_rounds=character_kill_rounds,
+        expected_damage=expected_damage,
+        party_hit_points=sum(max(0, c.hit_points) for c in party),
+    )
+
+
+def combatants_from_party(party: List) -> List[Combatant]:
+    """Personnages vivants, profil de EnhancedCombatSystem (critique: total doublé)"""
+    from ..core.combat_profile import combat_profile
+    combatants = []
+    for character in party:
+        if character.hit_points <= 0:
+            continue
+        profile = combat_profile(character)
+        combatants.append(Combatant(character.name, character.hit_points,
+                                    getattr(character, 'armor_class', 10), profile.attack_bonus,
+                                    profile.damage.text, profile.ability_mod, 'double'))
+    return combatants
+
+
+def combatants_from_monsters(monsters: List) -> List[Combatant]:
+    """Monstres vivants, attaque principale (monster_attack_profile)"""
+    from ..systems.batch_combat import monster_attack_profile
+    combatants = []
+    for monster in monsters:
+        if monster.hit_points <= 0:
+            continue
+        attack_bonus, damage, damage_bonus = monster_attack_profile(monster)
+        combatants.append(Combatant(monster.name, monster.hit_points,
+                                    getattr(monster, 'armor_class', 12), attack_bonus,
+                                    damage, damage_bonus))
+    return combatants
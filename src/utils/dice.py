@@ -0,0 +1,169 @@
+"""
+Dés - expressions compilées une fois ("2d8+3", "d20", "1d6+1d4-1") et lancers
+Un seul analyseur pour tout le jeu, mis en cache par texte (lru_cache)
+
+Le générateur par défaut est le module random (random global): les parties
+enregistrées et rejouées (src.simulation.replay) restent reproductibles.
+"""
+
+import random
+import re
+from functools import lru_cache
+from typing import List, Optional, Tuple
+
+_TERM_RE = re.compile(r"([+-]?)\s*(?:(\d*)\s*[dD]\s*(\d+)|(\d+))")
+
+_rng = random
+
+
+class DiceError(ValueError):
+    """Expression de dés invalide"""
+    pass
+
+
+def set_rng(rng=None):
+    """
+    Choisir le générateur des lancers (objet avec randint/choices, ex: random.Random(42))
+    None revient au random global
+    """
+    global _rng
+    _rng = rng if rng is not None else random
+
+
+def get_rng():
+    """Générateur utilisé par défaut pour les lancers"""
+    return _rng
+
+
+class DiceExpression:
+    """
+    Expression de dés immuable: somme de termes NdS et d'un bonus fixe
+
+    min, max et mean sont calculés à la compilation.
+    """
+
+    __slots__ = ('text', 'terms', 'bonus', 'min', 'max', 'mean')
+
+    def __init__(self, text: str, terms: Tuple[Tuple[int, int], ...], bonus: int):
+        """
+        Args:
+            text: Texte d'origine
+            terms: (nombre de dés, faces), nombre négatif pour un terme soustrait
+            bonus: Bonus fixe (peut être négatif)
+        """
+        low = high = bonus
+        mean = float(bonus)
+        for count, sides in terms:
+            if count >= 0:
+                low += count
+                high += count * sides
+            else:
+                low += count * sides
+                high += count
+            mean += count * (sides + 1) / 2
+        for name, value in (('text', text), ('terms', terms), ('bonus', bonus),
+                            ('min', low), ('max', high), ('mean', mean)):
+            object.__setattr__(self, name, value)
+
+    def __setattr__(self, name, value):
+        raise AttributeError("DiceExpression est immuable")
+
+    def __reduce__(self):
+        return parse_dice, (self.text,)
+
+    @property
+    def dice_count(self) -> int:
+        """Nombre total de dés lancés"""
+        return sum(abs(count) for count, _ in self.terms)
+
+    def roll(self, rng=None) -> int:
+        """Lancer les dés (générateur par défaut: voir set_rng)"""
+        randint = (rng or _rng).randint
+        total = self.bonus
+        for count, sides in self.terms:
+            if count >= 0:
+                for _ in range(count):
+                    total += randint(1, sides)
+            else:
+                for _ in range(-count):
+                    total -= randint(1, sides)
+        return total
+
+    def roll_many(self, n: int, rng=None) -> List[int]:
+        """
+        n lancers d'un coup: les dés de chaque terme sont tirés en un seul appel
+        (random.choices), bien plus rapide que n appels à roll()
+        """
+        rng = rng or _rng
+        totals = [self.bonus] * n
+        for count, sides in self.terms:
+            faces = range(1, sides + 1)
+            dice = abs(count)
+            values = rng.choices(faces, k=n * dice)
+            sign = 1 if count >= 0 else -1
+            if dice == 1:
+                totals = [t + sign * v for t, v in zip(totals, values)]
+            else:
+                totals = [t + sign * sum(values[i * dice:(i + 1) * dice]) for i, t in enumerate(totals)]
+        return totals
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"DiceExpression({self.text!r}, min={self.min}, max={self.max}, mean={self.mean})"
+
+    def __eq__(self, other) -> bool:
+        return isinstance(other, DiceExpression) and (self.terms, self.bonus) == (other.terms, other.bonus)
+
+    def __hash__(self) -> int:
+        return hash((self.terms, self.bonus))
+
+
+@lru_cache(maxsize=512)
+def parse_dice(text: str) -> DiceExpression:
+    """
+    Compiler une expression de dés (résultat mis en cache par texte)
+
+    Formes acceptées: "3", "d20", "2d8+3", "1d8 - 1", "2d6+1d4+2"
+
+    Raises:
+        DiceError: si l'expression est invalide
+    """
+    source = str(text).strip()
+    terms = []
+    bonus = 0
+    position = 0
+    while position < len(source):
+        match = _TERM_RE.match(source, position)
+        if not match or match.end() == position or (position > 0 and not match.group(1)):
+            raise DiceError(f"Expression de dés invalide: {text!r}")
+        sign = -1 if match.group(1) == '-' else 1
+        if match.group(3):
+            count = int(match.group(2) or 1)
+            sides = int(match.group(3))
+            if sides < 1:
+                raise DiceError(f"Dé sans face: {text!r}")
+            terms.append((sign * count, sides))
+        else:
+            bonus += sign * int(match.group(4))
+        position = match.end()
+        while position < len(source) and source[position].isspace():
+            position += 1
+    if not terms and not source:
+        raise DiceError("Expression de dés vide")
+    return DiceExpression(source, tuple(terms), bonus)
+
+
+def roll(text: str, rng=None) -> int:
+    """Lancer une expression de dés: roll("2d6+3")"""
+    return parse_dice(text).roll(rng)
+
+
+def roll_or(text: Optional[str], default: str, rng=None) -> int:
+    """Lancer text, ou default si text est absent ou invalide"""
+    try:
+        expression = parse_dice(text) if text else parse_dice(default)
+    except DiceError:
+        expression = parse_dice(default)
+    return expression.roll(rng)
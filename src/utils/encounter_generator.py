@@ -1,10 +1,13 @@
 """
 Générateur de rencontres aléatoires depuis tables PDF
 """
-import random
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 
+from .dice import parse_dice, DiceError
+from .damage_pmf import estimate_encounter, combatants_from_party, combatants_from_monsters
+from .monster_index import MonsterEntry, monster_index
+
 
 @dataclass
 class EncounterTable:
@@ -17,12 +20,29 @@ class EncounterTable:
 class RandomEncounterGenerator:
     """Génère des rencontres aléatoires"""
 
-    def __init__(self, encounter_data: List[Dict]):
+    def __init__(self, encounter_data: List[Dict], rng=None, index=None):
         """
         Args:
             encounter_data: Données extraites du PDF
+            rng: Générateur des jets (défaut: celui des dés, voir src.utils.rng)
+            index: Index des monstres (défaut: monster_index() partagé, construit
+                au premier monstre résolu)
         """
+        self.index = index
         self.tables = self._build_tables(encounter_data)
+        self.rng = rng
+
+    def resolve_monster(self, text: str) -> Optional[str]:
+        """Id du monstre désigné par un texte du PDF ("2d4 goblins" -> "goblin"), None si inconnu"""
+        index = self.index or monster_index()
+        entry = index.find(text)
+        return entry.id if entry else None
+
+    def _resolved(self, entry: Dict) -> Dict:
+        """Entrée de table avec son 'monster_id', résolu à la première utilisation"""
+        if 'monster_id' not in entry:
+            entry['monster_id'] = self.resolve_monster(entry['monster_type'])
+        return entry
 
     def _build_tables(self, data: List[Dict]) -> List[EncounterTable]:
         """Construire tables depuis données"""
@@ -33,10 +53,11 @@ class RandomEncounterGenerator:
         if data:
             entries = []
             for enc in data:
+                monster_type = enc.get('monster_type', enc['description'])
                 entries.append({
                     'roll': enc['roll'],
                     'count': enc.get('count', '1'),
-                    'monster_type': enc.get('monster_type', enc['description']),
+                    'monster_type': monster_type,
                     'description': enc['description']
                 })
 
@@ -73,20 +94,18 @@ class RandomEncounterGenerator:
             if self._matches_roll(roll, entry['roll']):
                 return {
                     'rolled': roll,
-                    'encounter': entry,
+                    'encounter': self._resolved(entry),
                     'table': table.name
                 }
 
         return None
 
     def _roll_dice(self, die_spec: str) -> int:
-        """Lancer un dé (ex: "1d6" -> 1-6)"""
-        match = die_spec.split('d')
-        if len(match) == 2:
-            count = int(match[0])
-            sides = int(match[1])
-            return sum(random.randint(1, sides) for _ in range(count))
-        return 1
+        """Lancer un dé (ex: "1d6" -> 1-6), 1 si le spec est invalide"""
+        try:
+            return parse_dice(die_spec).roll(self.rng)
+        except DiceError:
+            return 1
 
     def _matches_roll(self, roll: int, roll_spec: str) -> bool:
         """Vérifier si le jet correspond au spec (ex: "1-2", "3", "4-6")"""
@@ -109,7 +128,7 @@ class RandomEncounterGenerator:
                 all_encounters.append({
                     'table': table.name,
                     'roll_spec': entry['roll'],
-                    'encounter': entry
+                    'encounter': self._resolved(entry)
                 })
         return all_encounters
 
@@ -140,16 +159,19 @@ class EncounterDifficultyCalculator:
     }
 
     @classmethod
-    def calculate_difficulty(cls, party_levels: List[int], monsters_cr: List[float]) -> Dict:
+    def calculate_difficulty(cls, party_levels: List[int], monsters_cr: List[float],
+                             party: Optional[List] = None, monsters: Optional[List] = None) -> Dict:
         """
         Calculer la difficulté d'une rencontre
 
         Args:
             party_levels: Niveaux des PJs
             monsters_cr: CRs des monstres
+            party: Personnages (optionnel, avec monsters: estimation analytique)
+            monsters: Monstres créés (optionnel)
 
         Returns:
-            Dict avec difficulté et détails
+            Dict avec difficulté et détails ('analysis' si party et monsters)
         """
         # XP total des monstres
         monster_xp = sum(cls.XP_BY_CR.get(cr, 0) for cr in monsters_cr)
@@ -178,7 +200,7 @@ class EncounterDifficultyCalculator:
         else:
             difficulty = 'deadly'
 
-        return {
+        result = {
             'difficulty': difficulty,
             'monster_xp': monster_xp,
             'adjusted_xp': adjusted_xp,
@@ -186,6 +208,44 @@ class EncounterDifficultyCalculator:
             'thresholds': party_thresholds
         }
 
+        # Combattants connus: distributions exactes des dommages plutôt que les seuils XP
+        if party and monsters:
+            estimate = estimate_encounter(combatants_from_party(party), combatants_from_monsters(monsters))
+            result['difficulty'] = estimate.difficulty
+            result['analysis'] = estimate.to_dict()
+
+        return result
+
+    @classmethod
+    def suggest_monsters(cls, party_levels: List[int], difficulty: str = 'medium', count: int = 1,
+                         monster_type: Optional[str] = None, index=None) -> List[MonsterEntry]:
+        """
+        Monstres dont count exemplaires donnent la difficulté voulue
+
+        Args:
+            party_levels: Niveaux des PJs
+            difficulty: 'easy', 'medium', 'hard' ou 'deadly'
+            count: Nombre de monstres identiques
+            monster_type: Type de créature (ex: 'undead'), tous si None
+            index: Index des monstres (défaut: monster_index() partagé)
+
+        Returns:
+            Fiches par FP croissant (requête par intervalle d'XP)
+        """
+        levels = ['easy', 'medium', 'hard', 'deadly']
+        thresholds = [sum(cls.THRESHOLDS.get(lvl, cls.THRESHOLDS[1])[name] for lvl in party_levels)
+                      for name in levels]
+        position = levels.index(difficulty)
+
+        # XP ajustée dans [seuil, seuil suivant[, ramenée à un monstre
+        scale = cls._get_multiplier(count, len(party_levels)) * count
+        xp_min = -(-thresholds[position] // scale)
+        xp_max = None
+        if position + 1 < len(levels):
+            xp_max = -(-thresholds[position + 1] // scale) - 1
+        return (index or monster_index()).query(type=monster_type, xp_min=int(xp_min),
+                                                xp_max=None if xp_max is None else int(xp_max))
+
     @staticmethod
     def _get_multiplier(num_monsters: int, num_players: int) -> float:
         """Multiplicateur selon nombre de monstres"""
@@ -2,6 +2,8 @@
 from typing import Dict, List
 from dnd_5e_core import Character
 
+from ..core.combat_profile import invalidate_combat_profile
+
 
 class LevelUpManager:
     """Gestionnaire de montée de niveau"""
@@ -30,6 +32,7 @@ class LevelUpManager:
         hp_gain = (hit_die // 2 + 1) + con_mod
         character.max_hit_points += hp_gain
         character.hit_points = character.max_hit_points
+        invalidate_combat_profile(character)
         return True
 
     @classmethod
@@ -0,0 +1,301 @@
+"""
+Index des monstres connus - requêtes par FP, XP, type, taille et alignement
+Tableaux triés (bisect) par FP et par XP, et un seau par valeur de type,
+taille et alignement (chacun trié par FP): une requête coûte O(log n + k)
+au lieu d'un parcours du bestiaire
+"""
+
+import json
+import re
+import threading
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, replace
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from .monster_registry import monster_registry, parse_challenge_rating
+
+_COUNT_RE = re.compile(r"^\s*(\d*d\d+(\s*[+-]\s*\d+)?|\d+)\s+", re.IGNORECASE)
+
+# XP d'un monstre selon son FP (fiches 5etools de dnd_5e_core, sans XP)
+XP_BY_CHALLENGE_RATING = {
+    0: 10, 0.125: 25, 0.25: 50, 0.5: 100, 1: 200, 2: 450, 3: 700, 4: 1100, 5: 1800,
+    6: 2300, 7: 2900, 8: 3900, 9: 5000, 10: 5900, 11: 7200, 12: 8400, 13: 10000,
+    14: 11500, 15: 13000, 16: 15000, 17: 18000, 18: 20000, 19: 22000, 20: 25000,
+    21: 33000, 22: 41000, 23: 50000, 24: 62000, 25: 75000, 26: 90000, 27: 105000,
+    28: 120000, 29: 135000, 30: 155000,
+}
+
+# Abréviations des fiches 5etools
+_SIZE_CODES = {'t': 'tiny', 's': 'small', 'm': 'medium', 'l': 'large', 'h': 'huge', 'g': 'gargantuan'}
+_ALIGNMENT_CODES = {'l': 'lawful', 'n': 'neutral', 'c': 'chaotic', 'g': 'good', 'e': 'evil',
+                    'u': 'unaligned', 'a': 'any alignment'}
+
+# Dossiers de fiches de dnd_5e_core, dans l'ordre de recherche de load_monster
+_API_FOLDERS = ('official', 'extended')
+
+
+@dataclass(frozen=True)
+class MonsterEntry:
+    """Fiche résumée d'un monstre (de quoi choisir, pas de quoi combattre)"""
+    id: str
+    name: str
+    challenge_rating: float
+    xp: int
+    type: str = ''
+    size: str = ''
+    alignment: str = ''
+    source: str = 'local'
+
+
+def normalize_name(name: str) -> str:
+    """Clé de recherche: minuscules, tirets ("Goblin Boss" -> "goblin-boss")"""
+    return re.sub(r"[\s_]+", '-', name.strip().lower())
+
+
+def singular_forms(text: str) -> List[str]:
+    """
+    Le texte puis ses singuliers possibles (pluriels anglais réguliers):
+    "goblins" -> goblin, "harpies" -> harpy, "wolves" -> wolf, "knives" -> knife.
+    Les pluriels irréguliers ("men", "mice", "oxen") ne sont pas reconnus
+    """
+    forms = [text]
+    if text.endswith('ies'):
+        forms.append(text[:-3] + 'y')
+    if text.endswith('ves'):
+        forms.extend((text[:-3] + 'f', text[:-3] + 'fe'))
+    if text.endswith('es'):
+        forms.append(text[:-2])
+    if text.endswith('s'):
+        forms.append(text[:-1])
+    return forms
+
+
+def _field(item, key: str, default=None):
+    if isinstance(item, dict):
+        return item.get(key, default)
+    return getattr(item, key, default)
+
+
+def _label(value) -> str:
+    """Type / taille / alignement en minuscules (texte ou objet de l'API)"""
+    value = getattr(value, 'value', value)
+    if isinstance(value, dict):
+        return _label(value.get('name') or value.get('index') or value.get('type') or value.get('choose'))
+    if isinstance(value, list):
+        value = ' or '.join(str(v) for v in value)  # 5etools: {"choose": ["fey", "fiend"]}
+    return str(value or '').strip().lower()
+
+
+def entry_from(monster_id: str, item, source: str) -> MonsterEntry:
+    """Résumé d'une fiche JSON (locale ou API) ou d'un objet Monster"""
+    return MonsterEntry(
+        id=monster_id,
+        name=_field(item, 'name') or monster_id,
+        challenge_rating=parse_challenge_rating(_field(item, 'challenge_rating', 0)),
+        xp=int(_field(item, 'xp', 0) or 0),
+        type=_label(_field(item, 'type')),
+        size=_label(_field(item, 'size')),
+        alignment=_label(_field(item, 'alignment')),
+        source=source,
+    )
+
+
+class _SortedEntries:
+    """Fiches triées par une clé numérique, recherche d'intervalle par bisect"""
+
+    __slots__ = ('keys', 'entries')
+
+    def __init__(self, entries: Iterable[MonsterEntry], key):
+        ordered = sorted(entries, key=lambda e: (key(e), e.id))
+        self.keys = [key(e) for e in ordered]
+        self.entries = ordered
+
+    def between(self, low: Optional[float], high: Optional[float]) -> List[MonsterEntry]:
+        start = 0 if low is None else bisect_left(self.keys, low)
+        end = len(self.keys) if high is None else bisect_right(self.keys, high)
+        return self.entries[start:end]
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+
+def _by_cr(entry: MonsterEntry) -> float:
+    return entry.challenge_rating
+
+
+def _by_xp(entry: MonsterEntry) -> int:
+    return entry.xp
+
+
+class MonsterIndex:
+    """
+    Index en mémoire du bestiaire
+
+    Exemple:
+        index = monster_index()
+        index.query(type='undead', cr_min=0.25, cr_max=2)
+        index.find("2d4 Goblins")   # -> MonsterEntry('goblin', ...)
+    """
+
+    BUCKETS = ('type', 'size', 'alignment')
+
+    def __init__(self, entries: Iterable[MonsterEntry]):
+        # Premier arrivé gardé: les fiches locales priment ("goblin_boss" == "goblin-boss")
+        self._ids: Dict[str, MonsterEntry] = {}
+        seen = set()
+        for entry in entries:
+            key = normalize_name(entry.id)
+            if key not in seen:
+                seen.add(key)
+                self._ids[entry.id] = entry
+        self._cr = _SortedEntries(self._ids.values(), _by_cr)
+        self._xp = _SortedEntries(self._ids.values(), _by_xp)
+
+        # Un seau trié par FP pour chaque valeur de type, taille, alignement
+        self._buckets: Dict[str, Dict[str, _SortedEntries]] = {}
+        for field in self.BUCKETS:
+            groups: Dict[str, List[MonsterEntry]] = {}
+            for entry in self._cr.entries:
+                groups.setdefault(getattr(entry, field), []).append(entry)
+            self._buckets[field] = {value: _SortedEntries(group, _by_cr) for value, group in groups.items()}
+
+        self._names: Dict[str, MonsterEntry] = {}
+        for entry in self._cr.entries:
+            self._names.setdefault(normalize_name(entry.id), entry)
+            self._names.setdefault(normalize_name(entry.name), entry)
+
+    @classmethod
+    def from_sources(cls, registry=None, include_api: bool = True) -> 'MonsterIndex':
+        """Index des fiches locales du registre, complétées par dnd_5e_core"""
+        registry = registry or monster_registry()
+        entries = [entry_from(monster_id, data, 'local')
+                   for monster_id, data in registry.local_monsters.items()]
+        if include_api:
+            entries.extend(_api_entries())
+        return cls(entries)
+
+    # Accès
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def __contains__(self, monster_id: str) -> bool:
+        return monster_id in self._ids
+
+    def get(self, monster_id: str) -> Optional[MonsterEntry]:
+        return self._ids.get(monster_id)
+
+    def values(self, field: str) -> List[str]:
+        """Valeurs connues d'un champ indexé ('type', 'size', 'alignment')"""
+        return sorted(self._buckets[field])
+
+    def find(self, name: str) -> Optional[MonsterEntry]:
+        """
+        Monstre désigné par un texte de PDF ou de scénario: id, nom, pluriel,
+        nombre ou dés en tête ("goblin_boss", "Goblin Boss", "2d4 goblins")
+        """
+        text = normalize_name(_COUNT_RE.sub('', name or ''))
+        for candidate in singular_forms(text):
+            if candidate in self._names:
+                return self._names[candidate]
+        return None
+
+    # Requêtes
+
+    def by_challenge_rating(self, low: Optional[float] = None, high: Optional[float] = None) -> List[MonsterEntry]:
+        """Monstres de FP compris entre low et high (inclus), par FP croissant"""
+        return self._cr.between(low, high)
+
+    def by_xp(self, low: Optional[int] = None, high: Optional[int] = None) -> List[MonsterEntry]:
+        """Monstres d'XP comprise entre low et high (inclus), par XP croissante"""
+        return self._xp.between(low, high)
+
+    def query(self, type: Optional[str] = None, size: Optional[str] = None,
+              alignment: Optional[str] = None, cr_min=None, cr_max=None,
+              xp_min: Optional[int] = None, xp_max: Optional[int] = None) -> List[MonsterEntry]:
+        """
+        Monstres vérifiant tous les critères, par FP croissant
+
+        Le plus petit ensemble de départ (seau, intervalle de FP ou d'XP) est
+        trouvé par bisect, les autres critères ne filtrent que ses k fiches.
+        cr_min / cr_max acceptent "1/4".
+        """
+        cr_min = None if cr_min is None else parse_challenge_rating(cr_min)
+        cr_max = None if cr_max is None else parse_challenge_rating(cr_max)
+        filters = {'type': type, 'size': size, 'alignment': alignment}
+
+        candidates: List[Tuple[int, str, List[MonsterEntry]]] = []
+        for field, value in filters.items():
+            if value is not None:
+                bucket = self._buckets[field].get(_label(value))
+                if bucket is None:
+                    return []
+                matches = bucket.between(cr_min, cr_max)
+                candidates.append((len(matches), field, matches))
+        if xp_min is not None or xp_max is not None:
+            matches = self._xp.between(xp_min, xp_max)
+            candidates.append((len(matches), 'xp', matches))
+        if not candidates:
+            return self._cr.between(cr_min, cr_max)
+
+        _, source, entries = min(candidates, key=lambda c: c[0])
+        results = [
+            entry for entry in entries
+            if all(value is None or field == source or getattr(entry, field) == _label(value)
+                   for field, value in filters.items())
+            and (xp_min is None or entry.xp >= xp_min)
+            and (xp_max is None or entry.xp <= xp_max)
+            and (cr_min is None or entry.challenge_rating >= cr_min)
+            and (cr_max is None or entry.challenge_rating <= cr_max)
+        ]
+        if source == 'xp':
+            results.sort(key=lambda e: (e.challenge_rating, e.id))
+        return results
+
+
+def api_entry(monster_id: str, data: Dict) -> MonsterEntry:
+    """Résumé d'une fiche brute de dnd_5e_core (format de l'API 5e ou de 5etools)"""
+    entry = entry_from(monster_id, data, 'dnd_5e_core')
+    alignment = entry.alignment
+    if alignment and all(len(code) == 1 for code in alignment.split()):
+        alignment = ' '.join(_ALIGNMENT_CODES.get(code, code) for code in alignment.split())
+    return replace(entry, size=_SIZE_CODES.get(entry.size, entry.size), alignment=alignment,
+                   xp=entry.xp or XP_BY_CHALLENGE_RATING.get(entry.challenge_rating, 0))
+
+
+def _api_entries() -> List[MonsterEntry]:
+    """
+    Fiches brutes de dnd_5e_core (data/monsters/*/*.json), aucune si le
+    package est absent. Les objets Monster de load_all_monsters() n'ont ni
+    type, ni taille, ni alignement: le JSON est lu directement.
+    """
+    try:
+        from dnd_5e_core.data import get_data_directory
+        directory = Path(get_data_directory()) / "monsters"
+    except Exception:
+        return []
+    entries = []
+    for folder in _API_FOLDERS:
+        for path in sorted((directory / folder).glob("*.json")):
+            try:
+                data = json.loads(path.read_bytes())
+            except (OSError, ValueError):
+                continue
+            if isinstance(data, dict) and data.get('name'):
+                entries.append(api_entry(data.get('index') or path.stem, data))
+    return entries
+
+
+_index: Optional[MonsterIndex] = None
+_index_lock = threading.Lock()
+
+
+def monster_index() -> MonsterIndex:
+    """Index partagé du processus (construit au premier appel)"""
+    global _index
+    if _index is None:
+        with _index_lock:
+            if _index is None:
+                _index = MonsterIndex.from_sources()
+    return _index
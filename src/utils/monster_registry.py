@@ -0,0 +1,264 @@
+"""
+Registre des monstres partagé par tout le processus
+Une seule source pour les monstres locaux (data/monsters/all_monsters.json)
+et ceux de dnd_5e_core: fichier lu une fois, chaque fiche convertie une fois
+en prototype, puis clonée à chaque création (voir clone_monster)
+"""
+
+import json
+import threading
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional
+
+from .combat_copy import clone_combatant
+
+DEFAULT_MONSTERS_PATH = Path(__file__).parent.parent.parent / "data" / "monsters" / "all_monsters.json"
+
+
+def clone_monster(prototype):
+    """
+    Copie ne dupliquant que l'état modifié en combat: attributs simples
+    (HP...), conteneurs (conditions...) et emplacements de sorts (sc).
+    Caractéristiques, actions et dés restent partagés avec le prototype.
+    """
+    return clone_combatant(prototype)
+
+
+# Conversion des fiches
+
+def parse_feet(value, default: int = 5) -> int:
+    """Distance en pieds: 30, "30 ft", "80/320 ft" (portée normale)"""
+    if isinstance(value, (int, float)):
+        return int(value)
+    if not value:
+        return default
+    try:
+        return int(str(value).split('/')[0].replace('ft', '').strip())
+    except ValueError:
+        return default
+
+
+def parse_challenge_rating(value) -> float:
+    """FP numérique: 2, "2", "1/4" """
+    if isinstance(value, str):
+        if '/' in value:
+            numerator, denominator = value.split('/')
+            return float(numerator) / float(denominator)
+        return float(value)
+    return float(value or 0)
+
+
+def parse_armor_class(value) -> int:
+    """CA: entier ou liste de l'API ([{'value': 15, ...}])"""
+    if isinstance(value, list):
+        return value[0].get('value', 10) if value else 10
+    if isinstance(value, int):
+        return value
+    return 10
+
+
+def _walk_speed(speed) -> int:
+    return parse_feet(speed.get('walk', '30 ft'), 30) if isinstance(speed, dict) else 30
+
+
+def _action(name: str, desc: str, attack_bonus: int, damage_dice: str,
+            damage_type: str, normal_range: int):
+    from dnd_5e_core.combat import Action, ActionType, Damage
+    from dnd_5e_core.equipment import DamageType
+    from dnd_5e_core.mechanics import DamageDice
+
+    return Action(
+        name=name,
+        desc=desc,
+        type=ActionType.MELEE if normal_range <= 10 else ActionType.RANGED,
+        attack_bonus=attack_bonus,
+        damages=[Damage(
+            type=DamageType(index=damage_type.lower(), name=damage_type.capitalize(),
+                            desc=f"{damage_type} damage"),
+            dd=DamageDice(damage_dice)
+        )],
+        normal_range=normal_range
+    )
+
+
+def _monster(index: str, name: str, abilities: Dict, armor_class: int, hit_points: int,
+             hit_dice: str, xp: int, speed: int, challenge_rating: float, actions: List):
+    from dnd_5e_core import Abilities, Monster
+
+    return Monster(
+        index=index,
+        name=name,
+        abilities=Abilities(**{key: abilities.get(key, 10)
+                               for key in ('str', 'dex', 'con', 'int', 'wis', 'cha')}),
+        proficiencies=[],
+        armor_class=armor_class,
+        hit_points=hit_points,
+        hit_dice=hit_dice,
+        xp=xp,
+        speed=speed,
+        challenge_rating=challenge_rating,
+        actions=actions
+    )
+
+
+def monster_from_local(monster_id: str, data: Dict):
+    """Monstre d'une fiche de all_monsters.json (actions sans attaque ignorées)"""
+    actions = [
+        _action(action['name'], action.get('desc', ''), action['attack_bonus'],
+                action.get('damage_dice', '1d6'), action.get('damage_type', 'slashing'),
+                parse_feet(action.get('range')))
+        for action in data.get('actions', []) if 'attack_bonus' in action
+    ]
+    return _monster(monster_id, data['name'], data['abilities'], data['armor_class'],
+                    data['hit_points'], data['hit_dice'], data['xp'], _walk_speed(data.get('speed')),
+                    parse_challenge_rating(data['challenge_rating']), actions)
+
+
+def monster_from_api(monster_id: str, data: Dict):
+    """Monstre d'une fiche dnd_5e_core.data.load_monster (format de l'API 5e)"""
+    actions = []
+    for action in data.get('actions', []):
+        if 'attack_bonus' not in action or not action.get('damage'):
+            continue
+        damage = action['damage'][0] if isinstance(action['damage'], list) else action['damage']
+        damage_type = damage.get('damage_type', {}).get('name', 'slashing')
+        # Portée absente des fiches de l'API: attaques traitées comme de la mêlée
+        actions.append(_action(action.get('name', 'Attack'), action.get('desc', ''), action['attack_bonus'],
+                               damage.get('damage_dice', '1d6'), damage_type, 5))
+
+    abilities = {'str': data.get('strength', 10), 'dex': data.get('dexterity', 10),
+                 'con': data.get('constitution', 10), 'int': data.get('intelligence', 10),
+                 'wis': data.get('wisdom', 10), 'cha': data.get('charisma', 10)}
+    return _monster(data.get('index', monster_id), data.get('name', monster_id.replace('-', ' ').title()),
+                    abilities, parse_armor_class(data.get('armor_class')), data.get('hit_points', 1),
+                    data.get('hit_points_roll', data.get('hit_dice', '1d8')), data.get('xp', 0),
+                    _walk_speed(data.get('speed')), parse_challenge_rating(data.get('challenge_rating', 0)),
+                    actions)
+
+
+def _load_api_monster(monster_id: str) -> Optional[Dict]:
+    from dnd_5e_core.data import load_monster
+
+    return load_monster(monster_id.replace('_', '-')) or load_monster(monster_id)
+
+
+class MonsterRegistry:
+    """
+    Fabrique de monstres: fiches locales d'abord, puis dnd_5e_core
+
+    Le fichier local est lu au premier besoin; chaque id est converti une
+    fois en prototype (jamais remis au jeu, None si introuvable), puis
+    create_monster() en renvoie une copie (clone_monster). Sûr entre threads
+    (préchargement des combats en arrière-plan).
+    """
+
+    def __init__(self, local_path: Optional[str] = None,
+                 api_loader: Callable[[str], Optional[Dict]] = _load_api_monster):
+        """
+        Args:
+            local_path: Fiches locales (data/monsters/all_monsters.json par défaut)
+            api_loader: Fiche dnd_5e_core d'un id (None si inconnu)
+        """
+        self.local_path = Path(local_path) if local_path else DEFAULT_MONSTERS_PATH
+        self.api_loader = api_loader
+        self._local: Optional[Dict[str, Dict]] = None
+        self._prototypes: Dict[str, object] = {}
+        self._lock = threading.RLock()
+
+    @property
+    def local_monsters(self) -> Dict[str, Dict]:
+        """Fiches locales {id: fiche}, lues une seule fois"""
+        if self._local is None:
+            with self._lock:
+                if self._local is None:
+                    self._local = self._read_local()
+        return self._local
+
+    def _read_local(self) -> Dict[str, Dict]:
+        if not self.local_path.exists():
+            return {}
+        try:
+            with open(self.local_path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            print(f"⚠️ Erreur chargement monstres locaux: {e}")
+            return {}
+
+    def prototype(self, monster_id: str):
+        """Prototype de monster_id (construit au premier appel, None si introuvable)"""
+        try:
+            return self._prototypes[monster_id]
+        except KeyError:
+            pass
+        with self._lock:
+            if monster_id not in self._prototypes:
+                self._prototypes[monster_id] = self._create_prototype(monster_id)
+            return self._prototypes[monster_id]
+
+    def _create_prototype(self, monster_id: str):
+        try:
+            if monster_id in self.local_monsters:
+                return monster_from_local(monster_id, self.local_monsters[monster_id])
+            data = self.api_loader(monster_id)
+            if data:
+                return monster_from_api(monster_id, data)
+        except Exception as e:
+            print(f"⚠️ Erreur lors de la création du monstre {monster_id}: {e}")
+            return None
+        print(f"⚠️ Monstre non trouvé: {monster_id}")
+        return None
+
+    def create_monster(self, monster_id: str, name: Optional[str] = None):
+        """
+        Créer un monstre neuf
+
+        Args:
+            monster_id: ID du monstre (ex: "goblin", "magmin")
+            name: Nom personnalisé (optionnel)
+
+        Returns:
+            Monster ou None si non trouvé
+        """
+        prototype = self.prototype(monster_id)
+        if prototype is None:
+            return None
+        monster = clone_monster(prototype)
+        if name:
+            monster.name = name
+        return monster
+
+    def create_monsters(self, monster_ids: Iterable) -> List:
+        """Créer plusieurs monstres (ids ou tuples (id, nom)), les inconnus sont ignorés"""
+        monsters = []
+        for item in monster_ids:
+            monster = self.create_monster(*item) if isinstance(item, tuple) else self.create_monster(item)
+            if monster:
+                monsters.append(monster)
+        return monsters
+
+    def clear(self):
+        """Oublier fiches et prototypes (fichier local modifié, tests)"""
+        with self._lock:
+            self._local = None
+            self._prototypes.clear()
+
+    def __getstate__(self) -> Dict:
+        # Prototypes et verrou restent propres au processus
+        return {'local_path': self.local_path, 'api_loader': self.api_loader}
+
+    def __setstate__(self, state: Dict):
+        self.__init__(state['local_path'], state['api_loader'])
+
+
+_registry: Optional[MonsterRegistry] = None
+_registry_lock = threading.Lock()
+
+
+def monster_registry() -> MonsterRegistry:
+    """Registre partagé du processus (créé au premier appel)"""
+    global _registry
+    if _registry is None:
+        with _registry_lock:
+            if _registry is None:
+                _registry = MonsterRegistry()
+    return _registry
@@ -0,0 +1,125 @@
+"""
+Flux aléatoires dérivés d'une graine de session (façon SeedSequence.spawn de numpy)
+
+Chaque combat ou tirage de trésor reçoit son propre générateur, dérivé de
+l'entropie de session et de sa position dans l'arbre des flux (spawn_key):
+les flux sont indépendants et la graine d'un flux ne dépend ni de l'ordre
+d'exécution ni du processus qui l'utilise.
+"""
+
+import hashlib
+import random
+from contextlib import contextmanager
+from typing import Dict, Hashable, List, Optional, Tuple
+
+from .dice import get_rng, set_rng
+
+
+class SeedStream:
+    """
+    Nœud de l'arbre des graines: entropie de session + chemin depuis la racine
+
+    Exemple:
+        session = SeedStream(42)
+        combat_rng = session.spawn(1)[0].random()      # flux du prochain combat
+        trial = session.child(17).random()             # flux du 17e combat simulé
+    """
+
+    __slots__ = ('entropy', 'spawn_key', 'spawned')
+
+    def __init__(self, entropy: Optional[int] = None, spawn_key: Tuple[Hashable, ...] = ()):
+        """
+        Args:
+            entropy: Graine de session (aléatoire si None, voir .entropy pour la rejouer)
+            spawn_key: Chemin du flux depuis la racine
+        """
+        if entropy is None:
+            entropy = random.SystemRandom().getrandbits(64)
+        self.entropy = int(entropy)
+        self.spawn_key = tuple(spawn_key)
+        self.spawned = 0
+
+    @property
+    def seed(self) -> int:
+        """Graine 64 bits du flux (hachage de l'entropie et du chemin)"""
+        data = repr((self.entropy, self.spawn_key)).encode()
+        return int.from_bytes(hashlib.blake2b(data, digest_size=8).digest(), 'big')
+
+    def child(self, key: Hashable) -> 'SeedStream':
+        """Flux enfant nommé (même clé = même flux)"""
+        return SeedStream(self.entropy, self.spawn_key + (key,))
+
+    def spawn(self, n: int) -> List['SeedStream']:
+        """n nouveaux flux enfants, jamais deux fois les mêmes pour ce nœud"""
+        children = [self.child(self.spawned + i) for i in range(n)]
+        self.spawned += n
+        return children
+
+    def random(self) -> random.Random:
+        """Générateur du flux (randint, choice, choices...)"""
+        return random.Random(self.seed)
+
+    def __getstate__(self) -> Dict:
+        return {'entropy': self.entropy, 'spawn_key': self.spawn_key, 'spawned': self.spawned}
+
+    def __setstate__(self, state: Dict):
+        for name, value in state.items():
+            setattr(self, name, value)
+
+    def __repr__(self) -> str:
+        return f"SeedStream({self.entropy}, spawn_key={self.spawn_key})"
+
+
+def context_stream(game_context, key: Optional[Hashable] = None) -> Optional[SeedStream]:
+    """
+    Nouveau flux de la partie (game_context['seed_stream'])
+
+    Args:
+        game_context: Contexte de jeu
+        key: Flux nommé (défaut: prochain flux de la séquence)
+
+    Returns:
+        SeedStream, ou None si la partie n'a pas de graine de session
+    """
+    stream = game_context.get('seed_stream') if game_context is not None else None
+    if stream is None:
+        return None
+    return stream.spawn(1)[0] if key is None else stream.child(key)
+
+
+def context_rng(game_context, key: Optional[Hashable] = None) -> Optional[random.Random]:
+    """Générateur d'un nouveau flux de la partie (None sans graine de session)"""
+    stream = context_stream(game_context, key)
+    return stream.random() if stream is not None else None
+
+
+@contextmanager
+def use_rng(rng):
+    """Lancers de dés sur rng le temps du bloc (None: générateur inchangé)"""
+    if rng is None:
+        yield get_rng()
+        return
+    previous = get_rng()
+    set_rng(rng)
+    try:
+        yield rng
+    finally:
+        set_rng(previous)
+
+
+@contextmanager
+def use_stream(stream: Optional[SeedStream]):
+    """
+    Dés et random global (tirages internes de dnd_5e_core) sur le flux le
+    temps du bloc, état du random global restauré ensuite (None: inchangés)
+    """
+    if stream is None:
+        yield get_rng()
+        return
+    state = random.getstate()
+    random.seed(stream.child('global').seed)
+    try:
+        with use_rng(stream.random()) as rng:
+            yield rng
+    finally:
+        random.setstate(state)
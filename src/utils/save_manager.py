@@ -157,17 +157,9 @@ class JSONLoader:
 
     @staticmethod
     def load_monsters() -> Dict:
-        """Charger tous les monstres"""
-        try:
-            file_path = Path("data/monsters/all_monsters.json")
-            if file_path.exists():
-                with open(file_path, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    return data.get('monsters', {})
-            return {}
-        except Exception as e:
-            print(f"⚠️ Erreur chargement monstres: {e}")
-            return {}
+        """Charger tous les monstres locaux {id: fiche} (lus une fois par le registre partagé)"""
+        from .monster_registry import monster_registry
+        return dict(monster_registry().local_monsters)
 
     @staticmethod
     def load_parties() -> Dict:
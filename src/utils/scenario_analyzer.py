@@ -0,0 +1,313 @@
+"""
+Analyseur statique de scénarios - vérifie le graphe des scènes sans jouer
+Scènes inaccessibles, culs-de-sac, cycles, chemins vers les fins
+"""
+
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, asdict
+from pathlib import Path
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from ..scenes.scene_graph import SceneGraph, IMPLICIT_SCENES
+
+# Nombre max de chemins simples énumérés par scénario
+DEFAULT_MAX_PATHS = 100000
+
+
+@dataclass
+class PathSummary:
+    """Chemin de la scène de départ vers une fin"""
+    scenes: List[str]
+    combats: int
+
+    @property
+    def length(self) -> int:
+        return len(self.scenes)
+
+
+@dataclass
+class EndingStats:
+    """Statistiques des chemins menant à une fin"""
+    ending: str
+    kind: str  # 'victory' ou 'defeat'
+    paths: int = 0
+    shortest: Optional[PathSummary] = None
+    longest: Optional[PathSummary] = None
+    combats_per_path: Dict[int, int] = field(default_factory=dict)
+
+    def add(self, path: PathSummary):
+        self.paths += 1
+        self.combats_per_path[path.combats] = self.combats_per_path.get(path.combats, 0) + 1
+        if self.shortest is None or path.length < self.shortest.length:
+            self.shortest = path
+        if self.longest is None or path.length > self.longest.length:
+            self.longest = path
+
+
+@dataclass
+class ScenarioAnalysis:
+    """Rapport d'analyse d'un scénario"""
+    source: str
+    scenes: int
+    start: Optional[str]
+    unreachable: List[str] = field(default_factory=list)
+    dead_ends: List[str] = field(default_factory=list)
+    traps: List[str] = field(default_factory=list)
+    cycles: List[List[str]] = field(default_factory=list)
+    broken_links: List[str] = field(default_factory=list)
+    endings: List[EndingStats] = field(default_factory=list)
+    paths_truncated: bool = False
+    error: Optional[str] = None
+
+    @property
+    def is_healthy(self) -> bool:
+        """Aucun problème bloquant (les cycles sont autorisés)"""
+        return not (self.error or self.unreachable or self.dead_ends or self.traps or self.broken_links)
+
+    def to_dict(self) -> Dict:
+        data = asdict(self)
+        for ending in data['endings']:
+            for key in ('shortest', 'longest'):
+                if ending[key]:
+                    ending[key]['length'] = len(ending[key]['scenes'])
+        data['healthy'] = self.is_healthy
+        return data
+
+    def format_summary(self) -> str:
+        icon = "✅" if self.is_healthy else "⚠️"
+        lines = [f"{icon} {Path(self.source).name}: {self.scenes} scènes"]
+        if self.error:
+            lines.append(f"   ❌ {self.error}")
+            return "\n".join(lines)
+        if self.unreachable:
+            lines.append(f"   🚫 Inaccessibles: {', '.join(self.unreachable)}")
+        if self.dead_ends:
+            lines.append(f"   🧱 Culs-de-sac: {', '.join(self.dead_ends)}")
+        if self.traps:
+            lines.append(f"   🪤 Sans issue (aucune fin atteignable): {', '.join(self.traps)}")
+        if self.broken_links:
+            lines.append(f"   🔗 Transitions invalides: {', '.join(self.broken_links)}")
+        for cycle in self.cycles:
+            lines.append(f"   🔁 Cycle: {' ↔ '.join(cycle)}")
+        for ending in self.endings:
+            if not ending.paths:
+                lines.append(f"   🏁 {ending.ending} ({ending.kind}): inatteignable")
+                continue
+            combats = sorted(ending.combats_per_path)
+            lines.append(
+                f"   🏁 {ending.ending} ({ending.kind}): {ending.paths} chemin(s), "
+                f"{ending.shortest.length}-{ending.longest.length} scènes, "
+                f"{combats[0]}-{combats[-1]} combat(s)"
+            )
+        if self.paths_truncated:
+            lines.append("   ⚠️ Énumération des chemins tronquée")
+        return "\n".join(lines)
+
+
+class ScenarioAnalyzer:
+    """Analyse de graphe sur un SceneGraph compilé"""
+
+    def __init__(self, graph: SceneGraph, max_paths: int = DEFAULT_MAX_PATHS):
+        self.graph = graph
+        self.max_paths = max_paths
+
+    def reachable(self) -> List[bool]:
+        """Scènes atteignables depuis la scène de départ (parcours en largeur)"""
+        graph = self.graph
+        seen = [False] * len(graph)
+        if not len(graph):
+            return seen
+        seen[graph.start] = True
+        queue = deque([graph.start])
+        while queue:
+            node = queue.popleft()
+            for succ in graph.successors(node):
+                if not seen[succ]:
+                    seen[succ] = True
+                    queue.append(succ)
+        return seen
+
+    def endings(self) -> List[int]:
+        """Scènes terminales narratives: fins normales du scénario"""
+        graph = self.graph
+        return [i for i in range(len(graph)) if graph.is_terminal(i) and graph.types[i] == 'narrative']
+
+    def dead_ends(self) -> List[int]:
+        """Scènes terminales qui ne sont pas des fins (choix sans choix, combat sans suite...)"""
+        graph = self.graph
+        return [i for i in range(len(graph)) if graph.is_terminal(i) and graph.types[i] != 'narrative']
+
+    def traps(self, reachable: Sequence[bool]) -> List[int]:
+        """Scènes atteignables depuis lesquelles aucune fin n'est atteignable"""
+        graph = self.graph
+        predecessors: List[List[int]] = [[] for _ in range(len(graph))]
+        for node in range(len(graph)):
+            for succ in graph.successors(node):
+                predecessors[succ].append(node)
+
+        # Parcours arrière depuis toutes les fins
+        can_finish = [False] * len(graph)
+        queue = deque(self.endings())
+        for node in queue:
+            can_finish[node] = True
+        while queue:
+            node = queue.popleft()
+            for pred in predecessors[node]:
+                if not can_finish[pred]:
+                    can_finish[pred] = True
+                    queue.append(pred)
+
+        return [i for i in range(len(graph))
+                if reachable[i] and not can_finish[i] and not graph.is_terminal(i)]
+
+    def cycles(self) -> List[List[int]]:
+        """Composantes fortement connexes avec cycle (Tarjan itératif)"""
+        graph = self.graph
+        n = len(graph)
+        index_of = [-1] * n
+        lowlink = [0] * n
+        on_stack = [False] * n
+        stack: List[int] = []
+        components: List[List[int]] = []
+        counter = 0
+
+        for root in range(n):
+            if index_of[root] != -1:
+                continue
+            work = [(root, 0)]
+            while work:
+                node, child = work.pop()
+                if child == 0:
+                    index_of[node] = lowlink[node] = counter
+                    counter += 1
+                    stack.append(node)
+                    on_stack[node] = True
+                successors = graph.successors(node)
+                if child < len(successors):
+                    work.append((node, child + 1))
+                    succ = successors[child]
+                    if index_of[succ] == -1:
+                        work.append((succ, 0))
+                    elif on_stack[succ]:
+                        lowlink[node] = min(lowlink[node], index_of[succ])
+                    continue
+                # Tous les successeurs traités
+                if lowlink[node] == index_of[node]:
+                    component = []
+                    while True:
+                        member = stack.pop()
+                        on_stack[member] = False
+                        component.append(member)
+                        if member == node:
+                            break
+                    if len(component) > 1 or node in successors:
+                        components.append(sorted(component))
+                if work:
+                    parent = work[-1][0]
+                    lowlink[parent] = min(lowlink[parent], lowlink[node])
+
+        return sorted(components)
+
+    def ending_stats(self) -> Tuple[List[EndingStats], bool]:
+        """
+        Énumérer les chemins simples du départ vers chaque fin
+
+        Returns:
+            (statistiques par fin, énumération tronquée)
+        """
+        graph = self.graph
+        stats = {node: EndingStats(graph.ids[node], 'defeat' if graph.ids[node] in IMPLICIT_SCENES else 'victory')
+                 for node in self.endings()}
+        if not len(graph):
+            return [], False
+
+        is_combat = [t == 'combat' for t in graph.types]
+        on_path = [False] * len(graph)
+        path: List[int] = []
+        found = 0
+        truncated = False
+
+        def visit(node: int, combats: int):
+            nonlocal found, truncated
+            if truncated:
+                return
+            path.append(node)
+            on_path[node] = True
+            combats += is_combat[node]
+            if node in stats:
+                stats[node].add(PathSummary([graph.ids[i] for i in path], combats))
+                found += 1
+                if found >= self.max_paths:
+                    truncated = True
+            for succ in graph.successors(node):
+                if not on_path[succ]:
+                    visit(succ, combats)
+            on_path[node] = False
+            path.pop()
+
+        visit(graph.start, 0)
+        return list(stats.values()), truncated
+
+    def analyze(self, source: str = "") -> ScenarioAnalysis:
+        graph = self.graph
+        reachable = self.reachable()
+        endings, truncated = self.ending_stats()
+        return ScenarioAnalysis(
+            source=source,
+            scenes=len(graph),
+            start=graph.ids[graph.start] if len(graph) else None,
+            unreachable=[graph.ids[i] for i in range(len(graph)) if not reachable[i]],
+            dead_ends=[graph.ids[i] for i in self.dead_ends()],
+            traps=[graph.ids[i] for i in self.traps(reachable)],
+            cycles=[[graph.ids[i] for i in cycle] for cycle in self.cycles()],
+            broken_links=[str(reference) for reference in graph.dangling],
+            endings=endings,
+            paths_truncated=truncated
+        )
+
+
+def analyze_file(json_path: str, max_paths: int = DEFAULT_MAX_PATHS) -> ScenarioAnalysis:
+    """Analyser un fichier data/scenes/*.json (exécutable dans un processus fils)"""
+    from ..scenes.scene_cache import ScenarioCache
+
+    try:
+        bundle = ScenarioCache.default().load_bundle(json_path)
+    except Exception as e:
+        return ScenarioAnalysis(source=str(json_path), scenes=0, start=None, error=str(e))
+    return ScenarioAnalyzer(bundle.graph, max_paths).analyze(str(json_path))
+
+
+def analyze_files(json_paths: Sequence[str], workers: Optional[int] = None,
+                  max_paths: int = DEFAULT_MAX_PATHS) -> List[ScenarioAnalysis]:
+    """
+    Analyser plusieurs scénarios en parallèle
+
+    Args:
+        json_paths: Fichiers JSON
+        workers: Processus (None = nombre de CPU, 1 = séquentiel)
+        max_paths: Chemins max énumérés par scénario
+
+    Returns:
+        Rapports dans l'ordre des fichiers
+    """
+    json_paths = [str(p) for p in json_paths]
+    if workers == 1 or len(json_paths) <= 1:
+        return [analyze_file(p, max_paths) for p in json_paths]
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(analyze_file, json_paths, [max_paths] * len(json_paths)))
+
+
+def build_report(analyses: Sequence[ScenarioAnalysis]) -> Dict:
+    """Rapport JSON global"""
+    issues = Counter()
+    for analysis in analyses:
+        for key in ('unreachable', 'dead_ends', 'traps', 'broken_links', 'cycles'):
+            issues[key] += len(getattr(analysis, key))
+        issues['errors'] += bool(analysis.error)
+    return {
+        'scenarios': len(analyses),
+        'healthy': sum(analysis.is_healthy for analysis in analyses),
+        'issues': dict(issues),
+        'files': {Path(analysis.source).name: analysis.to_dict() for analysis in analyses}
+    }
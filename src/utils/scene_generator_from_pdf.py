@@ -5,21 +5,34 @@ from typing import List, Dict, Optional
 from src.scenes.scene_system import (
     NarrativeScene, ChoiceScene, CombatScene, RestScene
 )
+from src.utils.monster_index import monster_index
 
 
 class SceneGeneratorFromPDF:
     """Génère des scènes depuis sections PDF"""
 
-    def __init__(self, scene_data: List[Dict], monster_factory=None):
+    def __init__(self, scene_data: List[Dict], monster_factory=None, index=None):
         """
         Args:
             scene_data: Sections extraites du PDF
             monster_factory: Factory pour créer monstres
+            index: Index des monstres (défaut: monster_index() partagé)
         """
         self.scene_data = scene_data
         self.monster_factory = monster_factory
+        self.index = index
         self.generated_scenes = []
 
+    def resolve_monsters(self, names: List) -> List[str]:
+        """Ids des monstres cités par le PDF (noms ou fiches {'name': ...}), inconnus ignorés"""
+        index = self.index or monster_index()
+        ids = []
+        for name in names:
+            entry = index.find(name.get('name', '') if isinstance(name, dict) else name)
+            if entry:
+                ids.append(entry.id)
+        return ids
+
     def generate_all_scenes(self) -> List:
         """Générer toutes les scènes depuis les données"""
         scenes = []
@@ -52,7 +65,8 @@ class SceneGeneratorFromPDF:
         next_scene = self._determine_next_scene(index)
 
         if scene_type == 'combat':
-            return self._create_combat_scene(scene_id, title, description, next_scene)
+            return self._create_combat_scene(scene_id, title, description, next_scene,
+                                             data.get('monsters', []))
 
         elif scene_type == 'choice':
             return self._create_choice_scene(scene_id, title, description, data.get('choices', []))
@@ -95,12 +109,15 @@ class SceneGeneratorFromPDF:
             choices=choices
         )
 
-    def _create_combat_scene(self, scene_id: str, title: str, description: str, next_scene: str):
+    def _create_combat_scene(self, scene_id: str, title: str, description: str, next_scene: str,
+                             monsters: Optional[List] = None):
         """Créer scène de combat"""
-        # Factory par défaut: créer un gobelin
+        # Monstres cités par la section, un gobelin par défaut
+        monster_ids = self.resolve_monsters(monsters or []) or ['goblin']
+
         def default_enemies(ctx):
             if self.monster_factory:
-                return self.monster_factory.create_monsters(['goblin'])
+                return self.monster_factory.create_monsters(monster_ids)
             return []
 
         return CombatScene(
@@ -192,13 +209,22 @@ class PDFScenarioBuilder:
         return {
             'name': self._extract_scenario_name(),
             'scenes': self.scene_generator.export_to_json(),
-            'monsters': self.analysis.get('monsters', []),
-            'encounters': self.analysis.get('random_encounters', []),
+            'monsters': self._with_monster_ids(self.analysis.get('monsters', []), 'name'),
+            'encounters': self._with_monster_ids(self.analysis.get('random_encounters', []), 'description'),
             'treasures': self.analysis.get('treasures', []),
             'total_pages': self.analysis.get('total_pages', 0),
             'source': self.analysis.get('source_file', '')
         }
 
+    def _with_monster_ids(self, items: List[Dict], key: str) -> List[Dict]:
+        """Copies des fiches du PDF avec l'id du monstre connu ('monster_id', None si inconnu)"""
+        index = self.scene_generator.index or monster_index()
+        results = []
+        for item in items:
+            entry = index.find(item.get(key, ''))
+            results.append({**item, 'monster_id': entry.id if entry else None})
+        return results
+
     def _extract_scenario_name(self) -> str:
         """Extraire le nom du scénario"""
         source = self.analysis.get('source_file', '')
@@ -4,7 +4,6 @@ Permet de générer et distribuer des trésors au groupe
 """
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
-from random import choice, randint
 from dnd_5e_core.entities import Character
 from dnd_5e_core.data import load_weapon, load_armor
 from dnd_5e_core.equipment import (
@@ -19,6 +18,9 @@ from dnd_5e_core.equipment import (
     MagicItem
 )
 
+from ..core.combat_profile import invalidate_combat_profile
+from .dice import get_rng
+
 
 class TreasureType:
     """Types de trésors disponibles"""
@@ -45,22 +47,24 @@ class Treasure:
         return f"{self.name} ({self.value} gp)"
 
 
-def generate_treasure_by_cr(challenge_rating: float, num_monsters: int = 1) -> List[Treasure]:
+def generate_treasure_by_cr(challenge_rating: float, num_monsters: int = 1, rng=None) -> List[Treasure]:
     """
     Générer des trésors en fonction du CR des monstres vaincus
 
     Args:
         challenge_rating: CR du monstre
         num_monsters: Nombre de monstres vaincus
+        rng: Générateur du tirage (défaut: celui des dés, voir src.utils.rng)
 
     Returns:
         Liste de trésors générés
     """
+    rng = rng or get_rng()
     treasures = []
 
     # Or de base (selon CR)
     base_gold = int(10 * challenge_rating * num_monsters)
-    variation = randint(-5, 15)
+    variation = rng.randint(-5, 15)
     gold = max(base_gold + base_gold * variation // 100, 1)
 
     treasures.append(Treasure(
@@ -73,27 +77,28 @@ def generate_treasure_by_cr(challenge_rating: float, num_monsters: int = 1) -> L
     # Chance d'objets magiques (augmente avec CR)
     magic_item_chance = min(challenge_rating * 10, 50)
 
-    if randint(1, 100) <= magic_item_chance:
+    if rng.randint(1, 100) <= magic_item_chance:
         # Générer un objet magique aléatoire
-        magic_item = generate_random_magic_item(challenge_rating)
+        magic_item = generate_random_magic_item(challenge_rating, rng)
         if magic_item:
             treasures.append(magic_item)
 
     # Chance d'armes/armures (CR >= 1)
-    if challenge_rating >= 1 and randint(1, 100) <= 30:
-        equipment = generate_random_equipment()
+    if challenge_rating >= 1 and rng.randint(1, 100) <= 30:
+        equipment = generate_random_equipment(rng)
         if equipment:
             treasures.append(equipment)
 
     return treasures
 
 
-def generate_random_magic_item(challenge_rating: float) -> Optional[Treasure]:
+def generate_random_magic_item(challenge_rating: float, rng=None) -> Optional[Treasure]:
     """
     Générer un objet magique aléatoire approprié au CR
 
     Args:
         challenge_rating: CR pour déterminer la rareté
+        rng: Générateur du tirage (défaut: celui des dés)
 
     Returns:
         Trésor contenant l'objet magique
@@ -127,7 +132,7 @@ def generate_random_magic_item(challenge_rating: float) -> Optional[Treasure]:
     if not items_pool:
         return None
 
-    name, creator_func, value = choice(items_pool)
+    name, creator_func, value = (rng or get_rng()).choice(items_pool)
     item = creator_func()
 
     return Treasure(
@@ -138,10 +143,13 @@ def generate_random_magic_item(challenge_rating: float) -> Optional[Treasure]:
     )
 
 
-def generate_random_equipment() -> Optional[Treasure]:
+def generate_random_equipment(rng=None) -> Optional[Treasure]:
     """
     Générer une arme ou armure aléatoire
 
+    Args:
+        rng: Générateur du tirage (défaut: celui des dés)
+
     Returns:
         Trésor contenant l'équipement
     """
@@ -164,9 +172,10 @@ def generate_random_equipment() -> Optional[Treasure]:
     ]
 
     # Choisir aléatoirement arme ou armure
-    if randint(0, 1) == 0:
+    rng = rng or get_rng()
+    if rng.randint(0, 1) == 0:
         # Arme
-        index, value = choice(weapons)
+        index, value = rng.choice(weapons)
         item = load_weapon(index)
         if item:
             return Treasure(
@@ -177,7 +186,7 @@ def generate_random_equipment() -> Optional[Treasure]:
             )
     else:
         # Armure
-        index, value = choice(armors)
+        index, value = rng.choice(armors)
         item = load_armor(index)
         if item:
             return Treasure(
@@ -335,6 +344,7 @@ def add_item_to_inventory(character: Character, item):
 
                     if hasattr(item, 'apply_to_character'):
                         item.apply_to_character(character)
+                    invalidate_combat_profile(character)
 
                     print(f"      ⭐ Harmonisé et équipé")
 
@@ -0,0 +1,129 @@
+#!/usr/bin/env python3
+"""
+Test du moteur de combat par lots (NumPy)
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+np = pytest.importorskip("numpy")
+pytest.importorskip("dnd_5e_core")
+
+from src.systems.batch_combat import BatchCombatEngine, CombatantArrays, _parse_dice
+
+
+class FakeAbilities:
+    def __init__(self, str=10, dex=10):
+        self.str = str
+        self.dex = dex
+
+
+class FakeClass:
+    def __init__(self, index):
+        self.index = index
+
+
+class FakeCharacter:
+    def __init__(self, name, hit_points, class_index='fighter', strength=16, armor_class=16):
+        self.name = name
+        self.hit_points = hit_points
+        self.max_hit_points = hit_points
+        self.abilities = FakeAbilities(str=strength, dex=12)
+        self.class_type = FakeClass(class_index)
+        self.level = 1
+        self.armor_class = armor_class
+        self.weapon = None
+
+
+class FakeDamage:
+    def __init__(self, dice):
+        self.dd = dice
+
+
+class FakeAction:
+    def __init__(self, attack_bonus, dice):
+        self.name = "Griffes"
+        self.attack_bonus = attack_bonus
+        self.damages = [FakeDamage(dice)]
+        self.normal_range = 5
+
+
+class FakeMonster:
+    def __init__(self, name, hit_points, armor_class=12, attack_bonus=3, dice="1d6", xp=50):
+        self.name = name
+        self.hit_points = hit_points
+        self.armor_class = armor_class
+        self.abilities = FakeAbilities()
+        self.actions = [FakeAction(attack_bonus, dice)]
+        self.xp = xp
+
+
+def test_parse_dice():
+    assert _parse_dice("2d6+3") == (2, 6, 3)
+    assert _parse_dice("d8") == (1, 8, 0)
+    assert _parse_dice("1d4 - 1") == (1, 4, -1)
+    assert _parse_dice("???") == (1, 6, 0)
+
+
+def test_arrays_follow_enhanced_combat_rules():
+    party = CombatantArrays.from_party([FakeCharacter("Grok", 12), FakeCharacter("Lia", 9, 'rogue')])
+
+    # Épée longue 1d8 + FOR, bonus FOR + maîtrise 2; roublard: épée courte 1d6 + DEX
+    assert party.dice_sides.tolist() == [8, 6]
+    assert party.damage_bonus.tolist() == [3, 1]
+    assert party.attack_bonus.tolist() == [5, 3]
+
+
+def test_strong_party_wins_and_collects_xp():
+    party = CombatantArrays.from_party([FakeCharacter("Grok", 30), FakeCharacter("Tordek", 30)])
+    monsters = CombatantArrays.from_monsters([FakeMonster("gobelin", 7), FakeMonster("gobelin", 7)])
+
+    result = BatchCombatEngine(seed=1).run(party, monsters, fights=5000)
+
+    assert result.victory.mean() > 0.95
+    assert set(result.xp.tolist()) <= {0, 100}
+    assert (result.xp[result.victory] == 100).all()
+    assert result.rounds.min() >= 1
+    assert result.character_hp.shape == (5000, 2)
+
+
+def test_only_natural_twenty_hits_impossible_armor():
+    party = CombatantArrays.from_party([FakeCharacter("Grok", 30)])
+    monsters = CombatantArrays.from_monsters([FakeMonster("golem", 1000, armor_class=100, attack_bonus=-100)])
+
+    result = BatchCombatEngine(seed=2).run(party, monsters, fights=20000, max_rounds=1)
+
+    # Le monstre ne touche que sur 20 naturel: ~5% des combats
+    hit_rate = (result.character_hp[:, 0] < 30).mean()
+    assert 0.04 < hit_rate < 0.06
+    assert result.timeout.all()
+
+
+def test_numpy_backend_only_models_enhanced_combat():
+    from src.scenarios.json_scenario import JsonScenario
+    from src.simulation.combat_simulator import batch_unsupported_reason, simulate_encounter
+    from src.systems.enhanced_combat import EnhancedCombatSystem
+
+    enhanced = EnhancedCombatSystem(verbose=False)
+    assert batch_unsupported_reason(enhanced, {'level': 2}) is None
+    assert 'mass_battle' in batch_unsupported_reason(enhanced, {'mass_battle': {'min_monsters': 12}})
+
+    # Les scénarios combattent avec le CombatSystem de dnd_5e_core: numpy refusé
+    scenario = JsonScenario(str(Path(__file__).parent.parent / "data" / "scenes" / "chasse_gobelins.json"))
+    assert 'CombatSystem' in batch_unsupported_reason(scenario.combat_system, {})
+    party = scenario.create_party()
+    options = dict(n=20, combat_system=scenario.combat_system, monster_factory=scenario.monster_factory,
+                   workers=0, seed=4)
+    requested = simulate_encounter(party, ['goblin', 'goblin'], backend='numpy', **options)
+    python = simulate_encounter(party, ['goblin', 'goblin'], backend='python', **options)
+    assert requested.to_dict() == python.to_dict()
+
+
+if __name__ == "__main__":
+    for test in (test_parse_dice, test_arrays_follow_enhanced_combat_rules,
+                 test_strong_party_wins_and_collects_xp, test_only_natural_twenty_hits_impossible_armor,
+                 test_numpy_backend_only_models_enhanced_combat):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,174 @@
+#!/usr/bin/env python3
+"""
+Test de l'aperçu des choix - simulation Monte Carlo de chaque option
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.rendering.renderer import HeadlessRenderer
+from src.scenes.scene_factory import SceneFactory
+from src.scenes.game_context import GameContext
+from src.simulation.branch_preview import BranchPreviewer
+from src.simulation.headless import FirstChoicePolicy
+from src.simulation.snapshot import clone_character, clone_party
+from src.utils.rng import SeedStream
+
+
+class FakeMonster:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 5
+        self.xp = 50
+
+
+class FakeMonsterFactory:
+    def create_monster(self, monster_id, name=None):
+        return FakeMonster(name or monster_id)
+
+
+class CoinFlipCombatSystem:
+    """Le groupe gagne une fois sur deux (random global, comme le vrai combat)"""
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        if random.random() < 0.5:
+            alive_monsters.clear()
+        else:
+            for char in alive_chars:
+                char.hit_points = 0
+            alive_chars.clear()
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        pass
+
+
+class FakeSpellcaster:
+    def __init__(self):
+        self.spell_slots = [2, 1]
+
+
+class FakeCharacter:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 10
+        self.max_hit_points = 10
+        self.conditions = []
+        self.sc = FakeSpellcaster()
+
+
+SCENARIO = {
+    'scenes': [
+        {'id': 'crossroads', 'type': 'choice', 'title': 'Choix', 'description': '?', 'choices': [
+            {'text': 'Fuir', 'next_scene': 'ending'},
+            {'text': 'Attaquer', 'next_scene': 'fight', 'effects': ['bravery += 1']},
+        ]},
+        {'id': 'fight', 'type': 'combat', 'title': 'Combat', 'description': '',
+         'monsters': ['goblin', 'goblin'], 'on_victory': 'ending', 'on_defeat': 'game_over'},
+        {'id': 'ending', 'type': 'narrative', 'title': 'Fin', 'text': '...', 'next_scene': None},
+    ]
+}
+
+
+def make_manager():
+    return SceneFactory.build_scene_manager_from_json(SCENARIO, FakeMonsterFactory())
+
+
+def make_context():
+    return GameContext(
+        party=[FakeCharacter("Grok"), FakeCharacter("Elara")],
+        game_state={'total_xp': 0},
+        combat_system=CoinFlipCombatSystem(),
+    )
+
+
+def test_clone_character_is_independent():
+    original = FakeCharacter("Grok")
+    clone = clone_character(original)
+
+    clone.hit_points = 0
+    clone.conditions.append('poisoned')
+    clone.sc.spell_slots[0] = 0
+
+    assert original.hit_points == 10
+    assert original.conditions == []
+    assert original.sc.spell_slots == [2, 1]
+    assert clone_party([original])[0] is not original
+
+
+def test_preview_estimates_each_choice():
+    context = make_context()
+    choices = list(enumerate(make_manager().scenes['crossroads'].choices))
+    previewer = BranchPreviewer(rollouts=400, scene_manager_factory=make_manager, seed=3)
+
+    flee, attack = previewer.preview(choices, context)
+
+    assert flee.survival_rate == 1.0
+    assert flee.mean_xp == 0
+    assert attack.rollouts == 400
+    assert 0.4 < attack.survival_rate < 0.6
+    # 100 XP par victoire
+    assert abs(attack.mean_xp - 100 * attack.survival_rate) < 1e-9
+    assert set(attack.outcomes) == {'completed', 'defeat'}
+
+
+def test_preview_leaves_game_untouched():
+    context = make_context()
+    choices = list(enumerate(make_manager().scenes['crossroads'].choices))
+    random.seed(42)
+    expected = random.random()
+    random.seed(42)
+
+    BranchPreviewer(rollouts=50, scene_manager_factory=make_manager, seed=1).preview(choices, context)
+
+    assert all(c.hit_points == 10 for c in context.party)
+    assert dict(context.game_state) == {'total_xp': 0}
+    assert random.random() == expected
+
+
+def test_rollouts_leave_log_and_seed_stream_untouched():
+    pytest.importorskip("dnd_5e_core")
+    from src.systems.combat_log import CombatLog
+
+    context = make_context()
+    log = CombatLog()
+    context['combat_log'] = log
+    context['seed_stream'] = stream = SeedStream(5)
+    choices = list(enumerate(make_manager().scenes['crossroads'].choices))
+
+    BranchPreviewer(rollouts=50, scene_manager_factory=make_manager, seed=1).preview(choices, context)
+
+    assert len(log.events) == 0
+    assert stream.spawned == 0
+    assert context['combat_log'] is log
+
+
+def test_choice_scene_shows_estimates():
+    class CapturingRenderer(HeadlessRenderer):
+        def __init__(self):
+            super().__init__(FirstChoicePolicy())
+            self.options = None
+
+        def get_choice(self, options):
+            self.options = options
+            return super().get_choice(options)
+
+    manager = make_manager()
+    context = make_context()
+    context.renderer = CapturingRenderer()
+    context['branch_preview'] = BranchPreviewer(rollouts=20, scene_manager_factory=make_manager, seed=5)
+
+    manager.scenes['crossroads'].execute(context)
+
+    assert context.renderer.options[0].startswith("Fuir  [survie 100%, ~0 XP]")
+    assert "survie" in context.renderer.options[1]
+    assert manager.scenes['crossroads'].next_scene_id == 'ending'
+
+
+if __name__ == "__main__":
+    for test in (test_clone_character_is_independent, test_preview_estimates_each_choice,
+                 test_preview_leaves_game_untouched, test_choice_scene_shows_estimates):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,143 @@
+#!/usr/bin/env python3
+"""
+Test du journal de combat structuré
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("dnd_5e_core")
+
+from src.scenes.scene_system import CombatScene
+from src.systems.combat_log import CombatLog, LogLevel
+
+
+class FakeMonster:
+    def __init__(self, name, hit_points=4):
+        self.name = name
+        self.hit_points = hit_points
+        self.xp = 10
+
+
+class FakeCharacter:
+    def __init__(self, name, hit_points=10):
+        self.name = name
+        self.hit_points = hit_points
+        self.max_hit_points = hit_points
+        self.conditions = []
+
+
+class ScriptedCombatSystem:
+    """Chaque personnage inflige 3 dégâts, chaque monstre 2 et empoisonne"""
+
+    def log_message(self, message):
+        print(message)
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        monster = alive_monsters[0]
+        monster.hit_points -= 3
+        self.log_message(f"{character.name} frappe {monster.name}")
+        if monster.hit_points <= 0:
+            alive_monsters.remove(monster)
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        target = alive_chars[0]
+        target.hit_points -= 2
+        if 'poisoned' not in target.conditions:
+            target.conditions.append('poisoned')
+
+
+def fight(log):
+    party = [FakeCharacter("Grok")]
+    monsters = [FakeMonster("gobelin")]
+    combat_system = ScriptedCombatSystem()
+    # Ordre fixe (personnages puis monstres) pour des événements reproductibles
+    context = {'combat_log': log, 'scenario_settings': {'initiative': False}}
+    rounds = CombatScene.run_rounds(combat_system, party, list(party), list(monsters), context)
+    return rounds, combat_system
+
+
+def test_events_are_structured_and_rendered_per_round():
+    lines = []
+    log = CombatLog(LogLevel.NORMAL, output=lines.append)
+
+    rounds, combat_system = fight(log)
+
+    assert rounds == 2
+    kinds = [(e.round, e.kind, e.value) for e in log.events if e.kind != 'message']
+    assert kinds == [(1, 'damage', 3), (1, 'damage', 2), (1, 'condition', 1),
+                     (2, 'damage', 3), (2, 'kill', 0)]
+    assert sum("TOUR" in line for line in lines) == 2
+    # Les messages texte du système de combat ne s'affichent qu'en verbose
+    assert not any("frappe" in line for line in lines)
+    # Le système de combat retrouve son affichage d'origine
+    assert 'log_message' not in combat_system.__dict__
+
+
+def test_silent_log_prints_nothing(capsys):
+    log = CombatLog(LogLevel.SILENT)
+
+    fight(log)
+
+    assert capsys.readouterr().out == ""
+    assert any(e.kind == 'kill' for e in log.events)
+
+
+def test_summary_and_ring_buffer():
+    lines = []
+    log = CombatLog(LogLevel.SUMMARY, capacity=3, output=lines.append)
+
+    fight(log)
+
+    assert lines == ["  Tour 1: 5 dégâts", "  Tour 2: 3 dégâts, 1 mort(s)"]
+    assert len(log.events) == 3
+
+
+def test_jsonl_export(tmp_path):
+    streamed = tmp_path / "combat.jsonl"
+    log = CombatLog(LogLevel.SILENT, jsonl_path=str(streamed))
+
+    fight(log)
+    exported = tmp_path / "export.jsonl"
+    log.export_jsonl(str(exported))
+
+    events = CombatLog.load_jsonl(str(streamed))
+    assert events == CombatLog.load_jsonl(str(exported))
+    assert {'round': 2, 'kind': 'kill', 'actor': 'Grok', 'target': 'gobelin'} in events
+
+
+def test_log_does_not_change_real_combat_outcomes(tmp_path):
+    # Le CombatSystem de dnd_5e_core appelle log_message(msg, clean_ansi=True)
+    from dnd_5e_core.combat import CombatSystem
+    from src.scenarios.json_scenario import JsonScenario
+    from src.simulation.combat_simulator import run_trials
+    from src.utils.monster_registry import monster_registry
+
+    scenario = JsonScenario(str(Path(__file__).parent.parent / 'data' / 'scenes' / 'chasse_gobelins.json'))
+    party = scenario.create_party()
+    goblins = ['goblin', 'goblin', 'goblin']
+
+    def outcomes(**kwargs):
+        report = run_trials(party, goblins, 40, CombatSystem(verbose=False), monster_registry(),
+                            seed=3, **kwargs)
+        return report.to_dict()
+
+    plain = outcomes()
+    assert plain == outcomes(trace_path=str(tmp_path / "combats.trace"))
+    assert 0 < plain['win_rate'] < 1
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    test_events_are_structured_and_rendered_per_round()
+    print("✅ test_events_are_structured_and_rendered_per_round")
+    test_summary_and_ring_buffer()
+    print("✅ test_summary_and_ring_buffer")
+    with tempfile.TemporaryDirectory() as tmp:
+        test_jsonl_export(Path(tmp))
+        test_log_does_not_change_real_combat_outcomes(Path(tmp))
+    print("✅ test_jsonl_export")
+    print("✅ test_log_does_not_change_real_combat_outcomes")
@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test du profil de combat des personnages (cache et invalidation)
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("dnd_5e_core")
+
+from dnd_5e_core.combat import CombatSystem
+
+from src.core.combat_profile import combat_profile, invalidate_combat_profile
+from src.core.adapters import CharacterExtensions
+from src.systems.enhanced_combat import EnhancedCombatSystem
+
+
+class FakeAbilities:
+    def __init__(self, str=16, dex=12):
+        self.str = str
+        self.dex = dex
+
+
+class FakeClass:
+    def __init__(self, index):
+        self.index = index
+        self.can_cast = index == 'cleric'
+
+
+class FakeWeapon:
+    def __init__(self, name, dice):
+        self.name = name
+        self.damage_dice = dice
+
+
+class FakeSpell:
+    def __init__(self, name, level, heals=True):
+        self.name = name
+        self.level = level
+        self.heal_at_slot_level = {level: "1d8"} if heals else None
+
+
+class FakeSpellcaster:
+    def __init__(self, spells, slots):
+        self.learned_spells = spells
+        self.spell_slots = slots
+
+
+class FakeCharacter:
+    def __init__(self, class_index='fighter', level=1):
+        self.name = "Grok"
+        self.abilities = FakeAbilities()
+        self.class_type = FakeClass(class_index)
+        self.level = level
+        self.weapon = None
+        self.healing_potions = []
+        self.is_spell_caster = class_index == 'cleric'
+        self.hit_points = self.max_hit_points = 12
+
+
+def test_profile_is_computed_once():
+    character = FakeCharacter()
+
+    profile = combat_profile(character)
+
+    assert combat_profile(character) is profile
+    assert (profile.attack_bonus, profile.damage.text, profile.ability_mod) == (5, "1d8", 3)
+    assert profile.weapon_label == "son épée"
+    assert 4 <= profile.roll_damage() <= 11
+
+
+def test_invalidation_picks_up_new_weapon():
+    character = FakeCharacter()
+    combat_profile(character)
+
+    character.weapon = FakeWeapon("Hache à deux mains", "1d12")
+    assert combat_profile(character).damage.text == "1d8"
+
+    invalidate_combat_profile(character)
+    profile = combat_profile(character)
+    assert profile.damage.text == "1d12"
+    assert profile.weapon_label == "hache à deux mains"
+
+
+def test_healing_spells_follow_slots():
+    character = FakeCharacter('cleric')
+    cure, bolt = FakeSpell("cure-wounds", 1), FakeSpell("guiding-bolt", 1, heals=False)
+    character.sc = FakeSpellcaster([cure, bolt], [1, 0])
+
+    profile = combat_profile(character)
+    assert profile.healing_spells == (cure,)
+
+    character.sc.spell_slots[0] = 0
+    invalidate_combat_profile(character)
+    assert combat_profile(character).healing_spells == ()
+
+
+def test_slot_use_and_rest_invalidate():
+    character = FakeCharacter('cleric')
+    character.sc = FakeSpellcaster([], [2])
+    character.spell_slots_current = {1: 2}
+
+    first = combat_profile(character)
+    assert CharacterExtensions.cast_spell(character, 1)
+    second = combat_profile(character)
+    assert second is not first
+
+    CharacterExtensions.long_rest(character)
+    assert combat_profile(character) is not second
+
+
+class ParentTurn(CombatSystem):
+    """Tour du CombatSystem parent (soins, potions) enregistré au lieu d'être joué"""
+
+    def character_turn(self, character, *args, **kwargs):
+        self.parent_turns.append(character.name)
+
+
+class RecordingCombatSystem(EnhancedCombatSystem, ParentTurn):
+    def __init__(self):
+        super().__init__(verbose=False)
+        self.parent_turns = []
+
+
+def test_potion_bought_after_profile_is_used():
+    character = FakeCharacter()
+    combat_profile(character)
+    combat_system = RecordingCombatSystem()
+
+    # Achat chez un marchand: inventaire modifié sans invalider le profil
+    character.healing_potions.append("potion")
+    character.hit_points = 2
+    combat_system.character_turn(character, [character], ["gobelin"], [character])
+
+    assert combat_system.parent_turns == ["Grok"]
+
+
+if __name__ == "__main__":
+    for test in (test_profile_is_computed_once, test_invalidation_picks_up_new_weapon,
+                 test_healing_spells_follow_slots, test_slot_use_and_rest_invalidate,
+                 test_potion_bought_after_profile_is_used):
+        test()
+        print(f"✅ {test.__name__}")
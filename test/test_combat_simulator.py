@@ -0,0 +1,109 @@
+#!/usr/bin/env python3
+"""
+Test du simulateur de combat Monte Carlo
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.simulation.combat_simulator import simulate_encounter, combat_encounters
+
+
+class FakeMonster:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 6
+        self.xp = 25
+
+
+class FakeMonsterFactory:
+    def create_monster(self, monster_id, name=None):
+        return FakeMonster(name or monster_id)
+
+
+class D6CombatSystem:
+    """Chaque attaque inflige 1d6 (random global, comme EnhancedCombatSystem)"""
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        monster = alive_monsters[0]
+        monster.hit_points -= random.randint(1, 6)
+        if monster.hit_points <= 0:
+            alive_monsters.remove(monster)
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        target = alive_chars[0]
+        target.hit_points -= random.randint(1, 6)
+        if target.hit_points <= 0:
+            alive_chars.remove(target)
+
+
+class FakeCharacter:
+    def __init__(self, name, hit_points):
+        self.name = name
+        self.hit_points = hit_points
+        self.max_hit_points = hit_points
+
+
+def make_party():
+    return [FakeCharacter("Grok", 12), FakeCharacter("Elara", 8)]
+
+
+def test_simulate_encounter_statistics():
+    party = make_party()
+    report = simulate_encounter(party, ['goblin', 'goblin'], n=2000, combat_system=D6CombatSystem(),
+                                monster_factory=FakeMonsterFactory(), workers=0, seed=7)
+
+    assert report.trials == 2000
+    assert 0.5 < report.win_rate < 1.0
+    assert sum(report.rounds.values()) == 2000
+    assert set(report.xp) == {0, 50}
+    assert report.xp[50] == report.wins
+    # Grok est en tête et encaisse les coups en premier
+    assert report.death_probability(0) > report.death_probability(1)
+    assert 0 < report.mean_hp_remaining(0) < 12
+    # Le groupe d'origine n'est pas touché
+    assert [c.hit_points for c in party] == [12, 8]
+
+
+def test_simulation_is_reproducible():
+    kwargs = dict(combat_system=D6CombatSystem(), monster_factory=FakeMonsterFactory(), workers=0)
+    first = simulate_encounter(make_party(), ['orc'], n=300, seed=11, **kwargs)
+    second = simulate_encounter(make_party(), ['orc'], n=300, seed=11, **kwargs)
+
+    assert first.to_dict() == second.to_dict()
+
+
+def test_process_pool_merges_reports():
+    report = simulate_encounter(make_party(), ['goblin'], n=400, combat_system=D6CombatSystem(),
+                                monster_factory=FakeMonsterFactory(), workers=2, seed=3)
+
+    assert report.trials == 400
+    assert sum(report.rounds.values()) == 400
+    assert report.to_dict()['characters'][0]['name'] == "Grok"
+
+
+def test_results_do_not_depend_on_worker_count():
+    kwargs = dict(combat_system=D6CombatSystem(), monster_factory=FakeMonsterFactory(), seed=5)
+    single = simulate_encounter(make_party(), ['goblin'], n=200, workers=0, **kwargs)
+    pooled = simulate_encounter(make_party(), ['goblin'], n=200, workers=3, **kwargs)
+
+    assert (single.wins, single.rounds, single.deaths) == (pooled.wins, pooled.rounds, pooled.deaths)
+
+
+def test_combat_encounters_from_scenario():
+    scenario = {'scenes': [
+        {'id': 'intro', 'type': 'narrative'},
+        {'id': 'ambush', 'type': 'combat', 'monsters': ['orc', 'orc']},
+        {'id': 'empty', 'type': 'combat', 'monsters': []},
+    ]}
+
+    assert combat_encounters(scenario) == {'ambush': ['orc', 'orc']}
+
+
+if __name__ == "__main__":
+    for test in (test_simulate_encounter_statistics, test_simulation_is_reproducible,
+                 test_process_pool_merges_reports, test_results_do_not_depend_on_worker_count,
+                 test_combat_encounters_from_scenario):
+        test()
+        print(f"✅ {test.__name__}")
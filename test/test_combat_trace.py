@@ -0,0 +1,137 @@
+#!/usr/bin/env python3
+"""
+Test de la trace binaire des combats
+"""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("dnd_5e_core")
+
+from src.scenes.scene_system import CombatScene
+from src.systems import combat_trace
+from src.systems.combat_log import CombatLog, LogLevel
+from src.systems.combat_trace import HEADER, RECORD, CombatTrace, TraceReader
+
+
+class FakeClass:
+    def __init__(self, index):
+        self.index = index
+
+
+class FakeCharacter:
+    def __init__(self, name, class_index, hit_points=10):
+        self.name = name
+        self.class_type = FakeClass(class_index)
+        self.hit_points = hit_points
+        self.max_hit_points = hit_points
+        self.conditions = []
+
+
+class FakeMonster:
+    def __init__(self, name, hit_points=4):
+        self.name = name
+        self.index = 'goblin'
+        self.hit_points = hit_points
+        self.xp = 10
+
+
+class ScriptedCombatSystem:
+    """Le guerrier inflige 3 dégâts (critique sur son premier jet), le gobelin 2"""
+
+    combat_log = None
+
+    def log_message(self, message):
+        print(message)
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        monster = alive_monsters[0]
+        roll = 20 if monster.hit_points == 4 else 12
+        self.combat_log.attack(character.name, monster.name, roll, roll + 5)
+        monster.hit_points -= 3
+        if monster.hit_points <= 0:
+            alive_monsters.remove(monster)
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        self.combat_log.miss(monster.name, alive_chars[0].name, 3)
+        alive_chars[0].hit_points -= 2
+
+
+def traced_fights(path, count=3):
+    with CombatTrace(path, buffer_records=4) as trace:
+        log = CombatLog(LogLevel.SILENT, trace=trace)
+        for _ in range(count):
+            party = [FakeCharacter("Grok", 'fighter')]
+            context = {'combat_log': log, 'scenario_settings': {'initiative': False}}
+            CombatScene.run_rounds(ScriptedCombatSystem(), party, list(party),
+                                   [FakeMonster("Gobelin")], context)
+    return trace
+
+
+def test_records_are_fixed_width(tmp_path):
+    path = tmp_path / "combats.trace"
+    trace = traced_fights(path)
+
+    assert trace.records > 0
+    assert os.path.getsize(path) == HEADER.size + trace.records * RECORD.size
+    with TraceReader(path) as reader:
+        assert len(reader) == trace.records
+        assert reader.combats() == 3
+        assert [c['group'] for c in reader.combatants] == ['fighter', 'goblin']
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_aggregate_queries(tmp_path, monkeypatch, use_numpy):
+    if use_numpy and not combat_trace.NUMPY_AVAILABLE:
+        pytest.skip("numpy non disponible")
+    monkeypatch.setattr(combat_trace, 'NUMPY_AVAILABLE', use_numpy)
+    path = tmp_path / "combats.trace"
+    traced_fights(path)
+
+    with TraceReader(path) as reader:
+        # Par combat: 2 coups de 3 pour le guerrier, 1 coup de 2 pour le gobelin
+        assert reader.damage_by_group(side='character') == {'fighter': 18}
+        assert reader.damage_by_group(side='monster') == {'goblin': 6}
+        assert reader.damage_taken_by_group() == {'goblin': 18, 'fighter': 6}
+        assert reader.kills_by_group() == {'fighter': 3}
+        assert reader.critical_rate_by_group() == {'fighter': 0.5, 'goblin': 0.0}
+
+
+def test_dnd_5e_core_attacks_are_traced(tmp_path):
+    from src.scenarios.json_scenario import JsonScenario
+    from src.simulation.combat_simulator import run_trials
+
+    scenario = JsonScenario(str(Path(__file__).parent.parent / "data" / "scenes" / "chasse_gobelins.json"))
+    path = tmp_path / "combats.trace"
+    run_trials(scenario.create_party(), ['goblin'] * 3, 20, scenario.combat_system,
+               scenario.monster_factory, seed=3, trace_path=str(path))
+
+    with TraceReader(path) as reader:
+        attacks = [r for r in reader.records() if combat_trace.KINDS[r[2]] in ('attack', 'miss')]
+        assert attacks and all(1 <= r[6] <= 20 for r in attacks)
+        # Pas de flag critique sans 20 naturel
+        assert all(r[6] == 20 for r in attacks if r[3] & combat_trace.FLAG_CRITICAL)
+        assert set(reader.critical_rate_by_group(side='monster')) == {'goblin'}
+        assert set(reader.critical_rate_by_group(side='character')) == {'fighter', 'cleric'}
+
+
+def test_invalid_file_is_rejected(tmp_path):
+    path = tmp_path / "bad.trace"
+    traced_fights(path, count=1)
+    path.write_bytes(b"NOPE" + path.read_bytes()[4:])
+
+    with pytest.raises(ValueError):
+        TraceReader(path)
+
+
+if __name__ == "__main__":
+    import tempfile
+
+    for test in (test_records_are_fixed_width, test_dnd_5e_core_attacks_are_traced,
+                 test_invalid_file_is_rejected):
+        with tempfile.TemporaryDirectory() as directory:
+            test(Path(directory))
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test des distributions exactes de dommages et de temps d'élimination
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.utils.damage_pmf import (DamagePMF, Combatant, attack_pmf, dice_pmf, estimate_encounter,
+                                  hit_chances, kill_time, round_pmf)
+from src.utils.encounter_generator import EncounterDifficultyCalculator
+
+
+def test_dice_distribution_is_exact():
+    pmf = dice_pmf("2d6+1")
+
+    assert (pmf.low, pmf.high) == (3, 13)
+    assert pmf.probability(8) == pytest.approx(6 / 36)
+    assert pmf.probability(3) == pytest.approx(1 / 36)
+    assert pmf.mean == pytest.approx(8.0)
+    assert sum(pmf.to_dict().values()) == pytest.approx(1.0)
+
+
+def test_attack_mean_matches_hand_calculation():
+    # +5 contre CA 15: touche sur 10-19 (50%), critique sur 20 (5%)
+    assert hit_chances(5, 15) == (0.5, 0.05)
+
+    pmf = attack_pmf(5, 15, "1d8", 3)
+    assert pmf.probability(0) == pytest.approx(0.45)
+    assert pmf.mean == pytest.approx(0.5 * 7.5 + 0.05 * 12.0)
+
+
+def test_critical_rules():
+    dice = attack_pmf(20, 2, "1d6", critical='dice')
+    double = attack_pmf(20, 2, "1d6", critical='double')
+
+    # Même moyenne, mais total doublé: uniquement des valeurs paires au critique
+    assert dice.mean == pytest.approx(double.mean)
+    assert double.probability(7) == pytest.approx(0.0)
+    assert dice.probability(7) > 0
+
+
+def test_power_equals_repeated_sum():
+    attack = attack_pmf(4, 13, "1d6", 2)
+    repeated = attack + attack + attack + attack + attack
+
+    assert attack.power(5).to_dict() == pytest.approx(repeated.to_dict())
+    assert round_pmf([attack] * 5).mean == pytest.approx(5 * attack.mean)
+
+
+def test_kill_time_with_fixed_damage():
+    # 4 dommages par tour contre 10 PV: toujours 3 tours
+    result = kill_time(DamagePMF.point(4), 10)
+
+    assert result.probability_by(2) == 0.0
+    assert result.probability_by(3) == 1.0
+    assert result.expected == pytest.approx(3.0)
+    assert result.median == 3
+
+
+def test_kill_time_accounts_for_misses():
+    # Touche une fois sur deux pour 10: tours jusqu'au premier succès (géométrique)
+    result = kill_time(DamagePMF.mixture([(0.5, DamagePMF.point(0)), (0.5, DamagePMF.point(10))]), 10)
+
+    assert result.probability_by(1) == pytest.approx(0.5)
+    assert result.probability_by(2) == pytest.approx(0.75)
+    assert result.expected == pytest.approx(2.0, abs=1e-6)
+
+
+def test_harder_encounters_rank_higher():
+    party = [Combatant("Guerrier", 12, 16, 5, "1d8", 3), Combatant("Clerc", 10, 18, 4, "1d6", 2)]
+    goblin = Combatant("Gobelin", 7, 15, 4, "1d6", 2)
+    ogre = Combatant("Ogre", 59, 11, 6, "2d8", 4)
+
+    easy = estimate_encounter(party, [goblin])
+    deadly = estimate_encounter(party, [ogre, ogre])
+
+    assert easy.clear_rounds < deadly.clear_rounds
+    assert easy.pressure < deadly.pressure
+    assert easy.difficulty in ('trivial', 'easy')
+    assert deadly.difficulty == 'deadly'
+    assert easy.format_line().startswith("📊 Estimation")
+
+
+def test_xp_difficulty_unchanged_without_combatants():
+    result = EncounterDifficultyCalculator.calculate_difficulty([1, 1, 1, 1], [0.25, 0.25])
+
+    assert 'analysis' not in result
+    assert result['difficulty'] in ('trivial', 'easy', 'medium', 'hard', 'deadly')
+
+
+if __name__ == "__main__":
+    for test in (test_dice_distribution_is_exact, test_attack_mean_matches_hand_calculation,
+                 test_critical_rules, test_power_equals_repeated_sum, test_kill_time_with_fixed_damage,
+                 test_kill_time_accounts_for_misses, test_harder_encounters_rank_higher,
+                 test_xp_difficulty_unchanged_without_combatants):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,72 @@
+#!/usr/bin/env python3
+"""
+Test du module de dés - expressions compilées et lancers
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.dice import DiceError, parse_dice, roll, roll_or, set_rng
+
+
+def test_parse_and_statistics():
+    expression = parse_dice("2d8+3")
+
+    assert expression.terms == ((2, 8),)
+    assert expression.bonus == 3
+    assert (expression.min, expression.max, expression.mean) == (5, 19, 12.0)
+    assert parse_dice("d20").terms == ((1, 20),)
+    assert parse_dice("1d8 - 1").min == 0
+    assert parse_dice("7").terms == () and parse_dice("7").max == 7
+    multi = parse_dice("1d6+1d4-1")
+    assert (multi.min, multi.max, multi.mean) == (1, 9, 5.0)
+
+
+def test_cache_returns_same_immutable_object():
+    expression = parse_dice("3d6")
+
+    assert parse_dice("3d6") is expression
+    try:
+        expression.bonus = 5
+        assert False, "DiceExpression doit être immuable"
+    except AttributeError:
+        pass
+
+
+def test_invalid_expressions():
+    for text in ("", "2d", "d0", "2d6+", "abc", "2d6 3"):
+        try:
+            parse_dice(text)
+            assert False, f"{text!r} devrait être refusé"
+        except DiceError:
+            pass
+    assert roll_or("???", "1d1") == 1
+
+
+def test_rolls_stay_in_bounds_and_follow_rng():
+    expression = parse_dice("2d6+1d4-2")
+    rolls = expression.roll_many(2000, random.Random(1))
+
+    assert len(rolls) == 2000
+    assert min(rolls) >= expression.min and max(rolls) <= expression.max
+    assert abs(sum(rolls) / len(rolls) - expression.mean) < 0.3
+    assert roll("2d6", random.Random(5)) == roll("2d6", random.Random(5))
+
+
+def test_configurable_default_rng():
+    set_rng(random.Random(42))
+    try:
+        first = [roll("1d20") for _ in range(5)]
+        set_rng(random.Random(42))
+        assert [roll("1d20") for _ in range(5)] == first
+    finally:
+        set_rng(None)
+
+
+if __name__ == "__main__":
+    for test in (test_parse_and_statistics, test_cache_returns_same_immutable_object,
+                 test_invalid_expressions, test_rolls_stay_in_bounds_and_follow_rng,
+                 test_configurable_default_rng):
+        test()
+        print(f"✅ {test.__name__}")
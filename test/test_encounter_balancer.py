@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Test de l'équilibreur de rencontres
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.simulation.encounter_balancer import EncounterBalancer, balance_scenario, load_candidates
+
+CANDIDATES = [('rat', 10), ('goblin', 50), ('orc', 100), ('ogre', 450)]
+XP = dict(CANDIDATES)
+
+
+class ThreatModel:
+    """Victoire = 1 - XP totale / 1000 (décroît avec le nombre de monstres)"""
+
+    def __init__(self):
+        self.calls = []
+
+    def __call__(self, monster_ids):
+        self.calls.append(sorted(monster_ids))
+        return max(0.0, 1 - sum(XP[m] for m in monster_ids) / 1000)
+
+
+def make_balancer(**kwargs):
+    model = ThreatModel()
+    options = dict(target=0.85, tolerance=0.02, candidates=CANDIDATES, simulate=model)
+    options.update(kwargs)
+    return EncounterBalancer([], **options), model
+
+
+def test_count_bisection_reaches_target():
+    balancer, model = make_balancer()
+
+    result = balancer.balance(['goblin', 'goblin'])
+
+    assert result.monster_ids == ['goblin'] * 3
+    assert result.win_rate == 0.85 and result.on_target
+    assert result.original_win_rate == 0.9
+
+
+def test_win_rates_are_memoized():
+    balancer, model = make_balancer()
+
+    balancer.balance(['goblin'])
+    calls = len(model.calls)
+    balancer.balance(['goblin'])
+
+    assert len(model.calls) == calls == balancer.evaluations
+    assert balancer.win_rate(['orc', 'goblin']) == balancer.win_rate(['goblin', 'orc'])
+
+
+def test_too_hard_encounter_gets_weaker_monster():
+    balancer, model = make_balancer()
+
+    # Un ogre seul: 55% de victoire, même à 1 monstre
+    result = balancer.balance(['ogre'])
+
+    assert 'ogre' not in result.monster_ids
+    assert result.on_target
+
+
+def test_too_easy_encounter_gets_stronger_monster():
+    balancer, model = make_balancer(max_monsters=4)
+
+    # 4 rats au plus: 96% de victoire
+    result = balancer.balance(['rat'])
+
+    assert result.on_target
+    assert any(m != 'rat' for m in result.monster_ids)
+
+
+def test_balance_scenario_rewrites_monster_arrays():
+    balancer, model = make_balancer()
+    scenario = {'scenes': [
+        {'id': 'intro', 'type': 'narrative'},
+        {'id': 'fight', 'type': 'combat', 'monsters': ['orc', 'orc', 'orc']},
+    ]}
+
+    results = balance_scenario(scenario, balancer)
+
+    assert scenario['scenes'][1]['monsters'] == results['fight'].monster_ids
+    assert results['fight'].changed and results['fight'].on_target
+
+
+def test_candidates_sorted_by_xp():
+    candidates = load_candidates()
+    xp = [value for _, value in candidates]
+
+    assert xp == sorted(xp)
+    assert 'goblin' in dict(candidates)
+
+
+if __name__ == "__main__":
+    for test in (test_count_bisection_reaches_target, test_win_rates_are_memoized,
+                 test_too_hard_encounter_gets_weaker_monster, test_too_easy_encounter_gets_stronger_monster,
+                 test_balance_scenario_rewrites_monster_arrays, test_candidates_sorted_by_xp):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Test du préchargement des combats en arrière-plan
+"""
+import sys
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.prefetch import EncounterPrefetcher
+from src.scenes.scene_factory import SceneFactory
+from src.simulation.headless import HeadlessRunner, ScriptedChoicePolicy
+
+
+class RecordingMonsterFactory:
+    """Mémorise le thread qui crée chaque monstre"""
+
+    def __init__(self):
+        self.created = []
+
+    def create_monster(self, monster_id, name=None):
+        self.created.append((monster_id, threading.current_thread().name))
+        return FakeMonster(monster_id)
+
+
+class FakeMonster:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 5
+        self.xp = 10
+
+
+class FakeCharacter:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 10
+        self.max_hit_points = 10
+
+
+class WinningCombatSystem:
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        alive_monsters.clear()
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        pass
+
+
+SCENARIO = {
+    'scenes': [
+        {'id': 'intro', 'type': 'narrative', 'text': '...', 'next_scene': 'road'},
+        {'id': 'road', 'type': 'choice', 'choices': [
+            {'text': 'Gauche', 'next_scene': 'ambush'},
+            {'text': 'Droite', 'next_scene': 'far'},
+        ]},
+        {'id': 'ambush', 'type': 'combat', 'monsters': ['goblin'], 'on_victory': 'end'},
+        {'id': 'far', 'type': 'narrative', 'text': '...', 'next_scene': 'farther'},
+        {'id': 'farther', 'type': 'narrative', 'text': '...', 'next_scene': 'lair'},
+        {'id': 'lair', 'type': 'combat', 'monsters': ['orc'], 'on_victory': 'end'},
+        {'id': 'end', 'type': 'narrative', 'text': '...', 'next_scene': None},
+    ]
+}
+
+
+def test_upcoming_combats_within_hops():
+    manager = SceneFactory.build_scene_manager_from_json(SCENARIO, RecordingMonsterFactory())
+    assert EncounterPrefetcher(manager.scenes, hops=1).upcoming_combats('intro') == []
+    assert EncounterPrefetcher(manager.scenes, hops=2).upcoming_combats('intro') == ['ambush']
+    assert EncounterPrefetcher(manager.scenes, hops=4).upcoming_combats('intro') == ['ambush', 'lair']
+
+
+def test_enemies_built_on_worker_thread():
+    factory = RecordingMonsterFactory()
+    manager = SceneFactory.build_scene_manager_from_json(SCENARIO, factory)
+    manager.enable_prefetch(hops=2)
+    runner = HeadlessRunner(manager, policy=ScriptedChoicePolicy([1]), context_factory=lambda: {
+        'party': [FakeCharacter("Grok")], 'game_state': {}, 'combat_system': WinningCombatSystem()
+    })
+    result = runner.run_once()
+    assert result.outcome == 'completed'
+    assert factory.created == [('goblin', factory.created[0][1])]
+    assert factory.created[0][1].startswith('encounter-prefetch')
+
+
+def test_stale_prefetch_is_discarded():
+    factory = RecordingMonsterFactory()
+    manager = SceneFactory.build_scene_manager_from_json(SCENARIO, factory)
+    prefetcher = EncounterPrefetcher(manager.scenes, hops=2)
+    prefetcher.schedule('road', {})
+    assert manager.scenes['ambush'].has_prefetch()
+    # Le joueur part à droite: l'embuscade n'est plus à portée
+    prefetcher.schedule('farther', {})
+    assert not manager.scenes['ambush'].has_prefetch()
+    assert manager.scenes['lair'].has_prefetch()
+    prefetcher.shutdown()
+    assert not manager.scenes['lair'].has_prefetch()
+
+
+def test_failed_prefetch_falls_back():
+    manager = SceneFactory.build_scene_manager_from_json(SCENARIO, RecordingMonsterFactory())
+    scene = manager.scenes['ambush']
+    calls = []
+
+    def flaky_factory(game_context):
+        calls.append(threading.current_thread().name)
+        if len(calls) == 1:
+            raise RuntimeError("données indisponibles")
+        return [FakeMonster('goblin')]
+
+    scene.enemies_factory = flaky_factory
+    prefetcher = EncounterPrefetcher(manager.scenes, hops=2)
+    prefetcher.schedule('road', {})
+    enemies = scene.create_enemies({})
+    assert [m.name for m in enemies] == ['goblin']
+    assert len(calls) == 2
+    prefetcher.shutdown()
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")
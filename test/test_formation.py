@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test de la formation (ligne de front / arrière-garde)
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes import CombatScene, Formation
+
+
+class FakeCharacter:
+    def __init__(self, name, hit_points=10):
+        self.name = name
+        self.hit_points = hit_points
+        self.max_hit_points = hit_points
+
+
+class FakeMonster:
+    def __init__(self, name, hit_points=100):
+        self.name = name
+        self.hit_points = hit_points
+
+
+class TargetRecorder:
+    """Les personnages ne font rien, les monstres notent leurs cibles possibles"""
+
+    def __init__(self):
+        self.targets = []
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        pass
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        self.targets.append([c.name for c in alive_chars])
+
+
+def make_party(count=5):
+    return [FakeCharacter(f"pj{i}") for i in range(count)]
+
+
+def test_rows_follow_party_order():
+    party = make_party()
+    formation = Formation(party)
+
+    assert [c.name for c in formation.front] == ["pj0", "pj1", "pj2"]
+    assert [c.name for c in formation.back] == ["pj3", "pj4"]
+    assert formation.row_of(party[4]) == Formation.BACK
+    assert formation.row_of(FakeCharacter("inconnu")) is None
+
+
+def test_back_line_exposed_once_front_falls():
+    party = make_party()
+    formation = Formation(party)
+
+    for character in party[:3]:
+        character.hit_points = 0
+    formation.sync()
+    assert formation.front == []
+    assert formation.targets() == party[3:]
+
+    # Un soin relève pj1 à sa place: la ligne de front se reforme
+    party[1].hit_points = 4
+    formation.sync()
+    assert formation.targets() == [party[1]]
+
+
+def test_summoned_ally_joins_requested_row():
+    party = make_party(4)
+    formation = Formation(party, front_row=2)
+    wolf = FakeCharacter("loup")
+
+    formation.add(wolf, row=Formation.FRONT)
+
+    assert formation.front == [party[0], party[1], wolf]
+    assert formation.back == [party[2], party[3]]
+
+
+def test_scenario_configures_front_row():
+    party = make_party()
+
+    assert len(Formation.for_scenario(party, {'formation': {'front_row': 1}}).front) == 1
+    assert len(Formation.for_scenario(party, {}).front) == 3
+
+
+def test_combat_scene_targets_front_row():
+    party = make_party()
+    party[0].hit_points = 0
+    combat_system = TargetRecorder()
+    context = {'scenario_settings': {'formation': {'front_row': 2}}}
+
+    CombatScene.run_rounds(combat_system, party, party[1:], [FakeMonster("ogre")],
+                           context, max_rounds=1)
+
+    assert combat_system.targets == [["pj1"]]
+
+
+if __name__ == "__main__":
+    for test in (test_rows_follow_party_order, test_back_line_exposed_once_front_falls,
+                 test_summoned_ally_joins_requested_row, test_scenario_configures_front_row,
+                 test_combat_scene_targets_front_row):
+        test()
+        print(f"✅ {test.__name__}")
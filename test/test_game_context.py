@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+Test du GameContext typé et de la copie sur écriture du game_state
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.game_context import GameContext, GameState
+
+
+def test_dict_shim():
+    state = {'gold': 10}
+    ctx = GameContext(party=['Grok'], game_state=state, renderer='R', custom_flag=True)
+    assert ctx['renderer'] == 'R' and ctx.renderer == 'R'
+    assert ctx.get('combat_system') is None
+    assert ctx.get('weapons', []) == []
+    assert 'magic_items' not in ctx and 'party' in ctx
+    assert ctx['custom_flag'] is True and ctx.extras == {'custom_flag': True}
+    try:
+        ctx['combat_system']
+    except KeyError:
+        pass
+    else:
+        raise AssertionError("Un champ non renseigné doit lever KeyError")
+    assert set(ctx) == {'party', 'game_state', 'renderer', 'custom_flag'}
+
+    # game_state écrit dans le dict fourni (sauvegardes de BaseScenario)
+    ctx['game_state']['gold'] += 5
+    assert state['gold'] == 15
+    assert isinstance(ctx.game_state, GameState)
+
+
+def test_slots():
+    ctx = GameContext()
+    assert not hasattr(ctx, '__dict__')
+    try:
+        ctx.unknown_attribute = 1
+    except AttributeError:
+        pass
+    else:
+        raise AssertionError("GameContext doit être slotté")
+
+
+def test_coerce():
+    ctx = GameContext.coerce({'party': [], 'game_state': {'xp': 1}})
+    assert ctx.game_state['xp'] == 1
+    assert GameContext.coerce(ctx) is ctx
+
+
+def test_game_state_copy_on_write():
+    parent = GameState({'gold': 10, 'reputation': 1})
+    child = parent.fork()
+    assert child._data is parent._data
+
+    child['gold'] -= 7
+    assert child['gold'] == 3 and parent['gold'] == 10
+    assert child['reputation'] == 1
+
+    parent['reputation'] = 5
+    assert child['reputation'] == 1
+    grandchild = child.fork()
+    del grandchild['reputation']
+    assert 'reputation' in child
+
+
+def test_fork_keeps_parent_writing_through():
+    # Le contexte vivant doit continuer d'écrire dans BaseScenario.game_state après un aperçu
+    scenario_state = {'gold': 10, 'combat_victories': 0}
+    live = GameState(scenario_state)
+    preview = live.fork()
+    other = live.fork()
+    nested = preview.fork()
+
+    live['combat_victories'] += 1
+    live['gold'] = 25
+    assert live._data is scenario_state
+    assert scenario_state == {'gold': 25, 'combat_victories': 1}
+    for branch in (preview, other, nested):
+        assert dict(branch) == {'gold': 10, 'combat_victories': 0}
+
+    preview['gold'] = 0
+    assert other['gold'] == 10 and nested['gold'] == 10 and scenario_state['gold'] == 25
+    live['gold'] = 30
+    assert scenario_state['gold'] == 30 and nested['gold'] == 10
+
+
+def test_context_fork():
+    ctx = GameContext(party=['Grok'], game_state={'gold': 10}, renderer='R')
+    branch = ctx.fork(renderer='headless')
+    branch['game_state']['gold'] = 0
+    assert ctx['game_state']['gold'] == 10
+    ctx['game_state']['gold'] = 12
+    assert branch['game_state']['gold'] == 0
+    assert branch.party is ctx.party
+    assert branch.renderer == 'headless' and ctx.renderer == 'R'
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test du serveur de parties multi-sessions
+"""
+import asyncio
+import os
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.scene_factory import SceneFactory
+from src.server.game_server import GameServer
+from src.server.client import play_session, run_clients, fetch_stats
+from src.simulation.headless import RandomChoicePolicy, ScriptedChoicePolicy
+
+
+class FakeMonster:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 5
+        self.xp = 50
+
+
+class FakeMonsterFactory:
+    def create_monster(self, monster_id, name=None):
+        return FakeMonster(monster_id)
+
+
+class FakeCharacter:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 10
+        self.max_hit_points = 10
+
+
+class FakeCombatSystem:
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        alive_monsters.clear()
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        pass
+
+
+SCENARIO = {
+    'scenes': [
+        {'id': 'intro', 'type': 'narrative', 'text': 'Bienvenue', 'next_scene': 'crossroads'},
+        {'id': 'crossroads', 'type': 'choice', 'description': '?', 'choices': [
+            {'text': 'Combattre', 'next_scene': 'fight', 'effects': {'bravery': 1}},
+            {'text': 'Fuir', 'next_scene': 'ending'},
+        ]},
+        {'id': 'fight', 'type': 'combat', 'monsters': ['goblin'], 'on_victory': 'ending'},
+        {'id': 'ending', 'type': 'narrative', 'text': 'Fin', 'next_scene': None},
+    ]
+}
+
+created_managers = []
+
+
+def session_factory():
+    manager = SceneFactory.build_scene_manager_from_json(SCENARIO, FakeMonsterFactory())
+    created_managers.append(manager)
+    context = {'party': [FakeCharacter("Grok")], 'game_state': {}, 'combat_system': FakeCombatSystem()}
+    return manager, context, 'intro'
+
+
+async def start_server():
+    server = GameServer({'test': session_factory}, max_sessions=32)
+    tcp = await server.start_tcp('127.0.0.1', 0)
+    return server, tcp.sockets[0].getsockname()[1]
+
+
+def test_single_session_over_tcp():
+    async def scenario():
+        server, port = await start_server()
+        texts = []
+        try:
+            return await play_session(ScriptedChoicePolicy([1]), 'test', port=port,
+                                      on_text=texts.append), texts
+        finally:
+            await server.close()
+
+    result, texts = asyncio.run(scenario())
+    assert result['outcome'] == 'completed'
+    assert result['path'] == ['intro', 'crossroads', 'fight', 'ending']
+    assert result['choices'] == 1
+    # Les print() du combat sont envoyés au client, pas à la console
+    assert any('Ennemis' in text for text in texts)
+
+
+def test_concurrent_sessions_are_isolated():
+    async def scenario():
+        server, port = await start_server()
+        try:
+            summary = await run_clients(40, lambda i: RandomChoicePolicy(i), concurrency=20,
+                                        scenario='test', port=port)
+            stats = await fetch_stats(port=port)
+            return summary, stats
+        finally:
+            await server.close()
+
+    created_managers.clear()
+    summary, stats = asyncio.run(scenario())
+    assert summary['outcomes'] == {'completed': 40}
+    assert stats['sessions_started'] == 40
+    assert stats['active_sessions'] == 0
+    assert stats['peak_sessions'] >= 1
+    assert stats['steps'] >= 80
+    assert stats['step_latency_ms']['max'] >= stats['step_latency_ms']['p50']
+    # Un SceneManager par session
+    assert len({id(manager) for manager in created_managers}) == 40
+
+
+def test_unix_socket_and_errors():
+    async def scenario():
+        server = GameServer({'test': session_factory})
+        with tempfile.TemporaryDirectory() as tmp:
+            path = str(Path(tmp) / 'dnd.sock')
+            await server.start_unix(path)
+            try:
+                ok = await play_session(ScriptedChoicePolicy([2]), 'test', unix_path=path)
+                unknown = await play_session(ScriptedChoicePolicy([]), 'nope', unix_path=path)
+                return ok, unknown
+            finally:
+                await server.close()
+
+    ok, unknown = asyncio.run(scenario())
+    assert ok['outcome'] == 'completed'
+    assert ok['path'] == ['intro', 'crossroads', 'ending']
+    assert unknown['outcome'] == 'error'
+
+
+def test_close_restores_stdout_and_auto_save():
+    async def scenario(previous):
+        server = GameServer({'test': session_factory})
+        with tempfile.TemporaryDirectory() as tmp:
+            tcp = await server.start_tcp('127.0.0.1', 0)
+            await server.start_unix(str(Path(tmp) / 'dnd.sock'))
+            try:
+                # Un seul aiguillage pour les deux écoutes
+                assert sys.stdout.fallback is previous
+                assert os.environ['DND_AUTO_SAVE'] == 'true'
+                return await play_session(ScriptedChoicePolicy([2]), 'test',
+                                          port=tcp.sockets[0].getsockname()[1])
+            finally:
+                await server.close()
+
+    saved = os.environ.pop('DND_AUTO_SAVE', None)
+    try:
+        for value in (None, 'false'):
+            if value is not None:
+                os.environ['DND_AUTO_SAVE'] = value
+            previous = sys.stdout
+            assert asyncio.run(scenario(previous))['outcome'] == 'completed'
+            assert sys.stdout is previous
+            assert os.environ.get('DND_AUTO_SAVE') == value
+    finally:
+        os.environ.pop('DND_AUTO_SAVE', None)
+        if saved is not None:
+            os.environ['DND_AUTO_SAVE'] = saved
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")
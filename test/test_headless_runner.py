@@ -0,0 +1,144 @@
+#!/usr/bin/env python3
+"""
+Test du runner headless - parties complètes sans interaction
+"""
+import os
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.scene_factory import SceneFactory
+from src.simulation.headless import (
+    HeadlessRunner, FirstChoicePolicy, RandomChoicePolicy, ScriptedChoicePolicy
+)
+
+
+class FakeMonster:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 5
+        self.xp = 50
+
+
+class FakeMonsterFactory:
+    def create_monster(self, monster_id, name=None):
+        return FakeMonster(name or monster_id)
+
+
+class FakeCombatSystem:
+    """Le groupe gagne (ou perd) au premier tour"""
+
+    def __init__(self, party_wins=True):
+        self.party_wins = party_wins
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        if self.party_wins:
+            alive_monsters.clear()
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        if not self.party_wins:
+            for char in alive_chars:
+                char.hit_points = 0
+            alive_chars.clear()
+
+
+class FakeCharacter:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 10
+        self.max_hit_points = 10
+
+
+SCENARIO = {
+    'scenes': [
+        {'id': 'intro', 'type': 'narrative', 'title': 'Intro', 'text': '...', 'next_scene': 'crossroads'},
+        {'id': 'crossroads', 'type': 'choice', 'title': 'Choix', 'description': '?', 'choices': [
+            {'text': 'Tourner en rond', 'next_scene': 'loop'},
+            {'text': 'Combattre', 'next_scene': 'fight'},
+            {'text': 'Porte cassée', 'next_scene': 'nowhere'},
+        ]},
+        {'id': 'loop', 'type': 'narrative', 'title': 'Boucle', 'text': '...', 'next_scene': 'crossroads'},
+        {'id': 'fight', 'type': 'combat', 'title': 'Combat', 'description': '',
+         'monsters': ['goblin', 'goblin'], 'on_victory': 'ending', 'on_defeat': 'game_over'},
+        {'id': 'ending', 'type': 'narrative', 'title': 'Fin', 'text': '...', 'next_scene': None},
+    ]
+}
+
+
+def make_runner(policy, party_wins=True, max_steps=50):
+    manager = SceneFactory.build_scene_manager_from_json(SCENARIO, FakeMonsterFactory())
+
+    def context_factory():
+        return {
+            'party': [FakeCharacter("Grok"), FakeCharacter("Elara")],
+            'game_state': {},
+            'combat_system': FakeCombatSystem(party_wins),
+        }
+
+    return HeadlessRunner(manager, policy=policy, context_factory=context_factory, max_steps=max_steps)
+
+
+def test_completed_playthrough():
+    result = make_runner(ScriptedChoicePolicy([2])).run_once()
+    assert result.outcome == 'completed'
+    assert result.path == ['intro', 'crossroads', 'fight', 'ending']
+    assert result.game_state['total_xp'] == 100
+
+
+def test_defeat_in_combat():
+    result = make_runner(ScriptedChoicePolicy([2]), party_wins=False).run_once()
+    assert result.outcome == 'defeat'
+    assert result.path[-1] == 'fight'
+
+
+def test_missing_scene_is_reported():
+    result = make_runner(ScriptedChoicePolicy([3])).run_once()
+    assert result.outcome == 'missing_scene'
+
+
+def test_cycle_hits_step_limit():
+    result = make_runner(FirstChoicePolicy(), max_steps=20).run_once()
+    assert result.outcome == 'step_limit'
+    assert len(result.path) == 20
+
+
+def test_batch_report_is_reproducible():
+    first = make_runner(RandomChoicePolicy(seed=7)).run_batch(200)
+    second = make_runner(RandomChoicePolicy(seed=7)).run_batch(200)
+    assert first.runs == 200
+    assert first.outcomes == second.outcomes
+    assert first.scene_visits['intro'] == 200
+    assert first.runs_per_second > 0
+
+
+def test_environment_is_restored():
+    previous = {key: os.environ.pop(key, None) for key in ('DND_AUTO_SAVE', 'DND_TEXT_SPEED')}
+    os.environ['DND_TEXT_SPEED'] = 'slow'
+    try:
+        make_runner(ScriptedChoicePolicy([2])).run_once()
+        assert os.environ['DND_TEXT_SPEED'] == 'slow'
+        assert 'DND_AUTO_SAVE' not in os.environ
+    finally:
+        for key, value in previous.items():
+            os.environ.pop(key, None)
+            if value is not None:
+                os.environ[key] = value
+
+
+def test_real_scenario_files_run_headless():
+    for json_path in sorted((Path(__file__).parent.parent / 'data' / 'scenes').glob('*.json')):
+        data = SceneFactory.load_scenario_from_json_file(str(json_path), FakeMonsterFactory())
+        runner = HeadlessRunner(data, policy=RandomChoicePolicy(seed=1), context_factory=lambda: {
+            'party': [FakeCharacter("Grok")], 'game_state': {}, 'combat_system': FakeCombatSystem()
+        })
+        report = runner.run_batch(5)
+        assert report.runs == 5, json_path.name
+        assert sum(report.outcomes.values()) == 5
+        assert 'missing_scene' not in report.outcomes, json_path.name
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")
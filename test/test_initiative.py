@@ -0,0 +1,145 @@
+#!/usr/bin/env python3
+"""
+Test de l'ordre d'initiative des combats
+"""
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes import CombatScene, InitiativeScheduler
+
+
+class FakeAbilities:
+    def __init__(self, dex=10):
+        self.dex = dex
+
+
+class Fighter:
+    def __init__(self, name, hit_points=10, dex=10):
+        self.name = name
+        self.hit_points = hit_points
+        self.max_hit_points = hit_points
+        self.abilities = FakeAbilities(dex)
+        self.xp = 10
+
+
+class FixedRoll:
+    """randint renvoie toujours la même valeur: l'initiative ne dépend que de la DEX"""
+
+    def randint(self, low, high):
+        return 10
+
+
+def play_round(scheduler):
+    scheduler.start_round()
+    order = []
+    while (actor := scheduler.next_turn()) is not None:
+        order.append(actor.name)
+        scheduler.after_turn(actor)
+    return order
+
+
+def test_rolled_initiative_orders_turns():
+    rogue = Fighter("roublard", dex=18)
+    fighter = Fighter("guerrier", dex=10)
+    goblin = Fighter("gobelin", dex=14)
+
+    scheduler = InitiativeScheduler.for_combat([fighter, rogue], [goblin], rng=FixedRoll())
+
+    assert play_round(scheduler) == ["roublard", "gobelin", "guerrier"]
+    assert scheduler.initiative_of(rogue) == 14
+
+
+def test_fixed_order_keeps_characters_first():
+    party = [Fighter("a", dex=3), Fighter("b")]
+    monsters = [Fighter("m", dex=20)]
+
+    scheduler = InitiativeScheduler.for_combat(party, monsters, rolled=False)
+
+    assert play_round(scheduler) == ["a", "b", "m"]
+
+
+def test_dead_and_removed_combatants_are_skipped():
+    fighters = [Fighter(f"f{i}", dex=10 + 2 * i) for i in range(5)]
+    scheduler = InitiativeScheduler.for_combat(fighters, [], rng=FixedRoll())
+
+    scheduler.start_round()
+    assert scheduler.next_turn().name == "f4"
+    fighters[3].hit_points = 0
+    scheduler.remove(fighters[2])
+
+    assert [scheduler.next_turn().name, scheduler.next_turn().name] == ["f1", "f0"]
+    assert scheduler.next_turn() is None
+    assert fighters[2] not in scheduler
+
+
+def test_delayed_turn_moves_later():
+    fast, slow = Fighter("rapide", dex=16), Fighter("lent", dex=10)
+    scheduler = InitiativeScheduler.for_combat([fast, slow], [], rng=FixedRoll())
+
+    scheduler.start_round()
+    assert scheduler.next_turn() is fast
+    scheduler.delay(fast, 5)
+    assert [scheduler.next_turn(), scheduler.next_turn(), scheduler.next_turn()] == [slow, fast, None]
+
+    # Le retard est conservé aux tours suivants
+    assert play_round(scheduler) == ["lent", "rapide"]
+
+
+def test_readied_action_triggers_on_other_turn():
+    guard, goblin = Fighter("garde", dex=16), Fighter("gobelin", dex=10)
+    scheduler = InitiativeScheduler.for_combat([guard], [goblin], rng=FixedRoll())
+    reactions = []
+
+    scheduler.start_round()
+    scheduler.next_turn()
+    scheduler.ready(guard, lambda actor: actor is goblin,
+                    lambda actor: reactions.append(f"garde frappe {actor.name}"))
+    scheduler.after_turn(guard)
+    scheduler.after_turn(scheduler.next_turn())
+    scheduler.after_turn(goblin)
+
+    assert reactions == ["garde frappe gobelin"]
+
+
+class FirstTargetCombatSystem:
+    """Les personnages abattent un monstre par tour, les monstres infligent 1 dégât"""
+
+    def __init__(self):
+        self.turns = []
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        self.turns.append(character.name)
+        alive_monsters[0].hit_points = 0
+        alive_monsters.pop(0)
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        self.turns.append(monster.name)
+        alive_chars[0].hit_points -= 1
+
+
+def test_combat_scene_plays_in_initiative_order():
+    random.seed(11)
+    party = [Fighter(f"pj{i}", hit_points=30, dex=10 + i % 8) for i in range(10)]
+    monsters = [Fighter(f"orc{i}", hit_points=12, dex=8 + i % 6) for i in range(50)]
+    alive_chars, alive_monsters = list(party), list(monsters)
+    combat_system = FirstTargetCombatSystem()
+    context = {}
+
+    rounds = CombatScene.run_rounds(combat_system, party, alive_chars, alive_monsters, context)
+
+    assert not alive_monsters and alive_chars
+    assert 'initiative' not in context
+    # Au premier tour, personnages et monstres s'intercalent
+    first_round = combat_system.turns[:60]
+    assert any(name.startswith("orc") for name in first_round[:10])
+    assert rounds <= 10
+
+
+if __name__ == "__main__":
+    for test in (test_rolled_initiative_orders_turns, test_fixed_order_keeps_characters_first,
+                 test_dead_and_removed_combatants_are_skipped, test_delayed_turn_moves_later,
+                 test_readied_action_triggers_on_other_turn, test_combat_scene_plays_in_initiative_order):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,167 @@
+#!/usr/bin/env python3
+"""
+Test des grandes batailles (escouades de monstres)
+"""
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+pytest.importorskip("dnd_5e_core")
+
+from src.scenes.scene_system import CombatScene
+from src.simulation.headless import scenario_context_factory
+from src.systems.mass_battle import MassBattle, Squad, hit_probability
+
+
+class FakeDamage:
+    def __init__(self, dice):
+        self.dd = dice
+
+
+class FakeAction:
+    def __init__(self, attack_bonus, dice):
+        self.name = "Cimeterre"
+        self.attack_bonus = attack_bonus
+        self.damages = [FakeDamage(dice)]
+        self.normal_range = 5
+
+
+class FakeMonster:
+    def __init__(self, name="gobelin", hit_points=7, attack_bonus=4, dice="1d6+2"):
+        self.name = name
+        self.hit_points = hit_points
+        self.armor_class = 15
+        self.actions = [FakeAction(attack_bonus, dice)]
+        self.xp = 50
+
+
+class FakeCharacter:
+    def __init__(self, name, hit_points=40, armor_class=16):
+        self.name = name
+        self.hit_points = hit_points
+        self.max_hit_points = hit_points
+        self.armor_class = armor_class
+
+
+class CleaveCombatSystem:
+    """Chaque personnage abat le premier monstre; les monstres individuels frappent de 1"""
+
+    def __init__(self):
+        self.monster_turns = 0
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        monster = alive_monsters[0]
+        monster.hit_points = 0
+        alive_monsters.remove(monster)
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        self.monster_turns += 1
+        alive_chars[0].hit_points -= 1
+
+
+def test_hit_probability_keeps_natural_rolls():
+    assert hit_probability(4, 15) == pytest.approx(0.5)
+    assert hit_probability(-100, 10) == pytest.approx(0.05)
+    assert hit_probability(100, 10) == pytest.approx(0.95)
+
+
+def test_identical_monsters_form_squads():
+    goblins = [FakeMonster() for _ in range(10)]
+    ogres = [FakeMonster("ogre", 59, 6, "2d8+4") for _ in range(2)]
+
+    battle = MassBattle(goblins + ogres, expand_below=3)
+    alive = goblins + ogres
+    battle.sync(alive)
+
+    assert len(battle.squads) == 1 and battle.squads[0].count == 10
+    assert battle.individuals == ogres
+    assert alive == [goblins[0]] + ogres
+
+
+def test_squad_damage_matches_expected_value():
+    squad = Squad([FakeMonster() for _ in range(50)])
+    rng = random.Random(3)
+
+    # 50 attaques à 50%: 25 touches de 1d6+2 (5.5), plus les critiques
+    totals = [squad.roll_attacks(50, 15, rng)[1] for _ in range(400)]
+    mean = sum(totals) / len(totals)
+    assert 140 < mean < 165
+
+
+def test_squad_expands_into_individuals():
+    goblins = [FakeMonster() for _ in range(5)]
+    alive = list(goblins)
+    battle = MassBattle(goblins, expand_below=3)
+    battle.sync(alive)
+
+    goblins[0].hit_points = 0
+    goblins[1].hit_points = 0
+    battle.sync(alive)
+
+    assert battle.squads == []
+    assert alive == goblins[2:] == battle.individuals
+
+
+def test_hundred_versus_six_resolves_quickly():
+    random.seed(7)
+    party = [FakeCharacter(f"pj{i}") for i in range(6)]
+    goblins = [FakeMonster() for _ in range(100)]
+    alive_chars = list(party)
+    alive_monsters = list(goblins)
+    combat_system = CleaveCombatSystem()
+    context = {'scenario_settings': {'mass_battle': {'min_monsters': 12, 'expand_below': 3}}}
+
+    start = time.perf_counter()
+    rounds = CombatScene.run_rounds(combat_system, party, alive_chars, alive_monsters, context)
+    elapsed = time.perf_counter() - start
+
+    assert elapsed < 1.0
+    assert rounds <= 17
+    # Seuls les derniers gobelins (escouade dissoute) jouent individuellement
+    assert combat_system.monster_turns <= 3 * rounds
+    killed = sum(1 for g in goblins if g.hit_points <= 0)
+    assert killed == 100 or not alive_chars
+
+
+HORDE_SCENARIO = {
+    'name': 'La horde',
+    'mass_battle': {'min_monsters': 12, 'expand_below': 3},
+    'scenes': [
+        {'id': 'green_horde', 'type': 'combat', 'title': 'La horde verte',
+         'monsters': ['goblin'] * 12, 'on_victory': None, 'on_defeat': None},
+    ]
+}
+
+
+def test_scenario_json_enables_squads():
+    from src.scenarios.json_scenario import JsonScenario
+
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = Path(tmp) / "horde.json"
+        json_path.write_text(json.dumps(HORDE_SCENARIO), encoding='utf-8')
+        scenario = JsonScenario(str(json_path))
+        scenario.build_custom_scenes()
+        context = scenario_context_factory(scenario)()
+        goblins = scenario.scene_manager.scenes['green_horde'].create_enemies(context)
+    assert context['scenario_settings']['mass_battle']['min_monsters'] == len(goblins)
+
+    party = [FakeCharacter("pj1"), FakeCharacter("pj2")]
+    combat_system = CleaveCombatSystem()
+    CombatScene.run_rounds(combat_system, party, list(party), list(goblins), context, max_rounds=1)
+
+    # Une escouade de 12 gobelins: aucun tour de monstre individuel au premier tour
+    assert combat_system.monster_turns == 0
+    assert sum(c.hit_points for c in party) < 80
+
+if __name__ == "__main__":
+    for test in (test_hit_probability_keeps_natural_rolls, test_identical_monsters_form_squads,
+                 test_squad_damage_matches_expected_value, test_squad_expands_into_individuals,
+                 test_hundred_versus_six_resolves_quickly, test_scenario_json_enables_squads):
+        test()
+        print(f"✅ {test.__name__}")
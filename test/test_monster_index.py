@@ -0,0 +1,138 @@
+#!/usr/bin/env python3
+"""
+Test de l'index des monstres (requêtes par FP, XP, type, taille, alignement)
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.encounter_generator import EncounterDifficultyCalculator, RandomEncounterGenerator
+import pytest
+
+from src.utils.monster_index import MonsterEntry, MonsterIndex, api_entry, normalize_name
+
+
+def make_index() -> MonsterIndex:
+    """Fiches locales du dépôt, sans dnd_5e_core"""
+    return MonsterIndex.from_sources(include_api=False)
+
+
+def test_query_by_type_and_challenge_rating():
+    index = make_index()
+
+    undead = index.query(type='undead', cr_min='1/4', cr_max=2)
+    assert [e.id for e in undead] == ['skeleton', 'shadow', 'snake_guardian']
+    assert index.query(type='Undead', cr_min=3) == [index.get('snake_king')]
+    assert index.query(type='dragon') == []
+
+    ratings = [e.challenge_rating for e in index.by_challenge_rating()]
+    assert ratings == sorted(ratings) and len(ratings) == len(index)
+    assert 'undead' in index.values('type')
+
+
+def test_query_by_xp_keeps_challenge_rating_order():
+    index = make_index()
+
+    assert {e.id for e in index.by_xp(200, 200)} == {'animated-armor', 'giant_spider',
+                                                     'goblin_boss', 'snake_guardian'}
+    humanoids = index.query(type='humanoid', xp_min=100, xp_max=450)
+    assert [e.id for e in humanoids] == ['orc', 'goblin_boss', 'cult_fanatic', 'orc_eye_of_gruumsh']
+    assert all(e.type == 'humanoid' for e in index.query(xp_min=100, type='humanoid'))
+
+
+def test_find_from_pdf_text():
+    index = make_index()
+
+    assert index.find('2d4 Goblins').id == 'goblin'
+    assert index.find('orcs').id == 'orc'
+    assert index.find('Goblin Boss').id == 'goblin_boss'
+    assert index.find('1d6+2 skeletons').id == 'skeleton'
+    assert index.find('A red dragon') is None
+    assert normalize_name('Goblin Boss') == 'goblin-boss'
+
+
+def test_find_irregular_english_plurals():
+    index = MonsterIndex([MonsterEntry('wolf', 'Wolf', 0.25, 50, 'beast'),
+                          MonsterEntry('harpy', 'Harpy', 1.0, 200, 'monstrosity'),
+                          MonsterEntry('dire-wolf', 'Dire Wolf', 1.0, 200, 'beast')])
+
+    assert index.find('Wolves').id == 'wolf'
+    assert index.find('1d4 harpies').id == 'harpy'
+    assert index.find('3 dire wolves').id == 'dire-wolf'
+
+
+def test_local_entries_win_duplicates():
+    local = MonsterEntry('goblin_boss', 'Goblin Boss', 1.0, 200, 'humanoid')
+    api = MonsterEntry('goblin-boss', 'Goblin Boss', 1.0, 200, 'humanoid', source='dnd_5e_core')
+    bat = MonsterEntry('bat', 'Bat', 0.0, 10, 'beast', 'tiny', source='dnd_5e_core')
+
+    index = MonsterIndex([local, api, bat])
+
+    assert len(index) == 2 and 'goblin-boss' not in index
+    assert index.find('goblin-boss') is local
+    assert index.query(size='tiny') == [bat]
+
+
+def test_api_stat_block_abbreviations():
+    official = api_entry('zombie', {'index': 'zombie', 'name': 'Zombie', 'type': 'undead',
+                                    'size': 'Medium', 'alignment': 'neutral evil',
+                                    'challenge_rating': 0.25, 'xp': 50})
+    assert (official.type, official.size, official.alignment, official.xp) == ('undead', 'medium',
+                                                                               'neutral evil', 50)
+
+    # Format 5etools (fiches "extended"): abréviations, type imbriqué, pas d'XP
+    extended = api_entry('aarakocra-aeromancer', {
+        'name': 'Aarakocra Aeromancer', 'size': 'M', 'alignment': 'N', 'challenge_rating': 4.0,
+        'type': {'type': {'choose': ['celestial', 'fiend']}, 'tags': []}})
+    assert (extended.type, extended.size, extended.alignment, extended.xp) == (
+        'celestial or fiend', 'medium', 'neutral', 1100)
+
+
+def test_api_monsters_have_types():
+    pytest.importorskip("dnd_5e_core")
+    index = MonsterIndex.from_sources()
+
+    undead = {e.id for e in index.query(type='undead', cr_min='1/4', cr_max=2)}
+    assert {'zombie', 'ghoul', 'skeleton', 'shadow'} <= undead
+    assert index.get('zombie').source == 'dnd_5e_core' and index.get('ghoul').size == 'medium'
+    assert index.get('skeleton').source == 'local'
+
+
+def test_suggest_monsters_matches_difficulty():
+    index = make_index()
+    party = [1, 1, 1, 1]
+
+    medium = EncounterDifficultyCalculator.suggest_monsters(party, 'medium', index=index)
+    assert medium and all(e.challenge_rating == 1.0 for e in medium)
+    for entry in medium:
+        result = EncounterDifficultyCalculator.calculate_difficulty(party, [entry.challenge_rating])
+        assert result['difficulty'] == 'medium'
+
+    undead = EncounterDifficultyCalculator.suggest_monsters(party, 'easy', count=2,
+                                                            monster_type='undead', index=index)
+    assert [e.id for e in undead] == ['skeleton']
+    deadly = EncounterDifficultyCalculator.suggest_monsters(party, 'deadly', index=index)
+    assert index.get('mage') in deadly
+
+
+def test_random_encounters_resolve_monsters():
+    generator = RandomEncounterGenerator([
+        {'roll': '1-3', 'description': '2d4 goblins'},
+        {'roll': '4-6', 'description': 'A red dragon'},
+    ], index=make_index())
+
+    # Résolution à la première utilisation: l'index n'est pas requis à la construction
+    entries = generator.tables[0].entries
+    assert all('monster_id' not in e for e in entries)
+    assert [e['encounter']['monster_id'] for e in generator.get_all_possible_encounters()] == ['goblin', None]
+    rolled = generator.roll_encounter()
+    assert rolled['encounter']['monster_id'] == ('goblin' if rolled['rolled'] <= 3 else None)
+    assert generator.resolve_monster('Orcs') == 'orc'
+
+
+if __name__ == "__main__":
+    for test in (test_query_by_type_and_challenge_rating, test_query_by_xp_keeps_challenge_rating_order,
+                 test_find_from_pdf_text, test_find_irregular_english_plurals, test_local_entries_win_duplicates, test_api_stat_block_abbreviations,
+                 test_suggest_monsters_matches_difficulty, test_random_encounters_resolve_monsters):
+        test()
+        print(f"✅ {test.__name__}")
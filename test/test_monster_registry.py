@@ -0,0 +1,158 @@
+#!/usr/bin/env python3
+"""
+Test du registre de monstres partagé (prototypes clonés)
+"""
+import json
+import sys
+import threading
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import pytest
+
+from src.utils import monster_registry as registry_module
+from src.utils.monster_registry import (MonsterRegistry, clone_monster, monster_registry,
+                                        parse_challenge_rating, parse_feet)
+from src.utils.save_manager import JSONLoader
+
+
+class FakeSpellcaster:
+    def __init__(self):
+        self.spell_slots = [2, 1]
+
+
+class FakeMonster:
+    def __init__(self, index, data):
+        self.index = index
+        self.name = data['name']
+        self.hit_points = data['hit_points']
+        self.conditions = []
+        self.actions = [object()]
+        self.sc = FakeSpellcaster()
+
+
+@pytest.fixture
+def builds(monkeypatch):
+    calls = []
+
+    def fake_build(monster_id, data):
+        calls.append(monster_id)
+        return FakeMonster(monster_id, data)
+
+    monkeypatch.setattr(registry_module, 'monster_from_local', fake_build)
+    return calls
+
+
+def make_registry(tmp_path, api=None):
+    path = tmp_path / "monsters.json"
+    path.write_text(json.dumps({'goblin': {'name': 'Goblin', 'hit_points': 7}}), encoding='utf-8')
+    return MonsterRegistry(path, api_loader=lambda monster_id: (api or {}).get(monster_id))
+
+
+def test_prototype_built_once_and_cloned(tmp_path, builds):
+    registry = make_registry(tmp_path)
+
+    goblins = [registry.create_monster('goblin', f"Gobelin {i}") for i in range(8)]
+
+    assert builds == ['goblin']
+    assert [g.name for g in goblins[:2]] == ["Gobelin 0", "Gobelin 1"]
+    goblins[0].hit_points -= 5
+    goblins[0].conditions.append('prone')
+    goblins[0].sc.spell_slots[0] = 0
+    assert goblins[1].hit_points == 7 and goblins[1].conditions == []
+    assert goblins[1].sc.spell_slots == [2, 1]
+    # Les données immuables restent partagées
+    assert goblins[0].actions[0] is goblins[1].actions[0]
+    assert registry.prototype('goblin').hit_points == 7
+
+
+def test_clones_share_no_combat_state_with_prototype():
+    prototype = FakeMonster('goblin', {'name': 'Goblin', 'hit_points': 7})
+    first, second = clone_monster(prototype), clone_monster(prototype)
+
+    for clone in (first, second):
+        assert clone.conditions is not prototype.conditions
+        assert clone.sc is not prototype.sc
+        assert clone.sc.spell_slots is not prototype.sc.spell_slots
+    assert first.conditions is not second.conditions and first.sc is not second.sc
+
+    first.hit_points = 0
+    first.conditions.append('poisoned')
+    first.sc.spell_slots[1] = 0
+    assert (prototype.hit_points, prototype.conditions, prototype.sc.spell_slots) == (7, [], [2, 1])
+    assert (second.hit_points, second.conditions, second.sc.spell_slots) == (7, [], [2, 1])
+
+
+def test_failed_lookup_is_cached(tmp_path, builds, capsys):
+    lookups = []
+    registry = MonsterRegistry(make_registry(tmp_path).local_path,
+                               api_loader=lambda monster_id: lookups.append(monster_id))
+
+    for _ in range(3):
+        assert registry.create_monster('tarrasque') is None
+    assert registry.prototype('tarrasque') is None
+    assert lookups == ['tarrasque']
+    assert capsys.readouterr().out.count("Monstre non trouvé") == 1
+
+
+def test_unknown_monster_is_looked_up_once(tmp_path, builds, capsys):
+    lookups = []
+    registry = MonsterRegistry(make_registry(tmp_path).local_path,
+                               api_loader=lambda monster_id: lookups.append(monster_id))
+
+    assert registry.create_monster('tarrasque') is None
+    assert registry.create_monsters(['tarrasque', ('goblin', "Chef")])[0].name == "Chef"
+    assert lookups == ['tarrasque']
+    assert "Monstre non trouvé" in capsys.readouterr().out
+
+
+def test_concurrent_creation_builds_once(tmp_path, builds):
+    registry = make_registry(tmp_path)
+    threads = [threading.Thread(target=registry.create_monsters, args=(['goblin'] * 20,))
+               for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert builds == ['goblin']
+
+
+def test_shared_registry_and_json_loader():
+    assert monster_registry() is monster_registry()
+
+    monsters = JSONLoader.load_monsters()
+    assert monsters['goblin']['name'] == monster_registry().local_monsters['goblin']['name']
+    assert len(monsters) >= 15
+
+
+def test_stat_block_parsing():
+    assert parse_feet("80/320 ft") == 80
+    assert parse_feet("30 ft") == 30
+    assert parse_feet(None) == 5
+    assert parse_challenge_rating("1/4") == 0.25
+    assert parse_challenge_rating(2) == 2.0
+
+
+def test_real_monsters_from_local_data():
+    pytest.importorskip("dnd_5e_core")
+    registry = MonsterRegistry()
+
+    first, second = registry.create_monster('goblin'), registry.create_monster('goblin')
+    assert first is not second and first.name == second.name
+    assert clone_monster(first).hit_points == first.hit_points
+
+    # Blessure et état d'un gobelin: ni l'autre ni le prototype ne changent
+    first.hit_points -= 5
+    first.conditions = ['prone']
+    prototype = registry.prototype('goblin')
+    assert second.hit_points == prototype.hit_points == 7
+    assert getattr(second, 'conditions', None) != ['prone'] != getattr(prototype, 'conditions', None)
+    assert first.actions[0] is prototype.actions[0]
+
+
+if __name__ == "__main__":
+    for test in (test_clones_share_no_combat_state_with_prototype, test_shared_registry_and_json_loader,
+                 test_stat_block_parsing):
+        test()
+        print(f"✅ {test.__name__}")
@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Test du journal de partie et du rejeu déterministe
+"""
+import random
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.scene_factory import SceneFactory
+from src.simulation.headless import HeadlessRunner, RandomChoicePolicy
+from src.scenes.scene_system import SAVE_OPTION
+from src.simulation.replay import RecordingRenderer, SessionJournal, context_path, record, replay
+from src.utils.rng import SeedStream
+
+
+class FakeMonster:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 12
+        self.xp = 25
+
+
+class FakeMonsterFactory:
+    def create_monster(self, monster_id, name=None):
+        return FakeMonster(monster_id)
+
+
+class FakeCharacter:
+    def __init__(self, name):
+        self.name = name
+        self.hit_points = 12
+        self.max_hit_points = 12
+
+
+class DiceCombatSystem:
+    """Combat au d6 sur le random global, comme EnhancedCombatSystem"""
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        target = alive_monsters[0]
+        target.hit_points -= random.randint(1, 6)
+        if target.hit_points <= 0:
+            alive_monsters.remove(target)
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        target = random.choice(alive_chars)
+        target.hit_points -= random.randint(1, 6)
+        if target.hit_points <= 0:
+            alive_chars.remove(target)
+
+
+SCENARIO = {
+    'scenes': [
+        {'id': 'intro', 'type': 'narrative', 'text': '...', 'next_scene': 'road'},
+        {'id': 'road', 'type': 'choice', 'choices': [
+            {'text': 'Gobelins', 'next_scene': 'goblins'},
+            {'text': 'Orcs', 'next_scene': 'orcs'},
+            {'text': 'Attendre', 'next_scene': 'road'},
+        ]},
+        {'id': 'goblins', 'type': 'combat', 'monsters': ['goblin', 'goblin'], 'on_victory': 'camp'},
+        {'id': 'orcs', 'type': 'combat', 'monsters': ['orc', 'orc', 'orc'], 'on_victory': 'camp'},
+        {'id': 'camp', 'type': 'choice', 'choices': [
+            {'text': 'Repartir', 'next_scene': 'road'},
+            {'text': 'Rentrer', 'next_scene': 'end'},
+        ]},
+        {'id': 'end', 'type': 'narrative', 'text': '...', 'next_scene': None},
+    ]
+}
+
+
+def make_runner(policy_seed):
+    manager = SceneFactory.build_scene_manager_from_json(SCENARIO, FakeMonsterFactory())
+    return HeadlessRunner(manager, policy=RandomChoicePolicy(policy_seed), context_factory=context_factory,
+                          max_steps=200)
+
+
+def context_factory():
+    return {
+        'party': [FakeCharacter("Grok"), FakeCharacter("Elara")],
+        'game_state': {},
+        'combat_system': DiceCombatSystem(),
+    }
+
+
+def test_recording_captures_session():
+    result, journal = record(make_runner(3), "test.json", seed=1234)
+    assert journal.seed == 1234
+    assert journal.path == result.path
+    assert journal.outcome == result.outcome
+    assert len(journal.scene_seeds) == len(journal.path)
+    assert len(journal.choices) == result.choices
+
+
+def test_replay_reproduces_outcome():
+    for seed in range(20):
+        result, journal = record(make_runner(seed), "test.json", seed=seed)
+        # Du bruit dans le random global ne doit rien changer
+        random.seed()
+        manager = SceneFactory.build_scene_manager_from_json(SCENARIO, FakeMonsterFactory())
+        replayed = replay(journal, manager, context_factory)
+        assert replayed.matches, seed
+        assert replayed.outcome == result.outcome
+
+
+def test_journal_round_trip():
+    _, journal = record(make_runner(5), "test.json", seed=99)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'partie.json'
+        journal.save(str(path))
+        assert context_path(path).exists()
+        loaded = SessionJournal.load(str(path), trust_context=True)
+        assert loaded == journal
+        assert loaded.context == journal.context
+        assert loaded.restore_context()['game_state'] == journal.game_state
+
+
+def test_context_pickle_requires_opt_in():
+    _, journal = record(make_runner(5), "test.json", seed=99)
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / 'partie.json'
+        journal.save(str(path))
+
+        loaded = SessionJournal.load(str(path))
+        assert loaded.context is None
+        # L'état du jeu est dans le JSON du journal: il est toujours restauré
+        assert set(loaded.restore_context()) == {'game_state'}
+        assert loaded.game_state == journal.game_state is not None
+
+
+def test_replay_uses_recorded_party_and_session_seed():
+    def session_context():
+        # Groupe propre à la partie (data/parties, sous-classe...) et flux DND_SEED
+        party = [FakeCharacter("Tordek"), FakeCharacter("Jozan"), FakeCharacter("Lyra")]
+        for character in party:
+            character.hit_points = character.max_hit_points = 20
+        return dict(context_factory(), party=party, seed_stream=SeedStream(77))
+
+    for seed in range(10):
+        manager = SceneFactory.build_scene_manager_from_json(SCENARIO, FakeMonsterFactory())
+        runner = HeadlessRunner(manager, policy=RandomChoicePolicy(seed), context_factory=session_context,
+                                max_steps=200)
+        result, journal = record(runner, "test.json", seed=seed)
+        assert journal.session_seed == 77
+        assert [c.name for c in journal.restore_context()['party']] == ["Tordek", "Jozan", "Lyra"]
+
+        # Le rejeu part du contexte générique de l'outil
+        manager = SceneFactory.build_scene_manager_from_json(SCENARIO, FakeMonsterFactory())
+        replayed = replay(journal, manager, context_factory)
+        assert replayed.matches, seed
+        assert replayed.outcome == result.outcome
+
+
+def test_save_option_is_not_recorded():
+    class Inner:
+        def __init__(self, answers):
+            self.answers = list(answers)
+
+        def get_choice(self, options):
+            return self.answers.pop(0)
+
+    choices = []
+    renderer = RecordingRenderer(Inner([2, 1]), choices)
+    options = ["Gobelins", "Orcs", SAVE_OPTION]
+    assert renderer.get_choice(options) == 2
+    assert renderer.get_choice(options) == 1
+    assert choices == [1]
+
+
+def test_divergence_is_detected():
+    _, journal = record(make_runner(8), "test.json", seed=7)
+    # Un choix modifié emmène la partie ailleurs
+    journal.choices[0] = (journal.choices[0] + 1) % 3
+    manager = SceneFactory.build_scene_manager_from_json(SCENARIO, FakeMonsterFactory())
+    replayed = replay(journal, manager, context_factory)
+    assert not replayed.matches
+    assert replayed.diverged_at == 2
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")
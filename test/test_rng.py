@@ -0,0 +1,131 @@
+#!/usr/bin/env python3
+"""
+Test des flux aléatoires dérivés d'une graine de session
+"""
+import pickle
+import random
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.utils.dice import get_rng, parse_dice
+from src.utils.rng import SeedStream, context_rng, use_rng, use_stream
+
+
+def draws(rng, n=20):
+    return [rng.randint(1, 1000) for _ in range(n)]
+
+
+def test_streams_are_reproducible():
+    first, second = SeedStream(42), SeedStream(42)
+
+    assert [s.seed for s in first.spawn(3)] == [s.seed for s in second.spawn(3)]
+    assert draws(first.child('combat').random()) == draws(second.child('combat').random())
+    assert SeedStream(43).seed != SeedStream(42).seed
+
+
+def test_spawn_never_repeats_a_stream():
+    session = SeedStream(7)
+    seeds = [s.seed for s in session.spawn(2)] + [s.seed for s in session.spawn(2)]
+
+    assert len(set(seeds)) == 4
+    # Les flux numérotés et nommés ne se confondent pas
+    assert SeedStream(7).child(0).seed != SeedStream(7).child('0').seed
+    assert SeedStream(7).child(0).child(1).seed != SeedStream(7).child(1).child(0).seed
+
+
+def test_stream_survives_pickling():
+    stream = SeedStream(3).child(5)
+    stream.spawn(2)
+
+    copy = pickle.loads(pickle.dumps(stream))
+    assert (copy.seed, copy.spawned) == (stream.seed, 2)
+    assert draws(copy.random()) == draws(stream.random())
+
+
+def test_use_rng_scopes_dice_rolls():
+    previous = get_rng()
+
+    with use_rng(SeedStream(9).random()):
+        inside = [parse_dice("1d20").roll() for _ in range(10)]
+    assert get_rng() is previous
+
+    with use_rng(SeedStream(9).random()):
+        assert [parse_dice("1d20").roll() for _ in range(10)] == inside
+    with use_rng(None) as rng:
+        assert rng is previous
+
+
+def test_context_rng_follows_session_seed():
+    assert context_rng({}) is None
+
+    first = {'seed_stream': SeedStream(11)}
+    second = {'seed_stream': SeedStream(11)}
+    combats = [draws(context_rng(first)) for _ in range(2)]
+
+    assert combats[0] != combats[1]
+    assert combats == [draws(context_rng(second)) for _ in range(2)]
+    assert isinstance(context_rng(first, 'treasure'), random.Random)
+
+
+def test_use_stream_scopes_global_random():
+    random.seed(1)
+    state = random.getstate()
+
+    with use_stream(SeedStream(9)):
+        inside = draws(random)
+    assert random.getstate() == state
+
+    random.seed(2)
+    with use_stream(SeedStream(9)):
+        assert draws(random) == inside
+    with use_stream(None) as rng:
+        assert rng is get_rng()
+
+
+class Fighter:
+    def __init__(self, name, hit_points):
+        self.name = name
+        self.hit_points = self.max_hit_points = hit_points
+        self.armor_class = 12
+
+
+class GlobalRandomCombatSystem:
+    """Tirages sur le random global, comme dnd_5e_core"""
+
+    def character_turn(self, character, alive_chars, alive_monsters, party, **kwargs):
+        monster = alive_monsters[0]
+        monster.hit_points -= random.randint(1, 8)
+        if monster.hit_points <= 0:
+            alive_monsters.remove(monster)
+
+    def monster_turn(self, monster, alive_monsters, alive_chars, party, round_num):
+        character = alive_chars[0]
+        character.hit_points -= random.randint(1, 6)
+        if character.hit_points <= 0:
+            alive_chars.remove(character)
+
+
+def test_combat_rounds_follow_session_seed():
+    from src.scenes.scene_system import CombatScene
+
+    def fight(global_seed):
+        random.seed(global_seed)
+        state = random.getstate()
+        party = [Fighter("pj1", 20), Fighter("pj2", 20)]
+        monsters = [Fighter(f"gobelin{i}", 7) for i in range(4)]
+        context = {'seed_stream': SeedStream(5), 'scenario_settings': {'initiative': False}}
+        CombatScene.run_rounds(GlobalRandomCombatSystem(), party, list(party), list(monsters), context)
+        assert random.getstate() == state
+        return [c.hit_points for c in party + monsters]
+
+    assert fight(1) == fight(2)
+
+
+if __name__ == "__main__":
+    for test in (test_streams_are_reproducible, test_spawn_never_repeats_a_stream,
+                 test_stream_survives_pickling, test_use_rng_scopes_dice_rolls,
+                 test_context_rng_follows_session_seed, test_use_stream_scopes_global_random,
+                 test_combat_rounds_follow_session_seed):
+        test()
+        print(f"✅ {test.__name__}")
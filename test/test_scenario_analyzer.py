@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Test de l'analyseur statique de scénarios
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.scene_graph import SceneGraph
+from src.utils.scenario_analyzer import ScenarioAnalyzer, analyze_files, build_report
+
+SCENARIO = {
+    'scenes': [
+        {'id': 'intro', 'type': 'narrative', 'next_scene': 'hub'},
+        {'id': 'hub', 'type': 'choice', 'choices': [
+            {'text': 'Explorer', 'next_scene': 'explore'},
+            {'text': 'Combattre', 'next_scene': 'fight'},
+            {'text': 'Puits', 'next_scene': 'pit'},
+            {'text': 'Porte', 'next_scene': 'stuck'},
+        ]},
+        {'id': 'explore', 'type': 'narrative', 'next_scene': 'hub'},
+        {'id': 'fight', 'type': 'combat', 'monsters': ['goblin'], 'on_victory': 'boss'},
+        {'id': 'boss', 'type': 'combat', 'monsters': ['goblin_boss'], 'on_victory': 'victory'},
+        {'id': 'victory', 'type': 'narrative', 'next_scene': None},
+        {'id': 'pit', 'type': 'narrative', 'next_scene': 'pit'},
+        {'id': 'stuck', 'type': 'choice', 'choices': []},
+        {'id': 'orphan', 'type': 'narrative', 'next_scene': 'victory'},
+    ]
+}
+
+
+def analyze():
+    return ScenarioAnalyzer(SceneGraph.from_json(SCENARIO)).analyze("test.json")
+
+
+def test_structural_issues():
+    analysis = analyze()
+    assert analysis.unreachable == ['orphan']
+    assert analysis.dead_ends == ['stuck']
+    assert analysis.traps == ['pit']
+    assert not analysis.is_healthy
+
+
+def test_cycles():
+    cycles = analyze().cycles
+    assert ['hub', 'explore'] in cycles
+    assert ['pit'] in cycles
+    assert len(cycles) == 2
+
+
+def test_path_statistics():
+    endings = {ending.ending: ending for ending in analyze().endings}
+    victory = endings['victory']
+    assert victory.kind == 'victory'
+    assert victory.paths == 1
+    assert victory.shortest.scenes == ['intro', 'hub', 'fight', 'boss', 'victory']
+    assert victory.shortest.combats == 2
+
+    defeat = endings['game_over']
+    assert defeat.kind == 'defeat'
+    # Défaite au premier ou au second combat
+    assert defeat.paths == 2
+    assert defeat.combats_per_path == {1: 1, 2: 1}
+    assert defeat.shortest.length == 4 and defeat.longest.length == 5
+
+
+def test_path_enumeration_is_capped():
+    analyzer = ScenarioAnalyzer(SceneGraph.from_json(SCENARIO), max_paths=1)
+    _, truncated = analyzer.ending_stats()
+    assert truncated
+
+
+def test_real_scenarios_report():
+    files = sorted((Path(__file__).parent.parent / 'data' / 'scenes').glob('*.json'))
+    report = build_report(analyze_files(files, workers=2))
+    assert report['scenarios'] == len(files)
+    assert report['issues']['errors'] == 0
+    roanoke = report['files']['fort_roanoke_enrichi.json']
+    assert any({'main_choice', 'location_2'} <= set(cycle) for cycle in roanoke['cycles'])
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")
@@ -0,0 +1,101 @@
+#!/usr/bin/env python3
+"""
+Test du cache des scénarios compilés
+"""
+import json
+import os
+import pickle
+import sys
+import tempfile
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.scene_cache import ScenarioCache
+from src.scenes.scene_system import SceneManager
+from src.scenes.scene_graph import SceneGraph
+
+SCENARIO = {
+    'name': 'Test',
+    'scenes': [
+        {'id': 'intro', 'type': 'narrative', 'title': 'Intro', 'text': '...', 'next_scene': 'fight'},
+        {'id': 'fight', 'type': 'combat', 'title': 'Combat', 'monsters': ['goblin'],
+         'on_victory': 'ending'},
+        {'id': 'ending', 'type': 'narrative', 'title': 'Fin', 'text': '...', 'next_scene': None},
+    ]
+}
+
+
+def write_scenario(directory: Path, data) -> Path:
+    json_path = directory / 'test_scenario.json'
+    json_path.write_text(json.dumps(data), encoding='utf-8')
+    return json_path
+
+
+def test_miss_then_hit():
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = write_scenario(Path(tmp), SCENARIO)
+        cache = ScenarioCache()
+
+        first = cache.load_bundle(str(json_path))
+        second = cache.load_bundle(str(json_path))
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert second is first
+        assert second.scenario_data == SCENARIO
+
+
+def test_content_change_invalidates():
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = write_scenario(Path(tmp), SCENARIO)
+        cache = ScenarioCache()
+        first = cache.load_bundle(str(json_path))
+
+        changed = json.loads(json.dumps(SCENARIO))
+        changed['scenes'][2]['title'] = 'Autre fin'
+        write_scenario(Path(tmp), changed)
+        stat = json_path.stat()
+        os.utime(json_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+
+        bundle = cache.load_bundle(str(json_path))
+        assert cache.misses == 2
+        assert bundle is not first
+        assert bundle.scenario_data['scenes'][2]['title'] == 'Autre fin'
+        assert cache.clear() == 1
+
+
+def test_populate_builds_fresh_scenes():
+    with tempfile.TemporaryDirectory() as tmp:
+        json_path = write_scenario(Path(tmp), SCENARIO)
+        cache = ScenarioCache()
+
+        first = cache.build_scene_manager(str(json_path))
+        second = cache.build_scene_manager(str(json_path))
+        assert (cache.misses, cache.hits) == (1, 1)
+        assert first.current_scene_id == 'intro'
+        assert first.graph is second.graph
+        assert first.scenes['fight'] is not second.scenes['fight']
+        assert isinstance(first, SceneManager)
+
+
+def test_validation_warnings():
+    with tempfile.TemporaryDirectory() as tmp:
+        broken = {'scenes': [{'id': 'a', 'type': 'choice', 'choices': []},
+                             {'id': 'b', 'type': 'narrative', 'next_scene': 'nowhere'}]}
+        json_path = write_scenario(Path(tmp), broken)
+        bundle = ScenarioCache().load_bundle(str(json_path))
+        assert any('sans choix' in w for w in bundle.warnings)
+        assert any('nowhere' in w for w in bundle.warnings)
+
+
+def test_graph_pickle_round_trip():
+    graph = SceneGraph.from_json(SCENARIO)
+    restored = pickle.loads(pickle.dumps(graph))
+    assert restored == graph
+    assert restored.index['ending'] == graph.index['ending']
+    assert restored.successors(restored.index['fight']) == graph.successors(graph.index['fight'])
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Test des conditions et effets déclaratifs des choix
+"""
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.expressions import (
+    compile_condition, compile_effects, compile_statement, ExpressionError
+)
+from src.scenes.scene_factory import SceneFactory
+from src.rendering.renderer import HeadlessRenderer
+
+
+class Member:
+    def __init__(self, gold, hit_points=10, level=1):
+        self.name = "Grok"
+        self.gold = gold
+        self.hit_points = hit_points
+        self.level = level
+
+
+def context(**state):
+    return {'game_state': dict(state), 'party': [Member(6), Member(5), Member(0, hit_points=0, level=3)]}
+
+
+def test_conditions():
+    assert compile_condition("gold >= 50 and reputation > 0")(context(gold=60, reputation=1))
+    assert not compile_condition("gold >= 50 and reputation > 0")(context(gold=60))
+    assert compile_condition("not curse_level or gold > 2 * 10")(context(curse_level=1, gold=21))
+    assert compile_condition("ally in ('harpers', 'zhents')")(context(ally='harpers'))
+    assert compile_condition("ally not in ('harpers',)")(context(ally='zhents'))
+    assert compile_condition("-(clues - 5) == 2 and met_king == false")(context(clues=3, met_king=False))
+    assert compile_condition("TRUE")(context())
+
+
+def test_context_variables():
+    ctx = context()
+    assert compile_condition("party_gold >= 10")(ctx)
+    assert compile_condition("party_size == 2 and party_level == 3 and party_hp == 20")(ctx)
+    # game_state est prioritaire sur les variables calculées
+    assert not compile_condition("party_gold >= 10")(context(party_gold=0))
+
+
+def test_compiled_once():
+    assert compile_condition("gold > 1") is compile_condition("gold > 1")
+    assert compile_statement("gold -= 1") is compile_statement("gold -= 1")
+
+
+def test_invalid_expressions():
+    for text in ("gold >=", "gold $ 3", "(gold > 1", "gold > 1 1", "import os"):
+        try:
+            compile_condition(text)
+        except ExpressionError:
+            continue
+        raise AssertionError(text)
+    for text in ("10 = gold", "gold == 3", "gold -="):
+        try:
+            compile_statement(text)
+        except ExpressionError:
+            continue
+        raise AssertionError(text)
+
+
+def test_effects():
+    ctx = context(gold=50, reputation=1, secret_found=True)
+    compile_effects({'reputation': 2, 'secret_found': True, 'ally': 'harpers'})(ctx)
+    assert ctx['game_state']['reputation'] == 3
+    assert ctx['game_state']['secret_found'] is True
+    assert ctx['game_state']['ally'] == 'harpers'
+
+    compile_effects(["gold -= 10", "clues = clues + party_size", "bounty *= 2", "met_king = true"])(ctx)
+    assert ctx['game_state']['gold'] == 40
+    assert ctx['game_state']['clues'] == 2
+    assert ctx['game_state']['bounty'] == 0
+    assert ctx['game_state']['met_king'] is True
+
+
+class ScriptPolicy:
+    def __init__(self, index):
+        self.index = index
+        self.seen = []
+
+    def choose(self, options):
+        self.seen.append(list(options))
+        return self.index
+
+
+def test_choice_scene_from_json():
+    scene = SceneFactory.create_scene_from_dict({
+        'id': 'chamber', 'type': 'choice', 'title': 'Chambre', 'description': '',
+        'choices': [
+            {'text': 'Offrande', 'next_scene': 'offering',
+             'condition': 'party_gold >= 20', 'effects': ['offering_made = true']},
+            {'text': 'Voler', 'next_scene': 'steal', 'effects': {'curse_level': 1}},
+            {'text': 'Cassé', 'next_scene': 'x', 'condition': 'gold >>'},
+        ]
+    })
+    policy = ScriptPolicy(0)
+    ctx = context(curse_level=1)
+    ctx['renderer'] = HeadlessRenderer(policy)
+    scene.execute(ctx)
+    # Offrande masquée (11 po), condition invalide ignorée au chargement
+    assert policy.seen[0][:2] == ['Voler', 'Cassé']
+    assert scene.next_scene_id == 'steal'
+    assert ctx['game_state']['curse_level'] == 2
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")
@@ -0,0 +1,68 @@
+#!/usr/bin/env python3
+"""
+Test du graphe de scènes compilé
+"""
+import json
+import sys
+from pathlib import Path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from src.scenes.scene_factory import SceneFactory
+from src.scenes.scene_graph import SceneGraph
+
+SCENES_DIR = Path(__file__).parent.parent / 'data' / 'scenes'
+
+
+def test_fort_roanoke_graph():
+    with open(SCENES_DIR / 'fort_roanoke_enrichi.json', encoding='utf-8') as f:
+        data = json.load(f)
+    graph = SceneFactory.compile_scenario(data)
+
+    assert graph.is_valid
+    assert graph.ids[graph.start] == 'intro'
+    main_choice = graph.index['main_choice']
+    location_2 = graph.index['location_2']
+    assert location_2 in graph.successors(main_choice)
+    assert main_choice in graph.successors(location_2)
+    assert [kind for _, kind, _ in graph.out_edges(main_choice)] == ['choice'] * 3
+
+
+def test_dangling_references_reported_at_compile_time():
+    data = {'scenes': [
+        {'id': 'intro', 'type': 'narrative', 'next_scene': 'hall'},
+        {'id': 'hall', 'type': 'choice', 'choices': [{'text': 'Porte', 'next_scene': 'vault'}]},
+        {'id': 'fight', 'type': 'combat', 'on_victory': 'intro'},
+    ]}
+    graph = SceneGraph.from_json(data)
+    assert [str(r) for r in graph.dangling] == ['hall --choice--> vault']
+    # game_over est implicite (ajouté par BaseScenario.build_scenes)
+    assert 'game_over' in graph
+    assert graph.is_terminal(graph.index['game_over'])
+
+
+def test_graph_is_immutable():
+    graph = SceneGraph.from_json({'scenes': [{'id': 'intro', 'type': 'narrative'}]})
+    try:
+        graph.index['other'] = 1
+        assert False, "index devrait être en lecture seule"
+    except TypeError:
+        pass
+
+
+def test_manager_graph_matches_json_graph():
+    for json_path in sorted(SCENES_DIR.glob('*.json')):
+        with open(json_path, encoding='utf-8') as f:
+            data = json.load(f)
+        manager = SceneFactory.build_scene_manager_from_json(data)
+        from_json = manager.graph
+        from_manager = manager.compile_graph()
+        assert from_json.ids == from_manager.ids, json_path.name
+        assert from_json.edge_targets == from_manager.edge_targets, json_path.name
+        assert from_json.is_valid, (json_path.name, from_json.dangling)
+
+
+if __name__ == "__main__":
+    for name, func in list(globals().items()):
+        if name.startswith('test_'):
+            func()
+            print(f"✅ {name}")